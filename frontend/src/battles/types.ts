@@ -39,12 +39,16 @@ export const BATTLE_RISK_LEVELS: BattleRiskLevel[] = [
  * Payload for the ``battle_state`` WS message (world/web/webclient/message_types.py
  * ``BattleStatePayload``). Not part of the REST OpenAPI schema — this is a
  * hand-authored mirror of the backend dataclass, same convention as
- * ``RoulettePayload`` (components/roulette/types.ts). Carries no battle data
- * itself; it's a slim ping telling clients to refetch the REST aggregate.
+ * ``RoulettePayload`` (components/roulette/types.ts). ``snapshot`` is the same
+ * ``BattleDetail`` body ``/api/battles/<id>/`` returns at ``revision``; it is
+ * null when the recipient can't read the battle's scene, in which case the
+ * client falls back to refetching the REST aggregate.
  */
 export interface BattleStatePayload {
   battle_id: number;
   round_number: number | null;
+  revision: number;
+  snapshot: BattleDetail | null;
 }
 
 /**
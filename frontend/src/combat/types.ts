@@ -31,6 +31,7 @@ export type PositionNode = components['schemas']['PositionNode'];
 export type PositionEdgeInfo = components['schemas']['PositionEdge'];
 
 export type EncounterDetail = components['schemas']['EncounterDetail'];
+export type RoundJob = components['schemas']['RoundJob'];
 
 // current_round_actions is typed as {[key: string]: unknown}[] in the schema —
 // the backend serializes these with varying shapes depending on action type.
@@ -154,3 +155,20 @@ export interface DispatchResult {
 export function isDispatchFailure(result: Pick<DispatchResult, 'success'>): boolean {
   return result.success === false;
 }
+
+/**
+ * Payload for the ``combat_round_progress`` WS message
+ * (src/web/webclient/message_types.py ``CombatRoundProgressPayload``) — one
+ * push per phase checkpoint of a round queued with ``run_as_job``.
+ * Hand-authored mirror of the backend dataclass, same convention as
+ * ``BattleStatePayload`` (battles/types.ts).
+ */
+export interface CombatRoundProgressPayload {
+  job_id: string;
+  encounter_id: number;
+  round_number: number;
+  status: RoundJob['status'];
+  phase: string;
+  phase_label: string;
+  detail: string;
+}
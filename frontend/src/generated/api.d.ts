@@ -916,13 +916,11 @@ export interface paths {
       cookie?: never;
     };
     /**
-     * @description Read-only battle aggregate API — list (slim) and detail (full aggregate).
+     * @description Serve the battle's cached per-revision snapshot (world/battles/snapshots.py).
      *
-     *     Scene-gated exactly like ``CombatEncounterViewSet`` (world/combat/views.py):
-     *     a Battle is a 1:1 extension of scenes.Scene (world/battles/models.py), so
-     *     scene read-visibility alone decides who may see a battle. No participant
-     *     union needed — enlisting in a battle has no bearing here independent of
-     *     scene visibility.
+     *     ``get_object`` still runs the scene-visibility filter, so the cache
+     *     never widens who may read a battle; only the aggregate build is shared
+     *     with the ``battle_state`` push and every other viewer.
      */
     get: operations['battles_retrieve'];
     put?: never;
@@ -4516,6 +4514,11 @@ export interface paths {
      *     SharedMemoryModel identity map means all .save() calls during
      *     resolution update the same Python objects in participants_cached
      *     and opponents_cached — no re-fetch needed.
+     *
+     *     With ``run_as_job`` the round is queued instead (world.combat.round_jobs)
+     *     and the response is ``202`` with the job; progress arrives over the
+     *     ``combat_round_progress`` websocket message. Resubmitting the same
+     *     round returns the same job.
      */
     post: operations['combat_resolve_round_create'];
     delete?: never;
@@ -4541,6 +4544,23 @@ export interface paths {
     patch?: never;
     trace?: never;
   };
+  '/api/combat/{id}/round_job/': {
+    parameters: {
+      query?: never;
+      header?: never;
+      path?: never;
+      cookie?: never;
+    };
+    /** @description The latest queued round-resolution job for this encounter (polling fallback). */
+    get: operations['combat_round_job_retrieve'];
+    put?: never;
+    post?: never;
+    delete?: never;
+    options?: never;
+    head?: never;
+    patch?: never;
+    trace?: never;
+  };
   '/api/combat/{id}/taunt/': {
     parameters: {
       query?: never;
@@ -9196,7 +9216,7 @@ export interface paths {
       path?: never;
       cookie?: never;
     };
-    /** @description ViewSet for browsing interactions with destroy and mark_private actions. */
+    /** @description Paginated feed; a ``?q=`` search adds highlighted snippets for the page. */
     get: operations['interactions_list'];
     put?: never;
     post?: never;
@@ -22616,8 +22636,8 @@ export interface components {
       /**
        * @description Legendary deeds scoped to this battle's backing scene (#1735).
        *
-       *     Reads from the ``cached_deeds`` to_attr the view's Prefetch populates
-       *     on the battle's Scene (world/battles/views.py) — never a fresh query.
+       *     Reads from the ``cached_deeds`` to_attr the snapshot Prefetch populates
+       *     on the battle's Scene (world/battles/snapshots.py) — never a fresh query.
        */
       readonly deeds: unknown[];
     };
@@ -22650,7 +22670,7 @@ export interface components {
        *
        *     ``thumbnail_media_url`` mirrors ``world/combat/serializers.py``'s
        *     ``get_thumbnail_media_url`` — the uploaded-portrait ``Media`` FK,
-       *     already ``select_related``'d by the view's Prefetch (world/battles/views.py),
+       *     already ``select_related``'d by the snapshot Prefetch (world/battles/snapshots.py),
        *     so this never issues a query. ``thumbnail_url`` is the legacy URLField,
        *     kept alongside for callers still on it.
        */
@@ -28155,6 +28175,14 @@ export interface components {
        *     mute reveal is not a comprehension bypass.
        */
       readonly content: string;
+      /**
+       * @description Highlighted excerpt for a ``?q=`` search; None outside a search.
+       *
+       *     Snippets come from the raw text, so they are withheld wherever the
+       *     viewer would not read the raw text: muted personas, and content the
+       *     viewer only comprehends garbled (#2993).
+       */
+      readonly search_snippet: string | null;
       /**
        * @description The type of IC interaction
        *
@@ -28304,6 +28332,14 @@ export interface components {
        *     full content via the detail endpoint.
        */
       readonly content: string;
+      /**
+       * @description Highlighted excerpt for a ``?q=`` search; None outside a search.
+       *
+       *     Snippets come from the raw text, so they are withheld wherever the
+       *     viewer would not read the raw text: muted personas, and content the
+       *     viewer only comprehends garbled (#2993).
+       */
+      readonly search_snippet: string | null;
       /**
        * @description The type of IC interaction
        *
@@ -37319,6 +37355,16 @@ export interface components {
      * @enum {string}
      */
     ResolutionTypeEnum: 'destroy' | 'personal' | 'temporary';
+    /**
+     * @description Write serializer for ``resolve_round``.
+     *
+     *     ``run_as_job`` queues the round (world.combat.round_jobs) and answers
+     *     ``202`` with the job instead of resolving inside the request.
+     */
+    ResolveRoundRequest: {
+      /** @default false */
+      run_as_job: boolean;
+    };
     /** @description Read-only mirror of :class:`world.missions.types.ResolvedBeat`. */
     ResolvedBeat: {
       instance_id: number;
@@ -37882,6 +37928,24 @@ export interface components {
       readonly id: number;
       readonly display_name: string;
     };
+    /** @description Read serializer for a ``world.combat.types.RoundJob``. */
+    RoundJob: {
+      readonly job_id: string;
+      readonly encounter_id: number;
+      readonly round_number: number;
+      readonly status: components['schemas']['RoundJobStatusEnum'];
+      readonly phase: string;
+      readonly detail: string;
+      readonly encounter_completed: boolean;
+    };
+    /**
+     * @description * `queued` - Queued
+     *     * `running` - Running
+     *     * `succeeded` - Succeeded
+     *     * `failed` - Failed
+     * @enum {string}
+     */
+    RoundJobStatusEnum: 'queued' | 'running' | 'succeeded' | 'failed';
     /**
      * @description Read-shape for SanctumDetails surfaced on the player's "My Sanctums" view.
      *
@@ -47839,9 +47903,9 @@ export interface operations {
       };
       cookie?: never;
     };
-    requestBody: {
+    requestBody?: {
       content: {
-        'application/json': components['schemas']['EncounterDetailRequest'];
+        'application/json': components['schemas']['ResolveRoundRequest'];
       };
     };
     responses: {
@@ -47853,6 +47917,14 @@ export interface operations {
           'application/json': components['schemas']['EncounterDetail'];
         };
       };
+      202: {
+        headers: {
+          [name: string]: unknown;
+        };
+        content: {
+          'application/json': components['schemas']['RoundJob'];
+        };
+      };
     };
   };
   combat_revert_combo_create: {
@@ -47881,6 +47953,28 @@ export interface operations {
       };
     };
   };
+  combat_round_job_retrieve: {
+    parameters: {
+      query?: never;
+      header?: never;
+      path: {
+        /** @description A unique integer value identifying this combat encounter. */
+        id: number;
+      };
+      cookie?: never;
+    };
+    requestBody?: never;
+    responses: {
+      200: {
+        headers: {
+          [name: string]: unknown;
+        };
+        content: {
+          'application/json': components['schemas']['RoundJob'];
+        };
+      };
+    };
+  };
   combat_taunt_create: {
     parameters: {
       query?: never;
@@ -54339,6 +54433,8 @@ export interface operations {
         cursor?: string;
         mode?: string;
         persona?: number;
+        /** @description Full-text search over interaction content. */
+        q?: string;
         scene?: number;
         since?: string;
         target_persona?: number;
@@ -0,0 +1,44 @@
+import { describe, it, expect, vi, afterEach } from 'vitest';
+import { handleBattleStatePayload } from '../handleBattleStatePayload';
+import { battleKeys } from '@/battles/queries';
+import type { BattleDetail, BattleStatePayload } from '@/battles/types';
+import { queryClient } from '@/queryClient';
+
+describe('handleBattleStatePayload', () => {
+  afterEach(() => {
+    vi.restoreAllMocks();
+    queryClient.clear();
+  });
+
+  it('writes the pushed snapshot into the detail query without refetching it', () => {
+    const invalidateSpy = vi.spyOn(queryClient, 'invalidateQueries').mockResolvedValue();
+    const snapshot = { id: 5, scene_id: 12, name: 'Siege of the Gate' } as BattleDetail;
+    const payload: BattleStatePayload = {
+      battle_id: 5,
+      round_number: 2,
+      revision: 3,
+      snapshot,
+    };
+
+    handleBattleStatePayload(payload);
+
+    expect(queryClient.getQueryData(battleKeys.detail(5))).toBe(snapshot);
+    expect(invalidateSpy).toHaveBeenCalledTimes(1);
+    expect(invalidateSpy).toHaveBeenCalledWith({ queryKey: battleKeys.forScene(12) });
+  });
+
+  it('falls back to invalidating every battle query when no snapshot is attached', () => {
+    const invalidateSpy = vi.spyOn(queryClient, 'invalidateQueries').mockResolvedValue();
+    const payload: BattleStatePayload = {
+      battle_id: 5,
+      round_number: null,
+      revision: 4,
+      snapshot: null,
+    };
+
+    handleBattleStatePayload(payload);
+
+    expect(queryClient.getQueryData(battleKeys.detail(5))).toBeUndefined();
+    expect(invalidateSpy).toHaveBeenCalledWith({ queryKey: battleKeys.all });
+  });
+});
@@ -0,0 +1,54 @@
+import { describe, it, expect, vi, afterEach } from 'vitest';
+import { toast } from 'sonner';
+import { handleCombatRoundProgressPayload } from '../handleCombatRoundProgressPayload';
+import { combatKeys } from '@/combat/queries';
+import type { CombatRoundProgressPayload } from '@/combat/types';
+import { queryClient } from '@/queryClient';
+
+vi.mock('sonner', () => ({ toast: { error: vi.fn() } }));
+
+function payload(overrides: Partial<CombatRoundProgressPayload>): CombatRoundProgressPayload {
+  return {
+    job_id: 'abc',
+    encounter_id: 9,
+    round_number: 2,
+    status: 'running',
+    phase: '',
+    phase_label: '',
+    detail: '',
+    ...overrides,
+  };
+}
+
+describe('handleCombatRoundProgressPayload', () => {
+  afterEach(() => {
+    vi.restoreAllMocks();
+    vi.mocked(toast.error).mockClear();
+  });
+
+  it('ignores intermediate phases', () => {
+    const invalidateSpy = vi.spyOn(queryClient, 'invalidateQueries').mockResolvedValue();
+
+    handleCombatRoundProgressPayload(payload({ phase: 'clashes_resolved' }));
+
+    expect(invalidateSpy).not.toHaveBeenCalled();
+  });
+
+  it('refetches the encounter once the job succeeds', () => {
+    const invalidateSpy = vi.spyOn(queryClient, 'invalidateQueries').mockResolvedValue();
+
+    handleCombatRoundProgressPayload(payload({ status: 'succeeded' }));
+
+    expect(invalidateSpy).toHaveBeenCalledWith({ queryKey: combatKeys.encounter(9) });
+    expect(toast.error).not.toHaveBeenCalled();
+  });
+
+  it('surfaces the failure detail and still refetches', () => {
+    const invalidateSpy = vi.spyOn(queryClient, 'invalidateQueries').mockResolvedValue();
+
+    handleCombatRoundProgressPayload(payload({ status: 'failed', detail: 'Round failed.' }));
+
+    expect(toast.error).toHaveBeenCalledWith('Round failed.');
+    expect(invalidateSpy).toHaveBeenCalledWith({ queryKey: combatKeys.encounter(9) });
+  });
+});
@@ -6,9 +6,18 @@ import { queryClient } from '@/queryClient';
  * Battles are location-less (their backing scene has no ``location``), so the
  * existing scene/room broadcast paths never reach participants — ``battle_state``
  * is the dedicated seam (see ``BattleStatePayload`` in
- * ``src/web/webclient/message_types.py``). The payload carries no battle data
- * itself; on receipt we just invalidate so the REST aggregate refetches.
+ * ``src/web/webclient/message_types.py``). The server pushes the battle's
+ * detail snapshot, built once per revision for every recipient, so we write it
+ * straight into the detail query instead of refetching. Only the slim scene
+ * lookup (outcome etc.) is invalidated. A payload without a snapshot falls
+ * back to the old refetch so the REST visibility gate decides.
  */
-export function handleBattleStatePayload(_payload: BattleStatePayload) {
-  void queryClient.invalidateQueries({ queryKey: battleKeys.all });
+export function handleBattleStatePayload(payload: BattleStatePayload) {
+  const { battle_id: battleId, snapshot } = payload;
+  if (snapshot == null) {
+    void queryClient.invalidateQueries({ queryKey: battleKeys.all });
+    return;
+  }
+  queryClient.setQueryData(battleKeys.detail(battleId), snapshot);
+  void queryClient.invalidateQueries({ queryKey: battleKeys.forScene(snapshot.scene_id) });
 }
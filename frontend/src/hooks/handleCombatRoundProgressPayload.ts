@@ -0,0 +1,22 @@
+import { toast } from 'sonner';
+import type { CombatRoundProgressPayload } from '@/combat/types';
+import { combatKeys } from '@/combat/queries';
+import { queryClient } from '@/queryClient';
+
+/**
+ * combat_round_progress — pushed by ``world.combat.round_jobs`` at every phase
+ * checkpoint of a round queued with ``run_as_job``. Intermediate phases only
+ * matter to a progress indicator; once the job settles the encounter detail
+ * is refetched (a failed job leaves the round open for declarations, so the
+ * refetch is still what the panel needs). Failures surface their safe detail.
+ */
+export function handleCombatRoundProgressPayload(payload: CombatRoundProgressPayload) {
+  const { encounter_id: encounterId, status, detail } = payload;
+  if (status !== 'succeeded' && status !== 'failed') {
+    return;
+  }
+  if (status === 'failed') {
+    toast.error(detail);
+  }
+  void queryClient.invalidateQueries({ queryKey: combatKeys.encounter(encounterId) });
+}
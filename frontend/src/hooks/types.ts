@@ -35,6 +35,8 @@ export const WS_MESSAGE_TYPE = {
   MAIL_ARRIVED: 'mail_arrived',
   /** Inbound: an environmental hazard entered a damaging stage; show the response card (#2846). */
   HAZARD_PROMPT: 'hazard_prompt',
+  /** Inbound: phase checkpoint of a round resolving as a background job. */
+  COMBAT_ROUND_PROGRESS: 'combat_round_progress',
 } as const;
 
 export type SocketMessageType = (typeof WS_MESSAGE_TYPE)[keyof typeof WS_MESSAGE_TYPE];
@@ -28,6 +28,8 @@ import { handleRoulettePayload } from './handleRoulettePayload';
 import type { RoulettePayload } from '@/components/roulette/types';
 import { handleBattleStatePayload } from './handleBattleStatePayload';
 import type { BattleStatePayload } from '@/battles/types';
+import { handleCombatRoundProgressPayload } from './handleCombatRoundProgressPayload';
+import type { CombatRoundProgressPayload } from '@/combat/types';
 import { handleKudosReceivedPayload } from './handleKudosReceivedPayload';
 import { handleMailArrivedPayload } from './handleMailArrivedPayload';
 
@@ -204,6 +206,11 @@ export function useGameSocket() {
             return;
           }
 
+          if (msgType === WS_MESSAGE_TYPE.COMBAT_ROUND_PROGRESS) {
+            handleCombatRoundProgressPayload(kwargs as unknown as CombatRoundProgressPayload);
+            return;
+          }
+
           if (msgType === WS_MESSAGE_TYPE.MAIL_ARRIVED) {
             handleMailArrivedPayload(kwargs as unknown as MailArrivedPayload);
             return;
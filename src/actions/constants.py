@@ -113,6 +113,28 @@ class CombatActionSlot(models.TextChoices):
     PASSIVE_MENTAL = "passive-mental", "Passive (Mental)"
 
 
+class PacedActionKind(models.TextChoices):
+    """What a persisted server-paced action does on each step (``actions.pacing``)."""
+
+    TRAVEL = "travel", "Travel"
+    SERVANT_FETCH_ITEM = "servant_fetch_item", "Servant errand"
+    SERVANT_FETCH_OUTFIT = "servant_fetch_outfit", "Servant errand"
+    SERVANT_MEAL = "servant_meal", "Meal preparation"
+    SERVANT_BATH = "servant_bath", "Bath preparation"
+
+
+class PacedActionLane(models.TextChoices):
+    """Supersession lane: at most one pending paced action per owner per lane.
+
+    Scheduling into a lane replaces whatever the owner already had pending in
+    it (a re-dispatched walk replaces the old walk). Kinds without a lane may
+    run side by side.
+    """
+
+    TRAVEL = "travel", "Travel"
+    SERVANT_FETCH = "servant_fetch", "Servant fetch"
+
+
 class PlayerDecision(StrEnum):
     """Player decisions for paused resolution pipelines."""
 
@@ -3,15 +3,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, ClassVar
-import uuid
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from evennia.objects.models import ObjectDB
-from evennia.utils import delay
 
 from actions.base import Action
-from actions.constants import ActionCategory
+from actions.constants import ActionCategory, PacedActionKind, PacedActionLane
 from actions.definitions.item_helpers import resolve_item_instance
+from actions.pacing import cancel_paced_action, schedule_paced_action
 from actions.types import ActionContext, ActionResult, TargetType
 from commands.exceptions import CommandError
 from evennia_extensions.models import room_is_publicly_listed
@@ -25,6 +24,9 @@ from world.items.exceptions import InventoryError, NotReachable
 from world.mechanics.constants import ChallengeType
 from world.mechanics.models import ChallengeInstance
 
+if TYPE_CHECKING:
+    from actions.models import PacedActionStep
+
 
 @dataclass
 class GetAction(Action):
@@ -258,14 +260,13 @@ class TraverseExitAction(Action):
 class TravelAction(Action):
     """Walk a computed route to a destination room, one hop per tick.
 
-    Server-paced via evennia.utils.delay() — each scheduled hop reuses the
-    same check_exit_traversal/traverse_exit primitives TraverseExitAction
-    uses, so room-state broadcasts happen exactly as they do for a manual
-    walk. A per-caller `.ndb.active_travel_token` makes cancellation and
-    re-dispatch safe: every scheduled callback checks its token against the
-    caller's *current* active token before acting, so a stale callback from
-    a superseded or stopped walk silently no-ops instead of moving the
-    player unexpectedly (#2163).
+    Server-paced through ``actions.pacing`` — the route is persisted as a
+    TRAVEL paced action and each hop (``run_travel_hop``) reuses the same
+    check_exit_traversal/traverse_exit primitives TraverseExitAction uses, so
+    room-state broadcasts happen exactly as they do for a manual walk. The
+    walk occupies the caller's TRAVEL lane: a re-dispatch supersedes it and
+    ``StopTravelAction`` cancels it, and a superseded or stopped walk never
+    takes another hop (#2163). A walk survives a server reload.
     """
 
     key: str = "travel_to"
@@ -311,17 +312,12 @@ class TravelAction(Action):
         if not route:
             return ActionResult(success=False, message="You're already there.")
 
-        token = uuid.uuid4()
-        actor.ndb.active_travel_token = token
-        task = delay(
-            self.hop_delay_seconds,
-            self._do_hop,
+        schedule_paced_action(
             actor,
-            route,
-            0,
-            token,
+            PacedActionKind.TRAVEL,
+            delay_seconds=self.hop_delay_seconds,
+            state={"route": [exit_obj.pk for exit_obj in route]},
         )
-        actor.ndb.active_travel_task = task
 
         return ActionResult(success=True, message="You set off.")
 
@@ -353,55 +349,44 @@ class TravelAction(Action):
             return ActionResult(success=False, message=exc.msg)
         return ActionResult(success=True, message="You travel instantly through the network.")
 
-    @staticmethod
-    def _do_hop(actor: ObjectDB, route: list[ObjectDB], hop_index: int, token: uuid.UUID) -> None:
-        """Execute one hop of a scheduled walk, or no-op if superseded/stopped."""
-        if actor.ndb.active_travel_token != token:
-            return  # Superseded by a re-dispatch, or stopped — stale callback.
 
-        exit_obj = route[hop_index]
-        sdm = SceneDataManager()
-        try:
-            caller_state = sdm.initialize_state_for_object(actor)
-            exit_state = sdm.initialize_state_for_object(exit_obj)
-            check_exit_traversal(caller_state, exit_state)
-
-            destination_room = exit_obj.destination
-            if destination_room is None or not room_is_publicly_listed(destination_room):
-                closed_msg = "That path is no longer open."
-                raise CommandError(closed_msg)
-
-            dest_state = sdm.initialize_state_for_object(destination_room)
-            traverse_exit(caller_state, exit_state, dest_state)
-
-            caller_state = sdm.initialize_state_for_object(actor)
-            send_room_state(caller_state)
-        except CommandError as err:
-            actor.ndb.active_travel_token = None
-            actor.ndb.active_travel_task = None
-            actor.msg(f"Your route stops here: {err}")
-            return
-        except Exception:
-            actor.ndb.active_travel_token = None
-            actor.ndb.active_travel_task = None
-            raise
-
-        next_index = hop_index + 1
-        if next_index >= len(route):
-            actor.ndb.active_travel_token = None
-            actor.ndb.active_travel_task = None
-            actor.msg("You arrive.")
-            return
-
-        task = delay(
-            TravelAction.hop_delay_seconds,
-            TravelAction._do_hop,
-            actor,
-            route,
-            next_index,
-            token,
-        )
-        actor.ndb.active_travel_task = task
+def run_travel_hop(paced: PacedActionStep) -> float | None:
+    """Paced-action step for a TRAVEL walk: take hop ``paced.step`` of the route.
+
+    Returns the pause before the next hop, or None once the walk has arrived or
+    stopped. A hop whose exit is gone or no longer leaves the walker's room
+    (they were moved mid-walk, or the server reloaded) stops the walk.
+    """
+    actor = paced.owner
+    route = paced.state["route"]
+    exit_obj = ObjectDB.objects.filter(pk=route[paced.step]).first()
+    sdm = SceneDataManager()
+    try:
+        if exit_obj is None or exit_obj.location != actor.location:
+            off_route_msg = "You are no longer on your route."
+            raise CommandError(off_route_msg)
+        caller_state = sdm.initialize_state_for_object(actor)
+        exit_state = sdm.initialize_state_for_object(exit_obj)
+        check_exit_traversal(caller_state, exit_state)
+
+        destination_room = exit_obj.destination
+        if destination_room is None or not room_is_publicly_listed(destination_room):
+            closed_msg = "That path is no longer open."
+            raise CommandError(closed_msg)
+
+        dest_state = sdm.initialize_state_for_object(destination_room)
+        traverse_exit(caller_state, exit_state, dest_state)
+
+        caller_state = sdm.initialize_state_for_object(actor)
+        send_room_state(caller_state)
+    except CommandError as err:
+        actor.msg(f"Your route stops here: {err}")
+        return None
+
+    if paced.step + 1 >= len(route):
+        actor.msg("You arrive.")
+        return None
+    return TravelAction.hop_delay_seconds
 
 
 @dataclass
@@ -421,15 +406,8 @@ class StopTravelAction(Action):
         context: ActionContext | None = None,
         **kwargs: Any,
     ) -> ActionResult:
-        if actor.ndb.active_travel_token is None:
+        if not cancel_paced_action(actor, PacedActionLane.TRAVEL):
             return ActionResult(success=False, message="You aren't traveling anywhere.")
-
-        task = actor.ndb.active_travel_task
-        if task is not None:
-            task.cancel()
-
-        actor.ndb.active_travel_token = None
-        actor.ndb.active_travel_task = None
         return ActionResult(success=True, message="You stop where you are.")
 
 
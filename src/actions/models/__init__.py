@@ -10,6 +10,7 @@ from actions.models.effect_configs import (
     RemoveConditionOnCheckConfig,
 )
 from actions.models.enhancement import ActionEnhancement
+from actions.models.paced import PacedActionStep
 
 __all__ = [
     "ActionEnhancement",
@@ -21,5 +22,6 @@ __all__ = [
     "ConsequencePool",
     "ConsequencePoolEntry",
     "ModifyKwargsConfig",
+    "PacedActionStep",
     "RemoveConditionOnCheckConfig",
 ]
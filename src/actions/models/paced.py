@@ -0,0 +1,67 @@
+"""Persisted steps of server-paced multi-step actions (``actions.pacing``)."""
+
+from __future__ import annotations
+
+from django.db import models
+
+from actions.constants import PacedActionKind, PacedActionLane
+
+
+class PacedActionStep(models.Model):
+    """The next pending step of one server-paced action (a walk, a servant errand).
+
+    One row per in-flight action, rewritten as each step runs and deleted when
+    the action finishes or is cancelled. Because the step state lives here
+    rather than in a reactor callback's closure, a reload can resume the
+    action — or cancel it cleanly — instead of silently dropping it.
+
+    Deliberately a plain ``models.Model``: rows are short-lived and rewritten
+    by queryset updates, so an identity-mapped instance would only go stale.
+    """
+
+    owner = models.ForeignKey(
+        "objects.ObjectDB",
+        on_delete=models.CASCADE,
+        related_name="paced_actions",
+        help_text="The character performing the action.",
+    )
+    kind = models.CharField(
+        max_length=30,
+        choices=PacedActionKind.choices,
+        help_text="Which step handler runs this action.",
+    )
+    lane = models.CharField(
+        max_length=20,
+        choices=PacedActionLane.choices,
+        blank=True,
+        help_text="Supersession lane; blank for actions that may run side by side.",
+    )
+    step = models.PositiveSmallIntegerField(
+        default=0,
+        help_text="Index of the next step to run.",
+    )
+    state = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="Handler-specific state (object pks, names), JSON-safe only.",
+    )
+    next_step_at = models.DateTimeField(
+        db_index=True,
+        help_text="When the next step is due.",
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        app_label = "arxii"
+        verbose_name = "Paced Action Step"
+        verbose_name_plural = "Paced Action Steps"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["owner", "lane"],
+                condition=~models.Q(lane=""),
+                name="paced_action_one_per_owner_lane",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.get_kind_display()} step {self.step} for #{self.owner_id}"
@@ -0,0 +1,267 @@
+"""Reload-safe scheduler for server-paced multi-step actions.
+
+Multi-step actions the server paces on the player's behalf — an auto-walk
+that takes one hop every few seconds, a servant's errand that completes after
+a pause — persist their next step as a ``PacedActionStep`` row: owner, kind,
+step index, JSON state and the time the next step is due. One reactor timer,
+armed at the earliest due step, drives every pending action in the process;
+there is no per-actor ``delay()`` callback to lose on reload.
+
+Each kind maps to a step handler (``_STEP_HANDLERS``). A handler receives the
+row, validates the world is still as the action expects (the actor is where
+the step assumes, the item still exists), performs the step, and returns the
+seconds until its next step or ``None`` when the action is finished. A handler
+that raises ends its action; the exception is logged.
+
+Supersession and cancellation are centralized here: scheduling into a
+``PacedActionLane`` replaces whatever the owner had pending in that lane, and
+``cancel_paced_action`` drops it. The row itself is the cancellation token —
+a step whose row is gone never runs.
+
+``resume_paced_actions`` runs on server start: steps of unknown kinds, or
+overdue by more than ``RESUME_GRACE_SECONDS``, are cancelled with a message to
+the owner; the rest resume on the shared timer.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+from typing import TYPE_CHECKING, Any
+
+from django.db import transaction
+from django.db.models import Min
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from twisted.internet import reactor
+
+from actions.constants import PacedActionKind, PacedActionLane
+from actions.models import PacedActionStep
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from evennia.objects.models import ObjectDB
+    from twisted.internet.base import DelayedCall
+    from twisted.internet.interfaces import IReactorTime
+
+logger = logging.getLogger(__name__)
+
+# Scheduler used to arm the shared timer. Tests swap in ``twisted.internet.task.Clock``.
+_clock: IReactorTime = reactor  # ty: ignore[invalid-assignment]
+
+#: A step this far past due when the server starts is cancelled, not resumed —
+#: a walk that resumes an hour after the reload would surprise its player.
+RESUME_GRACE_SECONDS = 300
+
+#: Upper bound on steps run per timer firing; the timer re-arms immediately
+#: when more are due.
+STEP_BATCH_SIZE = 100
+
+# Step handlers by kind, as dotted paths so this module does not import the
+# action modules that import it.
+_STEP_HANDLERS: dict[str, str] = {
+    PacedActionKind.TRAVEL: "actions.definitions.movement.run_travel_hop",
+    PacedActionKind.SERVANT_FETCH_ITEM: "world.npc_services.servant_fetch.complete_item_fetch",
+    PacedActionKind.SERVANT_FETCH_OUTFIT: (
+        "world.npc_services.servant_fetch.complete_outfit_fetch"
+    ),
+    PacedActionKind.SERVANT_MEAL: "world.npc_services.servant_ambience.complete_pamper",
+    PacedActionKind.SERVANT_BATH: "world.npc_services.servant_ambience.complete_pamper",
+}
+
+_LANES: dict[str, str] = {
+    PacedActionKind.TRAVEL: PacedActionLane.TRAVEL,
+    PacedActionKind.SERVANT_FETCH_ITEM: PacedActionLane.SERVANT_FETCH,
+    PacedActionKind.SERVANT_FETCH_OUTFIT: PacedActionLane.SERVANT_FETCH,
+}
+
+# (owner pk, lane) -> pk of its pending row, so cancelling on every move costs
+# no query when nothing is pending. Verified against the table before use.
+_lane_index: dict[tuple[int, str], int] = {}
+
+
+class _SharedTimer:
+    """The one reactor timer, armed at the earliest pending step."""
+
+    def __init__(self) -> None:
+        self.call: DelayedCall | None = None
+        self.due_at: datetime | None = None
+
+    def arm(self, due_at: datetime) -> None:
+        """Make sure the timer fires no later than ``due_at``."""
+        if self.call is not None and self.call.active():
+            if self.due_at is not None and self.due_at <= due_at:
+                return
+            self.call.cancel()
+        delay = max((due_at - timezone.now()).total_seconds(), 0.0)
+        self.call = _clock.callLater(delay, _fire_timer)
+        self.due_at = due_at
+
+    def rearm(self) -> None:
+        """Re-arm for the earliest step in the table, or disarm when none is pending."""
+        if self.call is not None and self.call.active():
+            self.call.cancel()
+        self.call = None
+        self.due_at = None
+        earliest = PacedActionStep.objects.aggregate(earliest=Min("next_step_at"))["earliest"]
+        if earliest is not None:
+            self.arm(earliest)
+
+
+_timer = _SharedTimer()
+
+
+def _step_handler(kind: str) -> Callable[[PacedActionStep], float | None] | None:
+    path = _STEP_HANDLERS.get(kind)
+    return import_string(path) if path is not None else None
+
+
+def schedule_paced_action(
+    owner: ObjectDB,
+    kind: PacedActionKind,
+    *,
+    delay_seconds: float,
+    state: dict[str, Any] | None = None,
+) -> PacedActionStep:
+    """Persist a new paced action whose first step runs in ``delay_seconds``.
+
+    Supersedes the owner's pending action in the same lane, if any.
+
+    Args:
+        owner: The character performing the action.
+        kind: Which step handler runs it.
+        delay_seconds: Seconds until the first step.
+        state: JSON-safe handler state.
+
+    Returns:
+        The persisted step row.
+    """
+    lane = _LANES.get(kind, "")
+    with transaction.atomic():
+        if lane:
+            PacedActionStep.objects.filter(owner=owner, lane=lane).delete()
+        paced = PacedActionStep.objects.create(
+            owner=owner,
+            kind=kind,
+            lane=lane,
+            state=state or {},
+            next_step_at=timezone.now() + timedelta(seconds=delay_seconds),
+        )
+    if lane:
+        _lane_index[(owner.pk, lane)] = paced.pk
+    _timer.arm(paced.next_step_at)
+    return paced
+
+
+def pending_paced_action(owner: ObjectDB, lane: PacedActionLane) -> PacedActionStep | None:
+    """The owner's pending action in ``lane``, or None."""
+    pk = _lane_index.get((owner.pk, lane))
+    if pk is None:
+        return None
+    paced = PacedActionStep.objects.filter(pk=pk).first()
+    if paced is None:
+        _lane_index.pop((owner.pk, lane), None)
+    return paced
+
+
+def cancel_paced_action(owner: ObjectDB, lane: PacedActionLane) -> bool:
+    """Cancel the owner's pending action in ``lane``.
+
+    Returns:
+        True if an action was pending and is now cancelled.
+    """
+    pk = _lane_index.pop((owner.pk, lane), None)
+    if pk is None:
+        return False
+    deleted, _ = PacedActionStep.objects.filter(pk=pk).delete()
+    return bool(deleted)
+
+
+def run_due_paced_actions(now: datetime | None = None) -> int:
+    """Run every step due at ``now`` (default: the current time), then re-arm the timer.
+
+    Each step runs in its own transaction; a step whose row was cancelled or
+    superseded by an earlier step in the same batch is skipped.
+
+    Returns:
+        The number of steps run.
+    """
+    now = now or timezone.now()
+    due = list(
+        PacedActionStep.objects.filter(next_step_at__lte=now)
+        .select_related("owner")
+        .order_by("next_step_at", "pk")[:STEP_BATCH_SIZE]
+    )
+    ran = sum(_run_step(paced, now) for paced in due)
+    _timer.rearm()
+    return ran
+
+
+def _run_step(paced: PacedActionStep, now: datetime) -> bool:
+    handler = _step_handler(paced.kind)
+    wait: float | None = None
+    try:
+        with transaction.atomic():
+            if not PacedActionStep.objects.select_for_update().filter(pk=paced.pk).exists():
+                return False
+            wait = handler(paced) if handler is not None else None
+            rows = PacedActionStep.objects.filter(pk=paced.pk)
+            if wait is None:
+                rows.delete()
+            else:
+                rows.update(
+                    step=paced.step + 1,
+                    state=paced.state,
+                    next_step_at=now + timedelta(seconds=wait),
+                )
+    except Exception:
+        logger.exception("Paced %s step %d for #%d failed", paced.kind, paced.step, paced.owner_id)
+        PacedActionStep.objects.filter(pk=paced.pk).delete()
+        wait = None
+    if wait is None and paced.lane:
+        _lane_index.pop((paced.owner_id, paced.lane), None)
+    return True
+
+
+def _fire_timer() -> None:
+    """Timer callback: run whatever is due."""
+    _timer.call = None
+    _timer.due_at = None
+    try:
+        run_due_paced_actions()
+    except Exception:
+        logger.exception("Paced action timer failed")
+        _timer.rearm()
+
+
+def resume_paced_actions(now: datetime | None = None) -> int:
+    """Resume or cancel every persisted paced action. Called on server start.
+
+    Returns:
+        The number of actions resumed.
+    """
+    now = now or timezone.now()
+    stale_before = now - timedelta(seconds=RESUME_GRACE_SECONDS)
+    _lane_index.clear()
+    resumed = 0
+    for paced in PacedActionStep.objects.select_related("owner"):
+        if _step_handler(paced.kind) is None or paced.next_step_at < stale_before:
+            _cancel_on_resume(paced)
+            continue
+        if paced.lane:
+            _lane_index[(paced.owner_id, paced.lane)] = paced.pk
+        resumed += 1
+    _timer.rearm()
+    return resumed
+
+
+def _cancel_on_resume(paced: PacedActionStep) -> None:
+    paced.delete()
+    label = (
+        PacedActionKind(paced.kind).label if paced.kind in PacedActionKind.values else paced.kind
+    )
+    try:
+        paced.owner.msg(f"Your {label.lower()} was interrupted.")
+    except Exception:
+        logger.exception("Could not notify #%d of a cancelled paced action", paced.owner_id)
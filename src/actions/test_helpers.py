@@ -0,0 +1,40 @@
+"""Test-only helpers for driving server-paced actions without a running reactor.
+
+NOT a production code path. Tests run synchronously, so the shared pacing
+timer never fires; these helpers run the persisted steps directly, jumping
+the clock to each step's due time.
+"""
+
+from __future__ import annotations
+
+from django.db.models import Min
+
+from actions.models import PacedActionStep
+from actions.pacing import run_due_paced_actions
+
+
+def run_next_paced_step() -> int:
+    """Run whatever paced steps are due at the earliest pending time.
+
+    Returns:
+        The number of steps run (0 when nothing is pending).
+    """
+    earliest = PacedActionStep.objects.aggregate(earliest=Min("next_step_at"))["earliest"]
+    if earliest is None:
+        return 0
+    return run_due_paced_actions(now=earliest)
+
+
+def run_paced_actions_to_completion(max_rounds: int = 50) -> int:
+    """Run pending paced steps in due order until none remain.
+
+    Returns:
+        The total number of steps run.
+    """
+    total = 0
+    for _ in range(max_rounds):
+        ran = run_next_paced_step()
+        if not ran:
+            break
+        total += ran
+    return total
@@ -4,6 +4,7 @@ from unittest.mock import patch
 
 from django.test import TestCase, tag
 
+from actions.constants import PacedActionLane
 from actions.definitions.communication import PoseAction, SayAction, WhisperAction
 from actions.definitions.movement import (
     DropAction,
@@ -14,6 +15,8 @@ from actions.definitions.movement import (
     TraverseExitAction,
 )
 from actions.definitions.perception import InventoryAction, LookAction
+from actions.pacing import pending_paced_action
+from actions.test_helpers import run_next_paced_step, run_paced_actions_to_completion
 from evennia_extensions.factories import (
     AccountFactory,
     CharacterFactory,
@@ -615,23 +618,17 @@ class TravelActionTests(TestCase):
         )
         action = TravelAction()
 
-        with patch.object(actor, "msg"), patch("actions.definitions.movement.delay") as mock_delay:
-            # Capture-and-run: TravelAction schedules its next hop via
-            # evennia.utils.delay(seconds, callback, ...) — since this test
-            # runs synchronously (no real reactor), replace delay with an
-            # immediate call to the callback so the whole route walks in
-            # one test tick. This exercises the exact same callback logic
-            # the real delayed path uses, just without the real pause.
-            def run_immediately(_seconds, callback, *args, **kwargs):
-                callback(*args, **kwargs)
-
-            mock_delay.side_effect = run_immediately
+        with patch.object(actor, "msg"):
             result = action.run(actor, target=rooms[-1])
+            # No reactor runs in tests: step the persisted walk directly, one
+            # hop per due time — the same step handler the shared timer runs.
+            hops = run_paced_actions_to_completion()
 
         assert result.success is True
+        assert hops == 3
         actor.refresh_from_db()
         assert actor.location == rooms[-1]
-        assert actor.ndb.active_travel_token is None
+        assert pending_paced_action(actor, PacedActionLane.TRAVEL) is None
 
     @tag("postgres")  # a successful hop calls send_room_state -> get_ancestry,
     # which walks the areas_areaclosure materialized view (PG-only).
@@ -678,18 +675,14 @@ class TravelActionTests(TestCase):
         )
         action = TravelAction()
 
-        with patch.object(actor, "msg"), patch("actions.definitions.movement.delay") as mock_delay:
-
-            def run_immediately(_seconds, callback, *args, **kwargs):
-                callback(*args, **kwargs)
-
-            mock_delay.side_effect = run_immediately
+        with patch.object(actor, "msg"):
             result = action.run(actor, target=room_c)
+            run_paced_actions_to_completion()
 
         assert result.success is True
         actor.refresh_from_db()
         assert actor.location == room_c
-        assert actor.ndb.active_travel_token is None
+        assert pending_paced_action(actor, PacedActionLane.TRAVEL) is None
 
     def test_travel_no_route_fails_immediately(self):
         area = AreaFactory()
@@ -725,87 +718,75 @@ class TravelActionTests(TestCase):
         )
         action = TravelAction()
 
-        hop_count = {"n": 0}
-
-        def run_and_flip_privacy(_seconds, callback, *args, **kwargs):
-            hop_count["n"] += 1
-            if hop_count["n"] == 2:
-                # Simulate a GM flipping the final waypoint private between
-                # dispatch and this hop's execution.
-                rooms[2].room_profile.is_public = False
-                rooms[2].room_profile.save()
-            callback(*args, **kwargs)
-
-        with (
-            patch.object(actor, "msg"),
-            patch("actions.definitions.movement.delay", side_effect=run_and_flip_privacy),
-        ):
+        with patch.object(actor, "msg"):
             action.run(actor, target=rooms[-1])
+            run_next_paced_step()
+            # Simulate a GM flipping the final waypoint private between
+            # dispatch and the second hop's execution.
+            rooms[2].room_profile.is_public = False
+            rooms[2].room_profile.save()
+            run_paced_actions_to_completion()
 
         actor.refresh_from_db()
         # Stopped at the last successfully-reached room, never entered the
         # now-private room 2.
         assert actor.location == rooms[1]
-        assert actor.ndb.active_travel_token is None
+        assert pending_paced_action(actor, PacedActionLane.TRAVEL) is None
 
-    def test_stop_travel_clears_active_token(self):
+    def test_stop_travel_cancels_pending_walk(self):
         rooms, _exits = self._make_route(3)
         actor = ObjectDBFactory(
             db_key="Traveler3",
             db_typeclass_path="typeclasses.characters.Character",
             location=rooms[0],
         )
-        with patch.object(actor, "msg"), patch("actions.definitions.movement.delay") as mock_delay:
-            # Don't run the callback — leave the walk "in flight".
-            mock_delay.return_value = None
+        with patch.object(actor, "msg"):
             TravelAction().run(actor, target=rooms[-1])
 
-        assert actor.ndb.active_travel_token is not None
+        assert pending_paced_action(actor, PacedActionLane.TRAVEL) is not None
 
         with patch.object(actor, "msg"):
             result = StopTravelAction().run(actor)
+            # The stopped walk never takes another hop.
+            assert run_paced_actions_to_completion() == 0
 
         assert result.success is True
-        assert actor.ndb.active_travel_token is None
-        # Actor never actually moved past the origin (walk was stopped
-        # before any hop callback fired).
+        assert pending_paced_action(actor, PacedActionLane.TRAVEL) is None
         actor.refresh_from_db()
         assert actor.location == rooms[0]
 
+    def test_stop_travel_when_not_traveling_fails(self):
+        room = ObjectDBFactory(db_key="Idle", db_typeclass_path="typeclasses.rooms.Room")
+        actor = ObjectDBFactory(
+            db_key="Idler",
+            db_typeclass_path="typeclasses.characters.Character",
+            location=room,
+        )
+
+        result = StopTravelAction().run(actor)
+
+        assert result.success is False
+
     def test_redispatch_supersedes_prior_walk_no_orphaned_movement(self):
-        rooms, _exits = self._make_route(3)
+        rooms, exits = self._make_route(3)
         actor = ObjectDBFactory(
             db_key="Traveler4",
             db_typeclass_path="typeclasses.characters.Character",
             location=rooms[0],
         )
-        stale_callbacks = []
 
-        def capture_but_dont_run(_seconds, callback, *args, **kwargs):
-            stale_callbacks.append((callback, args, kwargs))
-
-        with (
-            patch.object(actor, "msg"),
-            patch("actions.definitions.movement.delay", side_effect=capture_but_dont_run),
-        ):
+        with patch.object(actor, "msg"):
             TravelAction().run(actor, target=rooms[-1])
-            first_token = actor.ndb.active_travel_token
+            first = pending_paced_action(actor, PacedActionLane.TRAVEL)
 
             # Re-dispatch mid-walk — supersedes the first walk.
             TravelAction().run(actor, target=rooms[1])
-            second_token = actor.ndb.active_travel_token
-
-        assert first_token != second_token
+            second = pending_paced_action(actor, PacedActionLane.TRAVEL)
 
-        # Now fire the STALE callback from the first walk (as if its delay
-        # had actually elapsed after being superseded) — it must no-op.
-        stale_callback, stale_args, stale_kwargs = stale_callbacks[0]
-        with patch.object(actor, "msg"):
-            stale_callback(*stale_args, **stale_kwargs)
-
-        actor.refresh_from_db()
-        # The stale callback did NOT move the actor — token mismatch caught it.
-        assert actor.location == rooms[0]
+        assert first.pk != second.pk
+        assert second.state["route"] == [exits[0].pk]
+        # Only the second walk is persisted; the first can never take a hop.
+        assert list(actor.paced_actions.values_list("pk", flat=True)) == [second.pk]
 
     @tag("postgres")  # a successful hop calls send_room_state -> get_ancestry,
     # which walks the areas_areaclosure materialized view (PG-only).
@@ -825,16 +806,12 @@ class TravelActionTests(TestCase):
         )
         action = TravelAction()
 
-        with patch.object(actor, "msg"), patch("actions.definitions.movement.delay") as mock_delay:
-
-            def run_immediately(_seconds, callback, *args, **kwargs):
-                callback(*args, **kwargs)
-
-            mock_delay.side_effect = run_immediately
+        with patch.object(actor, "msg"):
             # target is a plain int, exactly as it arrives from a REST dispatch's
             # raw JSON kwargs — NOT rooms[-1] (the ObjectDB), which is what a
             # telnet .run() call would pass.
             result = action.run(actor, target=rooms[-1].id)
+            run_paced_actions_to_completion()
 
         assert result.success is True
         actor.refresh_from_db()
@@ -870,7 +847,7 @@ class PortalTravelTests(TestCase):
     The branch is tried FIRST inside execute() (after the raw-int destination
     resolution); on a portal_route() hit it relocates instantly via
     perform_portal_travel and returns without ever touching find_route or
-    scheduling a hop via evennia.utils.delay(). On a miss it falls through to
+    scheduling a paced hop. On a miss it falls through to
     the pre-existing walking path, byte-identical to before this issue.
     """
 
@@ -900,25 +877,21 @@ class PortalTravelTests(TestCase):
         actor = self._make_traveler(origin, technique=technique)
         action = TravelAction()
 
-        with (
-            patch.object(actor, "msg"),
-            patch("actions.definitions.movement.delay") as mock_delay,
-        ):
+        with patch.object(actor, "msg"):
             result = action.run(actor, target=dest)
 
         assert result.success is True
         actor.refresh_from_db()
         assert actor.location == dest
         # No hop pacing at all — the portal branch never calls find_route or
-        # schedules a delayed hop, unlike the walking path.
-        mock_delay.assert_not_called()
-        assert actor.ndb.active_travel_token is None
+        # schedules a paced hop, unlike the walking path.
+        assert not actor.paced_actions.exists()
 
     @tag("postgres")  # a successful hop calls send_room_state -> get_ancestry (PG-only).
     def test_no_known_technique_falls_back_to_walking(self):
         """Anchors exist at both ends, but the traveler knows no portal-travel
         technique — portal_route() returns None and the walking path
-        (paced hop via evennia.utils.delay) runs exactly as it did pre-#2222.
+        (paced hops) runs exactly as it did pre-#2222.
         """
         area = AreaFactory()
         kind = PortalAnchorKindFactory()
@@ -942,16 +915,12 @@ class PortalTravelTests(TestCase):
         )
         actor = self._make_traveler(origin)  # no known technique
 
-        with patch.object(actor, "msg"), patch("actions.definitions.movement.delay") as mock_delay:
-
-            def run_immediately(_seconds, callback, *args, **kwargs):
-                callback(*args, **kwargs)
-
-            mock_delay.side_effect = run_immediately
+        with patch.object(actor, "msg"):
             result = TravelAction().run(actor, target=dest)
+            hops = run_paced_actions_to_completion()
 
         assert result.success is True
-        mock_delay.assert_called()  # the walking path paced at least one hop
+        assert hops >= 1  # the walking path paced at least one hop
         actor.refresh_from_db()
         assert actor.location == dest
 
@@ -971,7 +940,7 @@ class PortalTravelTests(TestCase):
         actor = self._make_traveler(origin, technique=technique)
         action = TravelAction()
 
-        with patch.object(actor, "msg"), patch("actions.definitions.movement.delay") as mock_delay:
+        with patch.object(actor, "msg"):
             # target is a plain int, exactly as it arrives from a REST dispatch's
             # raw JSON kwargs — NOT dest (the ObjectDB).
             result = action.run(actor, target=dest.id)
@@ -979,7 +948,7 @@ class PortalTravelTests(TestCase):
         assert result.success is True
         actor.refresh_from_db()
         assert actor.location == dest
-        mock_delay.assert_not_called()
+        assert not actor.paced_actions.exists()
 
 
 class TraverseExitWithChallengesTest(TestCase):
@@ -0,0 +1,187 @@
+"""Tests for the reload-safe paced-action scheduler (actions.pacing)."""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.utils import timezone
+from twisted.internet.task import Clock
+
+from actions import pacing
+from actions.constants import PacedActionKind, PacedActionLane
+from actions.models import PacedActionStep
+from actions.pacing import (
+    cancel_paced_action,
+    pending_paced_action,
+    resume_paced_actions,
+    run_due_paced_actions,
+    schedule_paced_action,
+)
+from evennia_extensions.factories import CharacterFactory
+
+_steps_seen: list[tuple[int, int]] = []
+
+
+def _two_step_handler(paced: PacedActionStep) -> float | None:
+    _steps_seen.append((paced.owner_id, paced.step))
+    return 2.0 if paced.step == 0 else None
+
+
+def _failing_handler(paced: PacedActionStep) -> float | None:
+    msg = "boom"
+    raise RuntimeError(msg)
+
+
+class PacingTestCase(TestCase):
+    def setUp(self) -> None:
+        self.clock = Clock()
+        for target, attr, value in (
+            (pacing, "_clock", self.clock),
+            (pacing, "_timer", pacing._SharedTimer()),
+            (pacing, "_lane_index", {}),
+        ):
+            patcher = patch.object(target, attr, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        handlers = patch.dict(
+            pacing._STEP_HANDLERS,
+            {
+                PacedActionKind.TRAVEL: f"{__name__}._two_step_handler",
+                PacedActionKind.SERVANT_MEAL: f"{__name__}._failing_handler",
+            },
+        )
+        handlers.start()
+        self.addCleanup(handlers.stop)
+        _steps_seen.clear()
+        self.owner = CharacterFactory()
+
+
+class ScheduleAndRunTests(PacingTestCase):
+    def test_one_shared_timer_armed_at_the_earliest_step(self) -> None:
+        other = CharacterFactory()
+        schedule_paced_action(self.owner, PacedActionKind.TRAVEL, delay_seconds=30)
+        schedule_paced_action(other, PacedActionKind.TRAVEL, delay_seconds=60)
+        self.assertEqual(len(self.clock.getDelayedCalls()), 1)
+        self.assertAlmostEqual(self.clock.getDelayedCalls()[0].getTime(), 30, delta=1)
+
+        schedule_paced_action(other, PacedActionKind.TRAVEL, delay_seconds=5)
+
+        self.assertEqual(len(self.clock.getDelayedCalls()), 1)
+        self.assertAlmostEqual(self.clock.getDelayedCalls()[0].getTime(), 5, delta=1)
+
+    def test_timer_runs_due_steps(self) -> None:
+        schedule_paced_action(self.owner, PacedActionKind.TRAVEL, delay_seconds=0)
+
+        self.clock.advance(0)
+
+        self.assertEqual(_steps_seen, [(self.owner.pk, 0)])
+        paced = PacedActionStep.objects.get(owner=self.owner)
+        self.assertEqual(paced.step, 1)
+        # Re-armed for the rescheduled second step.
+        self.assertEqual(len(self.clock.getDelayedCalls()), 1)
+
+    def test_step_returning_none_finishes_the_action(self) -> None:
+        paced = schedule_paced_action(self.owner, PacedActionKind.TRAVEL, delay_seconds=0)
+        now = paced.next_step_at
+
+        run_due_paced_actions(now=now)
+        run_due_paced_actions(now=now + timedelta(seconds=2))
+
+        self.assertEqual(_steps_seen, [(self.owner.pk, 0), (self.owner.pk, 1)])
+        self.assertFalse(PacedActionStep.objects.exists())
+        self.assertIsNone(pending_paced_action(self.owner, PacedActionLane.TRAVEL))
+        self.assertEqual(self.clock.getDelayedCalls(), [])
+
+    def test_steps_not_yet_due_wait(self) -> None:
+        paced = schedule_paced_action(self.owner, PacedActionKind.TRAVEL, delay_seconds=10)
+
+        ran = run_due_paced_actions(now=paced.next_step_at - timedelta(seconds=1))
+
+        self.assertEqual(ran, 0)
+        self.assertEqual(_steps_seen, [])
+
+    def test_failing_step_is_logged_and_dropped(self) -> None:
+        paced = schedule_paced_action(self.owner, PacedActionKind.SERVANT_MEAL, delay_seconds=0)
+
+        with self.assertLogs("actions.pacing", level="ERROR"):
+            run_due_paced_actions(now=paced.next_step_at)
+
+        self.assertFalse(PacedActionStep.objects.exists())
+
+
+class LaneTests(PacingTestCase):
+    def test_scheduling_into_a_lane_supersedes(self) -> None:
+        first = schedule_paced_action(self.owner, PacedActionKind.TRAVEL, delay_seconds=10)
+        second = schedule_paced_action(self.owner, PacedActionKind.TRAVEL, delay_seconds=10)
+
+        self.assertEqual(list(PacedActionStep.objects.values_list("pk", flat=True)), [second.pk])
+        self.assertNotEqual(first.pk, second.pk)
+        self.assertEqual(pending_paced_action(self.owner, PacedActionLane.TRAVEL), second)
+
+    def test_laneless_actions_run_side_by_side(self) -> None:
+        schedule_paced_action(self.owner, PacedActionKind.SERVANT_MEAL, delay_seconds=10)
+        schedule_paced_action(self.owner, PacedActionKind.SERVANT_MEAL, delay_seconds=10)
+
+        self.assertEqual(PacedActionStep.objects.count(), 2)
+
+    def test_cancelled_action_never_runs(self) -> None:
+        paced = schedule_paced_action(self.owner, PacedActionKind.TRAVEL, delay_seconds=0)
+
+        self.assertTrue(cancel_paced_action(self.owner, PacedActionLane.TRAVEL))
+        run_due_paced_actions(now=paced.next_step_at)
+
+        self.assertEqual(_steps_seen, [])
+        self.assertFalse(cancel_paced_action(self.owner, PacedActionLane.TRAVEL))
+
+    def test_cancel_with_nothing_pending_is_query_free(self) -> None:
+        with self.assertNumQueries(0):
+            self.assertFalse(cancel_paced_action(self.owner, PacedActionLane.SERVANT_FETCH))
+
+
+class ResumeTests(PacingTestCase):
+    def _persisted(self, kind: str, *, overdue_seconds: float, lane: str = "") -> PacedActionStep:
+        """A row as a previous server process would have left it."""
+        return PacedActionStep.objects.create(
+            owner=self.owner,
+            kind=kind,
+            lane=lane,
+            next_step_at=timezone.now() - timedelta(seconds=overdue_seconds),
+        )
+
+    def test_recent_steps_resume_on_the_shared_timer(self) -> None:
+        paced = self._persisted(
+            PacedActionKind.TRAVEL, overdue_seconds=5, lane=PacedActionLane.TRAVEL
+        )
+
+        with patch.object(self.owner, "msg") as mock_msg:
+            resumed = resume_paced_actions()
+
+        self.assertEqual(resumed, 1)
+        mock_msg.assert_not_called()
+        self.assertEqual(pending_paced_action(self.owner, PacedActionLane.TRAVEL), paced)
+        self.clock.advance(0)
+        self.assertEqual(_steps_seen, [(self.owner.pk, 0)])
+
+    def test_long_overdue_steps_are_cancelled_with_a_message(self) -> None:
+        self._persisted(
+            PacedActionKind.TRAVEL,
+            overdue_seconds=pacing.RESUME_GRACE_SECONDS + 60,
+            lane=PacedActionLane.TRAVEL,
+        )
+
+        with patch.object(self.owner, "msg") as mock_msg:
+            resumed = resume_paced_actions()
+
+        self.assertEqual(resumed, 0)
+        mock_msg.assert_called_once_with("Your travel was interrupted.")
+        self.assertFalse(PacedActionStep.objects.exists())
+        self.assertEqual(self.clock.getDelayedCalls(), [])
+
+    def test_unknown_kinds_are_cancelled(self) -> None:
+        self._persisted("retired_kind", overdue_seconds=0)
+
+        with patch.object(self.owner, "msg"):
+            resumed = resume_paced_actions()
+
+        self.assertEqual(resumed, 0)
+        self.assertFalse(PacedActionStep.objects.exists())
@@ -1,13 +1,19 @@
 """Tests for command serialization."""
 
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
+from evennia import Command
 
+from commands import utils
 from commands.evennia_overrides.builder import CmdDig
 from commands.evennia_overrides.perception import CmdLook
+from commands.frontend import FrontendMetadataMixin
 from commands.serializers import CommandSerializer
 from commands.utils import serialize_cmdset
+from evennia_extensions.factories import CharacterFactory
+from evennia_extensions.observability import cache_metrics
 
 
 class CommandSerializerTests(TestCase):
@@ -63,3 +69,74 @@ class CommandSerializerTests(TestCase):
 
         assert "restricted" not in actions
         assert "allowed" in actions
+
+
+class _CmdBuilderOnly(FrontendMetadataMixin, Command):
+    key = "builderonly"
+    locks = "cmd:perm(Builder)"
+    usage = [{"prompt": "builderonly", "params_schema": {}}]
+
+
+class _CmdOocOnly(FrontendMetadataMixin, Command):
+    key = "ooconly"
+    locks = "cmd:is_ooc()"
+    usage = [{"prompt": "ooconly", "params_schema": {}}]
+
+
+class SerializeCmdsetCacheTests(TestCase):
+    """Descriptors are built once per process; permission-only access per fingerprint."""
+
+    def setUp(self) -> None:
+        utils._reset_for_testing()
+        cache_metrics._reset_for_testing()
+        self.character = CharacterFactory()
+        self.character.permissions.add("Builder")
+        cmdset = SimpleNamespace(commands=[_CmdBuilderOnly(), _CmdOocOnly()])
+        patcher = patch("commands.utils._get_cmdset", return_value=cmdset)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _serialize_counting(self) -> tuple[list[str], int, int]:
+        with (
+            patch("commands.utils._has_command_access", wraps=utils._has_command_access) as access,
+            patch("commands.utils.CommandSerializer", wraps=CommandSerializer) as serializer,
+        ):
+            actions = [d["action"] for d in serialize_cmdset(self.character)]
+        return actions, access.call_count, serializer.call_count
+
+    def test_repeat_call_reuses_descriptors_and_permission_access(self) -> None:
+        first, first_access, first_serialized = self._serialize_counting()
+        second, second_access, second_serialized = self._serialize_counting()
+
+        self.assertIn("builderonly", first)
+        self.assertEqual(second, first)
+        self.assertEqual(first_serialized, len(first))
+        self.assertEqual(second_serialized, 0)
+        # Only the is_ooc()-locked command is re-checked.
+        self.assertEqual(first_access, 2)
+        self.assertEqual(second_access, 1)
+
+    def test_permission_change_rechecks_access(self) -> None:
+        self._serialize_counting()
+        self.character.permissions.remove("Builder")
+
+        actions, access_calls, _serialized = self._serialize_counting()
+
+        self.assertNotIn("builderonly", actions)
+        self.assertEqual(access_calls, 2)
+
+    @override_settings(OBSERVABILITY_ENABLED=True)
+    def test_cache_misses_are_counted(self) -> None:
+        serialize_cmdset(self.character)
+        serialize_cmdset(self.character)
+
+        registry = cache_metrics.get_registry()
+
+        def count(cache: str, result: str) -> float | None:
+            return registry.get_sample_value(
+                "cache_lookups_total", {"cache": cache, "result": result}
+            )
+
+        self.assertEqual(count("command_access", "miss"), 1.0)
+        self.assertEqual(count("command_access", "hit"), 1.0)
+        self.assertEqual(count("command_descriptors", "hit"), count("command_descriptors", "miss"))
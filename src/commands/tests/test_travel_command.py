@@ -2,6 +2,8 @@
 
 from django.test import TestCase
 
+from actions.constants import PacedActionKind, PacedActionLane
+from actions.pacing import pending_paced_action, schedule_paced_action
 from commands.travel import CmdTravel
 from evennia_extensions.factories import ObjectDBFactory, RoomProfileFactory
 from world.areas.factories import AreaFactory
@@ -46,7 +48,7 @@ class CmdTravelTests(TestCase):
         from unittest.mock import patch
 
         cmd = self._make_cmd("Friend")
-        with patch.object(self.caller, "msg"), patch("actions.definitions.movement.delay"):
+        with patch.object(self.caller, "msg"):
             cmd.func()
         # No CommandError raised means the action dispatched successfully —
         # TravelAction's own tests (Task 2) cover the walk mechanics; this
@@ -63,8 +65,10 @@ class CmdTravelTests(TestCase):
     def test_travel_stop_dispatches_stop_travel_action(self):
         from unittest.mock import patch
 
-        self.caller.ndb.active_travel_token = "some-token"  # noqa: S105
+        schedule_paced_action(
+            self.caller, PacedActionKind.TRAVEL, delay_seconds=60, state={"route": []}
+        )
         cmd = self._make_cmd("stop")
         with patch.object(self.caller, "msg"):
             cmd.func()
-        assert self.caller.ndb.active_travel_token is None
+        assert pending_paced_action(self.caller, PacedActionLane.TRAVEL) is None
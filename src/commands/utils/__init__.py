@@ -1,15 +1,46 @@
-"""Utility helpers for command handling."""
+"""Utility helpers for command handling.
+
+``serialize_cmdset`` runs on every puppet and every room-state send, over a
+merged cmdset of several hundred commands, so both of its per-command steps are
+cached in-process:
+
+* **Descriptors** depend only on the command's class, key and action, never on
+  who is looking — they are serialized once per process and shared (treat them
+  as read-only).
+* **Access** is cached per (command class, lock string, permission fingerprint)
+  when the command's ``cmd`` lock only calls permission lockfuncs
+  (:data:`_PERMISSION_ONLY_LOCKFUNCS`); any other lockfunc can read arbitrary
+  state, so those commands are still checked on every call.
+
+Misses on both caches are counted through
+``evennia_extensions.observability.cache_metrics``.
+"""
 
 from __future__ import annotations
 
 import logging
+import re
 from typing import Any
 
 from commands.frontend_types import FrontendDescriptor
 from commands.serializers import CommandSerializer
+from evennia_extensions.observability.cache_metrics import record_cache_lookup
 
 UNKNOWN_COMMAND_KEY = "unknown"
 
+#: Lockfuncs whose result depends only on the caller's permissions, superuser
+#: status and quell state — everything :func:`_permission_fingerprint` covers.
+_PERMISSION_ONLY_LOCKFUNCS = frozenset(
+    {"all", "true", "false", "none", "superuser", "perm", "perm_above", "pperm", "pperm_above"}
+)
+_LOCKFUNC_PATTERN = re.compile(r"(\w+)\s*\(")
+
+_DESCRIPTOR_CACHE_NAME = "command_descriptors"
+_ACCESS_CACHE_NAME = "command_access"
+
+_descriptor_cache: dict[tuple, tuple[FrontendDescriptor, ...]] = {}
+_access_cache: dict[tuple, bool] = {}
+
 
 def _get_cmdset(cmdset_obj: Any) -> Any:
     try:
@@ -48,23 +79,99 @@ def _has_command_access(command: Any, cmdset_obj: Any, source_name: str) -> bool
         return False
 
 
+def _has_permission_only_lock(command: Any) -> bool:
+    """True when the command's ``cmd`` lock reads nothing but caller permissions."""
+    try:
+        locks = command.locks
+    except AttributeError:
+        return False
+    if not isinstance(locks, str):
+        return False
+    for lock in locks.split(";"):
+        access_type, _, expression = lock.partition(":")
+        if access_type.strip() == "cmd":
+            return set(_LOCKFUNC_PATTERN.findall(expression)) <= _PERMISSION_ONLY_LOCKFUNCS
+    # No cmd lock: access() falls back to its default without reading any state.
+    return True
+
+
+def _permission_fingerprint(cmdset_obj: Any) -> tuple | None:
+    """Everything a permission-only lock can read about *cmdset_obj*, or None.
+
+    Mirrors Evennia's ``perm``/``pperm`` lockfuncs: the object's own permissions,
+    its puppeting account's permissions and quell flag, and the superuser lock
+    bypass. ``None`` means the caller can't be fingerprinted, so nothing is cached.
+    """
+    try:
+        fingerprint: tuple = (
+            type(cmdset_obj),
+            bool(cmdset_obj.locks.lock_bypass),
+            tuple(sorted(cmdset_obj.permissions.all())),
+        )
+        try:
+            account = cmdset_obj.account
+        except AttributeError:
+            account = None
+        if account:
+            fingerprint += (
+                account.is_superuser,
+                tuple(sorted(account.permissions.all())),
+                bool(account.attributes.get("_quell")),
+            )
+    except (AttributeError, TypeError):
+        return None
+    return fingerprint
+
+
+def _cached_command_access(
+    command: Any, cmdset_obj: Any, source_name: str, fingerprint: tuple | None
+) -> bool:
+    if fingerprint is None or not _has_permission_only_lock(command):
+        return _has_command_access(command, cmdset_obj, source_name)
+    key = (type(command), command.locks, fingerprint)
+    allowed = _access_cache.get(key)
+    record_cache_lookup(_ACCESS_CACHE_NAME, hit=allowed is not None)
+    if allowed is None:
+        allowed = _has_command_access(command, cmdset_obj, source_name)
+        _access_cache[key] = allowed
+    return allowed
+
+
+def _descriptor_key(command: Any) -> tuple:
+    """What a command's descriptors are built from: class, key and action."""
+    try:
+        action = command.action
+    except AttributeError:
+        action = None
+    if action is None:
+        return (type(command), _get_command_key(command))
+    return (type(command), _get_command_key(command), action.key, action.icon)
+
+
 def _serialize_command(
     command: Any,
     source_name: str,
     results: list[FrontendDescriptor],
 ) -> None:
-    try:
-        serializer = CommandSerializer(command)
-        payload = serializer.data
-        results.extend(payload["descriptors"])
-    except Exception as e:  # noqa: BLE001
-        logging.warning(
-            "Failed to serialize %s command %s: %s",
-            source_name,
-            _get_command_key(command),
-            e,
-            exc_info=True,
-        )
+    key = _descriptor_key(command)
+    descriptors = _descriptor_cache.get(key)
+    record_cache_lookup(_DESCRIPTOR_CACHE_NAME, hit=descriptors is not None)
+    if descriptors is None:
+        try:
+            serializer = CommandSerializer(command)
+            payload = serializer.data
+            descriptors = tuple(payload["descriptors"])
+        except Exception as e:  # noqa: BLE001
+            logging.warning(
+                "Failed to serialize %s command %s: %s",
+                source_name,
+                _get_command_key(command),
+                e,
+                exc_info=True,
+            )
+            return
+        _descriptor_cache[key] = descriptors
+    results.extend(descriptors)
 
 
 def _serialize_cmdset_commands(
@@ -76,14 +183,21 @@ def _serialize_cmdset_commands(
     if not cmdset:
         return
 
+    fingerprint = _permission_fingerprint(cmdset_obj)
     for command in cmdset.commands:
         if not _has_payload(command):
             continue
-        if not _has_command_access(command, cmdset_obj, source_name):
+        if not _cached_command_access(command, cmdset_obj, source_name, fingerprint):
             continue
         _serialize_command(command, source_name, results)
 
 
+def _reset_for_testing() -> None:
+    """Drop both serialization caches. **For use in tests only.**"""
+    _descriptor_cache.clear()
+    _access_cache.clear()
+
+
 def serialize_cmdset(obj: Any) -> list[FrontendDescriptor]:
     """Serialize commands in *obj*'s cmdset using Django serializers.
 
@@ -154,3 +154,13 @@ def _flush_natural_key_indexes() -> None:
 
 
 register_test_cache_flusher(_flush_natural_key_indexes)
+
+
+def _flush_block_graph() -> None:
+    """Drop the in-memory block graph (#1278); the next lookup reloads it from the database."""
+    from world.scenes.block_graph import reset_block_graph  # noqa: PLC0415
+
+    reset_block_graph()
+
+
+register_test_cache_flusher(_flush_block_graph)
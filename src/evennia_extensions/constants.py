@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import enum
+
 from django.db import models
 
 
@@ -17,6 +19,22 @@ class ExitKind(models.TextChoices):
     WINDOW = "window", "Window"
 
 
+class ObjectKind(models.TextChoices):
+    """What an Evennia object is, denormalized from its typeclass for indexed queries.
+
+    Stored on ``ObjectKindRecord``; derived by
+    ``evennia_extensions.services.object_kinds.derive_object_kind``.
+    """
+
+    CHARACTER = "character", "Character"
+    GM_CHARACTER = "gm_character", "GM Character"
+    STAFF_CHARACTER = "staff_character", "Staff Character"
+    COMPANION = "companion", "Companion"
+    ROOM = "room", "Room"
+    EXIT = "exit", "Exit"
+    ITEM = "item", "Item"
+
+
 class RoomEnclosure(models.TextChoices):
     """How enclosed a room is — gates which outdoor weather reaches its inhabitants (#1514).
 
@@ -31,3 +49,18 @@ class RoomEnclosure(models.TextChoices):
     ROOFED = "roofed", "Roofed"  # a roof stops rain/snow, but wind still reaches you
     WALLED = "walled", "Walled"  # roof + walls stop rain/snow and wind
     SEALED = "sealed", "Sealed"  # fully enclosed; also the substrate for future insulation
+
+
+class ArrivalFeature(enum.IntFlag):
+    """Bits of ``RoomProfile.arrival_features`` — which on-arrival hooks have content here.
+
+    ``Character.at_post_move`` skips every hook whose bit is clear, so an ordinary
+    room costs no hook queries. Each bit is owned by one content model (see
+    ``evennia_extensions.mixins.ArrivalFeatureContentMixin``), which sets or clears
+    it whenever a row is saved or deleted.
+    """
+
+    MISSION_TRIGGER = 1  # active ROOM_TRIGGER MissionGiver targeting the room
+    TRAPS = 2  # armed Trap in the room
+    CLUE_TRIGGERS = 4  # active ClueTrigger in the room
+    POSTED_NPC = 8  # active GUARD or DOORMAN NPCAssignment in the room
@@ -133,3 +133,57 @@ class RelatedCacheClearingMixin(CachedPropertiesMixin):
         """Delete and clear related object caches."""
         self.clear_related_caches()
         super().delete(*args, **kwargs)
+
+
+class ArrivalFeatureContentMixin:
+    """Keeps one ``RoomProfile.arrival_features`` bit in step with this model's rows.
+
+    For content that an on-arrival hook in ``Character.at_post_move`` looks for
+    (traps, clue triggers, posted guards and doormen, room-trigger mission givers). Subclasses
+    define:
+        arrival_feature: ArrivalFeature — the bit this model owns
+        arrival_room_field: str — attname of the FK holding the RoomProfile pk
+        arrival_content(room_profile_id) — classmethod; the rows that make the
+            hook worth running in that room
+
+    Every save/delete re-derives the bit for the row's room (and for the room
+    it moved away from). Bulk ``update()``/cascades bypass this; see
+    ``evennia_extensions.services.arrival_features``.
+    """
+
+    arrival_feature: ClassVar[int]
+    arrival_room_field: ClassVar[str]
+
+    @classmethod
+    def arrival_content(cls, room_profile_id: int):
+        raise NotImplementedError
+
+    def save(self, *args, **kwargs):
+        from evennia_extensions.services.arrival_features import (  # noqa: PLC0415
+            sync_arrival_feature,
+        )
+
+        previous_room_id = None
+        if self.pk is not None:
+            previous_room_id = (
+                type(self)
+                .objects.filter(pk=self.pk)
+                .values_list(self.arrival_room_field, flat=True)
+                .first()
+            )
+        result = super().save(*args, **kwargs)
+        room_id = getattr(self, self.arrival_room_field)
+        sync_arrival_feature(type(self), room_id)
+        if previous_room_id != room_id:
+            sync_arrival_feature(type(self), previous_room_id)
+        return result
+
+    def delete(self, *args, **kwargs):
+        from evennia_extensions.services.arrival_features import (  # noqa: PLC0415
+            sync_arrival_feature,
+        )
+
+        room_id = getattr(self, self.arrival_room_field)
+        result = super().delete(*args, **kwargs)
+        sync_arrival_feature(type(self), room_id)
+        return result
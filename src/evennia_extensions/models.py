@@ -14,7 +14,7 @@ from evennia.objects.models import ObjectDB
 from evennia.utils.idmapper.models import SharedMemoryModel
 
 from core.natural_keys import NaturalKeyManager, NaturalKeyMixin
-from evennia_extensions.constants import ExitKind, RoomEnclosure
+from evennia_extensions.constants import ExitKind, ObjectKind, RoomEnclosure
 from evennia_extensions.mixins import RelatedCacheClearingMixin
 from server.conf.serversession import ServerSession
 from world.areas.constants import GridOrigin
@@ -261,7 +261,11 @@ class Artist(SharedMemoryModel):
 
 
 class Media(NaturalKeyMixin, CreditedContent, SharedMemoryModel):
-    """Cloudinary-backed image: player-uploaded media or staff-authored game art.
+    """Stored image: player-uploaded media or staff-authored game art.
+
+    Files live in the configured media backend (Cloudinary or local disk, see
+    ``world.roster.services.media_storage``); ``cloudinary_public_id`` and
+    ``cloudinary_url`` hold that backend's key and URL whichever it is.
 
     Player-owned rows set ``player_data`` and leave ``slug`` null (created live
     via the player upload endpoint). Staff-authored rows leave ``player_data``
@@ -453,6 +457,39 @@ class ObjectDisplayData(SharedMemoryModel):
         verbose_name_plural = "Object Display Data"
 
 
+class ObjectKindRecord(SharedMemoryModel):
+    """The indexed kind of an Evennia object (character, room, exit, item, ...).
+
+    ``db_typeclass_path`` answers "is this a room?" only by a substring scan
+    over every object row; this 1:1 row answers it with an index. Written when
+    the object is created and whenever its typeclass is swapped (``ObjectParent``
+    hooks) — see ``evennia_extensions.services.object_kinds``.
+    """
+
+    # ObjectDB by design (#2608): every object has a kind — characters, rooms,
+    # exits and items alike.
+    objectdb = models.OneToOneField(
+        _OBJECTDB_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="kind_record",
+    )
+    kind = models.CharField(
+        max_length=20,
+        choices=ObjectKind.choices,
+        db_index=True,
+        help_text="What this object is, derived from its typeclass.",
+    )
+
+    class Meta:
+        app_label = "arxii"
+        verbose_name = "Object Kind"
+        verbose_name_plural = "Object Kinds"
+
+    def __str__(self):
+        return f"{self.objectdb_id}: {self.kind}"
+
+
 class PlayerAllowList(SharedMemoryModel):
     """
     Players this account allows to contact them (friends/allowlist).
@@ -656,6 +693,15 @@ class RoomProfile(NaturalKeyMixin, SharedMemoryModel):
         ),
     )
 
+    arrival_features = models.PositiveSmallIntegerField(
+        default=0,
+        help_text=(
+            "ArrivalFeature bitmask: which on-arrival hooks (traps, clue triggers, posted "
+            "NPCs, room-trigger missions) have content here. Maintained by those content "
+            "models on save/delete; Character.at_post_move skips hooks whose bit is clear."
+        ),
+    )
+
     objects = NaturalKeyManager()
 
     class NaturalKeyConfig:
@@ -0,0 +1,68 @@
+"""Hit/miss counters for in-process caches.
+
+Provides :func:`record_cache_lookup`, which counts one lookup against a named
+cache into a Prometheus Counter labelled by cache name and result
+(``hit``/``miss``). A steady miss rate on a cache that should be warm is the
+signal that its key is too fine-grained.
+
+When observability is disabled (the default), recording is a cheap no-op that
+creates and touches no metric object.
+"""
+
+from __future__ import annotations
+
+from prometheus_client import CollectorRegistry, Counter
+
+from evennia_extensions.observability.settings import observability_config
+
+# Module-owned registry — never touches the global default registry.
+_registry: CollectorRegistry = CollectorRegistry()
+_counter: Counter | None = None
+
+CACHE_HIT = "hit"
+CACHE_MISS = "miss"
+
+
+def get_registry() -> CollectorRegistry:
+    """Return the module-owned Prometheus CollectorRegistry.
+
+    Returns:
+        The CollectorRegistry that holds the cache lookup Counter.
+    """
+    return _registry
+
+
+def _get_or_create_counter() -> Counter:
+    """Return the lookup Counter, registering it on first use."""
+    global _counter  # noqa: PLW0603
+    if _counter is None:
+        _counter = Counter(
+            "cache_lookups",
+            "In-process cache lookups by cache and result",
+            ["cache", "result"],
+            registry=_registry,
+        )
+    return _counter
+
+
+def record_cache_lookup(cache: str, *, hit: bool) -> None:
+    """Count one lookup against *cache*.
+
+    Args:
+        cache: Short name of the cache (e.g. ``"command_descriptors"``).
+        hit: Whether the lookup was served from the cache.
+    """
+    if not observability_config().enabled:
+        return
+    _get_or_create_counter().labels(cache=cache, result=CACHE_HIT if hit else CACHE_MISS).inc()
+
+
+def _reset_for_testing() -> None:
+    """Reset module-level registry and counter.
+
+    **For use in tests only.**  Replaces the module-level registry with a fresh
+    instance so each test starts from a clean slate.
+    """
+    global _registry, _counter  # noqa: PLW0603
+    _registry = CollectorRegistry()
+    _counter = None
@@ -0,0 +1,63 @@
+"""Counter for requests refused by the API throttle.
+
+Provides :func:`record_throttled`, which counts one refused request into a
+Prometheus Counter labelled by throttle scope. A scope that throttles steadily
+points at a client stuck in a retry loop, or at a rate set too low.
+
+When observability is disabled (the default), recording is a cheap no-op that
+creates and touches no metric object.
+"""
+
+from __future__ import annotations
+
+from prometheus_client import CollectorRegistry, Counter
+
+from evennia_extensions.observability.settings import observability_config
+
+# Module-owned registry — never touches the global default registry.
+_registry: CollectorRegistry = CollectorRegistry()
+_counter: Counter | None = None
+
+
+def get_registry() -> CollectorRegistry:
+    """Return the module-owned Prometheus CollectorRegistry.
+
+    Returns:
+        The CollectorRegistry that holds the throttled-request Counter.
+    """
+    return _registry
+
+
+def _get_or_create_counter() -> Counter:
+    """Return the throttled-request Counter, registering it on first use."""
+    global _counter  # noqa: PLW0603
+    if _counter is None:
+        _counter = Counter(
+            "api_requests_throttled",
+            "API requests refused by the per-account throttle, by scope",
+            ["scope"],
+            registry=_registry,
+        )
+    return _counter
+
+
+def record_throttled(scope: str) -> None:
+    """Count one request refused under *scope*.
+
+    Args:
+        scope: The throttle scope (e.g. ``"combat_resolve"``).
+    """
+    if not observability_config().enabled:
+        return
+    _get_or_create_counter().labels(scope=scope).inc()
+
+
+def _reset_for_testing() -> None:
+    """Reset module-level registry and counter.
+
+    **For use in tests only.**  Replaces the module-level registry with a fresh
+    instance so each test starts from a clean slate.
+    """
+    global _registry, _counter  # noqa: PLW0603
+    _registry = CollectorRegistry()
+    _counter = None
@@ -0,0 +1,87 @@
+"""Per-room arrival-feature bitmask (``RoomProfile.arrival_features``).
+
+``Character.at_post_move`` used to run every on-arrival hook — mission
+ROOM_TRIGGER dispatch, trap detection, passive clue triggers, guard
+detection — and let each one spend a room-bound query discovering that an
+ordinary room has nothing for it. The bitmask records, per room, which of
+those hooks has content, so the movement path reads one already-loaded
+integer and skips the rest.
+
+The bits are written here, by the content models themselves
+(``ArrivalFeatureContentMixin`` on save/delete), never by callers. Writes that
+bypass ``save()`` — a cascade, a bulk ``update()`` — must call
+:func:`sync_arrival_feature` themselves when they *add* content; when they only
+remove it, the stale-set bit costs the hook its old query and nothing else.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import F
+
+from evennia_extensions.constants import ArrivalFeature
+from evennia_extensions.models import RoomProfile
+
+if TYPE_CHECKING:
+    from evennia.objects.models import ObjectDB
+
+    from evennia_extensions.mixins import ArrivalFeatureContentMixin
+
+_ALL_FEATURES = int(
+    ArrivalFeature.MISSION_TRIGGER
+    | ArrivalFeature.TRAPS
+    | ArrivalFeature.CLUE_TRIGGERS
+    | ArrivalFeature.POSTED_NPC
+)
+
+
+def room_arrival_features(room: ObjectDB | None) -> ArrivalFeature:
+    """The arrival features of ``room``; none for a non-room or a room without a profile.
+
+    Reads the idmapped ``RoomProfile`` — no query once the room's profile is loaded.
+    """
+    try:
+        profile = room.room_profile
+    except (AttributeError, ObjectDoesNotExist):
+        return ArrivalFeature(0)
+    return ArrivalFeature(profile.arrival_features)
+
+
+def sync_arrival_feature(
+    content_model: type[ArrivalFeatureContentMixin], room_profile_id: int | None
+) -> None:
+    """Set or clear ``content_model``'s bit on one room from its current content.
+
+    The bit flip is a single ``UPDATE ... SET arrival_features = arrival_features
+    | bit`` (or ``& ~bit``), so two content writes racing on one room cannot
+    drop each other's bits.
+    """
+    if room_profile_id is None:
+        return
+    feature = int(content_model.arrival_feature)
+    present = content_model.arrival_content(room_profile_id).exists()
+    bits = (
+        F("arrival_features").bitor(feature)
+        if present
+        else F("arrival_features").bitand(_ALL_FEATURES & ~feature)
+    )
+    if not RoomProfile.objects.filter(pk=room_profile_id).update(arrival_features=bits):
+        return
+    _refresh_cached_profile(room_profile_id)
+
+
+def _refresh_cached_profile(room_profile_id: int) -> None:
+    """Pull the new mask into the idmapped instance, if this process holds one.
+
+    Read through ``values_list``: ``refresh_from_db`` would get the cached
+    instance itself back from the idmapper and copy nothing.
+    """
+    cached = RoomProfile.get_cached_instance(room_profile_id)
+    if cached is not None:
+        cached.arrival_features = (
+            RoomProfile.objects.filter(pk=room_profile_id)
+            .values_list("arrival_features", flat=True)
+            .first()
+        ) or 0
@@ -0,0 +1,157 @@
+"""Ranked, typo-tolerant name search over ``ObjectDB.db_key`` for autocomplete.
+
+The search endpoints used to filter with ``db_key__icontains`` — a
+leading-wildcard ``LIKE`` that scans the whole object table on every keystroke.
+On Postgres, :func:`search_by_name` matches a name either as a substring or by
+``pg_trgm`` word similarity (``%>``), both served by the GIN trigram index on
+``upper(db_key)`` (``evennia_extensions/sql/objectdb_name_trgm_forward.sql``).
+The SQLite test tier has no ``pg_trgm``; there the same ranking is computed in
+Python from the same trigram definition.
+
+Search only narrows and orders a queryset. Callers pass one already filtered to
+what the viewer may see (online characters, staff-visible rooms, ...).
+"""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING
+
+from django.db import connection
+from django.db.models import Case, IntegerField, Q, Value, When
+from django.db.models.functions import Upper
+
+if TYPE_CHECKING:
+    from django.db.models import Model, QuerySet
+
+#: Default result cap for autocomplete endpoints.
+NAME_SEARCH_LIMIT = 20
+
+#: Minimum word similarity for a fuzzy-only match. Mirrors Postgres's default
+#: ``pg_trgm.word_similarity_threshold``, which the ``%>`` operator reads.
+WORD_SIMILARITY_THRESHOLD = 0.6
+
+# Match tiers, best first.
+_PREFIX = 0
+_SUBSTRING = 1
+_FUZZY = 2
+
+_WORD_PATTERN = re.compile(r"[^\W_]+", re.UNICODE)
+
+
+def _is_postgres() -> bool:
+    return connection.vendor == "postgresql"  # noqa: STRING_LITERAL
+
+
+def search_by_name[M: Model](
+    queryset: QuerySet[M],
+    term: str,
+    *,
+    field: str = "db_key",
+    limit: int = NAME_SEARCH_LIMIT,
+) -> list[M]:
+    """Rows of ``queryset`` whose ``field`` matches ``term``, best match first.
+
+    Ranking: names starting with ``term``, then names containing it, then names
+    only similar to it (a typo); within a tier, closer similarity first, then
+    alphabetical. An empty ``term`` returns the first ``limit`` rows by name.
+
+    Args:
+        queryset: Rows the caller may show; search never widens it.
+        term: What the user typed.
+        field: Path from the queryset's model to the ``ObjectDB.db_key`` column.
+        limit: Maximum rows returned.
+    """
+    term = term.strip()
+    if not term:
+        return list(queryset.order_by(field)[:limit])
+    if _is_postgres():
+        return _postgres_search(queryset, term, field, limit)
+    return _python_search(queryset, term, field, limit)
+
+
+def _postgres_search[M: Model](queryset: QuerySet[M], term: str, field: str, limit: int) -> list[M]:
+    from django.contrib.postgres.lookups import TrigramWordSimilar  # noqa: PLC0415
+    from django.contrib.postgres.search import TrigramWordSimilarity  # noqa: PLC0415
+
+    # ``alias`` rather than ``annotate`` keeps the rank off the returned
+    # instances, which are idmapped and shared across requests.
+    upper_name = Upper(field)
+    return list(
+        queryset.filter(
+            Q(**{f"{field}__icontains": term}) | Q(TrigramWordSimilar(upper_name, term.upper()))
+        )
+        .alias(
+            _name_tier=Case(
+                When(**{f"{field}__istartswith": term}, then=Value(_PREFIX)),
+                When(**{f"{field}__icontains": term}, then=Value(_SUBSTRING)),
+                default=Value(_FUZZY),
+                output_field=IntegerField(),
+            ),
+            _name_similarity=TrigramWordSimilarity(term, field),
+        )
+        .order_by("_name_tier", "-_name_similarity", field)[:limit]
+    )
+
+
+def _python_search[M: Model](queryset: QuerySet[M], term: str, field: str, limit: int) -> list[M]:
+    ranked = sorted(
+        (rank, pk)
+        for pk, name in queryset.values_list("pk", field)
+        if (rank := name_match_rank(term, name)) is not None
+    )
+    pks = list(dict.fromkeys(pk for _, pk in ranked))[:limit]
+    rows = {row.pk: row for row in queryset.filter(pk__in=pks)}
+    return [rows[pk] for pk in pks if pk in rows]
+
+
+def name_match_rank(term: str, name: str) -> tuple[int, float, str] | None:
+    """Sort key for ``name`` against ``term`` (lower is better), or None for no match.
+
+    The Python counterpart of the Postgres ordering in :func:`search_by_name`.
+    """
+    folded_term = term.casefold()
+    folded_name = name.casefold()
+    similarity = word_similarity(term, name)
+    if folded_name.startswith(folded_term):
+        tier = _PREFIX
+    elif folded_term in folded_name:
+        tier = _SUBSTRING
+    elif similarity >= WORD_SIMILARITY_THRESHOLD:
+        tier = _FUZZY
+    else:
+        return None
+    return tier, -similarity, folded_name
+
+
+def trigrams(text: str) -> set[str]:
+    """The ``pg_trgm`` trigram set of ``text``.
+
+    Each alphanumeric word is lower-cased and padded with two spaces in front
+    and one behind, as ``show_trgm()`` does, so ``"Bob"`` yields
+    ``{"  b", " bo", "bob", "ob "}``.
+    """
+    grams: set[str] = set()
+    for word in _WORD_PATTERN.findall(text.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def word_similarity(term: str, name: str) -> float:
+    """How well ``term`` matches some run of whole words in ``name``, from 0 to 1.
+
+    The share of ``term``'s trigrams found in the best-matching contiguous run
+    of ``name``'s words — a close approximation of ``pg_trgm``'s
+    ``word_similarity(term, name)``, which may also match partial words.
+    """
+    term_grams = trigrams(term)
+    if not term_grams:
+        return 0.0
+    words = _WORD_PATTERN.findall(name)
+    best = 0
+    for start in range(len(words)):
+        for end in range(start + 1, len(words) + 1):
+            shared = len(term_grams & trigrams(" ".join(words[start:end])))
+            best = max(best, shared)
+    return best / len(term_grams)
@@ -0,0 +1,108 @@
+"""Indexed object kinds (``ObjectKindRecord``) and the queries built on them.
+
+"Is this object a room / a GM character / an item?" used to be answered in SQL
+with ``db_typeclass_path__contains``, a substring scan over every object row.
+Each object now carries an indexed :class:`ObjectKind`, written by
+``ObjectParent.at_object_creation`` and ``ObjectParent.swap_typeclass`` through
+:func:`sync_object_kind`. Query with :func:`objects_of_kind`; ask about one
+loaded object with :func:`object_kind`, which never touches the database.
+
+Rows predating the column are filled by ``arx manage backfill_object_kinds``.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from evennia.objects.models import ObjectDB
+from evennia.objects.objects import DefaultCharacter, DefaultExit, DefaultRoom
+
+from evennia_extensions.constants import ObjectKind
+from evennia_extensions.models import ObjectKindRecord
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+
+#: Every kind that is some sort of character.
+CHARACTER_KINDS = frozenset(
+    {
+        ObjectKind.CHARACTER,
+        ObjectKind.GM_CHARACTER,
+        ObjectKind.STAFF_CHARACTER,
+        ObjectKind.COMPANION,
+    }
+)
+
+# Character subclasses with a kind of their own, most specific first.
+_CHARACTER_SUBKINDS: tuple[tuple[str, ObjectKind], ...] = (
+    ("typeclasses.gm_characters.GMCharacter", ObjectKind.GM_CHARACTER),
+    ("typeclasses.gm_characters.StaffCharacter", ObjectKind.STAFF_CHARACTER),
+    ("typeclasses.companions.CompanionObject", ObjectKind.COMPANION),
+)
+
+
+def derive_object_kind(obj: ObjectDB) -> ObjectKind:
+    """The kind ``obj``'s typeclass makes it. Walks the class MRO; no query."""
+    if isinstance(obj, DefaultCharacter):
+        for path, kind in _CHARACTER_SUBKINDS:
+            if obj.is_typeclass(path, exact=False):
+                return kind
+        return ObjectKind.CHARACTER
+    if isinstance(obj, DefaultRoom):
+        return ObjectKind.ROOM
+    if isinstance(obj, DefaultExit):
+        return ObjectKind.EXIT
+    return ObjectKind.ITEM
+
+
+def object_kind(obj: ObjectDB) -> ObjectKind:
+    """``obj``'s kind, from the idmapped record if loaded, else from its typeclass.
+
+    Never queries; the two sources agree because the record is written from
+    the typeclass.
+    """
+    record = ObjectKindRecord.get_cached_instance(obj.pk)
+    if record is not None:
+        return ObjectKind(record.kind)
+    return derive_object_kind(obj)
+
+
+def sync_object_kind(obj: ObjectDB) -> ObjectKind:
+    """Write ``obj``'s current kind to its ``ObjectKindRecord``.
+
+    One upsert for an object without a loaded record; nothing at all when the
+    loaded record is already right.
+    """
+    kind = derive_object_kind(obj)
+    cached = ObjectKindRecord.get_cached_instance(obj.pk)
+    if cached is not None:
+        if cached.kind != kind:
+            cached.kind = kind
+            cached.save(update_fields=["kind"])
+        return kind
+    ObjectKindRecord.objects.bulk_create(
+        [ObjectKindRecord(objectdb_id=obj.pk, kind=kind)],
+        update_conflicts=True,
+        unique_fields=["objectdb"],
+        update_fields=["kind"],
+    )
+    return kind
+
+
+def objects_of_kind(*kinds: ObjectKind) -> QuerySet[ObjectDB]:
+    """Objects whose kind is any of ``kinds`` — an indexed lookup."""
+    return ObjectDB.objects.filter(kind_record__kind__in=kinds)
+
+
+def account_has_gm_character(account) -> bool:
+    """Whether ``account`` owns a GM character.
+
+    Answered from the account's sessions when it is puppeting one of its GM
+    characters (no query), otherwise by one indexed lookup.
+    """
+    if any(
+        puppet.db_account_id == account.pk and object_kind(puppet) == ObjectKind.GM_CHARACTER
+        for puppet in account.get_puppeted_characters()
+    ):
+        return True
+    return objects_of_kind(ObjectKind.GM_CHARACTER).filter(db_account=account).exists()
@@ -0,0 +1,10 @@
+-- Trigram index behind name autocomplete (evennia_extensions.services.name_search).
+--
+-- Django renders ``db_key__icontains`` as ``UPPER("db_key"::text) LIKE UPPER(%s)``,
+-- a leading-wildcard LIKE no btree can serve. A GIN ``gin_trgm_ops`` index on that
+-- same ``upper(db_key)`` expression serves both the substring match and the
+-- typo-tolerant ``%>`` word-similarity match the service ORs with it.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS objectdb_db_key_upper_trgm
+    ON objects_objectdb USING gin (upper(db_key::text) gin_trgm_ops);
@@ -0,0 +1,2 @@
+-- The pg_trgm extension is left installed: other objects may come to depend on it.
+DROP INDEX IF EXISTS objectdb_db_key_upper_trgm;
@@ -0,0 +1,56 @@
+"""Tests for the ranked name search behind the autocomplete endpoints."""
+
+from django.test import SimpleTestCase, TestCase
+
+from evennia_extensions.factories import ObjectDBFactory
+from evennia_extensions.services.name_search import (
+    name_match_rank,
+    search_by_name,
+    trigrams,
+    word_similarity,
+)
+
+
+class TrigramTests(SimpleTestCase):
+    def test_trigrams_match_pg_trgm_padding(self) -> None:
+        self.assertEqual(trigrams("Bob"), {"  b", " bo", "bob", "ob "})
+
+    def test_word_similarity_scores_the_best_word(self) -> None:
+        self.assertEqual(word_similarity("plaza", "Notice Board Plaza"), 1.0)
+        self.assertGreaterEqual(word_similarity("Aleksander", "Sir Alexander"), 0.6)
+        self.assertEqual(word_similarity("zzz", "Bob"), 0.0)
+
+    def test_rank_orders_prefix_then_substring_then_fuzzy(self) -> None:
+        prefix = name_match_rank("ale", "Alexander")
+        substring = name_match_rank("ale", "Dale")
+        fuzzy = name_match_rank("Aleksander", "Alexander")
+        self.assertLess(prefix, substring)
+        self.assertLess(substring, fuzzy)
+        self.assertIsNone(name_match_rank("Bob", "Marguerite"))
+
+
+class SearchByNameTests(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.names = ["Harbor Gate", "Old Harbor", "Harbour Master", "Temple"]
+        for name in self.names:
+            ObjectDBFactory(db_key=name)
+
+    def _search(self, term: str, **kwargs) -> list[str]:
+        from evennia.objects.models import ObjectDB
+
+        queryset = ObjectDB.objects.filter(db_key__in=self.names)
+        return [obj.db_key for obj in search_by_name(queryset, term, **kwargs)]
+
+    def test_ranks_prefix_substring_and_typo_matches(self) -> None:
+        self.assertEqual(self._search("harbor"), ["Harbor Gate", "Old Harbor", "Harbour Master"])
+
+    def test_caps_results(self) -> None:
+        self.assertEqual(self._search("harbor", limit=1), ["Harbor Gate"])
+
+    def test_empty_term_lists_by_name(self) -> None:
+        self.assertEqual(self._search("  ", limit=2), ["Harbor Gate", "Harbour Master"])
+
+    def test_search_never_widens_the_queryset(self) -> None:
+        ObjectDBFactory(db_key="Harbor Annex")
+        self.assertNotIn("Harbor Annex", self._search("harbor"))
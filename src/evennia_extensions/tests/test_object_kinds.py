@@ -0,0 +1,76 @@
+"""Tests for the indexed object kind (ObjectKindRecord) and its maintenance."""
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from evennia.utils.idmapper.models import flush_cache
+
+from evennia_extensions.constants import ObjectKind
+from evennia_extensions.factories import AccountFactory, ObjectDBFactory
+from evennia_extensions.models import ObjectKindRecord
+from evennia_extensions.services.object_kinds import (
+    account_has_gm_character,
+    object_kind,
+    objects_of_kind,
+)
+
+
+def _stored_kind(obj) -> str:
+    return ObjectKindRecord.objects.values_list("kind", flat=True).get(objectdb_id=obj.pk)
+
+
+class ObjectKindMaintenanceTests(TestCase):
+    def test_creation_records_the_kind(self) -> None:
+        expected = {
+            "typeclasses.characters.Character": ObjectKind.CHARACTER,
+            "typeclasses.gm_characters.GMCharacter": ObjectKind.GM_CHARACTER,
+            "typeclasses.gm_characters.StaffCharacter": ObjectKind.STAFF_CHARACTER,
+            "typeclasses.rooms.Room": ObjectKind.ROOM,
+            "typeclasses.exits.Exit": ObjectKind.EXIT,
+            "typeclasses.objects.Object": ObjectKind.ITEM,
+        }
+        for path, kind in expected.items():
+            with self.subTest(path=path):
+                obj = ObjectDBFactory(db_typeclass_path=path)
+                self.assertEqual(_stored_kind(obj), kind)
+
+    def test_swap_typeclass_without_start_hooks_updates_the_kind(self) -> None:
+        obj = ObjectDBFactory(db_typeclass_path="typeclasses.characters.Character")
+
+        obj.swap_typeclass("typeclasses.gm_characters.GMCharacter", run_start_hooks=None)
+
+        self.assertEqual(_stored_kind(obj), ObjectKind.GM_CHARACTER)
+        self.assertEqual(list(objects_of_kind(ObjectKind.GM_CHARACTER)), [obj])
+
+    def test_object_kind_never_queries(self) -> None:
+        room = ObjectDBFactory(db_typeclass_path="typeclasses.rooms.Room")
+        flush_cache()  # Drop the idmapped record; the typeclass still answers.
+        room = type(room).objects.get(pk=room.pk)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(object_kind(room), ObjectKind.ROOM)
+
+    def test_backfill_records_missing_kinds(self) -> None:
+        exit_obj = ObjectDBFactory(db_typeclass_path="typeclasses.exits.Exit")
+        ObjectKindRecord.objects.filter(objectdb_id=exit_obj.pk).delete()
+        flush_cache()
+
+        call_command("backfill_object_kinds", stdout=StringIO())
+
+        self.assertEqual(_stored_kind(exit_obj), ObjectKind.EXIT)
+
+
+class AccountHasGMCharacterTests(TestCase):
+    def test_owned_gm_character(self) -> None:
+        account = AccountFactory()
+        character = ObjectDBFactory(db_typeclass_path="typeclasses.characters.Character")
+        character.db_account = account
+        character.save()
+        self.assertFalse(account_has_gm_character(account))
+
+        gm_character = ObjectDBFactory(db_typeclass_path="typeclasses.gm_characters.GMCharacter")
+        gm_character.db_account = account
+        gm_character.save()
+
+        self.assertTrue(account_has_gm_character(account))
@@ -29,11 +29,17 @@ def at_server_start():
     This is called every time the server starts up, regardless of
     how it was shut down.
     """
+    from actions.pacing import resume_paced_actions
+    from world.combat.tasks import rebuild_round_timers
     from world.game_clock.scripts import ensure_game_tick_script
+    from world.game_clock.task_registry import get_scheduler
     from world.game_clock.tasks import register_all_tasks
 
     register_all_tasks()
     ensure_game_tick_script()
+    get_scheduler().start()
+    rebuild_round_timers()
+    resume_paced_actions()
 
 
 def at_server_stop():
@@ -106,8 +106,18 @@ MIDDLEWARE += [
     "allauth.account.middleware.AccountMiddleware",
     "evennia.web.utils.middleware.SharedLoginMiddleware",
     "django_htmx.middleware.HtmxMiddleware",
+    # Last, so it sees the resolved view; see web/api/query_budget.py.
+    "web.api.query_budget.QueryBudgetMiddleware",
 ]
 
+# Per-view query budgets: "off", "warn" (log the most repeated SQL shapes) or
+# "raise". QUERY_BUDGET_RECORD_PATH, when set, appends every counted request as
+# a JSON line for `arx manage report_query_budgets`.
+QUERY_BUDGET_MODE = env("QUERY_BUDGET_MODE", default="warn" if DEBUG else "off")
+QUERY_BUDGET_RECORD_PATH = env("QUERY_BUDGET_RECORD_PATH", default="")
+# Budget for views that declare none; tests set it through within_query_budget.
+QUERY_BUDGET_DEFAULT: int | None = None
+
 # Enable webclient
 WEBCLIENT_ENABLED = True
 
@@ -118,16 +128,17 @@ WEBSOCKET_PROTOCOL_CLASS = "server.portal.secure_websocket.SecureWebSocketClient
 # Third-party integrations
 ######################################################################
 
-# Cloudinary configuration for media storage
-import cloudinary
-import cloudinary.api
-import cloudinary.uploader
+# Media storage for uploaded images (world/roster/services/media_storage.py):
+# "cloudinary", or "local" to keep files under MEDIA_ROOT (served at MEDIA_URL
+# by Evennia's web server). Local thumbnails need Pillow installed and are
+# generated on MEDIA_THUMBNAIL_WORKERS threads (0 = inline).
+MEDIA_STORAGE_BACKEND = env("MEDIA_STORAGE_BACKEND", default="cloudinary")
+MEDIA_THUMBNAIL_WORKERS = env.int("MEDIA_THUMBNAIL_WORKERS", default=2)
 
-cloudinary.config(
-    cloud_name=env("CLOUDINARY_CLOUD_NAME", default=""),
-    api_key=env("CLOUDINARY_API_KEY", default=""),
-    api_secret=env("CLOUDINARY_API_SECRET", default=""),
-)
+# Cloudinary credentials; the cloudinary backend configures the SDK on first use.
+CLOUDINARY_CLOUD_NAME = env("CLOUDINARY_CLOUD_NAME", default="")
+CLOUDINARY_API_KEY = env("CLOUDINARY_API_KEY", default="")
+CLOUDINARY_API_SECRET = env("CLOUDINARY_API_SECRET", default="")
 
 # Email configuration
 #
@@ -254,6 +265,46 @@ MAX_ESTABLISHED_PERSONAS_PER_SHEET = env.int("MAX_ESTABLISHED_PERSONAS_PER_SHEET
 # bound against a pathological/disconnected-but-still-searched graph.
 TRAVEL_MAX_HOPS = env.int("TRAVEL_MAX_HOPS", default=50)
 
+# Pre-warmed instanced rooms (world.instances.services). The pool cron tops the
+# pool up to the low-water mark; completed rooms are scrubbed and returned to
+# the pool until it holds INSTANCE_ROOM_POOL_MAX, and deleted beyond that.
+INSTANCE_ROOM_POOL_LOW_WATER = env.int("INSTANCE_ROOM_POOL_LOW_WATER", default=5)
+INSTANCE_ROOM_POOL_MAX = env.int("INSTANCE_ROOM_POOL_MAX", default=20)
+
+# Org tasks claimed per transaction by the due-task sweep
+# (world.tasking.services.resolve_due_tasks). Each batch commits as a whole.
+TASK_RESOLUTION_BATCH_SIZE = env.int("TASK_RESOLUTION_BATCH_SIZE", default=50)
+
+# Game clock scheduler (world.game_clock.task_registry): a real-interval task
+# due within this many seconds of a scheduler pass runs in that pass instead
+# of arming its own wake-up. Bounds how early a task can run.
+GAME_CLOCK_SCHEDULER_JITTER_SECONDS = env.int("GAME_CLOCK_SCHEDULER_JITTER_SECONDS", default=5)
+
+# Directory for combat round profiles / replay records
+# (world.combat.round_profiler). Empty disables profiling; when set, every
+# resolve_round records per-phase timings, its RNG seed and declared actions
+# for ``arx manage replay_combat_round``.
+COMBAT_ROUND_REPLAY_DIR = env("COMBAT_ROUND_REPLAY_DIR", default="")
+
+# Persistent technique power evaluations (world.magic.services.
+# technique_power_cache). Entries are keyed by a content hash of each
+# technique and the eval context, so they never go stale and survive restarts;
+# an edit re-prices only the edited technique.
+CACHES = {
+    **CACHES,
+    "technique_power": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": env(
+            "TECHNIQUE_POWER_CACHE_DIR",
+            default=os.path.join(GAME_DIR, "server", "cache", "technique_power"),
+        ),
+        "TIMEOUT": None,
+        "OPTIONS": {"MAX_ENTRIES": 20000},
+    },
+}
+# Worker processes for a cold corpus evaluation (0/1 evaluates in-process).
+TECHNIQUE_POWER_EVAL_WORKERS = env.int("TECHNIQUE_POWER_EVAL_WORKERS", default=4)
+
 # Overworld travel (#1855) — AP cost per IC hour of travel.
 AP_PER_IC_HOUR = env.int("AP_PER_IC_HOUR", default=2)
 # Overworld travel (#1855) — max hubs in a computed route.
@@ -374,6 +425,21 @@ REST_FRAMEWORK = {
     # explicitly `pagination_class = None` to return a bare array. See ADR-0138
     # and web/api/pagination.py.
     "DEFAULT_PAGINATION_CLASS": "web.api.pagination.DefaultPagination",
+    # Only views that name a throttle_scope listed in API_THROTTLE_SCOPES are
+    # throttled; see web/api/throttling.py.
+    "DEFAULT_THROTTLE_CLASSES": [
+        "web.api.throttling.AccountScopedThrottle",
+    ],
+}
+
+# Per-account token buckets for expensive endpoints. ``burst`` is how many
+# requests an account may make back to back; ``sustained`` is the refill rate.
+API_THROTTLE_SCOPES = {
+    "combat_resolve": {"burst": 5, "sustained": "20/min"},
+    "battle_aggregate": {"burst": 20, "sustained": "60/min"},
+    "interaction_feed": {"burst": 30, "sustained": "120/min"},
+    "presence": {"burst": 10, "sustained": "30/min"},
+    "technique_analytics": {"burst": 5, "sustained": "10/min"},
 }
 
 SPECTACULAR_SETTINGS = {
@@ -67,6 +67,11 @@ SCHEMA_CACHE_DIR = Path(__file__).resolve().parents[2] / ".test_schema_cache"
 # (ADR-0195); scopes the matview stand-in scan to models we own.
 FIRST_PARTY_APP_LABEL = "arxii"
 
+# FTS5 shadow of arxii_interaction.content, standing in for the PG tsvector column.
+_INTERACTION_FTS_SQL = (
+    Path(__file__).resolve().parents[2] / "world" / "scenes" / "sql" / "interaction_fts_sqlite.sql"
+)
+
 # How many fingerprint files to keep before pruning the oldest (branch
 # switching produces a handful of live fingerprints; more than this is
 # churn). A fingerprint mismatch is always safe — it just rebuilds and
@@ -317,6 +322,28 @@ def _create_matview_stand_in_tables() -> None:
             editor.create_model(model)
 
 
+def _create_interaction_fts_shadow() -> None:
+    """Create the FTS5 stand-in for Postgres' interaction full-text column.
+
+    On Postgres, ``?q=`` interaction search reads the generated ``content_tsv``
+    column that ``interaction_fulltext_forward.sql`` adds; that SQL never runs
+    here. ``world.scenes.interaction_search`` instead queries an FTS5
+    external-content table kept in sync by triggers. Idempotent, like the
+    matview stand-ins, so it runs after both a build and a restore.
+    """
+    from django.db import connections  # noqa: PLC0415
+
+    connection = connections[DEFAULT_DB_ALIAS]
+    connection.ensure_connection()
+    connection.connection.executescript(_INTERACTION_FTS_SQL.read_text())
+
+
+def _create_sqlite_stand_ins() -> None:
+    """Create every SQLite-tier stand-in for PG-only schema objects."""
+    _create_matview_stand_in_tables()
+    _create_interaction_fts_shadow()
+
+
 class SqliteTestRunner(TimedEvenniaTestRunner):
     """Test runner for the SQLite inner-loop tier.
 
@@ -342,7 +369,7 @@ class SqliteTestRunner(TimedEvenniaTestRunner):
         """
         if os.environ.get("ARX_SCHEMA_CACHE") == "0":
             config = super().setup_databases(**kwargs)
-            _create_matview_stand_in_tables()
+            _create_sqlite_stand_ins()
             return config
         template = SCHEMA_CACHE_DIR / f"schema-{_schema_fingerprint()}.sqlite3"
         if template.exists():
@@ -350,13 +377,13 @@ class SqliteTestRunner(TimedEvenniaTestRunner):
                 print(f"Restoring cached test schema ({template.name}).")
             with _migrate_replaced_by_restore(template):
                 config = super().setup_databases(**kwargs)
-            _create_matview_stand_in_tables()
+            _create_sqlite_stand_ins()
             return config
         old_config = super().setup_databases(**kwargs)
         # Create the stand-ins before dumping so the cached template carries
         # them; the restore path still re-runs the (idempotent) helper to
         # upgrade templates dumped before the stand-ins existed.
-        _create_matview_stand_in_tables()
+        _create_sqlite_stand_ins()
         _dump_sqlite_to_template(DEFAULT_DB_ALIAS, template)
         _prune_schema_cache()
         if self.verbosity >= 1:
@@ -64,11 +64,35 @@ EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
 # the case in fresh test DBs that haven't run Evennia's initial_setup).
 TEST_ENVIRONMENT = True
 
+# Technique power reports: per-process memory instead of the shared on-disk
+# cache (no cross-run leakage), and no spawn pool — workers would connect to
+# the real database, not the test one.
+CACHES["technique_power"] = {  # type: ignore[name-defined]
+    "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    "LOCATION": "technique-power-tests",
+}
+TECHNIQUE_POWER_EVAL_WORKERS = 0
+
+# No API throttling: the bucket store is process-wide and account pks repeat
+# across tests. Throttle tests opt in with override_settings.
+API_THROTTLE_SCOPES: dict[str, dict[str, int | str]] = {}
+
+# No instanced-room pool: completed rooms are deleted as before, so tests that
+# assert teardown see it. Pool tests opt in with override_settings.
+INSTANCE_ROOM_POOL_LOW_WATER = 0
+INSTANCE_ROOM_POOL_MAX = 0
+
+# A view that overruns its declared query budget fails the test that called it.
+QUERY_BUDGET_MODE = "raise"
+QUERY_BUDGET_RECORD_PATH = ""
+
 # Disable external services during tests
 SENDGRID_API_KEY = ""
 CLOUDINARY_CLOUD_NAME = ""
 CLOUDINARY_API_KEY = ""
 CLOUDINARY_API_SECRET = ""
+MEDIA_STORAGE_BACKEND = "cloudinary"
+MEDIA_THUMBNAIL_WORKERS = 0
 
 # These loggers fire ERROR-level messages only from tests that intentionally
 # trigger error paths to verify production behavior. Silencing them at CRITICAL
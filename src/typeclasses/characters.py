@@ -16,6 +16,8 @@ from django.utils.functional import cached_property
 from evennia.objects.objects import DefaultCharacter
 
 from commands.utils import serialize_cmdset
+from evennia_extensions.constants import ArrivalFeature
+from evennia_extensions.services.arrival_features import room_arrival_features
 from flows.constants import EventName
 from flows.emit import emit_event
 from flows.events.payloads import AttackLandedPayload, MovedPayload, MovePreDepartPayload
@@ -537,7 +539,8 @@ class Character(ObjectParent, DefaultCharacter):
             # emitted just above, not through this hardcoded list.
             # Each is wrapped by run_safely (#1164): a failure never breaks the move, but it
             # is captured as a SystemErrorReport and the player is told — not silently
-            # swallowed. The cheap room-bound query in each short-circuits ordinary rooms.
+            # swallowed. The room's arrival-feature bitmask says which of the room-bound
+            # hooks have content here, so an ordinary room skips them without a query.
             from world.clues.services import maybe_grant_clue_triggers
             from world.missions.services.trigger_dispatch import (
                 maybe_dispatch_on_enter,
@@ -551,21 +554,27 @@ class Character(ObjectParent, DefaultCharacter):
             )
             from world.species.services import reconcile_sunlight_exposure
 
-            run_safely(
+            features = room_arrival_features(self.location)
+            self._run_arrival_hook(
+                features,
+                ArrivalFeature.MISSION_TRIGGER,
                 "mission_trigger_on_enter",
                 lambda: maybe_dispatch_on_enter(self, self.location),
-                actor=self,
             )
-            run_safely(
+            self._run_arrival_hook(
+                features,
+                ArrivalFeature.TRAPS,
                 "trap_detection_on_enter",
                 lambda: check_room_traps_on_entry(self, self.location),
-                actor=self,
             )
-            run_safely(
+            self._run_arrival_hook(
+                features,
+                ArrivalFeature.CLUE_TRIGGERS,
                 "clue_trigger_on_enter",
                 lambda: maybe_grant_clue_triggers(self, self.location),
-                actor=self,
             )
+            # Character-bound, not room-bound (the sensitivity lives on the sheet),
+            # so it has no arrival bit.
             run_safely(
                 "sunlight_exposure_on_enter",
                 lambda: reconcile_sunlight_exposure(self, self.location),
@@ -589,10 +598,11 @@ class Character(ObjectParent, DefaultCharacter):
             run_safely("carried_body_on_move", _carried_body_on_move, actor=self)
 
             # Guard detection (#2178) — post-arrival stealth check.
-            run_safely(
+            self._run_arrival_hook(
+                features,
+                ArrivalFeature.POSTED_NPC,
                 "guard_detection_on_enter",
                 lambda: check_guard_detection(self, self.location),
-                actor=self,
             )
 
             # Doorman announcement (#2989) — deterministic arrival echo, no check.
@@ -600,10 +610,11 @@ class Character(ObjectParent, DefaultCharacter):
                 announce_arrival,
             )
 
-            run_safely(
+            self._run_arrival_hook(
+                features,
+                ArrivalFeature.POSTED_NPC,
                 "doorman_announce_on_enter",
                 lambda: announce_arrival(self, self.location),
-                actor=self,
             )
 
             # Cancel any in-progress servant fetch (#2276) — the servant
@@ -618,6 +629,13 @@ class Character(ObjectParent, DefaultCharacter):
                 actor=self,
             )
 
+    def _run_arrival_hook(self, features, feature, name, hook):
+        """``run_safely`` an on-arrival hook, unless the room has no content for it."""
+        from world.player_submissions.services import run_safely
+
+        if features & feature:
+            run_safely(name, hook, actor=self)
+
     def _maybe_justice_room_arrival(self):
         """Max-tier guard pressure on public-room arrival (#2378)."""
         from world.justice.constants import GuardTrigger
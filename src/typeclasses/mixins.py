@@ -41,6 +41,25 @@ class ObjectParent:
     ) -> BaseState:
         return self.state_class(obj=self, context=context)
 
+    def at_object_creation(self: Union[Self, "DefaultObject"]) -> None:
+        """Record the new object's indexed kind (character, room, exit, item, ...)."""
+        from evennia_extensions.services.object_kinds import sync_object_kind
+
+        super().at_object_creation()
+        sync_object_kind(self)
+
+    def swap_typeclass(self: Union[Self, "DefaultObject"], *args, **kwargs):
+        """Swap typeclass, then re-record the object's kind for the new class.
+
+        Evennia only re-runs ``at_object_creation`` for ``run_start_hooks="all"``,
+        so the kind is synced here for every swap.
+        """
+        from evennia_extensions.services.object_kinds import sync_object_kind
+
+        result = super().swap_typeclass(*args, **kwargs)
+        sync_object_kind(self)
+        return result
+
     @cached_property
     def trigger_handler(self: Union[Self, "DefaultObject"]) -> TriggerHandler:
         """Populate-once cache of active triggers for this object."""
@@ -0,0 +1,84 @@
+"""Tests for the per-room arrival-feature bitmask gating at_post_move's hooks."""
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from evennia_extensions.constants import ArrivalFeature
+from evennia_extensions.factories import RoomProfileFactory
+from evennia_extensions.services.arrival_features import room_arrival_features
+from world.clues.factories import ClueTriggerFactory
+from world.clues.models import ClueTrigger
+from world.missions.factories import MissionGiverFactory
+from world.missions.models import MissionGiver
+from world.npc_services.models import NPCAssignment
+from world.room_features.factories import TrapFactory
+from world.room_features.models import Trap
+from world.roster.factories import RosterEntryFactory
+
+_HOOK_TABLES = tuple(
+    model._meta.db_table for model in (Trap, ClueTrigger, MissionGiver, NPCAssignment)
+)
+
+
+class ArrivalFeatureMaintenanceTests(TestCase):
+    """Content models set and clear their own bit on save/delete."""
+
+    def setUp(self) -> None:
+        self.room_profile = RoomProfileFactory()
+        self.room = self.room_profile.objectdb
+
+    def test_plain_room_has_no_features(self) -> None:
+        self.assertEqual(room_arrival_features(self.room), ArrivalFeature(0))
+
+    def test_arming_and_disarming_a_trap_toggles_its_bit(self) -> None:
+        trap = TrapFactory(room_profile=self.room_profile)
+        self.assertEqual(room_arrival_features(self.room), ArrivalFeature.TRAPS)
+
+        trap.is_armed = False
+        trap.save(update_fields=["is_armed"])
+
+        self.assertEqual(room_arrival_features(self.room), ArrivalFeature(0))
+
+    def test_bit_stays_while_other_content_remains(self) -> None:
+        first = ClueTriggerFactory(room_profile=self.room_profile)
+        ClueTriggerFactory(room_profile=self.room_profile)
+
+        first.delete()
+
+        self.assertEqual(room_arrival_features(self.room), ArrivalFeature.CLUE_TRIGGERS)
+
+    def test_features_combine_and_follow_a_moved_row(self) -> None:
+        TrapFactory(room_profile=self.room_profile)
+        giver = MissionGiverFactory(target=self.room)
+        self.assertEqual(
+            room_arrival_features(self.room),
+            ArrivalFeature.TRAPS | ArrivalFeature.MISSION_TRIGGER,
+        )
+
+        other = RoomProfileFactory()
+        giver.target = other.objectdb
+        giver.save()
+
+        self.assertEqual(room_arrival_features(self.room), ArrivalFeature.TRAPS)
+        self.assertEqual(room_arrival_features(other.objectdb), ArrivalFeature.MISSION_TRIGGER)
+
+
+class ArrivalFeatureHookGatingTests(TestCase):
+    """at_post_move skips hooks whose bit is clear."""
+
+    def test_walking_through_plain_rooms_issues_no_hook_queries(self) -> None:
+        character = RosterEntryFactory().character_sheet.character
+        rooms = [RoomProfileFactory().objectdb for _ in range(10)]
+
+        with CaptureQueriesContext(connection) as queries:
+            for room in rooms:
+                character.move_to(room, quiet=True)
+
+        self.assertEqual(character.location, rooms[-1])
+        hook_queries = [
+            query["sql"]
+            for query in queries.captured_queries
+            if any(table in query["sql"] for table in _HOOK_TABLES)
+        ]
+        self.assertEqual(hook_queries, [])
@@ -4,6 +4,7 @@ from unittest.mock import patch
 
 from django.test import TestCase
 
+from evennia_extensions.constants import ArrivalFeature
 from evennia_extensions.factories import CharacterFactory, RoomProfileFactory
 from world.character_sheets.factories import CharacterSheetFactory
 
@@ -11,7 +12,8 @@ from world.character_sheets.factories import CharacterSheetFactory
 class GuardDetectionHookTests(TestCase):
     def test_at_post_move_calls_check_guard_detection(self):
         """at_post_move should call check_guard_detection via run_safely."""
-        room_profile = RoomProfileFactory()
+        # A guard-posted room; the hook is skipped where the bit is clear.
+        room_profile = RoomProfileFactory(arrival_features=ArrivalFeature.POSTED_NPC)
         room = room_profile.objectdb
         char = CharacterFactory(db_key="traveler")
         CharacterSheetFactory(character=char)
@@ -24,7 +26,8 @@ class GuardDetectionHookTests(TestCase):
 
     def test_at_post_move_guard_detection_failure_does_not_break_move(self):
         """If check_guard_detection raises, at_post_move still completes."""
-        room_profile = RoomProfileFactory()
+        # A guard-posted room; the hook is skipped where the bit is clear.
+        room_profile = RoomProfileFactory(arrival_features=ArrivalFeature.POSTED_NPC)
         room = room_profile.objectdb
         char = CharacterFactory(db_key="resilient-traveler")
         CharacterSheetFactory(character=char)
@@ -9,9 +9,12 @@ panel surfaces.
 
 **Two-tier caching.** Evaluating ~270 techniques with DB lookups per cast band is
 too slow to run on every page load or every header-sort click, so the expensive
-step (:func:`_evaluate_corpus`, everything but `sort`) is cached independently of
-`sort` via Django's cache - a sort-only re-render (a GET carrying a new `?sort=`)
-reuses the cached corpus and only re-buckets/re-sorts, which is cheap. The VIEW
+step (:func:`_evaluate_corpus`, everything but `sort`) goes through
+`world.magic.services.technique_power_cache.evaluate_corpus`, which keeps one
+report per technique in the file-backed ``technique_power`` cache keyed by content
+hashes - shared across processes and restarts, and only the techniques an edit
+touched are re-priced. A sort-only re-render (a GET carrying a new `?sort=`)
+therefore only re-hashes, re-buckets and re-sorts. The VIEW
 (`web.admin.tuning.views.tuning_techniques_fragment`) layers its own exact-param
 cache on top of the full `TechniquePanelData` this module returns, mirroring the
 simulation panel's cache-key/last-key-pointer contract - see that view's docstring.
@@ -21,9 +24,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from django.core.cache import cache
-
-from world.magic.services import technique_power_eval
+from world.magic.services import technique_power_cache
 from world.magic.types.technique_power import (
     EvalContext,
     ReferenceFrame,
@@ -51,10 +52,6 @@ _ROLLER_POINTS_DEFAULT = 25
 _TARGET_DIFFICULTY_DEFAULT = 25
 _ROLL_MODIFIER_DEFAULT = 0
 
-#: 24h - matches `_SIMULATION_CACHE_TIMEOUT` in `web.admin.tuning.views`; a
-#: catalog-wide evaluation run should outlive a single admin session.
-_CORPUS_CACHE_TIMEOUT = 60 * 60 * 24
-
 
 def resolve_sort_key(sort: str) -> str:
     """Whitelist-or-fallback for a `sort` value (query param or form input)."""
@@ -105,28 +102,15 @@ class TechniquePanelData:
     reference: ReferenceFrame
 
 
-def _corpus_cache_key(params: TechniqueAnalyticsParams) -> str:
-    """Cache key for the expensive evaluator run - deliberately excludes `sort`."""
-    return (
-        f"tuning-tech-power-corpus:{params.level}:{params.thread_level}:"
-        f"{params.roller_points}:{params.target_difficulty}:{params.roll_modifier}"
-    )
-
-
 def _evaluate_corpus(
     params: TechniqueAnalyticsParams,
 ) -> tuple[list[TechniquePowerReport], ReferenceFrame]:
-    """Run (or reuse a cached) `evaluate_all_with_reference` for *params* (#3279).
+    """Price the whole catalog for *params*, reusing every still-valid cached report (#3279).
 
-    Called via the module object (`technique_power_eval.evaluate_all_with_reference`,
-    never a bare `from ... import`) so tests can patch it at its origin and still
+    Called via the module object (`technique_power_cache.evaluate_corpus`, never a
+    bare `from ... import`) so tests can patch it at its origin and still
     intercept this call.
     """
-    key = _corpus_cache_key(params)
-    cached = cache.get(key)
-    if cached is not None:
-        return cached
-
     context = EvalContext(
         level=params.level,
         thread_level=params.thread_level,
@@ -134,9 +118,7 @@ def _evaluate_corpus(
         target_difficulty=params.target_difficulty,
         roll_modifier=params.roll_modifier,
     )
-    result = technique_power_eval.evaluate_all_with_reference(context)
-    cache.set(key, result, _CORPUS_CACHE_TIMEOUT)
-    return result
+    return technique_power_cache.evaluate_corpus(context)
 
 
 def _is_zero_value(report: TechniquePowerReport) -> bool:
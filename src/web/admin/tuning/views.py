@@ -31,6 +31,7 @@ from web.admin.tuning import technique_analytics
 from web.admin.tuning.checks_analytics import compute_chart_distributions, compute_matchup
 from web.admin.tuning.condition_analytics import compute_condition_danger
 from web.admin.tuning.consequence_analytics import inspect_pool, list_pools
+from web.api.throttling import throttled_view
 from world.combat import simulation
 from world.combat.constants import OpponentTier, RiskLevel
 from world.combat.simulation import SimulationParams, SimulationReport
@@ -321,6 +322,7 @@ def _cache_technique_panel(
 
 
 @superuser_required
+@throttled_view("technique_analytics")
 def tuning_techniques_fragment(request: HttpRequest) -> HttpResponse:
     """Techniques combat-power panel: league table of every technique's DE (#3279 Task 3).
 
@@ -7,10 +7,20 @@ without creating import dependencies on domain-specific modules like typeclasses
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from collections.abc import Hashable
+import hashlib
+import time
+from typing import TYPE_CHECKING, Any
 
+from django.utils.http import parse_etags
 from evennia.objects.models import ObjectDB
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.permissions import SAFE_METHODS
 from rest_framework.request import Request
+from rest_framework.response import Response
+
+from web.api.revisions import bump_revision, revision_epoch
 
 if TYPE_CHECKING:
     from typeclasses.characters import Character
@@ -83,3 +93,128 @@ class CharacterContextMixin:
             return ObjectDB.objects.get(id=character_id)
         except ObjectDB.DoesNotExist:
             return None
+
+
+# Detail routes in this codebase all use DRF's default ``pk`` lookup.
+REVISION_LOOKUP_KWARG = "pk"
+
+
+class _NotModified(APIException):
+    """Raised from ``initial()`` to short-circuit a matching conditional GET."""
+
+    status_code = status.HTTP_304_NOT_MODIFIED
+
+
+def _normalize_etag(etag: str) -> str:
+    """Strip the weak-validator prefix; If-None-Match uses weak comparison (RFC 9110)."""
+    return etag.removeprefix("W/")
+
+
+class ConditionalGetMixin:
+    """
+    ``ETag`` / ``If-None-Match`` support for heavy read endpoints.
+
+    A view declares what its payload depends on by overriding
+    :meth:`get_version_parts` — cheap values such as a
+    :mod:`web.api.revisions` counter, an ``updated_at`` aggregate, or a row
+    count. The mixin hashes those parts together with the viewer, the full
+    request path, and the process epoch into an ``ETag``. When the client's
+    ``If-None-Match`` carries the same token, the request answers ``304 Not
+    Modified`` straight after authentication and permission checks, before the
+    handler builds (and queries for) its payload.
+
+    Browsers revalidate automatically once a response carries an ``ETag`` and
+    ``Cache-Control: no-cache``, so polling clients need no changes to
+    benefit.
+
+    Attributes:
+        etag_max_age: Optional staleness bound in seconds. When set, the
+            token also rolls over on this cadence, so a change the declared
+            parts don't track is still picked up within one window.
+        revision_scope: Optional :mod:`web.api.revisions` scope. Successful
+            unsafe requests against a detail route of this view bump
+            ``(revision_scope, pk)``, so writes made through the view itself
+            invalidate its ETags without each action remembering to.
+
+    Why this lives here:
+        - One implementation of the validator semantics (weak comparison,
+          ``*``, header shape) instead of one per endpoint
+        - Runs as part of DRF's ``initial()`` so auth and permission checks
+          still happen before a 304 can be returned
+    """
+
+    etag_max_age: int | None = None
+    revision_scope: str | None = None
+
+    _etag: str | None = None
+
+    def get_version_parts(self) -> tuple[Hashable, ...] | None:
+        """
+        Return the values the current response depends on.
+
+        Returning ``None`` (the default) opts the current request out of
+        conditional handling — e.g. for actions other than ``retrieve``.
+        """
+        return None
+
+    def verify_not_modified(self) -> None:
+        """
+        Re-check access just before answering 304.
+
+        Only runs when the client's token matched, so per-object gates that
+        ``get_object`` would apply (blocks, visibility) cost nothing on the
+        rebuild path, where ``get_object`` applies them anyway. Raise
+        ``Http404``/``PermissionDenied`` to refuse.
+        """
+
+    def _compute_etag(self, request: Request, parts: tuple[Hashable, ...]) -> str:
+        viewer_id = request.user.pk if request.user.is_authenticated else None
+        window = int(time.time() // self.etag_max_age) if self.etag_max_age else None
+        material = repr((revision_epoch(), viewer_id, request.get_full_path(), window, parts))
+        digest = hashlib.blake2b(material.encode(), digest_size=16).hexdigest()
+        return f'"{digest}"'
+
+    def initial(self, request: Request, *args: Any, **kwargs: Any) -> None:
+        """Run DRF's auth/permission checks, then answer 304 if the client is current."""
+        super().initial(request, *args, **kwargs)  # type: ignore[misc]
+        self._etag = None
+        if request.method not in ("GET", "HEAD"):
+            return
+        parts = self.get_version_parts()
+        if parts is None:
+            return
+        self._etag = self._compute_etag(request, parts)
+        if_none_match = request.headers.get("If-None-Match")
+        if not if_none_match:
+            return
+        client_etags = {_normalize_etag(etag) for etag in parse_etags(if_none_match)}
+        if "*" in client_etags or self._etag in client_etags:
+            self.verify_not_modified()
+            raise _NotModified
+
+    def handle_exception(self, exc: Exception) -> Response:
+        """Turn the internal not-modified signal into a bodiless 304."""
+        if isinstance(exc, _NotModified):
+            return Response(status=status.HTTP_304_NOT_MODIFIED)
+        return super().handle_exception(exc)  # type: ignore[misc]
+
+    def finalize_response(
+        self, request: Request, response: Response, *args: Any, **kwargs: Any
+    ) -> Response:
+        """Attach validator headers to conditional responses; bump on successful writes."""
+        response = super().finalize_response(request, response, *args, **kwargs)  # type: ignore[misc]
+        if self._etag is not None and response.status_code in (
+            status.HTTP_200_OK,
+            status.HTTP_304_NOT_MODIFIED,
+        ):
+            response["ETag"] = self._etag
+            response["Cache-Control"] = "private, no-cache"
+        elif (
+            self.revision_scope is not None
+            and request.method not in SAFE_METHODS
+            and status.is_success(response.status_code)
+        ):
+            lookup = self.kwargs.get(REVISION_LOOKUP_KWARG)  # type: ignore[attr-defined]
+            if lookup is not None:
+                bump_revision(self.revision_scope, int(lookup))
+        return response
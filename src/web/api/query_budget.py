@@ -0,0 +1,242 @@
+"""Per-view query budgets, enforced per request.
+
+Almost every hot endpoint was tuned by hand against N+1 queries
+(``select_related``/``prefetch_related``, ``Prefetch(to_attr=...)`` — see
+``evennia_extensions/CACHED_PROPERTY_STANDARD.md``). A budget pins that work
+down: a view declares the most queries one request may issue, and
+:class:`QueryBudgetMiddleware` counts them through
+``connection.execute_wrapper``.
+
+Declare a budget with :func:`query_budget` on a function view, an ``APIView``
+/ ``ViewSet`` class, or one viewset action method (the action's budget wins
+over its class's). A test can hold every request it makes to a budget of its
+own with :func:`within_query_budget`. What happens on overrun follows
+``settings.QUERY_BUDGET_MODE``:
+
+* ``"off"`` — nothing is counted (production default).
+* ``"warn"`` — log a warning naming the most repeated SQL shapes, which is
+  where an N+1 shows up (development default).
+* ``"raise"`` — raise :class:`QueryBudgetExceeded`, failing the test that
+  made the request (test default).
+
+When ``settings.QUERY_BUDGET_RECORD_PATH`` is set, every counted request is
+appended there as one JSON line, budgeted or not; ``arx manage
+report_query_budgets`` ranks the views of such a recorded session.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+import json
+import logging
+from pathlib import Path
+import re
+import threading
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from django.conf import settings
+from django.db import connection
+from django.http import HttpRequest, HttpResponse
+
+if TYPE_CHECKING:
+    from django.test.utils import override_settings
+
+logger = logging.getLogger(__name__)
+
+QUERY_BUDGET_OFF = "off"
+QUERY_BUDGET_WARN = "warn"
+QUERY_BUDGET_RAISE = "raise"
+
+# How many distinct SQL shapes a report or warning names.
+TOP_SHAPES = 3
+
+_NUMBER = re.compile(r"\b\d+\b")
+_QUOTED = re.compile(r"'(?:[^']|'')*'")
+_PLACEHOLDER_LIST = re.compile(r"\((?:\s*%s\s*,)+\s*%s\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+_ViewT = TypeVar("_ViewT", bound=Callable[..., Any])
+
+_record_lock = threading.Lock()
+
+# Request attribute carrying ``view_budget()`` from process_view to __call__.
+_VIEW_ATTR = "_query_budget_view"
+
+
+class QueryBudgetExceeded(AssertionError):
+    """A request issued more queries than its view's budget (``"raise"`` mode)."""
+
+
+def query_budget(limit: int) -> Callable[[_ViewT], _ViewT]:
+    """Declare the most queries one request to the decorated view may issue."""
+
+    def decorator(view: _ViewT) -> _ViewT:
+        view.query_budget = limit  # ty: ignore[unresolved-attribute]
+        return view
+
+    return decorator
+
+
+def sql_shape(sql: str) -> str:
+    """``sql`` with its literals and ``IN`` list lengths erased.
+
+    Two queries with the same shape differ only in their parameters — the
+    signature of a query issued once per row.
+    """
+    shape = _QUOTED.sub("?", sql)
+    shape = _NUMBER.sub("?", shape)
+    shape = _PLACEHOLDER_LIST.sub("(...)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+@dataclass
+class RequestQueryReport:
+    """What one request spent against its view's budget."""
+
+    view: str
+    method: str
+    path: str
+    budget: int | None
+    queries: int = 0
+    repeated_shapes: list[tuple[str, int]] = field(default_factory=list)
+
+    @property
+    def over_budget(self) -> bool:
+        return self.budget is not None and self.queries > self.budget
+
+    def describe(self) -> str:
+        lines = [
+            f"{self.method} {self.path} ({self.view}) issued {self.queries} queries; "
+            f"budget is {self.budget}."
+        ]
+        lines.extend(f"  {count}x {shape}" for shape, count in self.repeated_shapes)
+        return "\n".join(lines)
+
+
+class QueryCounter:
+    """``connection.execute_wrapper`` callable counting queries by shape."""
+
+    def __init__(self) -> None:
+        self.shapes: Counter[str] = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        self.shapes[sql_shape(sql)] += 1
+        return execute(sql, params, many, context)
+
+    @property
+    def total(self) -> int:
+        return sum(self.shapes.values())
+
+    def repeated(self, top: int = TOP_SHAPES) -> list[tuple[str, int]]:
+        """The ``top`` most frequent shapes issued more than once."""
+        return [(shape, count) for shape, count in self.shapes.most_common(top) if count > 1]
+
+
+def view_budget(view_func: Callable[..., Any], method: str) -> tuple[str, int | None]:
+    """The dotted name and declared budget of the view serving ``method``.
+
+    DRF's ``as_view()`` functions carry the view class (``cls``) and, for
+    viewsets, the HTTP-method-to-action map (``actions``).
+    """
+    view_class = getattr(view_func, "cls", None)
+    if view_class is None:
+        name = f"{view_func.__module__}.{view_func.__qualname__}"
+        return name, getattr(view_func, "query_budget", None)
+    name = f"{view_class.__module__}.{view_class.__qualname__}"
+    action = (getattr(view_func, "actions", None) or {}).get(method.lower())
+    if action is not None:
+        name = f"{name}.{action}"
+        handler_budget = getattr(getattr(view_class, action, None), "query_budget", None)
+        if handler_budget is not None:
+            return name, handler_budget
+    return name, getattr(view_class, "query_budget", None)
+
+
+class QueryBudgetMiddleware:
+    """Count each request's queries and hold them to the view's declared budget.
+
+    Goes last in ``MIDDLEWARE`` so ``process_view`` sees the resolved view; the
+    count covers everything inside it, response rendering included.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        mode = settings.QUERY_BUDGET_MODE
+        if mode == QUERY_BUDGET_OFF:
+            return self.get_response(request)
+        counter = QueryCounter()
+        with connection.execute_wrapper(counter):
+            response = self.get_response(request)
+        resolved = getattr(request, _VIEW_ATTR, None)
+        if resolved is None:
+            return response  # No view ran (404, redirect from earlier middleware).
+        name, declared = resolved
+        budget = _effective_budget(declared)
+        report = RequestQueryReport(
+            view=name,
+            method=request.method or "",
+            path=request.path,
+            budget=budget,
+            queries=counter.total,
+            repeated_shapes=counter.repeated(),
+        )
+        _record(report)
+        if report.over_budget:
+            if mode == QUERY_BUDGET_RAISE:
+                raise QueryBudgetExceeded(report.describe())
+            logger.warning("Query budget exceeded: %s", report.describe())
+        return response
+
+    def process_view(
+        self,
+        request: HttpRequest,
+        view_func: Callable[..., Any],
+        _view_args: tuple[Any, ...],
+        _view_kwargs: dict[str, Any],
+    ) -> None:
+        setattr(request, _VIEW_ATTR, view_budget(view_func, request.method or ""))
+
+
+def _effective_budget(declared: int | None) -> int | None:
+    """The tighter of the view's budget and a test's ``within_query_budget``."""
+    imposed = settings.QUERY_BUDGET_DEFAULT
+    if declared is None or imposed is None:
+        return imposed if declared is None else declared
+    return min(declared, imposed)
+
+
+def within_query_budget(limit: int) -> override_settings:
+    """Test decorator: fail if any request the test makes issues over ``limit`` queries.
+
+    Applies to views with no budget of their own, and tightens those that have one.
+    Usable on a test method or a whole ``TestCase`` class.
+    """
+    from django.test.utils import override_settings  # noqa: PLC0415
+
+    return override_settings(QUERY_BUDGET_MODE=QUERY_BUDGET_RAISE, QUERY_BUDGET_DEFAULT=limit)
+
+
+def _record(report: RequestQueryReport) -> None:
+    path = settings.QUERY_BUDGET_RECORD_PATH
+    if not path:
+        return
+    line = json.dumps(asdict(report))
+    with _record_lock, Path(path).open("a", encoding="utf-8") as handle:
+        handle.write(line + "\n")
+
+
+def load_recorded_session(path: Path) -> list[RequestQueryReport]:
+    """Read the reports a ``QUERY_BUDGET_RECORD_PATH`` session appended."""
+    reports = []
+    with path.open(encoding="utf-8") as handle:
+        for raw in handle:
+            if not raw.strip():
+                continue
+            row = json.loads(raw)
+            row["repeated_shapes"] = [tuple(pair) for pair in row["repeated_shapes"]]
+            reports.append(RequestQueryReport(**row))
+    return reports
@@ -0,0 +1,88 @@
+"""Process-local revision counters for cheap API version tokens.
+
+A revision is a monotonically increasing integer per ``(scope, key)`` pair —
+e.g. ``("character_sheet", 42)``. Writers bump it explicitly (this codebase
+has no Django signals, ADR-0009); readers fold the current value into an
+``ETag`` so an unchanged resource can answer ``304 Not Modified`` without
+rebuilding its payload (see :class:`web.api.mixins.ConditionalGetMixin`).
+
+Counters live in memory: Evennia serves the API from the single Server
+process, so one dict is the whole truth. They reset on restart, which is why
+:func:`revision_epoch` is folded into every token — a token minted before a
+reload can never collide with a post-reload counter that happens to have
+climbed back to the same number.
+
+Bumps are deferred with ``transaction.on_commit``: bumping before commit
+would let a concurrent reader pair the new counter with the old rows and hand
+the client a token that then matches forever.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable
+import threading
+import uuid
+
+from django.db import transaction
+
+# Scopes shared by writers and the views that read them. Module-level
+# constants rather than literals so a typo is an ImportError, not a silent
+# never-invalidated ETag.
+CHARACTER_SHEET_SCOPE = "character_sheet"
+BATTLE_SCOPE = "battle"
+
+_lock = threading.Lock()
+_revisions: dict[tuple[str, Hashable], int] = {}
+_epoch: str = uuid.uuid4().hex
+
+
+def revision_epoch() -> str:
+    """Return the per-process nonce that distinguishes counters across restarts."""
+    return _epoch
+
+
+def get_revision(scope: str, key: Hashable = None) -> int:
+    """Return the current revision for ``(scope, key)``; ``0`` if never bumped."""
+    return _revisions.get((scope, key), 0)
+
+
+def _increment(scope: str, key: Hashable) -> int:
+    with _lock:
+        revision = _revisions.get((scope, key), 0) + 1
+        _revisions[(scope, key)] = revision
+    return revision
+
+
+def advance_revision(scope: str, key: Hashable = None) -> int:
+    """Bump ``(scope, key)`` immediately and return the new revision.
+
+    For callers that already run post-commit (an ``on_commit`` callback) and
+    need the new number in hand, e.g. to stamp a pushed snapshot. Everyone
+    else wants :func:`bump_revision`.
+    """
+    return _increment(scope, key)
+
+
+def bump_revision(scope: str, key: Hashable = None) -> None:
+    """Mark ``(scope, key)`` as changed once the current transaction commits.
+
+    Outside a transaction the bump is immediate. A rolled-back transaction
+    never bumps, so a failed write can't churn every client's cache.
+
+    Args:
+        scope: One of the ``*_SCOPE`` constants in this module.
+        key: Identifies the resource within the scope (usually a pk);
+            ``None`` for scope-wide revisions such as authored content.
+    """
+    transaction.on_commit(lambda: _increment(scope, key))
+
+
+def _reset_for_testing() -> None:
+    """Drop every counter and mint a fresh epoch.
+
+    **For use in tests only.**
+    """
+    global _epoch  # noqa: PLW0603
+    with _lock:
+        _revisions.clear()
+    _epoch = uuid.uuid4().hex
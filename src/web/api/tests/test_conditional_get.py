@@ -0,0 +1,104 @@
+"""Tests for ConditionalGetMixin and the revision counters behind it."""
+
+from django.test import TestCase
+from rest_framework.permissions import AllowAny
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, force_authenticate
+from rest_framework.views import APIView
+
+from evennia_extensions.factories import AccountFactory
+from web.api import revisions
+from web.api.mixins import ConditionalGetMixin
+
+
+class _VersionedView(ConditionalGetMixin, APIView):
+    """Minimal view whose payload depends on one class-level counter."""
+
+    permission_classes = [AllowAny]
+    version = 1
+    builds = 0
+
+    def get_version_parts(self) -> tuple[int]:
+        return (type(self).version,)
+
+    def get(self, _request: Request) -> Response:
+        type(self).builds += 1
+        return Response({"version": type(self).version})
+
+
+class ConditionalGetMixinTests(TestCase):
+    """ETag issue, 304 short-circuit, and invalidation."""
+
+    def setUp(self) -> None:
+        self.factory = APIRequestFactory()
+        self.view = _VersionedView.as_view()
+        _VersionedView.version = 1
+        _VersionedView.builds = 0
+
+    def _get(self, etag: str | None = None) -> Response:
+        headers = {"HTTP_IF_NONE_MATCH": etag} if etag else {}
+        return self.view(self.factory.get("/versioned/", **headers))
+
+    def test_first_response_carries_etag_and_no_cache(self) -> None:
+        response = self._get()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["ETag"].startswith('"'))
+        self.assertEqual(response["Cache-Control"], "private, no-cache")
+
+    def test_matching_etag_returns_304_without_building_payload(self) -> None:
+        etag = self._get()["ETag"]
+
+        response = self._get(etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(_VersionedView.builds, 1)
+
+    def test_weak_validator_from_client_still_matches(self) -> None:
+        etag = self._get()["ETag"]
+
+        response = self._get(f"W/{etag}")
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_changed_version_part_rebuilds(self) -> None:
+        etag = self._get()["ETag"]
+        _VersionedView.version = 2
+
+        response = self._get(etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(_VersionedView.builds, 2)
+
+    def test_etag_is_per_viewer(self) -> None:
+        first = self.factory.get("/versioned/")
+        second = self.factory.get("/versioned/")
+        force_authenticate(first, user=AccountFactory(username="etag_viewer_a"))
+        force_authenticate(second, user=AccountFactory(username="etag_viewer_b"))
+
+        self.assertNotEqual(self.view(first)["ETag"], self.view(second)["ETag"])
+
+
+class RevisionCounterTests(TestCase):
+    """bump_revision defers to commit and survives only within the process epoch."""
+
+    def setUp(self) -> None:
+        revisions._reset_for_testing()
+
+    def test_bump_applies_on_commit(self) -> None:
+        with self.captureOnCommitCallbacks(execute=True):
+            revisions.bump_revision(revisions.CHARACTER_SHEET_SCOPE, 7)
+            self.assertEqual(revisions.get_revision(revisions.CHARACTER_SHEET_SCOPE, 7), 0)
+
+        self.assertEqual(revisions.get_revision(revisions.CHARACTER_SHEET_SCOPE, 7), 1)
+        self.assertEqual(revisions.get_revision(revisions.CHARACTER_SHEET_SCOPE, 8), 0)
+
+    def test_reset_mints_new_epoch(self) -> None:
+        before = revisions.revision_epoch()
+
+        revisions._reset_for_testing()
+
+        self.assertNotEqual(revisions.revision_epoch(), before)
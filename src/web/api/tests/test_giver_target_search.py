@@ -98,3 +98,20 @@ class MissionGiverTargetSearchAPIViewTests(TestCase):
     def test_id_lookup_non_numeric_id_400(self) -> None:
         resp = self.client.get(self.URL, {"kind": "room_trigger", "id": "abc"})
         self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_room_search_tolerates_a_typo(self) -> None:
+        resp = self.client.get(self.URL, {"kind": "room_trigger", "search": "Notise Board"})
+        self.assertEqual([row["id"] for row in resp.json()], [self.room.pk])
+
+    def test_room_search_ranks_prefix_before_substring(self) -> None:
+        inner = ObjectDBFactory(db_key="Inner Plaza", db_typeclass_path="typeclasses.rooms.Room")
+        RoomProfile.objects.get_or_create(objectdb=inner)
+        plaza = ObjectDBFactory(db_key="Plaza Steps", db_typeclass_path="typeclasses.rooms.Room")
+        RoomProfile.objects.get_or_create(objectdb=plaza)
+
+        resp = self.client.get(self.URL, {"kind": "room_trigger", "search": "plaza"})
+
+        self.assertEqual(
+            [row["name"] for row in resp.json()],
+            ["Plaza Steps", "Inner Plaza", "Notice Board Plaza"],
+        )
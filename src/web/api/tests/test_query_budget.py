@@ -0,0 +1,71 @@
+"""Tests for per-view query budgets and the session report."""
+
+from io import StringIO
+from pathlib import Path
+import tempfile
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from evennia_extensions.factories import AccountFactory
+from web.api.query_budget import (
+    QueryBudgetExceeded,
+    load_recorded_session,
+    sql_shape,
+    view_budget,
+    within_query_budget,
+)
+from world.areas.views import PresenceView
+
+
+class SqlShapeTests(SimpleTestCase):
+    def test_erases_literals_and_in_list_length(self) -> None:
+        self.assertEqual(
+            sql_shape('SELECT *  FROM "t" WHERE "id" IN (%s, %s, %s) AND "k" = \'a\' LIMIT 21'),
+            'SELECT * FROM "t" WHERE "id" IN (...) AND "k" = ? LIMIT ?',
+        )
+        self.assertEqual(
+            sql_shape('SELECT * FROM "t" WHERE "id" IN (%s, %s)'),
+            sql_shape('SELECT * FROM "t" WHERE "id" IN (%s, %s, %s, %s)'),
+        )
+
+
+class ViewBudgetTests(SimpleTestCase):
+    def test_reads_class_budget_and_names_the_view(self) -> None:
+        name, budget = view_budget(PresenceView.as_view(), "GET")
+        self.assertEqual(name, "world.areas.views.PresenceView")
+        self.assertEqual(budget, PresenceView.query_budget)
+
+
+class QueryBudgetMiddlewareTests(TestCase):
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.client.force_authenticate(AccountFactory())
+        self.url = reverse("areas:presence")
+
+    @within_query_budget(0)
+    def test_overrun_fails_the_test(self) -> None:
+        with self.assertRaisesMessage(QueryBudgetExceeded, "budget is 0."):
+            self.client.get(reverse("areas:area-list"))
+
+    def test_declared_budget_holds(self) -> None:
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+
+    def test_recorded_session_report(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "session.jsonl"
+            with override_settings(QUERY_BUDGET_RECORD_PATH=str(path)):
+                self.client.get(self.url)
+                self.client.get(self.url)
+
+            reports = load_recorded_session(path)
+            out = StringIO()
+            call_command("report_query_budgets", str(path), stdout=out)
+
+        self.assertEqual(len(reports), 2)
+        self.assertEqual(reports[0].view, "world.areas.views.PresenceView")
+        self.assertIn("2 requests over 1 views", out.getvalue())
+        self.assertIn("world.areas.views.PresenceView: 2 requests", out.getvalue())
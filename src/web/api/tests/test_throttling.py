@@ -0,0 +1,97 @@
+"""Tests for the per-account token-bucket API throttle."""
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from evennia_extensions.factories import AccountFactory
+from evennia_extensions.observability import throttle_metrics
+from web.api import throttling
+from web.api.throttling import BucketRate, TokenBucketStore, parse_scope_rate
+
+_PRESENCE_SCOPES = {"presence": {"burst": 2, "sustained": "6/min"}}
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TokenBucketStoreTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.clock = _FakeClock()
+        self.store = TokenBucketStore(clock=self.clock)
+        self.rate = BucketRate(burst=2, per_second=0.5)
+
+    def test_burst_then_wait_for_refill(self) -> None:
+        self.assertEqual(self.store.consume("s", "a", self.rate), 0)
+        self.assertEqual(self.store.consume("s", "a", self.rate), 0)
+        self.assertEqual(self.store.consume("s", "a", self.rate), 2.0)
+
+        self.clock.now += 2.0
+
+        self.assertEqual(self.store.consume("s", "a", self.rate), 0)
+
+    def test_buckets_are_per_ident_and_scope(self) -> None:
+        for _ in range(2):
+            self.store.consume("s", "a", self.rate)
+
+        self.assertEqual(self.store.consume("s", "b", self.rate), 0)
+        self.assertEqual(self.store.consume("t", "a", self.rate), 0)
+
+    def test_parse_scope_rate(self) -> None:
+        self.assertEqual(
+            parse_scope_rate({"burst": 3, "sustained": "30/min"}),
+            BucketRate(burst=3, per_second=0.5),
+        )
+
+
+@override_settings(API_THROTTLE_SCOPES=_PRESENCE_SCOPES, OBSERVABILITY_ENABLED=True)
+class AccountScopedThrottleTests(TestCase):
+    """The presence endpoint (``throttle_scope = "presence"``) under a tiny bucket."""
+
+    def setUp(self) -> None:
+        throttling._reset_for_testing()
+        throttle_metrics._reset_for_testing()
+        self.url = reverse("areas:presence")
+        self.client = APIClient()
+
+    def tearDown(self) -> None:
+        throttling._reset_for_testing()
+
+    def _get_as(self, account) -> int:
+        self.client.force_authenticate(account)
+        return self.client.get(self.url)
+
+    def test_refuses_past_burst_with_retry_after(self) -> None:
+        account = AccountFactory()
+        self.assertEqual(self._get_as(account).status_code, status.HTTP_200_OK)
+        self.assertEqual(self._get_as(account).status_code, status.HTTP_200_OK)
+
+        response = self._get_as(account)
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(response["Retry-After"], "10")
+        self.assertEqual(
+            throttle_metrics.get_registry().get_sample_value(
+                "api_requests_throttled_total", {"scope": "presence"}
+            ),
+            1.0,
+        )
+
+    def test_accounts_do_not_share_a_bucket(self) -> None:
+        first, second = AccountFactory(), AccountFactory()
+        for _ in range(3):
+            self._get_as(first)
+
+        self.assertEqual(self._get_as(second).status_code, status.HTTP_200_OK)
+
+    @override_settings(API_THROTTLE_SCOPES={})
+    def test_unconfigured_scope_is_not_throttled(self) -> None:
+        account = AccountFactory()
+        statuses = {self._get_as(account).status_code for _ in range(5)}
+        self.assertEqual(statuses, {status.HTTP_200_OK})
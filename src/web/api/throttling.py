@@ -0,0 +1,200 @@
+"""Per-account request throttling for expensive API endpoints.
+
+A view opts in by naming a scope — ``throttle_scope = "interaction_feed"`` on
+the class, or ``@action(..., throttle_scope="combat_resolve")`` for one action.
+``settings.API_THROTTLE_SCOPES`` maps each scope to a token bucket: ``burst``
+is the bucket size (how many requests may arrive back to back) and
+``sustained`` the refill rate in DRF's ``"<count>/<period>"`` notation. Views
+without a scope, and scopes missing from the setting, are never throttled.
+
+Buckets are keyed by account, so players sharing an address don't throttle
+each other; anonymous requests fall back to the client address. The bucket
+store is process-local — there is one Evennia server process, so no shared
+cache is needed, and a restart simply refills every bucket.
+
+Plain Django views (the staff tuning fragments) use :func:`throttled_view`,
+which draws on the same store. Refused requests get a 429 with
+``Retry-After`` and are counted by
+:mod:`evennia_extensions.observability.throttle_metrics`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import wraps
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+from rest_framework import status
+from rest_framework.throttling import BaseThrottle
+
+from evennia_extensions.observability.throttle_metrics import record_throttled
+
+# Period suffixes accepted in a ``sustained`` rate, as in DRF's own throttles.
+_PERIOD_SECONDS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+# Full buckets carry no information, so the store drops them once it grows past
+# this many keys rather than remembering every account that ever made a request.
+_PRUNE_THRESHOLD = 4096
+
+
+@dataclass(frozen=True)
+class BucketRate:
+    """One scope's bucket size and refill rate."""
+
+    burst: int
+    per_second: float
+
+
+@dataclass
+class _Bucket:
+    rate: BucketRate
+    tokens: float
+    updated: float
+
+    def level(self, now: float) -> float:
+        """Tokens held at ``now``, refilled since the last update and capped at the burst."""
+        refilled = self.tokens + (now - self.updated) * self.rate.per_second
+        return min(float(self.rate.burst), refilled)
+
+
+def parse_scope_rate(config: dict[str, int | str]) -> BucketRate:
+    """Parse one ``API_THROTTLE_SCOPES`` entry.
+
+    Args:
+        config: ``{"burst": <int>, "sustained": "<count>/<period>"}``, where the
+            period is ``s``, ``m``, ``h`` or ``d`` (or a word starting with one).
+    """
+    count, period = str(config["sustained"]).split("/")
+    return BucketRate(
+        burst=int(config["burst"]),
+        per_second=int(count) / _PERIOD_SECONDS[period[0]],
+    )
+
+
+class TokenBucketStore:
+    """Process-local token buckets keyed by ``(scope, ident)``.
+
+    Thread-safe: the reactor thread and Django's request threads share it.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._buckets: dict[tuple[str, str], _Bucket] = {}
+        self._lock = threading.Lock()
+
+    def consume(self, scope: str, ident: str, rate: BucketRate) -> float:
+        """Take one token for ``ident`` under ``scope``.
+
+        Returns:
+            0 when the request may proceed, otherwise the seconds until a token
+            is next available.
+        """
+        now = self._clock()
+        with self._lock:
+            bucket = self._buckets.get((scope, ident))
+            if bucket is None or bucket.rate != rate:
+                bucket = _Bucket(rate=rate, tokens=float(rate.burst), updated=now)
+                self._buckets[scope, ident] = bucket
+            else:
+                bucket.tokens = bucket.level(now)
+                bucket.updated = now
+            if bucket.tokens >= 1:
+                bucket.tokens -= 1
+                wait = 0.0
+            else:
+                wait = (1 - bucket.tokens) / rate.per_second
+            if len(self._buckets) > _PRUNE_THRESHOLD:
+                self._prune(now)
+        return wait
+
+    def _prune(self, now: float) -> None:
+        """Drop buckets that have refilled completely (caller holds the lock)."""
+        full = [
+            key for key, bucket in self._buckets.items() if bucket.level(now) >= bucket.rate.burst
+        ]
+        for key in full:
+            del self._buckets[key]
+
+    def clear(self) -> None:
+        """Forget every bucket."""
+        with self._lock:
+            self._buckets.clear()
+
+
+_store = TokenBucketStore()
+
+
+def _scope_rate(scope: str | None) -> BucketRate | None:
+    if scope is None:
+        return None
+    config = settings.API_THROTTLE_SCOPES.get(scope)
+    if config is None:
+        return None
+    return parse_scope_rate(config)
+
+
+def _request_ident(request: HttpRequest, address: str) -> str:
+    user = getattr(request, "user", None)
+    if user is not None and user.is_authenticated:
+        return f"account:{user.pk}"
+    return f"addr:{address}"
+
+
+class AccountScopedThrottle(BaseThrottle):
+    """Token-bucket throttle keyed by account, scoped by the view's ``throttle_scope``."""
+
+    def __init__(self) -> None:
+        self._wait = 0.0
+
+    def allow_request(self, request, view) -> bool:
+        """Consume a token from this account's bucket for the view's scope."""
+        scope = getattr(view, "throttle_scope", None)
+        rate = _scope_rate(scope)
+        if rate is None:
+            return True
+        ident = _request_ident(request, self.get_ident(request))
+        self._wait = _store.consume(scope, ident, rate)
+        if self._wait:
+            record_throttled(scope)
+            return False
+        return True
+
+    def wait(self) -> float:
+        """Whole seconds until the next token; DRF sends it as ``Retry-After``."""
+        return math.ceil(self._wait)
+
+
+def throttled_view(
+    scope: str,
+) -> Callable[[Callable[..., HttpResponse]], Callable[..., HttpResponse]]:
+    """Throttle a plain Django view under ``scope``, as DRF views are throttled."""
+
+    def decorator(view: Callable[..., HttpResponse]) -> Callable[..., HttpResponse]:
+        @wraps(view)
+        def wrapper(request: HttpRequest, *args: object, **kwargs: object) -> HttpResponse:
+            rate = _scope_rate(scope)
+            if rate is not None:
+                ident = _request_ident(request, request.META.get("REMOTE_ADDR", ""))
+                wait = _store.consume(scope, ident, rate)
+                if wait:
+                    record_throttled(scope)
+                    response = HttpResponse(
+                        "Request was throttled.", status=status.HTTP_429_TOO_MANY_REQUESTS
+                    )
+                    response["Retry-After"] = str(math.ceil(wait))
+                    return response
+            return view(request, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _reset_for_testing() -> None:
+    """Empty the bucket store. **For use in tests only.**"""
+    _store.clear()
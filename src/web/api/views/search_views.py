@@ -7,9 +7,10 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from evennia_extensions.models import RoomProfile
+from evennia_extensions.services.name_search import NAME_SEARCH_LIMIT, search_by_name
 from world.missions.constants import GiverKind
 from world.missions.target_queries import environmental_detail_candidates
-from world.roster.models import RosterEntry
+from world.roster.models import RosterEntry, RosterTenure
 
 
 class OnlineCharacterSearchAPIView(APIView):
@@ -20,12 +21,13 @@ class OnlineCharacterSearchAPIView(APIView):
         # Autocomplete endpoint returning custom dicts, not a model queryset
         term = request.query_params.get("search", "")  # noqa: USE_FILTERSET
         connected = AccountDB.objects.get_connected_accounts()
-        qs = RosterEntry.objects.filter(tenures__player_data__account__in=connected)
-        if term:
-            qs = qs.filter(character__db_key__icontains=term)
-        names = (
-            qs.values_list("character__db_key", flat=True).distinct().order_by("character__db_key")
-        )
+        online = RosterEntry.objects.filter(
+            pk__in=RosterTenure.objects.filter(player_data__account__in=connected).values(
+                "roster_entry_id"
+            )
+        ).select_related("character_sheet__character")
+        entries = search_by_name(online, term, field="character_sheet__character__db_key")
+        names = dict.fromkeys(entry.character_sheet.character.db_key for entry in entries)
         data = [{"value": name, "label": name} for name in names]
         return Response(data)
 
@@ -75,7 +77,7 @@ class MissionGiverTargetSearchAPIView(APIView):
     """
 
     permission_classes = [IsAuthenticated, IsAdminUser]
-    RESULT_CAP = 20
+    RESULT_CAP = NAME_SEARCH_LIMIT
 
     def get(self, request, *args, **kwargs):
         """Return matching {id, name, hint} rows, or a single row for ?id=."""
@@ -109,30 +111,26 @@ class MissionGiverTargetSearchAPIView(APIView):
         qs = RoomProfile.objects.select_related("objectdb", "area")
         if target_id is not None:
             qs = qs.filter(objectdb_id=target_id)
-        elif term:
-            qs = qs.filter(objectdb__db_key__icontains=term)
-        qs = qs.order_by("objectdb__db_key")[: self.RESULT_CAP]
+            term = ""
         return [
             {
                 "id": rp.objectdb_id,
                 "name": rp.objectdb.db_key,
                 "hint": rp.area.name if rp.area_id else "",
             }
-            for rp in qs
+            for rp in search_by_name(qs, term, field="objectdb__db_key", limit=self.RESULT_CAP)
         ]
 
     def _environmental_detail_rows(self, target_id: str | None, term: str) -> list[dict]:
         qs = environmental_detail_candidates().select_related("db_location")
         if target_id is not None:
             qs = qs.filter(pk=target_id)
-        elif term:
-            qs = qs.filter(db_key__icontains=term)
-        qs = qs.order_by("db_key")[: self.RESULT_CAP]
+            term = ""
         return [
             {
                 "id": obj.pk,
                 "name": obj.db_key,
                 "hint": obj.db_location.db_key if obj.db_location_id else "",
             }
-            for obj in qs
+            for obj in search_by_name(qs, term, limit=self.RESULT_CAP)
         ]
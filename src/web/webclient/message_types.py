@@ -22,6 +22,7 @@ class WebsocketMessageType(str, Enum):
     KUDOS_RECEIVED = "kudos_received"
     MAIL_ARRIVED = "mail_arrived"
     HAZARD_PROMPT = "hazard_prompt"
+    COMBAT_ROUND_PROGRESS = "combat_round_progress"
 
 
 @dataclass
@@ -125,16 +126,40 @@ class CommandErrorPayload:
 
 @dataclass
 class BattleStatePayload:
-    """Slim ping for ``battle_state`` messages.
+    """Payload for ``battle_state`` messages.
 
     Battles are location-less (their backing scene has no ``location``), so the
     existing scene/room broadcast paths never reach participants — this is the
-    dedicated seam. Carries no battle data itself; clients refetch the REST
-    aggregate on receipt.
+    dedicated seam. ``snapshot`` is the full ``BattleDetailSerializer`` payload
+    at ``revision``, built once and shared by every recipient
+    (world/battles/snapshots.py). It is ``None`` for a recipient who can't read
+    the battle's scene; that client refetches the REST aggregate, which applies
+    the visibility gate.
     """
 
     battle_id: int
     round_number: int | None
+    revision: int
+    snapshot: dict | None = None
+
+
+@dataclass
+class CombatRoundProgressPayload:
+    """Payload for ``combat_round_progress`` messages.
+
+    Pushed by the asynchronous round-resolution job (world/combat/round_jobs.py)
+    as it starts, at each ``RoundPhase`` checkpoint, and when it finishes.
+    Carries no round outcome; clients refetch the encounter once ``status`` is
+    terminal (``succeeded``/``failed``).
+    """
+
+    job_id: str
+    encounter_id: int
+    round_number: int
+    status: str
+    phase: str
+    phase_label: str
+    detail: str
 
 
 @dataclass
@@ -8,6 +8,7 @@ from rest_framework.views import APIView
 from rest_framework.viewsets import ReadOnlyModelViewSet
 
 from evennia_extensions.models import RoomProfile
+from web.api.query_budget import query_budget
 from world.areas.constants import GridOrigin
 from world.areas.filters import AreaFilter, RoomProfileFilter
 from world.areas.models import Area
@@ -84,6 +85,7 @@ class RoomProfileViewSet(ReadOnlyModelViewSet):
         )
 
 
+@query_budget(20)
 class PresenceView(APIView):
     """Online presence for the web `who`/`where` surfaces (#1463).
 
@@ -93,6 +95,7 @@ class PresenceView(APIView):
     """
 
     permission_classes = [IsAuthenticated]
+    throttle_scope = "presence"
 
     def get(self, request: Request) -> Response:
         from world.areas.services import where_listing  # noqa: PLC0415
@@ -1453,12 +1453,25 @@ def resolve_battle_round(*, battle_round: BattleRound) -> BattleRoundResult:
     participants via ``notify_battle_state_changed`` (#2009), deferred via
     ``transaction.on_commit`` so it fires only once this transaction commits.
 
+    Runs under one condition-digest memo, prefetched for every declaring
+    participant, so each character's condition effects load once per round.
+
     Args:
         battle_round: The ``BattleRound`` in DECLARING or RESOLVING status.
 
     Returns:
         A ``BattleRoundResult`` summarising what happened this round.
     """
+    from world.conditions.digest import condition_digest_scope  # noqa: PLC0415
+
+    with condition_digest_scope():
+        return _resolve_battle_round(battle_round)
+
+
+def _resolve_battle_round(battle_round: BattleRound) -> BattleRoundResult:
+    """Body of :func:`resolve_battle_round`, run inside its digest scope."""
+    from world.conditions.digest import prefetch_condition_digests  # noqa: PLC0415
+
     _block_if_participant_mid_audere_majora_crossing(battle_round.battle)
 
     result = BattleRoundResult()
@@ -1510,6 +1523,9 @@ def resolve_battle_round(*, battle_round: BattleRound) -> BattleRoundResult:
     # the main iteration so they resolve alongside player declarations.
     _companion_decls = _process_companion_orders(battle_round)
     declarations.extend(_companion_decls)
+    prefetch_condition_digests(
+        {decl.participant.character_sheet.character for decl in declarations}
+    )
     declarations.sort(
         key=lambda d: 0
         if d.action_kind in (BattleActionKind.REPEL, BattleActionKind.SET_ENVIRONMENT)
@@ -73,8 +73,8 @@ class BattlePlaceSerializer(serializers.ModelSerializer):
     encounter_scene_id = serializers.SerializerMethodField()
     encounter_roster = serializers.SerializerMethodField()
     vehicle = serializers.SerializerMethodField()
-    # Sourced from the "cached_fortifications" to_attr the view's Prefetch
-    # populates (world/battles/views.py) — never the bare "fortifications"
+    # Sourced from the "cached_fortifications" to_attr the snapshot Prefetch
+    # populates (world/battles/snapshots.py) — never the bare "fortifications"
     # manager, which would re-query.
     fortifications = FortificationSerializer(
         many=True, read_only=True, source="cached_fortifications"
@@ -193,7 +193,7 @@ class BattleParticipantSerializer(serializers.ModelSerializer):
 
         ``thumbnail_media_url`` mirrors ``world/combat/serializers.py``'s
         ``get_thumbnail_media_url`` — the uploaded-portrait ``Media`` FK,
-        already ``select_related``'d by the view's Prefetch (world/battles/views.py),
+        already ``select_related``'d by the snapshot Prefetch (world/battles/snapshots.py),
         so this never issues a query. ``thumbnail_url`` is the legacy URLField,
         kept alongside for callers still on it.
         """
@@ -289,9 +289,9 @@ class BattleListSerializer(serializers.ModelSerializer):
 class BattleDetailSerializer(serializers.ModelSerializer):
     """Full battle aggregate — sides, places, units, and participants."""
 
-    # Each nested list is sourced from the view's "cached_*" to_attr Prefetch
-    # (world/battles/views.py._detail_prefetches) rather than the bare related
-    # manager, so nesting costs zero extra queries.
+    # Each nested list is sourced from a "cached_*" to_attr Prefetch
+    # (world/battles/snapshots.py battle_detail_prefetches) rather than the
+    # bare related manager, so nesting costs zero extra queries.
     round = serializers.SerializerMethodField()
     sides = BattleSideSerializer(many=True, read_only=True, source="cached_sides")
     places = BattlePlaceSerializer(many=True, read_only=True, source="cached_places")
@@ -337,8 +337,8 @@ class BattleDetailSerializer(serializers.ModelSerializer):
     def get_deeds(self, obj: Battle) -> list:
         """Legendary deeds scoped to this battle's backing scene (#1735).
 
-        Reads from the ``cached_deeds`` to_attr the view's Prefetch populates
-        on the battle's Scene (world/battles/views.py) — never a fresh query.
+        Reads from the ``cached_deeds`` to_attr the snapshot Prefetch populates
+        on the battle's Scene (world/battles/snapshots.py) — never a fresh query.
         """
         return BattleDeedSerializer(obj.scene.cached_deeds, many=True).data
 
@@ -72,10 +72,15 @@ from world.battles.models import (
     BattleVehicle,
     Fortification,
 )
+from world.battles.snapshots import (
+    advance_battle_revision,
+    get_battle_snapshot,
+    invalidate_battle_snapshot,
+)
 from world.combat.constants import OpponentTier, RiskLevel
 from world.conditions.models import CapabilityType
 from world.mechanics.models import Property
-from world.scenes.constants import RoundStatus
+from world.scenes.constants import RoundStatus, ScenePrivacyMode
 
 if TYPE_CHECKING:
     from world.buildings.models import Building
@@ -140,6 +145,7 @@ def add_side(
     Returns:
         The newly created ``BattleSide``.
     """
+    invalidate_battle_snapshot(battle)
     return BattleSide.objects.create(
         battle=battle,
         role=role,
@@ -177,6 +183,7 @@ def add_place(  # noqa: PLR0913 - each param is a distinct place attribute
     Returns:
         The newly created ``BattlePlace``.
     """
+    invalidate_battle_snapshot(battle)
     return BattlePlace.objects.create(
         battle=battle,
         name=name,
@@ -277,6 +284,7 @@ def add_unit(  # noqa: PLR0913 - each param is a distinct unit attribute
         MilitaryUnitCapability(unit=mu, capability=capability, value=value)
         for capability, value in capability_values
     )
+    invalidate_battle_snapshot(battle)
     return BattleUnit.objects.create(
         battle=battle,
         side=side,
@@ -331,6 +339,7 @@ def create_fortification(
             )
 
             max_integrity += get_city_defense_integrity_bonus(place.battle.region)
+    invalidate_battle_snapshot(place.battle)
     return Fortification.objects.create(
         place=place,
         defending_side=defending_side,
@@ -398,6 +407,7 @@ def create_battle_vehicle(
             defending_side=side,
             kind=FortificationKind.HULL,
         )
+    invalidate_battle_snapshot(battle)
     return vehicle
 
 
@@ -506,6 +516,7 @@ def set_battle_side_posture(*, side: BattleSide, posture: str) -> BattleSide:
     """
     side.posture = posture
     side.save(update_fields=["posture"])
+    invalidate_battle_snapshot(side.battle)
     return side
 
 
@@ -521,6 +532,7 @@ def assign_unit_commander(*, unit: BattleUnit, commander: CharacterSheet | None)
     """
     unit.military_unit.commander = commander
     unit.military_unit.save(update_fields=["commander"])
+    invalidate_battle_snapshot(unit.battle)
     return unit
 
 
@@ -543,6 +555,7 @@ def enlist_participant(
     Returns:
         The newly created ``BattleParticipant``.
     """
+    invalidate_battle_snapshot(battle)
     return BattleParticipant.objects.create(
         battle=battle,
         character_sheet=character_sheet,
@@ -553,7 +566,7 @@ def enlist_participant(
 
 
 def notify_battle_state_changed(battle: Battle) -> None:
-    """Slim BATTLE_STATE ping -> connected participants; clients refetch the REST aggregate.
+    """Push the battle's new snapshot to connected participants over BATTLE_STATE.
 
     Battles are location-less by default (their backing scene has no
     ``location``) unless a GM staged this one from their own room (#2010,
@@ -561,26 +574,48 @@ def notify_battle_state_changed(battle: Battle) -> None:
     path is guaranteed to reach every connected participant, so this is the
     dedicated seam. Called after round transitions (begin_battle_round,
     resolve_battle_round) and on conclusion (conclude_battle) -- always deferred
-    via ``transaction.on_commit`` at each call site, so it runs post-commit and a
-    client that refetches on receipt always sees committed state.
+    via ``transaction.on_commit`` at each call site, so it runs post-commit and
+    the snapshot it builds always reflects committed state.
+
+    Advances the battle's revision and builds the aggregate once
+    (world/battles/snapshots.py); every recipient gets the same dict, and the
+    REST detail endpoint serves it too. Recipients who couldn't read the
+    battle through REST (private scene, not a scene participant) get the
+    ping without the snapshot.
     """
+    advance_battle_revision(battle)
+    revision, snapshot = get_battle_snapshot(battle)
     current = battle.current_round
-    payload = asdict(
+    round_number = current.round_number if current else None
+    full = asdict(
         BattleStatePayload(
             battle_id=battle.pk,
-            round_number=current.round_number if current else None,
+            round_number=round_number,
+            revision=revision,
+            snapshot=snapshot,
         )
     )
+    slim = asdict(
+        BattleStatePayload(battle_id=battle.pk, round_number=round_number, revision=revision)
+    )
+    scene = battle.scene
+    readers: set[int] | None = None
+    if scene.privacy_mode != ScenePrivacyMode.PUBLIC:
+        readers = set(scene.participants.values_list("pk", flat=True))
     # A fresh, bounded query rather than BattleStateCache (participants_on_side/
     # participants_on_place): the cache indexes rows by side/place, not "every
     # participant", and neither cached row carries the character_sheet__character
-    # join this ping needs -- reading through it would still cost a
-    # per-participant query. One bounded query here, not a refetch of cached state.
+    # join this push needs -- reading through it would still cost a
+    # per-participant query.
     for participant in battle.participants.select_related("character_sheet__character"):
         character = participant.character_sheet.character
         if character is None or not character.has_account:
             continue
-        character.msg(battle_state=((), payload))
+        account = character.account
+        can_read = readers is None or (
+            account is not None and (account.is_staff or account.pk in readers)
+        )
+        character.msg(battle_state=((), full if can_read else slim))
 
 
 @transaction.atomic
@@ -1074,6 +1109,7 @@ def maybe_pause_battle_for_disconnect(character_sheet: CharacterSheet) -> None:
         return
     battle.is_paused = True
     battle.save(update_fields=["is_paused"])
+    invalidate_battle_snapshot(battle)
 
 
 def maybe_conclude_on_timer(*, battle: Battle) -> BattleOutcome | None:
@@ -1194,6 +1230,7 @@ def open_champion_duel(
     enc.save(update_fields=["is_champion_duel"])
     battle_place.combat_encounter = enc
     battle_place.save(update_fields=["combat_encounter"])
+    invalidate_battle_snapshot(battle_place.battle)
     install_champion_duel_trigger(enc)
     return enc
 
@@ -1250,6 +1287,7 @@ def open_siege_engine_encounter(
     )
     battle_place.combat_encounter = enc
     battle_place.save(update_fields=["combat_encounter"])
+    invalidate_battle_snapshot(battle_place.battle)
     return enc
 
 
@@ -1302,5 +1340,6 @@ def open_place_encounter(*, battle_place: BattlePlace) -> CombatEncounter:
 
     battle_place.combat_encounter = enc
     battle_place.save(update_fields=["combat_encounter"])
+    invalidate_battle_snapshot(battle_place.battle)
     install_place_encounter_trigger(enc)
     return enc
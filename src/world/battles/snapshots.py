@@ -0,0 +1,221 @@
+"""Per-revision battle snapshot cache.
+
+``notify_battle_state_changed`` used to send a slim ping, after which every
+connected participant refetched ``/api/battles/<id>/`` — one full aggregate
+serialization per client per round transition. Instead the server builds the
+``BattleDetailSerializer`` payload once per battle *revision*, keeps it here,
+pushes it inside the ``battle_state`` message, and the REST detail endpoint
+serves the same cached dict as a fallback (reconnects, missed pushes, GM
+staging polls).
+
+A battle's revision lives in :mod:`web.api.revisions` under ``BATTLE_SCOPE``.
+It advances in exactly two ways:
+
+* ``notify_battle_state_changed`` calls :func:`advance_battle_revision`
+  post-commit — round transitions and conclusion.
+* Setup/staging services that change the aggregate outside a round
+  transition (add a side/place/unit, enlist, posture, pause, open a front
+  encounter) call :func:`invalidate_battle_snapshot`, which bumps on commit.
+
+Live front-fight rosters (``BattlePlaceSerializer.get_encounter_roster``)
+change with combat, not with the battle, so a cached entry also expires after
+``SNAPSHOT_MAX_AGE_SECONDS`` and is rebuilt at the same revision — the same
+staleness bound the frontend's detail poll already accepts.
+
+One dict in the single Server process is the whole cache, guarded by a lock
+because the web API runs on Twisted's thread pool. Entries are one per battle
+(only the newest revision is kept), so memory is bounded by live battles.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from django.db.models import Prefetch, prefetch_related_objects
+from rest_framework.renderers import JSONRenderer
+
+from web.api.revisions import BATTLE_SCOPE, advance_revision, bump_revision, get_revision
+from world.battles.models import (
+    BattleParticipant,
+    BattlePlace,
+    BattleSide,
+    BattleUnit,
+    Fortification,
+)
+from world.battles.serializers import BattleDetailSerializer
+from world.conditions.models import ConditionInstance
+from world.scenes.constants import PersonaType
+from world.scenes.models import Persona
+from world.societies.models import LegendEntry
+
+if TYPE_CHECKING:
+    from world.battles.models import Battle
+
+SNAPSHOT_MAX_AGE_SECONDS = 10
+
+_lock = threading.Lock()
+# battle pk -> (revision, built_at monotonic seconds, snapshot dict)
+_snapshots: dict[int, tuple[int, float, dict[str, Any]]] = {}
+
+
+def battle_detail_prefetches() -> list[Prefetch]:
+    """Explicit ``to_attr``-cached prefetches for the nested battle aggregate.
+
+    Every relation the detail serializer nests (sides/places/units/
+    participants, plus places' fortifications and the battle's scene-scoped
+    deeds) is loaded via a ``Prefetch`` with ``to_attr`` — never a bare
+    string — so the serializer's cache reads cost zero extra queries
+    (repo-wide PREFETCH_STRING rule).
+    ``BattleSideSerializer``/``BattlePlaceSerializer``/etc. read the
+    matching ``cached_*`` attrs via their ``source=`` kwarg.
+    """
+    return [
+        Prefetch(
+            "sides",
+            queryset=BattleSide.objects.select_related("covenant"),
+            to_attr="cached_sides",
+        ),
+        Prefetch(
+            "places",
+            queryset=BattlePlace.objects.select_related(
+                "battle", "combat_encounter"
+            ).prefetch_related(
+                Prefetch(
+                    "fortifications",
+                    queryset=Fortification.objects.all(),
+                    to_attr="cached_fortifications",
+                ),
+            ),
+            to_attr="cached_places",
+        ),
+        Prefetch("units", queryset=BattleUnit.objects.all(), to_attr="cached_units"),
+        Prefetch(
+            "participants",
+            queryset=BattleParticipant.objects.select_related(
+                "character_sheet",
+                "character_sheet__character",
+                "character_sheet__character__display_data",
+                "character_sheet__active_alternate_self",
+                "character_sheet__active_alternate_self__alternate_self",
+            ).prefetch_related(
+                # Pre-fill CharacterSheet.cached_payload_personas (a
+                # @cached_property doubling as this to_attr target) so
+                # BattleParticipantSerializer resolves the PRIMARY persona
+                # with zero per-row queries. Queryset shape mirrors
+                # world/combat/views.py's identical Prefetch (#630) and the
+                # property's own documented fallback (must match exactly, or
+                # prefetched vs. non-prefetched rows diverge).
+                Prefetch(
+                    "character_sheet__personas",
+                    queryset=Persona.objects.filter(
+                        persona_type__in=[PersonaType.PRIMARY, PersonaType.ESTABLISHED]
+                    )
+                    .order_by("-persona_type", "created_at", "id")
+                    .select_related("thumbnail"),
+                    to_attr="cached_payload_personas",
+                ),
+                # #2196: prefetch the character's active condition instances so
+                # resolve_thumbnail() doesn't fire per-participant queries.
+                Prefetch(
+                    "character_sheet__character__condition_instances",
+                    queryset=ConditionInstance.objects.select_related(
+                        "condition", "current_stage"
+                    ).filter(
+                        is_suppressed=False,
+                    ),
+                    to_attr="cached_active_conditions",
+                ),
+            ),
+            to_attr="cached_participants",
+        ),
+        # Deeds scoped to the battle's backing scene (#1735). LegendEntry.scene
+        # has related_name="legend_entries" on Scene, so the prefetch path is
+        # scene__legend_entries. The to_attr lands on the Scene instance, which
+        # BattleDetailSerializer.get_deeds reads as obj.scene.cached_deeds.
+        Prefetch(
+            "scene__legend_entries",
+            queryset=LegendEntry.objects.filter(is_active=True)
+            .select_related("persona")
+            .order_by("-created_at"),
+            to_attr="cached_deeds",
+        ),
+    ]
+
+
+def _discard_prefetched(battle: Battle) -> None:
+    """Drop every ``to_attr`` a previous build left on idmapped instances.
+
+    Battle and its children are SharedMemoryModels: the queryset hands back
+    the *same* Python objects each time, and Django skips a ``to_attr``
+    prefetch whose attribute is already set. Without this, a rebuild would
+    serialize whatever the first build loaded.
+    """
+    state = battle.__dict__
+    for place in state.pop("cached_places", ()):
+        place.__dict__.pop("cached_fortifications", None)
+    for participant in state.pop("cached_participants", ()):
+        sheet = participant.character_sheet
+        sheet.__dict__.pop("cached_payload_personas", None)
+        if sheet.character is not None:
+            sheet.character.__dict__.pop("cached_active_conditions", None)
+    state.pop("cached_sides", None)
+    state.pop("cached_units", None)
+    battle.scene.__dict__.pop("cached_deeds", None)
+
+
+def _build(battle: Battle) -> dict[str, Any]:
+    _discard_prefetched(battle)
+    prefetch_related_objects([battle], *battle_detail_prefetches())
+    # Round-trip through the REST renderer so the pushed payload is plain
+    # JSON types and byte-for-byte what the detail endpoint would return.
+    return json.loads(JSONRenderer().render(BattleDetailSerializer(battle).data))
+
+
+def battle_revision(battle: Battle) -> int:
+    """Return the battle's current snapshot revision (``0`` until first advanced)."""
+    return get_revision(BATTLE_SCOPE, battle.pk)
+
+
+def get_battle_snapshot(battle: Battle) -> tuple[int, dict[str, Any]]:
+    """Return ``(revision, snapshot)``, building it only if the cache is stale.
+
+    The revision is read *before* any rows are, so a write that commits
+    mid-build bumps past the entry stored here instead of hiding behind it.
+    Concurrent misses may both build; the newer revision wins the slot.
+    """
+    revision = battle_revision(battle)
+    cached = _snapshots.get(battle.pk)
+    if (
+        cached is not None
+        and cached[0] == revision
+        and time.monotonic() - cached[1] < SNAPSHOT_MAX_AGE_SECONDS
+    ):
+        return revision, cached[2]
+    snapshot = _build(battle)
+    with _lock:
+        current = _snapshots.get(battle.pk)
+        if current is None or current[0] <= revision:
+            _snapshots[battle.pk] = (revision, time.monotonic(), snapshot)
+    return revision, snapshot
+
+
+def advance_battle_revision(battle: Battle) -> int:
+    """Advance the revision now; for post-commit callers about to push a snapshot."""
+    return advance_revision(BATTLE_SCOPE, battle.pk)
+
+
+def invalidate_battle_snapshot(battle: Battle) -> None:
+    """Mark the battle's cached snapshot stale once the current transaction commits."""
+    bump_revision(BATTLE_SCOPE, battle.pk)
+
+
+def _reset_for_testing() -> None:
+    """Drop every cached snapshot.
+
+    **For use in tests only.**
+    """
+    with _lock:
+        _snapshots.clear()
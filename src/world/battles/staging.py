@@ -32,6 +32,7 @@ from world.battles.services import (
     create_battle,
     create_fortification,
 )
+from world.battles.snapshots import invalidate_battle_snapshot
 from world.combat.constants import RiskLevel
 
 if TYPE_CHECKING:
@@ -130,6 +131,7 @@ def instantiate_battle_blueprint(
             raise BattleStagingError(msg)
         _ensure_blueprint_replace_is_safe(battle)
         battle.places.all().delete()
+        invalidate_battle_snapshot(battle)
 
     created_places: list[BattlePlace] = []
     for bp_place in blueprint.places.all():
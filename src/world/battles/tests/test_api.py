@@ -18,6 +18,7 @@ from rest_framework import status as http_status
 from rest_framework.test import APIClient
 
 from evennia_extensions.factories import AccountFactory
+from world.battles import snapshots
 from world.battles.constants import (
     BattleOutcome,
     BattlePosture,
@@ -38,7 +39,13 @@ from world.battles.factories import (
     FortificationFactory,
 )
 from world.battles.resolution import resolve_battle_round
-from world.battles.services import begin_battle_round, conclude_battle, enlist_participant
+from world.battles.services import (
+    add_side,
+    begin_battle_round,
+    conclude_battle,
+    enlist_participant,
+    notify_battle_state_changed,
+)
 from world.character_sheets.factories import CharacterSheetFactory
 from world.combat.factories import CombatEncounterFactory, CombatOpponentFactory
 from world.covenants.factories import CovenantFactory
@@ -52,6 +59,11 @@ from world.societies.factories import LegendEntryFactory, LegendSourceTypeFactor
 class BattleApiJourneyTest(TestCase):
     """Covers list/detail shape, scene visibility, and the ?scene= filter."""
 
+    def setUp(self) -> None:
+        # Detail responses come from the process-wide snapshot cache; sqlite
+        # reuses rolled-back pks, so a previous test's entry must not leak in.
+        snapshots._reset_for_testing()
+
     @classmethod
     def setUpTestData(cls) -> None:
         cls.covenant = CovenantFactory(name="The Iron Vanguard")
@@ -468,18 +480,35 @@ class BattleApiJourneyTest(TestCase):
 
 
 class BattleStatePingTest(TestCase):
-    """BATTLE_STATE ping seam (#2009 Task 2).
+    """BATTLE_STATE push seam (#2009 Task 2).
 
     Battles are location-less (their backing scene has no ``location``), so the
     existing scene/room broadcast paths never reach participants -- this
-    dedicated ping fills that gap on round transitions. Clients refetch the
-    REST aggregate on receipt; the payload itself carries no battle data.
+    dedicated push fills that gap on round transitions. It carries the battle's
+    per-revision snapshot so clients no longer refetch the REST aggregate.
     """
 
     def setUp(self) -> None:
+        snapshots._reset_for_testing()
         self.battle = BattleFactory(name="Ping Battle")
         self.side = BattleSideFactory(battle=self.battle, role=BattleSideRole.ATTACKER)
 
+    def _assert_pushed_snapshot(
+        self, mock_msg: mock.MagicMock, *, round_number: int | None
+    ) -> None:
+        mock_msg.assert_called_once()
+        _args, payload = mock_msg.call_args.kwargs["battle_state"]
+        self.assertEqual(payload["battle_id"], self.battle.pk)
+        self.assertEqual(payload["round_number"], round_number)
+        self.assertEqual(payload["revision"], snapshots.battle_revision(self.battle))
+        self.assertEqual(payload["snapshot"]["id"], self.battle.pk)
+
+    def _connected_participant(self):
+        sheet = CharacterSheetFactory()
+        enlist_participant(battle=self.battle, character_sheet=sheet, side=self.side)
+        sheet.character.sessions.count = lambda: 1
+        return sheet.character
+
     def test_begin_battle_round_pings_connected_participant(self) -> None:
         sheet = CharacterSheetFactory()
         enlist_participant(battle=self.battle, character_sheet=sheet, side=self.side)
@@ -500,9 +529,7 @@ class BattleStatePingTest(TestCase):
             for callback in callbacks:
                 callback()
 
-        mock_msg.assert_called_once_with(
-            battle_state=((), {"battle_id": self.battle.pk, "round_number": 1})
-        )
+        self._assert_pushed_snapshot(mock_msg, round_number=1)
 
     def test_begin_battle_round_skips_participant_without_account(self) -> None:
         sheet = CharacterSheetFactory()
@@ -541,9 +568,7 @@ class BattleStatePingTest(TestCase):
 
         # The round completes as part of resolution, so current_round is None
         # by the time the deferred ping reads it.
-        mock_msg.assert_called_once_with(
-            battle_state=((), {"battle_id": self.battle.pk, "round_number": None})
-        )
+        self._assert_pushed_snapshot(mock_msg, round_number=None)
 
     def test_conclude_battle_pings_connected_participant(self) -> None:
         sheet = CharacterSheetFactory()
@@ -560,6 +585,69 @@ class BattleStatePingTest(TestCase):
             for callback in callbacks:
                 callback()
 
-        mock_msg.assert_called_once_with(
-            battle_state=((), {"battle_id": self.battle.pk, "round_number": None})
-        )
+        self._assert_pushed_snapshot(mock_msg, round_number=None)
+
+    def test_snapshot_is_serialized_once_for_every_recipient(self) -> None:
+        characters = [self._connected_participant() for _ in range(3)]
+
+        with (
+            mock.patch.object(
+                snapshots, "BattleDetailSerializer", wraps=snapshots.BattleDetailSerializer
+            ) as serializer,
+            mock.patch.object(characters[0], "msg") as first,
+            mock.patch.object(characters[1], "msg") as second,
+            mock.patch.object(characters[2], "msg") as third,
+        ):
+            notify_battle_state_changed(self.battle)
+
+        self.assertEqual(serializer.call_count, 1)
+        pushed = [m.call_args.kwargs["battle_state"][1]["snapshot"] for m in (first, second, third)]
+        self.assertEqual(len(pushed[0]["participants"]), 3)
+        self.assertTrue(all(snapshot == pushed[0] for snapshot in pushed))
+
+    def test_private_scene_pushes_snapshot_only_to_scene_readers(self) -> None:
+        self.battle.scene.privacy_mode = ScenePrivacyMode.PRIVATE
+        self.battle.scene.save(update_fields=["privacy_mode"])
+        reader = self._connected_participant()
+        reader.db_account = AccountFactory(username="battle_push_reader")
+        SceneParticipationFactory(scene=self.battle.scene, account=reader.db_account)
+        outsider = self._connected_participant()
+
+        with (
+            mock.patch.object(reader, "msg") as reader_msg,
+            mock.patch.object(outsider, "msg") as outsider_msg,
+        ):
+            notify_battle_state_changed(self.battle)
+
+        self.assertIsNotNone(reader_msg.call_args.kwargs["battle_state"][1]["snapshot"])
+        outsider_payload = outsider_msg.call_args.kwargs["battle_state"][1]
+        self.assertIsNone(outsider_payload["snapshot"])
+        self.assertEqual(outsider_payload["battle_id"], self.battle.pk)
+
+    def test_rest_detail_serves_the_pushed_snapshot(self) -> None:
+        notify_battle_state_changed(self.battle)
+        client = APIClient()
+        client.force_authenticate(user=AccountFactory(username="battle_rest_fallback"))
+
+        with mock.patch.object(
+            snapshots, "BattleDetailSerializer", wraps=snapshots.BattleDetailSerializer
+        ) as serializer:
+            response = client.get(f"/api/battles/{self.battle.pk}/")
+
+        self.assertEqual(response.status_code, http_status.HTTP_200_OK)
+        self.assertEqual(response.data["id"], self.battle.pk)
+        serializer.assert_not_called()
+
+    def test_setup_service_invalidates_cached_detail(self) -> None:
+        """A staging write between pushes must not be hidden by the cache --
+        nor by the idmapped Battle's leftover ``to_attr`` prefetches."""
+        client = APIClient()
+        client.force_authenticate(user=AccountFactory(username="battle_rest_staging"))
+        before = client.get(f"/api/battles/{self.battle.pk}/").data
+
+        with self.captureOnCommitCallbacks(execute=True):
+            add_side(battle=self.battle, role=BattleSideRole.DEFENDER)
+        after = client.get(f"/api/battles/{self.battle.pk}/").data
+
+        self.assertEqual(len(before["sides"]), 1)
+        self.assertEqual(len(after["sides"]), 2)
@@ -80,7 +80,7 @@ class ChampionDuelOutcomeWiringTests(TestCase):
         # trigger_handler cache before the trigger above was installed, so a
         # synchronous refresh() is needed to see it within this transaction —
         # the same same-transaction-visibility pattern documented on
-        # world.combat.services._refresh_participant_trigger_handlers.
+        # world.combat.services._refresh_participant_round_caches.
         self.room.trigger_handler.refresh()
 
         # Defeat the opponent to trigger VICTORY via the real resolution path.
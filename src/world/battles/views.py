@@ -5,21 +5,18 @@ from __future__ import annotations
 from django.db.models import Prefetch, QuerySet
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
 from rest_framework.serializers import Serializer
 from rest_framework.viewsets import ReadOnlyModelViewSet
 
 from world.battles.models import (
     Battle,
     BattleMapBlueprint,
-    BattleParticipant,
-    BattlePlace,
-    BattleSide,
-    BattleUnit,
     BattleUnitTemplate,
     BattleUnitTemplateCapability,
     BlueprintBattlePlace,
     BlueprintFortification,
-    Fortification,
 )
 from world.battles.serializers import (
     BattleDetailSerializer,
@@ -27,12 +24,10 @@ from world.battles.serializers import (
     BattleMapBlueprintSerializer,
     BattleUnitTemplateSerializer,
 )
-from world.conditions.models import ConditionInstance
+from world.battles.snapshots import get_battle_snapshot
 from world.gm.permissions import HasGMTrust
 from world.mechanics.models import Property
-from world.scenes.constants import PersonaType
-from world.scenes.models import Persona, Scene
-from world.societies.models import LegendEntry
+from world.scenes.models import Scene
 from world.stories.pagination import StandardResultsSetPagination
 
 
@@ -50,104 +45,29 @@ class BattleViewSet(ReadOnlyModelViewSet):
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ["scene", "outcome"]
     pagination_class = StandardResultsSetPagination
+    throttle_scope = "battle_aggregate"
 
     def get_serializer_class(self) -> type[Serializer]:
         if self.action == "list":
             return BattleListSerializer
         return BattleDetailSerializer
 
-    def _detail_prefetches(self) -> list[Prefetch]:
-        """Explicit ``to_attr``-cached prefetches for the retrieve-only nested aggregate.
-
-        Every relation the detail serializer nests (sides/places/units/
-        participants, plus places' fortifications and the battle's scene-scoped
-        deeds) is loaded via a ``Prefetch`` with ``to_attr`` — never a bare
-        string — so the serializer's cache reads cost zero extra queries
-        (repo-wide PREFETCH_STRING rule).
-        ``BattleSideSerializer``/``BattlePlaceSerializer``/etc. read the
-        matching ``cached_*`` attrs via their ``source=`` kwarg.
-        """
-        return [
-            Prefetch(
-                "sides",
-                queryset=BattleSide.objects.select_related("covenant"),
-                to_attr="cached_sides",
-            ),
-            Prefetch(
-                "places",
-                queryset=BattlePlace.objects.select_related(
-                    "battle", "combat_encounter"
-                ).prefetch_related(
-                    Prefetch(
-                        "fortifications",
-                        queryset=Fortification.objects.all(),
-                        to_attr="cached_fortifications",
-                    ),
-                ),
-                to_attr="cached_places",
-            ),
-            Prefetch("units", queryset=BattleUnit.objects.all(), to_attr="cached_units"),
-            Prefetch(
-                "participants",
-                queryset=BattleParticipant.objects.select_related(
-                    "character_sheet",
-                    "character_sheet__character",
-                    "character_sheet__character__display_data",
-                    "character_sheet__active_alternate_self",
-                    "character_sheet__active_alternate_self__alternate_self",
-                ).prefetch_related(
-                    # Pre-fill CharacterSheet.cached_payload_personas (a
-                    # @cached_property doubling as this to_attr target) so
-                    # BattleParticipantSerializer resolves the PRIMARY persona
-                    # with zero per-row queries. Queryset shape mirrors
-                    # world/combat/views.py's identical Prefetch (#630) and the
-                    # property's own documented fallback (must match exactly, or
-                    # prefetched vs. non-prefetched rows diverge).
-                    Prefetch(
-                        "character_sheet__personas",
-                        queryset=Persona.objects.filter(
-                            persona_type__in=[PersonaType.PRIMARY, PersonaType.ESTABLISHED]
-                        )
-                        .order_by("-persona_type", "created_at", "id")
-                        .select_related("thumbnail"),
-                        to_attr="cached_payload_personas",
-                    ),
-                    # #2196: prefetch the character's active condition instances so
-                    # resolve_thumbnail() doesn't fire per-participant queries.
-                    Prefetch(
-                        "character_sheet__character__condition_instances",
-                        queryset=ConditionInstance.objects.select_related(
-                            "condition", "current_stage"
-                        ).filter(
-                            is_suppressed=False,
-                        ),
-                        to_attr="cached_active_conditions",
-                    ),
-                ),
-                to_attr="cached_participants",
-            ),
-            # Deeds scoped to the battle's backing scene (#1735). LegendEntry.scene
-            # has related_name="legend_entries" on Scene, so the prefetch path is
-            # scene__legend_entries. The to_attr lands on the Scene instance, which
-            # BattleDetailSerializer.get_deeds reads as obj.scene.cached_deeds.
-            Prefetch(
-                "scene__legend_entries",
-                queryset=LegendEntry.objects.filter(is_active=True)
-                .select_related("persona")
-                .order_by("-created_at"),
-                to_attr="cached_deeds",
-            ),
-        ]
-
     def _base_queryset(self) -> QuerySet[Battle]:
-        qs = Battle.objects.select_related("scene").order_by("-created_at")
-        if self.action == "retrieve":
-            qs = qs.prefetch_related(*self._detail_prefetches())
-        return qs
+        return Battle.objects.select_related("scene").order_by("-created_at")
 
     def get_queryset(self) -> QuerySet[Battle]:
         return self._filter_readable(self._base_queryset())
 
+    def retrieve(self, request: Request, *args: object, **kwargs: object) -> Response:
+        """Serve the battle's cached per-revision snapshot (world/battles/snapshots.py).
+
+        ``get_object`` still runs the scene-visibility filter, so the cache
+        never widens who may read a battle; only the aggregate build is shared
+        with the ``battle_state`` push and every other viewer.
+        """
+        _revision, snapshot = get_battle_snapshot(self.get_object())
+        return Response(snapshot)
+
     def _filter_readable(self, qs: QuerySet[Battle]) -> QuerySet[Battle]:
         """Restrict list/retrieve to battles whose scene the caller may view.
 
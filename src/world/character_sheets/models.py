@@ -14,6 +14,8 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from world.achievements.handlers import StatHandler
     from world.achievements.models import Achievement
     from world.classes.models import CharacterClassLevel
@@ -1213,6 +1215,22 @@ class CharacterSheet(SharedMemoryModel):
             current_stage__stage_order=5,
         ).exists()
 
+    @staticmethod
+    def protagonism_locked_ids(sheet_ids: Iterable[int]) -> set[int]:
+        """The subset of ``sheet_ids`` that ``is_protagonism_locked``, in one query.
+
+        The batch form for daily ticks; extend it alongside ``is_protagonism_locked``.
+        """
+        from world.conditions.models import ConditionInstance  # noqa: PLC0415
+
+        return set(
+            ConditionInstance.objects.filter(
+                target_id__in=sheet_ids,
+                condition__corruption_resonance__isnull=False,
+                current_stage__stage_order=5,
+            ).values_list("target_id", flat=True)
+        )
+
     @property
     def in_control(self) -> bool:
         """Whether this character is in control of their own actions.
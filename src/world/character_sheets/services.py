@@ -9,6 +9,7 @@ from django.db import transaction
 from evennia.objects.models import ObjectDB
 from evennia.utils.create import create_object
 
+from web.api.revisions import CHARACTER_SHEET_SCOPE, bump_revision
 from world.character_sheets.models import (
     _PROFILE_FIELDS,
     CharacterSheet,
@@ -232,3 +233,4 @@ def set_physical_description(sheet: CharacterSheet, text: str) -> None:
     """
     sheet.additional_desc = text
     sheet.save(update_fields=["additional_desc"])
+    bump_revision(CHARACTER_SHEET_SCOPE, sheet.pk)
@@ -5,6 +5,7 @@ Tests for the character sheets API viewset.
 from __future__ import annotations
 
 from decimal import Decimal
+from unittest.mock import patch
 
 from django.test import TestCase
 from rest_framework.test import APIClient
@@ -32,6 +33,7 @@ from world.character_sheets.serializers import (
     _build_theming,
     get_character_sheet_queryset,
 )
+from world.character_sheets.services import set_physical_description
 from world.character_sheets.types import SheetVisibility
 from world.classes.factories import PathFactory
 from world.classes.models import PathStage
@@ -197,6 +199,33 @@ class TestCharacterSheetViewSet(TestCase):
         assert response.status_code == 200
         assert response.data["can_edit"] is False
 
+    def test_retrieve_honors_if_none_match(self) -> None:
+        """A repeat poll with the issued ETag answers 304 until the sheet changes."""
+        self.client.force_authenticate(user=self.original_player.account)
+        sheet = self.roster_entry.character_sheet
+        url = f"/api/character-sheets/{sheet.character.pk}/"
+        etag = self.client.get(url)["ETag"]
+
+        assert self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+        with self.captureOnCommitCallbacks(execute=True):
+            set_physical_description(sheet, "Taller than expected.")
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+
+    def test_conditional_retrieve_still_applies_block_gate(self) -> None:
+        """A stale ETag never turns a block-hidden sheet into a 304."""
+        self.client.force_authenticate(user=self.other_player.account)
+        url = f"/api/character-sheets/{self.roster_entry.character_sheet.character.pk}/"
+        etag = self.client.get(url)["ETag"]
+
+        with patch("world.character_sheets.views.sheet_blocked_for_viewer", return_value=True):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 404
+
 
 class TestIdentitySection(TestCase):
     """Tests for the identity section of the character sheet API response."""
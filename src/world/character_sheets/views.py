@@ -9,12 +9,15 @@ from django.http import Http404
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
 from rest_framework.decorators import action
+from rest_framework.generics import get_object_or_404
 from rest_framework.mixins import RetrieveModelMixin
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
+from web.api.mixins import ConditionalGetMixin
+from web.api.revisions import CHARACTER_SHEET_SCOPE, get_revision
 from world.character_creation.services import (
     clear_origin_slot,
     set_origin_slot,
@@ -59,7 +62,7 @@ def _spendable_stat_rows(sheet: CharacterSheet, cap: int | None) -> list[dict]:
     ]
 
 
-class CharacterSheetViewSet(RetrieveModelMixin, GenericViewSet):
+class CharacterSheetViewSet(ConditionalGetMixin, RetrieveModelMixin, GenericViewSet):
     """Read-only detail endpoint for character sheets, keyed by character pk.
 
     Returns character sheet data for a single character. The response
@@ -69,6 +72,13 @@ class CharacterSheetViewSet(RetrieveModelMixin, GenericViewSet):
 
     pagination_class = None  # 2026-07 audit: opt out of default paginator (ADR-0138)
 
+    # The sheet aggregates dozens of character-scoped tables, most written by
+    # other subsystems' services, so the revision counter alone can't see every
+    # change: writes through this viewset (and set_physical_description) bump it,
+    # and the window bounds staleness for the rest.
+    revision_scope = CHARACTER_SHEET_SCOPE
+    etag_max_age = 60
+
     serializer_class = CharacterSheetSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = []
@@ -89,6 +99,25 @@ class CharacterSheetViewSet(RetrieveModelMixin, GenericViewSet):
             raise Http404
         return sheet
 
+    def get_version_parts(self) -> tuple[int] | None:
+        """Version the retrieve payload by the sheet's revision counter."""
+        pk = self.kwargs.get("pk", "")
+        if self.action != "retrieve" or not pk.isdigit():
+            return None
+        return (get_revision(CHARACTER_SHEET_SCOPE, int(pk)),)
+
+    def verify_not_modified(self) -> None:
+        """Re-run the block gate so a viewer blocked after caching gets 404, not 304.
+
+        Resolves the bare sheet rather than the full section-prefetch queryset.
+        """
+        sheet = get_object_or_404(
+            CharacterSheet.objects.select_related("roster_entry"), pk=self.kwargs["pk"]
+        )
+        user = self.request.user
+        if not user.is_staff and sheet_blocked_for_viewer(viewer_account=user, sheet=sheet):
+            raise Http404
+
     def _check_ownership(self, sheet: CharacterSheet) -> None:
         """404 if the requesting user can't edit this sheet.
 
@@ -16,6 +16,8 @@ from evennia.utils.idmapper.models import SharedMemoryModel
 
 from core.mixins import DiscriminatorMixin
 from core.natural_keys import NaturalKeyManager, NaturalKeyMixin
+from evennia_extensions.constants import ArrivalFeature
+from evennia_extensions.mixins import ArrivalFeatureContentMixin
 from world.clues.constants import ClueResolution, ClueTargetKind
 from world.contributors.models import CreditedContent
 
@@ -282,7 +284,7 @@ class RoomClue(SharedMemoryModel):
         return f"{self.clue.name} hidden in {self.room_profile}"
 
 
-class ClueTrigger(SharedMemoryModel):
+class ClueTrigger(ArrivalFeatureContentMixin, SharedMemoryModel):
     """A clue granted passively on entering a room — no search, just a precondition (#1160).
 
     The trigger counterpart to ``RoomClue``: where a RoomClue is found by an active Search
@@ -327,6 +329,13 @@ class ClueTrigger(SharedMemoryModel):
         ),
     )
 
+    arrival_feature = ArrivalFeature.CLUE_TRIGGERS
+    arrival_room_field = "room_profile_id"
+
+    @classmethod
+    def arrival_content(cls, room_profile_id: int) -> models.QuerySet[ClueTrigger]:
+        return cls.objects.filter(room_profile_id=room_profile_id, is_active=True)
+
     class Meta:
         ordering = ["room_profile", "clue"]
         verbose_name = "Clue Trigger"
@@ -505,6 +505,21 @@ class TestCodexTreeQueryCount(TestCase):
         for subject in self.subjects[1:]:
             assert relevant[subject.name] == 2
 
+    def test_unchanged_tree_revalidates_with_304(self):
+        """A poll carrying the tree's ETag skips the tree build entirely."""
+        etag = self.client.get("/api/codex/categories/tree/")["ETag"]
+
+        # Only the session read and the visibility set remain:
+        #   1. SELECT django_session
+        #   2. SELECT public CodexEntry ids
+        with self.assertNumQueries(2):
+            response = self.client.get("/api/codex/categories/tree/", HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        CodexEntryFactory(subject=self.subjects[0], name="QC newly public", is_public=True)
+        response = self.client.get("/api/codex/categories/tree/", HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+
 
 class PerspectiveOfFieldTests(TestCase):
     """perspective_of names the flagged holder; null on plain entries (#3277)."""
@@ -21,6 +21,7 @@ from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
+from web.api.mixins import ConditionalGetMixin
 from world.codex.filters import CodexEntryFilter
 from world.codex.models import (
     BeginningsCodexGrant,
@@ -147,12 +148,28 @@ class CodexVisibilityMixin:
         return _subjects_with_visible_entries(self._visible_entry_ids())
 
 
-class CodexCategoryViewSet(CodexVisibilityMixin, viewsets.ReadOnlyModelViewSet):
+class CodexCategoryViewSet(
+    ConditionalGetMixin, CodexVisibilityMixin, viewsets.ReadOnlyModelViewSet
+):
     """List and retrieve codex categories with a visible subtree."""
 
     serializer_class = CodexCategorySerializer
     permission_classes = [AllowAny]
     pagination_class = None
+    # Authored taxonomy edits (renames, reordering) don't move the tree's
+    # version parts; they land within this window.
+    etag_max_age = 300
+
+    def get_version_parts(self) -> tuple[int, ...] | None:
+        """Version ``tree`` by its visibility set, which decides everything it shows.
+
+        ``_visible_entry_ids`` is memoized on the view, so a changed tree reuses
+        it and pays no extra queries; an unchanged one skips the subject walk,
+        the annotation query, and serialization.
+        """
+        if self.action != "tree":
+            return None
+        return tuple(sorted(self._visible_entry_ids()))
 
     def get_queryset(self):
         """Only categories with at least one visible subject."""
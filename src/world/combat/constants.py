@@ -87,6 +87,28 @@ class PaceMode(models.TextChoices):
     MANUAL = "manual", "Manual"
 
 
+class RoundJobStatus(models.TextChoices):
+    """Lifecycle of an asynchronous round-resolution job (world.combat.round_jobs)."""
+
+    QUEUED = "queued", "Queued"
+    RUNNING = "running", "Running"
+    SUCCEEDED = "succeeded", "Succeeded"
+    FAILED = "failed", "Failed"
+
+
+class RoundPhase(models.TextChoices):
+    """Checkpoints ``resolve_round`` reports through its ``on_phase`` callback."""
+
+    NPC_ACTIONS_SELECTED = "npc_actions_selected", "NPC actions selected"
+    ROUND_STARTED = "round_started", "Round started, combos detected"
+    TRIGGERS_REFRESHED = "triggers_refreshed", "Passives and triggers refreshed"
+    ACTIONS_RESOLVED = "actions_resolved", "Actions resolved, damage applied"
+    CHALLENGES_RESOLVED = "challenges_resolved", "Challenges resolved"
+    CLASHES_RESOLVED = "clashes_resolved", "Clashes resolved"
+    CONDITIONS_TICKED = "conditions_ticked", "Conditions ticked"
+    ROUND_CLOSED = "round_closed", "Round closed"
+
+
 class ParticipantStatus(models.TextChoices):
     """Current status of a PC participant in an encounter."""
 
@@ -1,12 +1,14 @@
 """Models for the combat system."""
 
+from datetime import datetime, timedelta
 from decimal import Decimal
+from functools import partial
 from typing import TYPE_CHECKING
 
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models
+from django.db import models, transaction
 from django.db.models import F, Q
 from django.utils import timezone
 from django.utils.functional import cached_property
@@ -66,6 +68,7 @@ from world.gm.constants import GMLevel
 from world.magic.constants import EffectKind, VitalBonusTarget
 from world.magic.models.commitments import CommittingDeclaration
 from world.magic.types.aura import AffinityType
+from world.scenes.constants import RoundStatus
 from world.scenes.round_models import AbstractRound
 
 # Lazy model references (Django app_label.ModelName), extracted to satisfy S1192.
@@ -77,6 +80,11 @@ CHARACTER_SHEET_MODEL = "arxii.CharacterSheet"
 TECHNIQUE_MODEL = "arxii.Technique"
 COMBAT_PARTICIPANT_MODEL = "arxii.CombatParticipant"
 COMBAT_ENCOUNTER_MODEL = "arxii.CombatEncounter"
+
+# Fields whose change can move, arm or disarm a timed round's deadline timer.
+_ROUND_TIMER_FIELDS = frozenset(
+    {"status", "pace_mode", "pace_timer_minutes", "is_paused", "round_started_at"}
+)
 OBJECTS_OBJECTDB_MODEL = "objects.ObjectDB"
 
 _MUST_BE_NULL_FOR_KIND = "Must be null for this kind."
@@ -239,6 +247,35 @@ class CombatEncounter(AbstractRound):
             f"(Round {self.round_number}, {self.get_status_display()})"
         )
 
+    def save(self, *args: object, **kwargs: object) -> None:
+        """Save, then re-arm the round deadline timer once the write commits.
+
+        Every pause, pace change, round start and resolution is a save touching
+        one of ``_ROUND_TIMER_FIELDS``, so this is the single place the
+        in-process timer (``world.combat.tasks``) learns about them. The
+        deadline is captured now; a later save in the same transaction queues
+        its own sync after this one, so the last write wins.
+        """
+        super().save(*args, **kwargs)  # type: ignore[arg-type]
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and _ROUND_TIMER_FIELDS.isdisjoint(update_fields):  # type: ignore[arg-type]
+            return
+        from world.combat.tasks import sync_round_timer  # noqa: PLC0415
+
+        transaction.on_commit(partial(sync_round_timer, self.pk, self.round_deadline))
+
+    @property
+    def round_deadline(self) -> datetime | None:
+        """When the current TIMED round auto-resolves; None if no timer should run."""
+        if (
+            self.pace_mode != PaceMode.TIMED
+            or self.status != RoundStatus.DECLARING
+            or self.is_paused
+            or self.round_started_at is None
+        ):
+            return None
+        return self.round_started_at + timedelta(minutes=self.pace_timer_minutes)
+
     @property
     def forced_escape(self) -> bool:
         """True when an unbeatable Hero Killer is on the field (#875).
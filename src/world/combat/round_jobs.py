@@ -0,0 +1,209 @@
+"""Asynchronous round resolution for large encounters.
+
+``resolve_round`` runs every clash, combo, damage application, condition tick
+and NPC selection of a round inline, under a ``select_for_update`` lock on the
+encounter. Triggered synchronously from the REST ``resolve_round`` action, a
+big round can outlive the HTTP request. :func:`submit_round_job` instead
+queues the round and returns at once (the view answers ``202`` with the job);
+the round then resolves on a Twisted thread-pool thread — which gets its own
+Django DB connection — and reports each ``RoundPhase`` checkpoint over the
+``combat_round_progress`` websocket message.
+
+Submission is idempotent per ``(encounter, round_number)``: a second submit
+while the first is queued, running or succeeded hands back the same job, so a
+double-clicked button or a retried request never resolves a round twice. Only
+a failed job may be superseded by a fresh submission.
+
+The registry is process-local (Evennia serves the API from the single Server
+process) and keeps only the latest job per encounter. A reload drops it; any
+round whose job was mid-flight rolled back with its transaction and is simply
+still DECLARING.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+import logging
+import threading
+from typing import TYPE_CHECKING
+import uuid
+
+from django.db import close_old_connections, connections, transaction
+from twisted.internet import reactor, threads
+
+from actions.errors import ActionDispatchError
+from web.webclient.message_types import CombatRoundProgressPayload
+from world.combat.constants import RoundJobStatus, RoundPhase
+from world.combat.models import CombatEncounter, CombatParticipant
+from world.combat.types import RoundJob
+from world.scenes.constants import RoundStatus
+
+if TYPE_CHECKING:
+    from evennia.accounts.models import AccountDB
+    from evennia.objects.models import ObjectDB
+
+logger = logging.getLogger(__name__)
+
+_ERR_JOB_FAILED = "Round resolution failed. The round is still open for declarations."
+_ERR_INVALID_STATUS = "Encounter is not in a valid status for this action."
+
+_lock = threading.Lock()
+_jobs: dict[int, RoundJob] = {}
+
+
+def get_round_job(encounter_id: int) -> RoundJob | None:
+    """Return the latest round job submitted for the encounter, if any."""
+    return _jobs.get(encounter_id)
+
+
+def submit_round_job(encounter: CombatEncounter, *, submitted_by: AccountDB | None) -> RoundJob:
+    """Queue resolution of the encounter's current round; idempotent per round.
+
+    Validation that can fail fast (wrong status, a participant mid Audere
+    Majora crossing) runs here so the caller can still answer ``400``; the
+    round itself starts once the caller's transaction commits.
+
+    Raises:
+        ValueError: If the encounter is not DECLARING and no job exists for
+            this round.
+        ActionDispatchError: If a participant is mid Audere Majora crossing.
+    """
+    from world.combat.services import (  # noqa: PLC0415
+        _block_if_participant_mid_audere_majora_crossing,
+    )
+
+    existing = _reusable_job(encounter)
+    if existing is not None:
+        return existing
+    if encounter.status != RoundStatus.DECLARING:
+        raise ValueError(_ERR_INVALID_STATUS)
+    _block_if_participant_mid_audere_majora_crossing(encounter)
+    with _lock:
+        existing = _reusable_job(encounter)
+        if existing is not None:
+            return existing
+        job = RoundJob(
+            job_id=uuid.uuid4().hex,
+            encounter_id=encounter.pk,
+            round_number=encounter.round_number,
+            submitted_by_id=submitted_by.pk if submitted_by is not None else None,
+            status=RoundJobStatus.QUEUED,
+        )
+        _jobs[encounter.pk] = job
+    transaction.on_commit(lambda: _dispatch(job))
+    return job
+
+
+def _reusable_job(encounter: CombatEncounter) -> RoundJob | None:
+    """The encounter's job for its current round, unless that job failed."""
+    job = _jobs.get(encounter.pk)
+    if (
+        job is None
+        or job.round_number != encounter.round_number
+        or job.status == RoundJobStatus.FAILED
+    ):
+        return None
+    return job
+
+
+def _dispatch(job: RoundJob) -> None:
+    """Run the job on the reactor's thread pool, or inline when no reactor runs.
+
+    Submissions arrive on a web worker thread, so the hand-off to the pool is
+    routed through the reactor thread. Inline covers management shells and the
+    test runner, where there is no running reactor to hand the thread back to.
+    """
+    if reactor.running:
+        reactor.callFromThread(threads.deferToThread, _run_in_thread, job)
+    else:
+        _run(job)
+
+
+def _run_in_thread(job: RoundJob) -> None:
+    # Pool threads are reused: drop any connection a previous task left
+    # unusable before, and release this thread's connection after.
+    close_old_connections()
+    try:
+        _run(job)
+    finally:
+        connections.close_all()
+
+
+def _run(job: RoundJob) -> None:
+    from world.combat.services import resolve_round  # noqa: PLC0415
+
+    recipients = _recipients(job)
+    job.status = RoundJobStatus.RUNNING
+    _push(job, recipients)
+
+    def report(phase: str) -> None:
+        job.phase = phase
+        _push(job, recipients)
+
+    try:
+        encounter = CombatEncounter.objects.get(pk=job.encounter_id)
+        result = resolve_round(encounter, on_phase=report)
+    except ActionDispatchError as exc:
+        job.status = RoundJobStatus.FAILED
+        job.detail = exc.user_message
+    except Exception:
+        logger.exception(
+            "Round job %s failed for encounter %d round %d",
+            job.job_id,
+            job.encounter_id,
+            job.round_number,
+        )
+        job.status = RoundJobStatus.FAILED
+        job.detail = _ERR_JOB_FAILED
+    else:
+        job.status = RoundJobStatus.SUCCEEDED
+        job.encounter_completed = result.encounter_completed
+    _push(job, recipients)
+
+
+def _recipients(job: RoundJob) -> list[AccountDB | ObjectDB]:
+    """Connected participants' characters plus the submitting account, resolved once."""
+    from evennia.accounts.models import AccountDB  # noqa: PLC0415
+
+    recipients: list[AccountDB | ObjectDB] = []
+    puppeteer_ids: set[int] = set()
+    for participant in CombatParticipant.objects.filter(
+        encounter_id=job.encounter_id
+    ).select_related("character_sheet__character"):
+        character = participant.character_sheet.character
+        if character is None or not character.has_account:
+            continue
+        recipients.append(character)
+        if character.account is not None:
+            puppeteer_ids.add(character.account.pk)
+    # A GM resolving from outside the fight still wants the progress bar.
+    if job.submitted_by_id is not None and job.submitted_by_id not in puppeteer_ids:
+        submitter = AccountDB.objects.filter(pk=job.submitted_by_id).first()
+        if submitter is not None:
+            recipients.append(submitter)
+    return recipients
+
+
+def _push(job: RoundJob, recipients: list[AccountDB | ObjectDB]) -> None:
+    payload = asdict(
+        CombatRoundProgressPayload(
+            job_id=job.job_id,
+            encounter_id=job.encounter_id,
+            round_number=job.round_number,
+            status=job.status,
+            phase=job.phase,
+            phase_label=RoundPhase(job.phase).label if job.phase else "",
+            detail=job.detail,
+        )
+    )
+    for recipient in recipients:
+        recipient.msg(combat_round_progress=((), payload))
+
+
+def _reset_for_testing() -> None:
+    """Forget every job.
+
+    **For use in tests only.**
+    """
+    with _lock:
+        _jobs.clear()
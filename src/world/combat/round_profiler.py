@@ -0,0 +1,263 @@
+"""Opt-in round profiler and deterministic replay log for ``resolve_round``.
+
+A slow round gives no hint of *which* stage was slow — clash drivers, combo
+detection, damage application, trigger refreshes and condition ticks all run
+inside one ``resolve_round`` call. :class:`RoundProfiler` hangs off the
+``RoundPhase`` checkpoints the round already reports and records, per phase,
+wall time and the number of queries this thread sent.
+
+It also makes the round reproducible. Every roll in the combat pipeline goes
+through the module-level ``random`` generator, so the profiler seeds it with a
+fresh recorded seed before the round starts and snapshots the declared
+``CombatRoundAction`` rows. Together with a post-round outcome fingerprint
+that forms a :class:`~world.combat.types.RoundReplayRecord`;
+``arx manage replay_combat_round <file>`` re-runs the round against a DB
+snapshot taken before it and checks the outcome matches.
+
+Profiling is off unless ``settings.COMBAT_ROUND_REPLAY_DIR`` names a directory;
+each profiled round then writes one JSON record there once its transaction
+commits. Seeding the shared generator is a diagnostics-only trade-off: other
+threads rolling while a profiled round runs draw from the seeded sequence, and
+the generator is reseeded from OS entropy as soon as the round finishes.
+"""
+
+from __future__ import annotations
+
+from contextlib import ExitStack
+from dataclasses import asdict
+import json
+import logging
+from pathlib import Path
+import random
+import secrets
+import time
+from typing import TYPE_CHECKING, Any, Self
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, transaction
+from django.utils import timezone
+
+from world.combat.models import (
+    CombatEncounter,
+    CombatOpponent,
+    CombatParticipant,
+    CombatRoundAction,
+)
+from world.combat.types import PhaseTiming, RoundReplayRecord
+from world.scenes.constants import RoundStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+_ERR_NOT_AT_ROUND = (
+    "Encounter {encounter_id} is not declaring round {round_number}; "
+    "restore the DB snapshot taken before that round."
+)
+_ERR_ACTIONS_DIFFER = (
+    "Declared actions for round {round_number} differ from the record; "
+    "restore the DB snapshot taken before that round."
+)
+
+
+def round_profiling_enabled() -> bool:
+    """True when ``resolve_round`` should profile and record every round."""
+    return bool(settings.COMBAT_ROUND_REPLAY_DIR)
+
+
+def _as_json(value: Any) -> Any:
+    """Normalise ORM values (datetimes, decimals) the way a saved record holds them."""
+    return json.loads(json.dumps(value, cls=DjangoJSONEncoder))
+
+
+def declared_actions(encounter: CombatEncounter) -> list[dict]:
+    """The round's ``CombatRoundAction`` rows as column attname -> JSON value."""
+    columns = [f.attname for f in CombatRoundAction._meta.concrete_fields]  # noqa: SLF001
+    rows = (
+        CombatRoundAction.objects.filter(
+            participant__encounter=encounter,
+            round_number=encounter.round_number,
+        )
+        .order_by("pk")
+        .values(*columns)
+    )
+    return _as_json(list(rows))
+
+
+def round_outcome(encounter_id: int) -> dict:
+    """Fingerprint of the encounter after a round: statuses, health, boss phases.
+
+    Reads through ``values()`` so the DB — not the identity map — is what a
+    replay is compared against.
+    """
+    return _as_json(
+        {
+            "encounter": CombatEncounter.objects.filter(pk=encounter_id)
+            .values("status", "round_number")
+            .get(),
+            "opponents": list(
+                CombatOpponent.objects.filter(encounter_id=encounter_id)
+                .order_by("pk")
+                .values("pk", "status", "health", "current_phase", "swarm_count")
+            ),
+            "participants": list(
+                CombatParticipant.objects.filter(encounter_id=encounter_id)
+                .order_by("pk")
+                .values(
+                    "pk",
+                    "status",
+                    "character_sheet__vitals__health",
+                    "character_sheet__vitals__life_state",
+                )
+            ),
+        }
+    )
+
+
+class RoundProfiler:
+    """Times and records one ``resolve_round`` call; use as a context manager.
+
+    Entering snapshots the declared actions and seeds ``random``; each
+    ``RoundPhase`` checkpoint closes a :class:`PhaseTiming`; :meth:`finish`
+    adds the outcome fingerprint and returns the completed record.
+    """
+
+    def __init__(self, encounter: CombatEncounter, *, seed: int | None = None) -> None:
+        self.encounter = encounter
+        self.seed = secrets.randbits(63) if seed is None else seed
+        self.record = RoundReplayRecord(
+            encounter_id=encounter.pk,
+            round_number=encounter.round_number,
+            seed=self.seed,
+            declared_actions=[],
+        )
+        self._stack = ExitStack()
+        self._queries = 0
+        self._mark_queries = 0
+        self._mark = 0.0
+
+    def __enter__(self) -> Self:
+        self.record.declared_actions = declared_actions(self.encounter)
+        self.record.recorded_at = timezone.now().isoformat()
+        self._stack.enter_context(connection.execute_wrapper(self._count_query))
+        random.seed(self.seed)
+        self._mark = time.perf_counter()
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self._stack.close()
+        # Back to OS entropy: rolls after the round must not be predictable.
+        random.seed()
+
+    def _count_query(
+        self,
+        execute: Callable[..., Any],
+        sql: str,
+        params: Any,
+        many: bool,
+        context: dict[str, Any],
+    ) -> Any:
+        self._queries += 1
+        return execute(sql, params, many, context)
+
+    def checkpoint(self, phase: str) -> None:
+        """Close the timing window that ends at ``phase``."""
+        now = time.perf_counter()
+        self.record.phases.append(
+            PhaseTiming(
+                phase=phase,
+                wall_ms=round((now - self._mark) * 1000, 3),
+                queries=self._queries - self._mark_queries,
+            )
+        )
+        self._mark = now
+        self._mark_queries = self._queries
+
+    def phase_hook(self, on_phase: Callable[[str], None] | None) -> Callable[[str], None]:
+        """A ``resolve_round`` progress callback that checkpoints, then forwards."""
+
+        def report(phase: str) -> None:
+            self.checkpoint(phase)
+            if on_phase is not None:
+                on_phase(phase)
+
+        return report
+
+    def finish(self) -> RoundReplayRecord:
+        """Add the post-round outcome fingerprint and return the record."""
+        self.record.outcome = round_outcome(self.record.encounter_id)
+        return self.record
+
+
+def replay_record_path(record: RoundReplayRecord) -> Path:
+    """Where a profiled round's record is written under the replay directory."""
+    name = f"encounter-{record.encounter_id}-round-{record.round_number}-{record.seed:x}.json"
+    return Path(settings.COMBAT_ROUND_REPLAY_DIR) / name
+
+
+def write_replay_record(record: RoundReplayRecord, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(asdict(record), indent=2))
+
+
+def load_replay_record(path: Path) -> RoundReplayRecord:
+    data = json.loads(path.read_text())
+    data["phases"] = [PhaseTiming(**phase) for phase in data["phases"]]
+    return RoundReplayRecord(**data)
+
+
+def save_replay_record_on_commit(record: RoundReplayRecord) -> None:
+    """Log the round's profile and write its record once the round commits.
+
+    A rolled-back round never happened, so it leaves no record behind.
+    """
+
+    def _save() -> None:
+        total_ms = sum(phase.wall_ms for phase in record.phases)
+        total_queries = sum(phase.queries for phase in record.phases)
+        slowest = max(record.phases, key=lambda phase: phase.wall_ms, default=None)
+        logger.info(
+            "Round %d of encounter %d: %.0f ms, %d queries (slowest phase %s)",
+            record.round_number,
+            record.encounter_id,
+            total_ms,
+            total_queries,
+            slowest.phase if slowest is not None else "-",
+        )
+        path = replay_record_path(record)
+        try:
+            write_replay_record(record, path)
+        except OSError:
+            # Diagnostics only — a full disk must not surface as a failed round.
+            logger.exception("Could not write combat round replay record %s", path)
+
+    transaction.on_commit(_save)
+
+
+def replay_round(record: RoundReplayRecord) -> RoundReplayRecord:
+    """Re-run a recorded round with its seed and return the fresh record.
+
+    The caller owns the transaction (the management command rolls back unless
+    asked to commit). Compare ``record.outcome`` with the returned record's.
+
+    Raises:
+        CombatEncounter.DoesNotExist: If the encounter is gone.
+        ValueError: If the DB is not at the recorded round's declaration
+            phase, or its declared actions differ from the record.
+    """
+    from world.combat.services import resolve_round  # noqa: PLC0415
+
+    encounter = CombatEncounter.objects.get(pk=record.encounter_id)
+    if encounter.status != RoundStatus.DECLARING or encounter.round_number != record.round_number:
+        raise ValueError(
+            _ERR_NOT_AT_ROUND.format(
+                encounter_id=record.encounter_id, round_number=record.round_number
+            )
+        )
+    if declared_actions(encounter) != record.declared_actions:
+        raise ValueError(_ERR_ACTIONS_DIFFER.format(round_number=record.round_number))
+    profiler = RoundProfiler(encounter, seed=record.seed)
+    resolve_round(encounter, profiler=profiler)
+    return profiler.record
@@ -25,6 +25,7 @@ from world.combat.constants import (
     EncounterOutcome,
     OpponentTier,
     ParticipantStatus,
+    RoundJobStatus,
 )
 from world.combat.models import (
     Clash,
@@ -1261,6 +1262,28 @@ class RemoveParticipantSerializer(serializers.Serializer):
     participant_id = serializers.IntegerField()
 
 
+class ResolveRoundSerializer(serializers.Serializer):
+    """Write serializer for ``resolve_round``.
+
+    ``run_as_job`` queues the round (world.combat.round_jobs) and answers
+    ``202`` with the job instead of resolving inside the request.
+    """
+
+    run_as_job = serializers.BooleanField(default=False)
+
+
+class RoundJobSerializer(serializers.Serializer):
+    """Read serializer for a ``world.combat.types.RoundJob``."""
+
+    job_id = serializers.CharField(read_only=True)
+    encounter_id = serializers.IntegerField(read_only=True)
+    round_number = serializers.IntegerField(read_only=True)
+    status = serializers.ChoiceField(choices=RoundJobStatus.choices, read_only=True)
+    phase = serializers.CharField(read_only=True)
+    detail = serializers.CharField(read_only=True)
+    encounter_completed = serializers.BooleanField(read_only=True)
+
+
 class UpgradeComboSerializer(serializers.Serializer):
     """Write serializer for upgrading an action to a combo."""
 
@@ -126,6 +126,7 @@ from world.combat.constants import (
     OpponentTier,
     PaceMode,
     ParticipantStatus,
+    RoundPhase,
     StrikeDelivery,
     SustainedKind,
     TargetingMode,
@@ -161,6 +162,11 @@ from world.combat.models import (
     ThreatPoolEntry,
     ThreatRecord,
 )
+from world.combat.round_profiler import (
+    RoundProfiler,
+    round_profiling_enabled,
+    save_replay_record_on_commit,
+)
 from world.combat.types import (
     ActionOutcome,
     AvailableCombo,
@@ -1715,7 +1721,7 @@ def maybe_resolve_on_ready(encounter: CombatEncounter) -> RoundResolutionResult
     """Resolve the round early when every ACTIVE participant is ready (#2120).
 
     Only applies in ``PaceMode.READY`` — ``TIMED`` encounters keep resolving via
-    the game-clock sweep (``check_and_resolve_timed_encounters``); ``MANUAL``
+    their deadline timer (``world.combat.tasks``); ``MANUAL``
     encounters resolve only on an explicit GM/force-resolve call. Compares the
     ACTIVE participant count against this round's ``is_ready=True``
     ``CombatRoundAction`` count; when they're equal (and non-zero — an
@@ -6000,7 +6006,7 @@ def _apply_passive_technique(
     )
 
 
-def _refresh_participant_trigger_handlers(encounter: CombatEncounter) -> None:
+def _refresh_participant_round_caches(encounter: CombatEncounter) -> None:
     """Make passive-installed reactive triggers visible within the same round.
 
     ``_resolve_passive_actions`` may install reactive conditions (e.g. DEFEND's
@@ -6015,16 +6021,22 @@ def _refresh_participant_trigger_handlers(encounter: CombatEncounter) -> None:
     freshly ``bulk_create``d rows (already visible in this transaction) are loaded
     before ``_resolve_actions`` runs. The deferred ``on_commit(_reset)`` remains
     intact as the cross-transaction/rollback safety net.
+
+    Then prefetch every participant's condition effect digest, so the targeting,
+    gating and check-modifier reads of the round are served from memory.
     """
+    from world.conditions.digest import prefetch_condition_digests  # noqa: PLC0415
+
     participants = CombatParticipant.objects.filter(
         encounter=encounter,
         status=ParticipantStatus.ACTIVE,
     ).select_related("character_sheet__character")
-    for participant in participants:
-        character = participant.character_sheet.character
+    characters = [participant.character_sheet.character for participant in participants]
+    for character in characters:
         handler = character.trigger_handler
         if handler is not None:
             handler.refresh()
+    prefetch_condition_digests(characters)
 
 
 def _resolve_passive_actions(
@@ -10896,14 +10908,14 @@ def _break_bar_contributor_labels(boss: CombatOpponent) -> list[str]:
 
 
 @transaction.atomic
-def resolve_round(  # noqa: PLR0915 - orchestration function; already at the
-    # single-helper-call budget (see _fire_round_start), and the #1899
-    # climactic-moment guard is one more mandatory statement past the limit.
+def resolve_round(  # noqa: PLR0913 - check hooks, progress and profiler are distinct
     encounter: CombatEncounter,
     *,
     defense_check_fn: PerformCheckFn | None = None,
     defense_check_type: CheckType | None = None,
     offense_check_fn: PerformCheckFn | None = None,
+    on_phase: Callable[[str], None] | None = None,
+    profiler: RoundProfiler | None = None,
 ) -> RoundResolutionResult:
     """Orchestrate a full combat round: detect combos -> resolve -> consequences.
 
@@ -10948,10 +10960,61 @@ def resolve_round(  # noqa: PLR0915 - orchestration function; already at the
             (the caster's personal check, falling back to the declared technique's
             action_template.check_type only when unprovisioned, ADR-0096) — it is
             no longer passed externally.
+        on_phase: Optional progress callback, called with a ``RoundPhase`` value
+            at each checkpoint. Runs inside the round's transaction, so it must
+            only report — the async job runner (world.combat.round_jobs) pushes
+            these to clients as they happen.
+        profiler: Optional ``RoundProfiler`` to time and record this round
+            under (the replay command passes one carrying the recorded seed).
+            Without one, a profiler is created — and its replay record saved
+            on commit — only when ``settings.COMBAT_ROUND_REPLAY_DIR`` is set.
 
     Returns:
         ``RoundResolutionResult`` with outcomes and phase transitions.
     """
+    from world.conditions.digest import condition_digest_scope  # noqa: PLC0415
+    from world.magic.services import technique_stats_scope  # noqa: PLC0415
+
+    persist = profiler is None and round_profiling_enabled()
+    if persist:
+        profiler = RoundProfiler(encounter)
+    # One runtime-stat memo and one condition-digest memo for the whole round:
+    # every cast of a participant's technique after the first reads its
+    # intensity/control from it, and condition reads hit the digests.
+    if profiler is None:
+        with technique_stats_scope(), condition_digest_scope():
+            return _resolve_round(
+                encounter,
+                defense_check_fn=defense_check_fn,
+                defense_check_type=defense_check_type,
+                offense_check_fn=offense_check_fn,
+                report_phase=on_phase or _ignore_phase,
+            )
+    with profiler, technique_stats_scope(), condition_digest_scope():
+        result = _resolve_round(
+            encounter,
+            defense_check_fn=defense_check_fn,
+            defense_check_type=defense_check_type,
+            offense_check_fn=offense_check_fn,
+            report_phase=profiler.phase_hook(on_phase),
+        )
+    record = profiler.finish()
+    if persist:
+        save_replay_record_on_commit(record)
+    return result
+
+
+def _resolve_round(  # noqa: PLR0915 - orchestration function; already at the
+    # single-helper-call budget (see _fire_round_start), and the #1899
+    # climactic-moment guard is one more mandatory statement past the limit.
+    encounter: CombatEncounter,
+    *,
+    defense_check_fn: PerformCheckFn | None,
+    defense_check_type: CheckType | None,
+    offense_check_fn: PerformCheckFn | None,
+    report_phase: Callable[[str], None],
+) -> RoundResolutionResult:
+    """Body of :func:`resolve_round`, run inside its transaction (and profiler)."""
     _block_if_participant_mid_audere_majora_crossing(encounter)
 
     enc = CombatEncounter.objects.select_for_update().get(pk=encounter.pk)
@@ -10989,6 +11052,7 @@ def resolve_round(  # noqa: PLR0915 - orchestration function; already at the
     from world.combat.berserk_compulsion import select_berserk_actions  # noqa: PLC0415
 
     select_berserk_actions(enc)
+    report_phase(RoundPhase.NPC_ACTIONS_SELECTED)
 
     enc.status = RoundStatus.RESOLVING
     enc.save(update_fields=["status"])
@@ -10998,6 +11062,7 @@ def resolve_round(  # noqa: PLR0915 - orchestration function; already at the
 
     # --- Round-start lifecycle: emit event, drain upkeep, detect combos ---
     result.available_combos = _fire_round_start(enc, round_number)
+    report_phase(RoundPhase.ROUND_STARTED)
 
     # --- Vulnerability window countdown (#2016) ---
     CombatOpponent.objects.filter(
@@ -11087,8 +11152,9 @@ def resolve_round(  # noqa: PLR0915 - orchestration function; already at the
     # --- Resolve in speed-rank order ---
     resolution_order = get_resolution_order(encounter)
     _resolve_passive_actions(encounter, pc_actions)
-    _refresh_participant_trigger_handlers(encounter)
+    _refresh_participant_round_caches(encounter)
     _ensure_reactive_challenges(encounter, pc_actions)
+    report_phase(RoundPhase.TRIGGERS_REFRESHED)
     result.action_outcomes = _resolve_actions(
         resolution_order,
         pc_actions,
@@ -11105,6 +11171,7 @@ def resolve_round(  # noqa: PLR0915 - orchestration function; already at the
         enc,
         round_number,
     )
+    report_phase(RoundPhase.ACTIONS_RESOLVED)
 
     # --- Post-pass: deferred challenge declarations (in initiative order) ---
     result.challenge_outcomes = _resolve_declared_challenges(
@@ -11112,6 +11179,7 @@ def resolve_round(  # noqa: PLR0915 - orchestration function; already at the
         round_number,
         resolution_order,
     )
+    report_phase(RoundPhase.CHALLENGES_RESOLVED)
 
     # --- Post-pass: clash opportunity detection + per-round drivers ---
     result.clash_outcomes = _resolve_clashes(
@@ -11119,6 +11187,7 @@ def resolve_round(  # noqa: PLR0915 - orchestration function; already at the
         round_number,
         resolution_order,
     )
+    report_phase(RoundPhase.CLASHES_RESOLVED)
 
     # --- Break-bar assessment (#2016, diversity-weighted feeds #2642) ---
     # Runs AFTER the clash post-pass (not before, as pre-#2642) so the HOLD
@@ -11143,6 +11212,7 @@ def resolve_round(  # noqa: PLR0915 - orchestration function; already at the
     end_targets = [p.character_sheet.character for p in active_participants]
     end_targets += [opp.objectdb for opp in active_opponents_end if opp.objectdb is not None]
     tick_round_for_targets(end_targets, timing="end")
+    report_phase(RoundPhase.CONDITIONS_TICKED)
 
     # --- Sent Flying explicit resolution (#2638): every unanswered marker
     # resolves now — plummet chain or hard impact. Deliberately AFTER the
@@ -11188,10 +11258,15 @@ def resolve_round(  # noqa: PLR0915 - orchestration function; already at the
         enc.round_started_at = None
         enc.save(update_fields=["status", "round_started_at"])
     encounter.refresh_from_db()
+    report_phase(RoundPhase.ROUND_CLOSED)
 
     return result
 
 
+def _ignore_phase(_phase: str) -> None:
+    """Default ``resolve_round`` progress callback: report nowhere."""
+
+
 # ---------------------------------------------------------------------------
 # Clash tuning singleton accessors
 # ---------------------------------------------------------------------------
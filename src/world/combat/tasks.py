@@ -1,28 +1,127 @@
-"""Combat timer task for auto-resolving timed rounds."""
+"""Combat round timers for auto-resolving timed rounds.
+
+Each TIMED encounter in its declaration phase gets one reactor ``callLater``
+armed at its exact deadline (``CombatEncounter.round_deadline``), so a
+two-minute round resolves at two minutes rather than at the next game tick.
+``CombatEncounter.save()`` re-arms or cancels the timer after every commit that
+touches the round's timing — round start, pause/unpause, pace change,
+resolution — and ``rebuild_round_timers`` re-arms every live round on server
+start, since timers do not survive a reload.
+
+``check_and_resolve_timed_encounters`` stays registered with the game clock as
+a safety net for rounds whose timer was lost; it skips encounters that have a
+timer armed in this process.
+"""
 
 from __future__ import annotations
 
-from datetime import timedelta
+from datetime import datetime
 import logging
+from typing import TYPE_CHECKING
 
 from django.db import transaction
 from django.utils import timezone
+from twisted.internet import reactor
 
 from world.combat.constants import PaceMode
 from world.combat.models import CombatEncounter
 from world.scenes.constants import RoundStatus
 
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+    from twisted.internet.base import DelayedCall
+    from twisted.internet.interfaces import IReactorTime
+
 logger = logging.getLogger(__name__)
 
+# Scheduler used to arm timers. Tests swap in ``twisted.internet.task.Clock``.
+_clock: IReactorTime = reactor  # ty: ignore[invalid-assignment]
+
+# Armed deadline timers, keyed by encounter pk.
+_round_timers: dict[int, DelayedCall] = {}
+
+
+def _live_timed_encounters() -> QuerySet[CombatEncounter]:
+    return CombatEncounter.objects.filter(
+        status=RoundStatus.DECLARING,
+        pace_mode=PaceMode.TIMED,
+        is_paused=False,
+        round_started_at__isnull=False,
+    )
+
+
+def sync_round_timer(encounter_id: int, deadline: datetime | None) -> None:
+    """Arm, move or cancel one encounter's round timer.
+
+    Args:
+        encounter_id: The encounter's pk.
+        deadline: When its round auto-resolves, or None to cancel the timer.
+    """
+    existing = _round_timers.pop(encounter_id, None)
+    if existing is not None and existing.active():
+        existing.cancel()
+    if deadline is None:
+        return
+    delay = max((deadline - timezone.now()).total_seconds(), 0.0)
+    _round_timers[encounter_id] = _clock.callLater(delay, _fire_round_timer, encounter_id)
+
+
+def rebuild_round_timers() -> int:
+    """Re-arm timers for every live TIMED round. Called on server start.
+
+    Returns the number of timers armed.
+    """
+    encounters = list(_live_timed_encounters())
+    for encounter in encounters:
+        sync_round_timer(encounter.pk, encounter.round_deadline)
+    return len(encounters)
+
+
+def _fire_round_timer(encounter_id: int) -> None:
+    """Timer callback: resolve the round, or re-arm if it woke before the deadline."""
+    _round_timers.pop(encounter_id, None)
+    try:
+        resolved = _resolve_if_expired(encounter_id, timezone.now())
+    except CombatEncounter.DoesNotExist:
+        return  # Resolved by a GM or no longer declaring.
+    except Exception:
+        logger.exception("Failed to auto-resolve encounter %d", encounter_id)
+        return
+    if not resolved:
+        # The reactor clock ran slightly ahead of the wall clock; try again.
+        encounter = CombatEncounter.objects.filter(pk=encounter_id).first()
+        if encounter is not None:
+            sync_round_timer(encounter_id, encounter.round_deadline)
+
+
+def _resolve_if_expired(encounter_id: int, now: datetime) -> bool:
+    """Lock one encounter and resolve its round if the deadline has passed.
+
+    Raises ``CombatEncounter.DoesNotExist`` when it is no longer declaring.
+    """
+    with transaction.atomic():
+        enc = CombatEncounter.objects.select_for_update().get(
+            pk=encounter_id,
+            status=RoundStatus.DECLARING,  # Re-check under lock
+        )
+        deadline = enc.round_deadline
+        if deadline is None or now < deadline:
+            return False
+        from world.combat.services import resolve_round  # noqa: PLC0415
+
+        resolve_round(enc)
+    logger.info("Auto-resolved timed encounter %d (round %d)", enc.pk, enc.round_number)
+    return True
+
 
 def check_and_resolve_timed_encounters() -> list[int]:
     """Find expired timed encounters and auto-resolve them.
 
-    Called periodically by the game clock scheduler. Queries for
-    DECLARING encounters in TIMED mode past their deadline, then
-    resolves each one individually. Each encounter is locked and
-    resolved in its own transaction to prevent one failure from
-    blocking others.
+    Safety net behind the per-round timers, called periodically by the game
+    clock scheduler. Queries for DECLARING encounters in TIMED mode that have
+    no timer armed in this process, then resolves each one past its deadline
+    individually. Each encounter is locked and resolved in its own transaction
+    to prevent one failure from blocking others.
 
     Returns list of resolved encounter IDs.
     """
@@ -30,35 +129,14 @@ def check_and_resolve_timed_encounters() -> list[int]:
 
     # Find candidates without locking
     candidate_ids = list(
-        CombatEncounter.objects.filter(
-            status=RoundStatus.DECLARING,
-            pace_mode=PaceMode.TIMED,
-            is_paused=False,
-            round_started_at__isnull=False,
-        ).values_list("pk", flat=True)
+        _live_timed_encounters().exclude(pk__in=list(_round_timers)).values_list("pk", flat=True)
     )
 
     resolved_ids: list[int] = []
     for enc_id in candidate_ids:
         try:
-            with transaction.atomic():
-                enc = CombatEncounter.objects.select_for_update().get(
-                    pk=enc_id,
-                    status=RoundStatus.DECLARING,  # Re-check under lock
-                )
-                deadline = enc.round_started_at + timedelta(
-                    minutes=enc.pace_timer_minutes,
-                )
-                if now >= deadline:
-                    from world.combat.services import resolve_round  # noqa: PLC0415
-
-                    resolve_round(enc)
-                    resolved_ids.append(enc_id)
-                    logger.info(
-                        "Auto-resolved timed encounter %d (round %d)",
-                        enc.pk,
-                        enc.round_number,
-                    )
+            if _resolve_if_expired(enc_id, now):
+                resolved_ids.append(enc_id)
         except CombatEncounter.DoesNotExist:
             pass  # Already resolved by GM or status changed
         except Exception:
@@ -175,7 +175,7 @@ class ShieldedConditionHalvesDamageTest(TestCase):
         resolve_round → _resolve_passive_actions → _apply_passive_technique (ALLY)
             → bulk_apply_conditions → _install_reactive_side_effects installs the
               Shielded reactive Trigger on the ally (bulk_create, in-transaction) →
-        _refresh_participant_trigger_handlers refreshes the ally's TriggerHandler
+        _refresh_participant_round_caches refreshes the ally's TriggerHandler
             SYNCHRONOUSLY so the new Trigger is visible THIS round →
         NPC fixed-damage attack → apply_damage_to_participant emits
             DAMAGE_PRE_APPLY → ally's Shielded trigger fires MODIFY_PAYLOAD(0.5) →
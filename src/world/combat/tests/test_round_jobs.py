@@ -0,0 +1,112 @@
+"""Tests for asynchronous round-resolution jobs (world.combat.round_jobs)."""
+
+from __future__ import annotations
+
+from unittest import mock
+
+from django.test import TestCase
+from rest_framework import status as http_status
+from rest_framework.test import APIClient
+
+from evennia_extensions.factories import AccountFactory
+from world.combat import round_jobs
+from world.combat.constants import RoundJobStatus, RoundPhase
+from world.combat.factories import CombatEncounterFactory
+from world.combat.services import resolve_round
+from world.scenes.constants import RoundStatus
+from world.scenes.factories import SceneFactory, SceneParticipationFactory
+
+
+class RoundJobApiTests(TestCase):
+    """``resolve_round`` with ``run_as_job``: 202, progress pushes, idempotency."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.gm_account = AccountFactory(username="round_job_gm")
+        cls.scene = SceneFactory()
+        SceneParticipationFactory(scene=cls.scene, account=cls.gm_account, is_gm=True)
+
+    def setUp(self) -> None:
+        round_jobs._reset_for_testing()
+        self.encounter = CombatEncounterFactory(
+            scene=self.scene, status=RoundStatus.DECLARING, round_number=1
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.gm_account)
+
+    def _submit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(
+                f"/api/combat/{self.encounter.pk}/resolve_round/",
+                {"run_as_job": True},
+                format="json",
+            )
+
+    def test_job_mode_answers_202_then_resolves_the_round(self) -> None:
+        response = self._submit()
+
+        self.assertEqual(response.status_code, http_status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data["status"], RoundJobStatus.QUEUED)
+        job = round_jobs.get_round_job(self.encounter.pk)
+        self.assertEqual(job.job_id, response.data["job_id"])
+        self.assertEqual(job.status, RoundJobStatus.SUCCEEDED)
+        self.encounter.refresh_from_db()
+        self.assertNotEqual(self.encounter.status, RoundStatus.DECLARING)
+
+    def test_submitter_receives_each_phase_in_order(self) -> None:
+        # setUpTestData attributes are deep-copied per test; patch the class so
+        # the idmapped instance the job loads is covered too.
+        with mock.patch.object(type(self.gm_account), "msg") as mock_msg:
+            self._submit()
+
+        payloads = [c.kwargs["combat_round_progress"][1] for c in mock_msg.call_args_list]
+        self.assertEqual(payloads[0]["status"], RoundJobStatus.RUNNING)
+        self.assertEqual(payloads[-1]["status"], RoundJobStatus.SUCCEEDED)
+        phases = [p["phase"] for p in payloads[1:-1]]
+        self.assertEqual(phases[0], RoundPhase.NPC_ACTIONS_SELECTED)
+        self.assertIn(RoundPhase.CLASHES_RESOLVED, phases)
+        self.assertEqual(phases[-1], RoundPhase.ROUND_CLOSED)
+        self.assertEqual(payloads[-1]["phase_label"], RoundPhase.ROUND_CLOSED.label)
+
+    def test_double_submission_returns_the_same_job(self) -> None:
+        with mock.patch("world.combat.services.resolve_round", wraps=resolve_round) as resolve:
+            first = self._submit()
+            second = self._submit()
+
+        self.assertEqual(second.status_code, http_status.HTTP_202_ACCEPTED)
+        self.assertEqual(first.data["job_id"], second.data["job_id"])
+        self.assertEqual(second.data["status"], RoundJobStatus.SUCCEEDED)
+        resolve.assert_called_once()
+
+    def test_failed_job_reports_safe_detail_and_allows_resubmission(self) -> None:
+        with mock.patch("world.combat.services.resolve_round", side_effect=RuntimeError("boom")):
+            first = self._submit()
+        job = round_jobs.get_round_job(self.encounter.pk)
+
+        self.assertEqual(job.status, RoundJobStatus.FAILED)
+        self.assertEqual(job.detail, round_jobs._ERR_JOB_FAILED)
+        second = self._submit()
+        self.assertNotEqual(first.data["job_id"], second.data["job_id"])
+        self.assertEqual(
+            round_jobs.get_round_job(self.encounter.pk).status, RoundJobStatus.SUCCEEDED
+        )
+
+    def test_job_mode_rejects_encounter_not_declaring(self) -> None:
+        self.encounter.status = RoundStatus.BETWEEN_ROUNDS
+        self.encounter.save(update_fields=["status"])
+
+        response = self._submit()
+
+        self.assertEqual(response.status_code, http_status.HTTP_400_BAD_REQUEST)
+        self.assertIsNone(round_jobs.get_round_job(self.encounter.pk))
+
+    def test_round_job_endpoint_reports_latest_job(self) -> None:
+        missing = self.client.get(f"/api/combat/{self.encounter.pk}/round_job/")
+        job_id = self._submit().data["job_id"]
+
+        response = self.client.get(f"/api/combat/{self.encounter.pk}/round_job/")
+
+        self.assertEqual(missing.status_code, http_status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.status_code, http_status.HTTP_200_OK)
+        self.assertEqual(response.data["job_id"], job_id)
+        self.assertEqual(response.data["status"], RoundJobStatus.SUCCEEDED)
@@ -0,0 +1,156 @@
+"""Tests for the round profiler, replay records and ``replay_combat_round``."""
+
+from __future__ import annotations
+
+import contextlib
+from decimal import Decimal
+from io import StringIO
+from pathlib import Path
+import tempfile
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import transaction
+from django.test import TestCase, override_settings
+from evennia.utils.idmapper.models import flush_cache
+
+from actions.factories import ActionTemplateFactory
+from world.character_sheets.factories import CharacterSheetFactory
+from world.checks.factories import CheckTypeFactory
+from world.combat.constants import ActionCategory, OpponentTier, RoundPhase
+from world.combat.factories import (
+    CombatEncounterFactory,
+    CombatOpponentFactory,
+    CombatParticipantFactory,
+    ThreatPoolEntryFactory,
+    ThreatPoolFactory,
+)
+from world.combat.models import CombatEncounter, CombatOpponentAction, CombatRoundAction
+from world.combat.round_profiler import (
+    RoundProfiler,
+    load_replay_record,
+    write_replay_record,
+)
+from world.combat.services import resolve_round
+from world.combat.types import RoundReplayRecord
+from world.conditions.factories import DamageSuccessLevelMultiplierFactory
+from world.magic.factories import EffectTypeFactory, GiftFactory, TechniqueFactory
+from world.scenes.constants import RoundStatus
+from world.seeds.checks import seed_check_resolution_tables
+from world.vitals.models import CharacterVitals
+
+
+class _Rollback(Exception):
+    pass
+
+
+class RoundProfilerTests(TestCase):
+    """Per-phase profile, replay record on commit, and deterministic replay."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        seed_check_resolution_tables()
+        cls.effect_attack = EffectTypeFactory(name="Attack", base_power=20)
+        cls.gift = GiftFactory()
+        DamageSuccessLevelMultiplierFactory(
+            min_success_level=1, multiplier=Decimal("1.00"), label="Full"
+        )
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.replay_dir = Path(tmp.name)
+        self.encounter = CombatEncounterFactory(status=RoundStatus.DECLARING, round_number=1)
+        pool = ThreatPoolFactory()
+        entry = ThreatPoolEntryFactory(pool=pool, base_damage=30)
+        opponent = CombatOpponentFactory(
+            encounter=self.encounter,
+            tier=OpponentTier.MOOK,
+            health=50,
+            max_health=50,
+            threat_pool=pool,
+        )
+        sheet = CharacterSheetFactory()
+        participant = CombatParticipantFactory(encounter=self.encounter, character_sheet=sheet)
+        CharacterVitals.objects.create(character_sheet=sheet, health=100, max_health=100)
+        technique = TechniqueFactory(
+            gift=self.gift,
+            effect_type=self.effect_attack,
+            action_template=ActionTemplateFactory(check_type=CheckTypeFactory()),
+        )
+        self.action = CombatRoundAction.objects.create(
+            participant=participant,
+            round_number=1,
+            focused_category=ActionCategory.PHYSICAL,
+            focused_action=technique,
+            focused_opponent_target=opponent,
+        )
+        npc_action = CombatOpponentAction.objects.create(
+            opponent=opponent, round_number=1, threat_entry=entry
+        )
+        npc_action.targets.add(participant)
+
+    def _record_and_roll_back(self) -> RoundReplayRecord:
+        """Profile the round, then unwind it — the test's 'DB snapshot'."""
+        profiler = RoundProfiler(self.encounter)
+        with contextlib.suppress(_Rollback), transaction.atomic():
+            resolve_round(self.encounter, profiler=profiler)
+            raise _Rollback
+        flush_cache()
+        path = self.replay_dir / "round.json"
+        write_replay_record(profiler.record, path)
+        return profiler.record
+
+    def test_profiled_round_writes_record_on_commit(self) -> None:
+        with (
+            override_settings(COMBAT_ROUND_REPLAY_DIR=str(self.replay_dir)),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            resolve_round(self.encounter)
+
+        [path] = self.replay_dir.iterdir()
+        record = load_replay_record(path)
+        self.assertEqual(record.encounter_id, self.encounter.pk)
+        self.assertEqual([a["id"] for a in record.declared_actions], [self.action.pk])
+        phases = [timing.phase for timing in record.phases]
+        self.assertEqual(phases[0], RoundPhase.NPC_ACTIONS_SELECTED)
+        self.assertEqual(phases[-1], RoundPhase.ROUND_CLOSED)
+        self.assertIn(RoundPhase.TRIGGERS_REFRESHED, phases)
+        self.assertGreater(sum(timing.queries for timing in record.phases), 0)
+        self.assertEqual(record.outcome["encounter"]["status"], RoundStatus.BETWEEN_ROUNDS)
+
+    def test_unprofiled_round_writes_nothing(self) -> None:
+        with self.captureOnCommitCallbacks(execute=True):
+            resolve_round(self.encounter)
+
+        self.assertEqual(list(self.replay_dir.iterdir()), [])
+
+    def test_replay_reproduces_recorded_outcome_and_rolls_back(self) -> None:
+        record = self._record_and_roll_back()
+        out = StringIO()
+
+        call_command("replay_combat_round", str(self.replay_dir / "round.json"), stdout=out)
+
+        self.assertIn("Outcome matches the recording.", out.getvalue())
+        self.assertIn(RoundPhase.CLASHES_RESOLVED, out.getvalue())
+        encounter = CombatEncounter.objects.get(pk=record.encounter_id)
+        self.assertEqual(encounter.status, RoundStatus.DECLARING)
+
+    def test_replay_refuses_changed_declarations(self) -> None:
+        self._record_and_roll_back()
+        CombatRoundAction.objects.filter(pk=self.action.pk).update(
+            focused_category=ActionCategory.SOCIAL
+        )
+
+        with self.assertRaisesMessage(CommandError, "differ from the record"):
+            call_command("replay_combat_round", str(self.replay_dir / "round.json"))
+
+    def test_replay_flags_divergent_outcome(self) -> None:
+        self._record_and_roll_back()
+        path = self.replay_dir / "round.json"
+        record = load_replay_record(path)
+        record.outcome["opponents"][0]["health"] = -999
+        write_replay_record(record, path)
+
+        with self.assertRaisesMessage(CommandError, "opponents"):
+            call_command("replay_combat_round", str(path), stdout=StringIO())
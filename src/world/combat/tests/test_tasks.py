@@ -1,17 +1,26 @@
 """Tests for combat timer task."""
 
 from datetime import timedelta
+from unittest.mock import patch
 
 from django.test import TestCase
 from django.utils import timezone
+from twisted.internet.task import Clock
 
+from world.combat import tasks
 from world.combat.constants import PaceMode
 from world.combat.factories import CombatEncounterFactory, CombatOpponentFactory
-from world.combat.tasks import check_and_resolve_timed_encounters
+from world.combat.tasks import check_and_resolve_timed_encounters, rebuild_round_timers
 from world.scenes.constants import RoundStatus
 
 
 class CombatTimerTaskTest(TestCase):
+    def setUp(self) -> None:
+        # Timers armed by other tests' committed saves would hide their pks from the sweep.
+        timers = patch.dict(tasks._round_timers, clear=True)
+        timers.start()
+        self.addCleanup(timers.stop)
+
     def test_resolves_expired_encounter(self) -> None:
         encounter = CombatEncounterFactory(
             status=RoundStatus.DECLARING,
@@ -81,3 +90,98 @@ class CombatTimerTaskTest(TestCase):
         resolved = check_and_resolve_timed_encounters()
 
         assert encounter.pk not in resolved
+
+
+class CombatRoundTimerTest(TestCase):
+    """Per-round deadline timers armed from ``CombatEncounter.save()``."""
+
+    def setUp(self) -> None:
+        self.clock = Clock()
+        patcher = patch.object(tasks, "_clock", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        timers = patch.dict(tasks._round_timers, clear=True)
+        timers.start()
+        self.addCleanup(timers.stop)
+
+    def _timed_encounter(self, *, started_minutes_ago: float):
+        with self.captureOnCommitCallbacks(execute=True):
+            encounter = CombatEncounterFactory(
+                status=RoundStatus.DECLARING,
+                pace_mode=PaceMode.TIMED,
+                pace_timer_minutes=2,
+                round_started_at=timezone.now() - timedelta(minutes=started_minutes_ago),
+                round_number=1,
+            )
+        CombatOpponentFactory(encounter=encounter)
+        return encounter
+
+    def test_round_start_arms_timer_at_deadline(self) -> None:
+        encounter = self._timed_encounter(started_minutes_ago=0)
+
+        timer = tasks._round_timers[encounter.pk]
+        self.assertAlmostEqual(timer.getTime(), 120, delta=5)
+
+    def test_timer_resolves_round_when_it_fires(self) -> None:
+        encounter = self._timed_encounter(started_minutes_ago=3)
+
+        self.clock.advance(0)
+
+        encounter.refresh_from_db()
+        self.assertNotEqual(encounter.status, RoundStatus.DECLARING)
+        self.assertNotIn(encounter.pk, tasks._round_timers)
+
+    def test_pause_cancels_timer(self) -> None:
+        encounter = self._timed_encounter(started_minutes_ago=0)
+        timer = tasks._round_timers[encounter.pk]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            encounter.is_paused = True
+            encounter.save(update_fields=["is_paused"])
+
+        self.assertFalse(timer.active())
+        self.assertNotIn(encounter.pk, tasks._round_timers)
+
+    def test_pace_change_reschedules_timer(self) -> None:
+        encounter = self._timed_encounter(started_minutes_ago=0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            encounter.pace_timer_minutes = 5
+            encounter.save(update_fields=["pace_timer_minutes"])
+
+        self.assertAlmostEqual(tasks._round_timers[encounter.pk].getTime(), 300, delta=5)
+        self.assertEqual(len(self.clock.getDelayedCalls()), 1)
+
+    def test_early_wakeup_rearms_instead_of_resolving(self) -> None:
+        encounter = self._timed_encounter(started_minutes_ago=0)
+
+        tasks._fire_round_timer(encounter.pk)
+
+        encounter.refresh_from_db()
+        self.assertEqual(encounter.status, RoundStatus.DECLARING)
+        self.assertIn(encounter.pk, tasks._round_timers)
+
+    def test_rebuild_arms_only_live_timed_rounds(self) -> None:
+        live = CombatEncounterFactory(
+            status=RoundStatus.DECLARING,
+            pace_mode=PaceMode.TIMED,
+            round_started_at=timezone.now(),
+        )
+        CombatEncounterFactory(
+            status=RoundStatus.DECLARING,
+            pace_mode=PaceMode.TIMED,
+            is_paused=True,
+            round_started_at=timezone.now(),
+        )
+        CombatEncounterFactory(status=RoundStatus.BETWEEN_ROUNDS, pace_mode=PaceMode.TIMED)
+
+        self.assertEqual(rebuild_round_timers(), 1)
+        self.assertEqual(list(tasks._round_timers), [live.pk])
+
+    def test_sweep_skips_encounters_with_an_armed_timer(self) -> None:
+        encounter = self._timed_encounter(started_minutes_ago=3)
+
+        resolved = check_and_resolve_timed_encounters()
+
+        self.assertNotIn(encounter.pk, resolved)
+        self.assertIn(encounter.pk, tasks._round_timers)
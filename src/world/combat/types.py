@@ -125,6 +125,51 @@ class RoundResolutionResult:
     clash_outcomes: list[ClashRoundResult] = field(default_factory=list)
 
 
+@dataclass
+class RoundJob:
+    """One queued/running/finished asynchronous ``resolve_round`` call.
+
+    Lives only in ``world.combat.round_jobs``' process-local registry; ``status``
+    and ``phase`` are mutated in place by the worker as resolution advances.
+    """
+
+    job_id: str
+    encounter_id: int
+    round_number: int
+    submitted_by_id: int | None
+    status: str  # RoundJobStatus value
+    phase: str = ""  # RoundPhase value; empty until the first checkpoint
+    detail: str = ""  # user-facing failure message; never exception text
+    encounter_completed: bool = False
+
+
+@dataclass
+class PhaseTiming:
+    """Wall time and query count spent reaching one ``RoundPhase`` checkpoint."""
+
+    phase: str  # RoundPhase value
+    wall_ms: float
+    queries: int
+
+
+@dataclass
+class RoundReplayRecord:
+    """Everything needed to re-run one profiled round (world.combat.round_profiler).
+
+    ``declared_actions`` are the round's ``CombatRoundAction`` rows as they
+    stood before resolution (column attname -> JSON value); ``outcome`` is the
+    post-round fingerprint a replay must reproduce.
+    """
+
+    encounter_id: int
+    round_number: int
+    seed: int
+    declared_actions: list[dict]
+    phases: list[PhaseTiming] = field(default_factory=list)
+    outcome: dict = field(default_factory=dict)
+    recorded_at: str = ""
+
+
 # ---------------------------------------------------------------------------
 # Combat magic pipeline integration (Spec: 2026-04-30)
 # ---------------------------------------------------------------------------
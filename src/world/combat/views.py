@@ -7,6 +7,7 @@ import logging
 from typing import cast
 
 from django.db.models import Prefetch, Q, QuerySet
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
@@ -53,6 +54,7 @@ from world.combat.permissions import (
     IsEncounterParticipant,
     IsInEncounterRoom,
 )
+from world.combat.round_jobs import get_round_job, submit_round_job
 from world.combat.serializers import (
     ACTIVE_CONDITIONS_CACHE_ATTR,
     AddOpponentSerializer,
@@ -69,7 +71,9 @@ from world.combat.serializers import (
     OpponentTargetSerializer,
     ProposeLethalDuelSerializer,
     RemoveParticipantSerializer,
+    ResolveRoundSerializer,
     RoundActionSerializer,
+    RoundJobSerializer,
     ThreatPoolSerializer,
     UpgradeComboSerializer,
     UseItemSerializer,
@@ -210,6 +214,8 @@ class CombatEncounterViewSet(ModelViewSet):
     filter_backends = [DjangoFilterBackend]
     filterset_class = CombatEncounterFilter
     pagination_class = StandardResultsSetPagination
+    # Unthrottled by default; resolve_round sets its own scope (web/api/throttling.py).
+    throttle_scope: str | None = None
 
     def perform_create(self, serializer: BaseSerializer[CombatEncounter]) -> None:
         """Create the encounter, defaulting room from the scene's location.
@@ -436,16 +442,30 @@ class CombatEncounterViewSet(ModelViewSet):
         # Service updates encounter in place via refresh_from_db
         return self._serialize_encounter(request, encounter)
 
-    @action(detail=True, methods=[HTTPMethod.POST])
+    @extend_schema(
+        request=ResolveRoundSerializer,
+        responses={200: EncounterDetailSerializer, 202: RoundJobSerializer},
+    )
+    @action(detail=True, methods=[HTTPMethod.POST], throttle_scope="combat_resolve")
     def resolve_round(self, request: Request, pk: int | None = None) -> Response:
         """Resolve the current round.
 
         SharedMemoryModel identity map means all .save() calls during
         resolution update the same Python objects in participants_cached
         and opponents_cached — no re-fetch needed.
+
+        With ``run_as_job`` the round is queued instead (world.combat.round_jobs)
+        and the response is ``202`` with the job; progress arrives over the
+        ``combat_round_progress`` websocket message. Resubmitting the same
+        round returns the same job.
         """
         encounter = self.get_object()
+        params = ResolveRoundSerializer(data=request.data)
+        params.is_valid(raise_exception=True)
         try:
+            if params.validated_data["run_as_job"]:
+                job = submit_round_job(encounter, submitted_by=request.user)
+                return Response(RoundJobSerializer(job).data, status=status.HTTP_202_ACCEPTED)
             resolve_round(encounter)
         except ActionDispatchError as exc:
             return Response(
@@ -459,6 +479,16 @@ class CombatEncounterViewSet(ModelViewSet):
             )
         return self._serialize_encounter(request, encounter)
 
+    @extend_schema(responses=RoundJobSerializer)
+    @action(detail=True, methods=[HTTPMethod.GET])
+    def round_job(self, request: Request, pk: int | None = None) -> Response:
+        """The latest queued round-resolution job for this encounter (polling fallback)."""
+        encounter = self.get_object()
+        job = get_round_job(encounter.pk)
+        if job is None:
+            raise Http404
+        return Response(RoundJobSerializer(job).data)
+
     @action(detail=True, methods=[HTTPMethod.POST])
     def add_participant(self, request: Request, pk: int | None = None) -> Response:
         """Add a PC to the encounter (GM action)."""
@@ -0,0 +1,319 @@
+"""Per-target condition effect digests.
+
+Every numeric condition reader — capability values, check modifiers,
+resistance, ``ModifierTarget`` contributions, acute damage over time — walks
+the same thing: a target's active ``ConditionInstance`` rows and the effect rows
+attached to each instance's template or current stage. ``ConditionEffectDigest``
+loads that once per target: one query for the instances, then one query per
+effect model the first time a reader needs it, instead of one per instance per
+read.
+
+Outside a :func:`condition_digest_scope` each reader builds a fresh digest.
+Inside one (a combat or battle round), digests are memoized per target;
+``prefetch_condition_digests`` loads every participant's digest in one query
+per model. The condition services drop a target's digest through
+:func:`invalidate_condition_digest` whenever they change its instances, and
+``ConditionInstance.save`` / ``delete`` do the same for direct writes.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+import contextvars
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from django.db.models import Model, Q, QuerySet
+from django.utils import timezone
+
+from world.conditions.constants import DurationType
+from world.conditions.models import (
+    ConditionCapabilityEffect,
+    ConditionCheckModifier,
+    ConditionDamageOverTime,
+    ConditionInstance,
+    ConditionModifierEffect,
+    ConditionResistanceModifier,
+)
+
+if TYPE_CHECKING:
+    from evennia.objects.models import ObjectDB
+
+    from world.checks.models import CheckType
+    from world.conditions.constants import DamageTickTiming
+    from world.conditions.models import ConditionOrStageEffect, DamageType
+
+_EFFECT_MODELS: tuple[type[ConditionOrStageEffect], ...] = (
+    ConditionCapabilityEffect,
+    ConditionCheckModifier,
+    ConditionResistanceModifier,
+    ConditionModifierEffect,
+    ConditionDamageOverTime,
+)
+
+Contribution = tuple[ConditionInstance, int]
+
+
+def scale_effect_value(
+    value: int, effect: ConditionOrStageEffect, instance: ConditionInstance
+) -> int:
+    """``value`` scaled by the instance's severity or its current stage.
+
+    ``effective_severity`` already folds in the stage multiplier, so scaling by
+    severity and by the stage are mutually exclusive — if/elif, never both.
+    """
+    if effect.scales_with_severity:
+        return int(value * instance.effective_severity)
+    if instance.current_stage:
+        return int(value * instance.current_stage.severity_multiplier)
+    return value
+
+
+def _is_active(instance: ConditionInstance, now: datetime) -> bool:
+    # Keep in sync with get_active_conditions in services.py
+    return not instance.is_suppressed or (
+        instance.suppressed_until is not None and instance.suppressed_until < now
+    )
+
+
+def _is_lapsed(instance: ConditionInstance, now: datetime) -> bool:
+    """True for an instance ``get_active_conditions`` would sweep as expired."""
+    return (
+        instance.expires_at is not None
+        and now >= instance.expires_at
+        and instance.condition.default_duration_type == DurationType.INGAME_TIME
+    )
+
+
+class ConditionEffectDigest:
+    """A target's active condition instances and the effect rows that apply to them."""
+
+    def __init__(
+        self,
+        target_id: int,
+        instances: list[ConditionInstance],
+        *,
+        valid_until: datetime | None = None,
+    ) -> None:
+        self.target_id = target_id
+        self.instances = instances
+        # When the active set changes with no write: the first IC-time expiry of
+        # an active instance, or the first suppression to lapse.
+        self.valid_until = valid_until
+        self._effects: dict[type[Model], list[list[ConditionOrStageEffect]]] = {}
+        self._check_cache: dict[int, list[Contribution]] = {}
+
+    def is_current(self, now: datetime) -> bool:
+        return self.valid_until is None or now < self.valid_until
+
+    def effect_filter(self) -> Q | None:
+        """Effect rows on any instance's template or current stage; None with no instances."""
+        if not self.instances:
+            return None
+        query = Q(condition_id__in={inst.condition_id for inst in self.instances})
+        stage_ids = {inst.current_stage_id for inst in self.instances if inst.current_stage_id}
+        if stage_ids:
+            query |= Q(stage_id__in=stage_ids)
+        return query
+
+    def load_effects(self, model: type[Model], rows: Iterable[ConditionOrStageEffect]) -> None:
+        """Attach ``model`` rows to the instances they apply to, in pk order per instance."""
+        by_condition: dict[int, list[ConditionOrStageEffect]] = defaultdict(list)
+        by_stage: dict[int, list[ConditionOrStageEffect]] = defaultdict(list)
+        for row in rows:
+            if row.condition_id is not None:
+                by_condition[row.condition_id].append(row)
+            else:
+                by_stage[row.stage_id].append(row)
+        per_instance = []
+        for inst in self.instances:
+            effects = by_condition.get(inst.condition_id, [])
+            if inst.current_stage_id:
+                effects = [*effects, *by_stage.get(inst.current_stage_id, [])]
+            per_instance.append(sorted(effects, key=lambda row: row.pk))
+        self._effects[model] = per_instance
+
+    def _effects_for(self, model: type[Model]) -> Iterator[tuple[ConditionInstance, Model]]:
+        if model not in self._effects:
+            query = self.effect_filter()
+            rows = [] if query is None else _effect_queryset(model).filter(query)
+            self.load_effects(model, rows)
+        for inst, effects in zip(self.instances, self._effects[model], strict=True):
+            for effect in effects:
+                yield inst, effect
+
+    # -- readers ---------------------------------------------------------
+
+    def capability_contributions(self, capability_id: int) -> list[Contribution]:
+        return [
+            (inst, scale_effect_value(effect.value, effect, inst))
+            for inst, effect in self._effects_for(ConditionCapabilityEffect)
+            if effect.capability_id == capability_id
+        ]
+
+    def capability_totals(self) -> dict[int, int]:
+        """Summed contribution per CapabilityType pk, not floored."""
+        totals: dict[int, int] = {}
+        for inst, effect in self._effects_for(ConditionCapabilityEffect):
+            cap_id = effect.capability_id
+            totals[cap_id] = totals.get(cap_id, 0) + scale_effect_value(effect.value, effect, inst)
+        return totals
+
+    def check_contributions(self, check_type: CheckType) -> list[Contribution]:
+        """Modifiers naming ``check_type``, or its category with no specific type."""
+        cached = self._check_cache.get(check_type.pk)
+        if cached is None:
+            cached = [
+                (inst, scale_effect_value(mod.modifier_value, mod, inst))
+                for inst, mod in self._effects_for(ConditionCheckModifier)
+                if mod.check_type_id == check_type.pk
+                or (mod.check_type_id is None and mod.check_category_id == check_type.category_id)
+            ]
+            self._check_cache[check_type.pk] = cached
+        return list(cached)
+
+    def resistance_contributions(self, damage_type_id: int | None) -> list[Contribution]:
+        """Modifiers for ``damage_type_id`` plus the all-types ones; only those for None."""
+        return [
+            (inst, scale_effect_value(mod.modifier_value, mod, inst))
+            for inst, mod in self._effects_for(ConditionResistanceModifier)
+            if mod.damage_type_id is None
+            or (damage_type_id is not None and mod.damage_type_id == damage_type_id)
+        ]
+
+    def modifier_contributions(self, modifier_target_id: int) -> list[Contribution]:
+        return [
+            (inst, scale_effect_value(effect.value, effect, inst))
+            for inst, effect in self._effects_for(ConditionModifierEffect)
+            if effect.modifier_target_id == modifier_target_id
+        ]
+
+    def acute_damage(self, timing: DamageTickTiming) -> list[tuple[DamageType, int]]:
+        """Per-round damage ticks at ``timing``; long-term DoT is the chronic tick's."""
+        damage_dealt: list[tuple[DamageType, int]] = []
+        for inst, dot in self._effects_for(ConditionDamageOverTime):
+            if dot.tick_timing != timing or dot.is_long_term:
+                continue
+            damage = dot.base_damage
+            if dot.scales_with_severity:
+                damage = damage * inst.effective_severity
+            elif inst.current_stage:
+                damage = damage * inst.current_stage.severity_multiplier
+            if dot.scales_with_stacks:
+                damage = damage * inst.stacks
+            damage = int(damage)
+            if damage > 0:
+                damage_dealt.append((dot.damage_type, damage))
+        return damage_dealt
+
+
+def _effect_queryset(model: type[Model]) -> QuerySet:
+    if model is ConditionDamageOverTime:
+        return model.objects.select_related("damage_type")
+    return model.objects.all()
+
+
+def _load_digests(
+    targets: Iterable[ObjectDB],  # noqa: OBJECTDB_PARAM
+) -> dict[int, ConditionEffectDigest]:
+    """Build one digest per target from a single instance query.
+
+    A target holding an active instance whose IC-time expiry has passed goes
+    through ``get_active_conditions`` instead, which removes it first.
+    """
+    from world.conditions.services import get_active_conditions  # noqa: PLC0415
+
+    by_pk = {target.pk: target for target in targets}
+    if not by_pk:
+        return {}
+    now = timezone.now()
+    grouped: dict[int, list[ConditionInstance]] = {pk: [] for pk in by_pk}
+    for inst in ConditionInstance.objects.filter(target_id__in=by_pk).select_related(
+        "condition", "condition__category", "current_stage"
+    ):
+        grouped[inst.target_id].append(inst)
+
+    digests: dict[int, ConditionEffectDigest] = {}
+    for pk, instances in grouped.items():
+        active = [inst for inst in instances if _is_active(inst, now)]
+        if any(_is_lapsed(inst, now) for inst in active):
+            active = list(get_active_conditions(by_pk[pk]))
+        boundaries = [
+            inst.expires_at
+            for inst in active
+            if inst.expires_at is not None
+            and inst.condition.default_duration_type == DurationType.INGAME_TIME
+        ]
+        boundaries += [
+            inst.suppressed_until
+            for inst in instances
+            if inst.is_suppressed
+            and inst.suppressed_until is not None
+            and inst.suppressed_until >= now
+        ]
+        digests[pk] = ConditionEffectDigest(
+            pk, active, valid_until=min(boundaries) if boundaries else None
+        )
+    return digests
+
+
+_digest_memo: contextvars.ContextVar[dict[int, ConditionEffectDigest] | None] = (
+    contextvars.ContextVar("condition_digest_memo", default=None)
+)
+
+
+@contextmanager
+def condition_digest_scope() -> Iterator[None]:
+    """Memoize condition effect digests for one combat or battle round.
+
+    A nested scope joins the outer one.
+    """
+    if _digest_memo.get() is not None:
+        yield
+        return
+    token = _digest_memo.set({})
+    try:
+        yield
+    finally:
+        _digest_memo.reset(token)
+
+
+def invalidate_condition_digest(target_pk: int | None) -> None:
+    """Forget the memoized digest for one target."""
+    memo = _digest_memo.get()
+    if memo is not None and target_pk is not None:
+        memo.pop(target_pk, None)
+
+
+def get_condition_effect_digest(target: ObjectDB) -> ConditionEffectDigest:  # noqa: OBJECTDB_PARAM
+    """``target``'s digest — memoized inside a :func:`condition_digest_scope`."""
+    memo = _digest_memo.get()
+    if memo is not None:
+        digest = memo.get(target.pk)
+        if digest is not None and digest.is_current(timezone.now()):
+            return digest
+    digest = _load_digests([target])[target.pk]
+    if memo is not None:
+        memo[target.pk] = digest
+    return digest
+
+
+def prefetch_condition_digests(targets: Iterable[ObjectDB]) -> None:  # noqa: OBJECTDB_PARAM
+    """Load every target's digest and all of its effect rows up front.
+
+    One query for the instances and one per effect model, whatever the number
+    of targets. A no-op outside a :func:`condition_digest_scope`.
+    """
+    memo = _digest_memo.get()
+    if memo is None:
+        return
+    digests = _load_digests(targets)
+    instances = [inst for digest in digests.values() for inst in digest.instances]
+    query = ConditionEffectDigest(0, instances).effect_filter()
+    for model in _EFFECT_MODELS:
+        rows = [] if query is None else list(_effect_queryset(model).filter(query))
+        for digest in digests.values():
+            digest.load_effects(model, rows)
+    memo.update(digests)
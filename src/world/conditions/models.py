@@ -1463,6 +1463,21 @@ class ConditionInstance(SharedMemoryModel):
         stack_str = f" x{self.stacks}" if self.stacks > 1 else ""
         return f"{self.condition.name}{stage_str}{stack_str} on {self.target}"
 
+    def save(self, *args: object, **kwargs: object) -> None:
+        super().save(*args, **kwargs)
+        # A round's memoized effect digest for this target no longer matches.
+        from world.conditions.digest import invalidate_condition_digest  # noqa: PLC0415
+
+        invalidate_condition_digest(self.target_id)
+
+    def delete(self, *args: object, **kwargs: object) -> tuple[int, dict[str, int]]:
+        from world.conditions.digest import invalidate_condition_digest  # noqa: PLC0415
+
+        target_id = self.target_id
+        result = super().delete(*args, **kwargs)
+        invalidate_condition_digest(target_id)
+        return result
+
     @property
     def is_expired(self) -> bool:
         """Check if this condition has expired by rounds."""
@@ -18,8 +18,8 @@ from typing import TYPE_CHECKING, Any
 
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
-from django.db.models import Q, QuerySet, Sum
-from django.db.models.functions import Coalesce
+from django.db.models import F, Q, QuerySet, Sum, Value
+from django.db.models.functions import Coalesce, Greatest
 from django.utils import timezone
 
 from flows.constants import EventName
@@ -51,17 +51,15 @@ from world.conditions.constants import (
     StackBehavior,
     TreatmentTargetKind,
 )
+from world.conditions.digest import get_condition_effect_digest, invalidate_condition_digest
 from world.conditions.models import (
     CapabilityType,
-    ConditionCapabilityEffect,
     ConditionCategory,
-    ConditionCheckModifier,
     ConditionConditionInteraction,
     ConditionDamageInteraction,
     ConditionDamageOverTime,
     ConditionInstance,
     ConditionModifierEffect,
-    ConditionResistanceModifier,
     ConditionStage,
     ConditionTemplate,
     DamageSuccessLevelMultiplier,
@@ -112,7 +110,7 @@ FREEFORM_RESIST_COOLDOWN_SECONDS = 60
 
 
 def _invalidate_condition_handler(target: "ObjectDB") -> None:  # noqa: OBJECTDB_PARAM
-    """Invalidate the target's cached conditions handler.
+    """Invalidate the target's cached conditions handler and effect digest.
 
     ``conditions`` is installed as a ``cached_property`` on ``ObjectParent``
     so every typeclassed object (Character, Room, Exit, Object) exposes the
@@ -126,6 +124,7 @@ def _invalidate_condition_handler(target: "ObjectDB") -> None:  # noqa: OBJECTDB
     """
     if hasattr(target, "conditions"):
         target.conditions.invalidate()
+    invalidate_condition_digest(target.pk)
 
 
 # =============================================================================
@@ -1833,30 +1832,13 @@ def get_capability_status(
     Returns:
         CapabilityStatus with total value and per-condition breakdown
     """
-    target = character_sheet.character
-    result = CapabilityStatus()
-
-    active_instances = get_active_conditions(target)
-
-    for instance in active_instances:
-        query = Q(condition=instance.condition)
-        if instance.current_stage:
-            query |= Q(stage=instance.current_stage)
-        effects = ConditionCapabilityEffect.objects.filter(query, capability=capability)
-
-        for effect in effects:
-            modifier = effect.value
-            if effect.scales_with_severity:
-                modifier = int(modifier * instance.effective_severity)
-            elif instance.current_stage:
-                modifier = int(modifier * instance.current_stage.severity_multiplier)
-            result.value += modifier
-            result.condition_contributions.append((instance, modifier))
-
+    digest = get_condition_effect_digest(character_sheet.character)
+    contributions = digest.capability_contributions(capability.pk)
     # Floor at 0
-    result.value = max(0, result.value)
-
-    return result
+    return CapabilityStatus(
+        value=max(0, sum(modifier for _instance, modifier in contributions)),
+        condition_contributions=contributions,
+    )
 
 
 def get_condition_modifier_total(
@@ -1878,24 +1860,8 @@ def get_condition_modifier_total(
     Returns:
         Integer sum of matching condition-effect contributions (0 when none).
     """
-    target = character_sheet.character
-    total = 0
-
-    for instance in get_active_conditions(target):
-        query = Q(condition=instance.condition)
-        if instance.current_stage:
-            query |= Q(stage=instance.current_stage)
-        effects = ConditionModifierEffect.objects.filter(query, modifier_target=modifier_target)
-
-        for effect in effects:
-            value = effect.value
-            if effect.scales_with_severity:
-                value = int(value * instance.effective_severity)
-            elif instance.current_stage:
-                value = int(value * instance.current_stage.severity_multiplier)
-            total += value
-
-    return total
+    digest = get_condition_effect_digest(character_sheet.character)
+    return sum(value for _instance, value in digest.modifier_contributions(modifier_target.pk))
 
 
 def get_condition_modifier_breakdown(
@@ -1911,24 +1877,11 @@ def get_condition_modifier_breakdown(
     The sum of returned values MUST equal get_condition_modifier_total for the same inputs.
     Empty list when no contributions.
     """
-    target = character_sheet.character
-    rows: list[tuple[str, int]] = []
-
-    for instance in get_active_conditions(target):
-        query = Q(condition=instance.condition)
-        if instance.current_stage:
-            query |= Q(stage=instance.current_stage)
-        effects = ConditionModifierEffect.objects.filter(query, modifier_target=modifier_target)
-
-        for effect in effects:
-            value = effect.value
-            if effect.scales_with_severity:
-                value = int(value * instance.effective_severity)
-            elif instance.current_stage:
-                value = int(value * instance.current_stage.severity_multiplier)
-            rows.append((instance.condition.name, value))
-
-    return rows
+    digest = get_condition_effect_digest(character_sheet.character)
+    return [
+        (instance.condition.name, value)
+        for instance, value in digest.modifier_contributions(modifier_target.pk)
+    ]
 
 
 @dataclass(frozen=True)
@@ -2182,48 +2135,10 @@ def get_all_capability_values(character_sheet: "CharacterSheet") -> dict[int, in
     Returns:
         Dict mapping capability PK to total values (floor 0)
     """
-    target = character_sheet.character
-    active_instances = list(get_active_conditions(target))
-
     # Aggregate condition-derived values (may be empty with no active conditions).
-    totals: dict[int, int] = {}
-    if active_instances:
-        # Build batch filter
-        condition_ids = [i.condition_id for i in active_instances]
-        query = Q(condition_id__in=condition_ids)
-        stage_ids = [i.current_stage_id for i in active_instances if i.current_stage_id]
-        if stage_ids:
-            query |= Q(stage_id__in=stage_ids)
-
-        effects = ConditionCapabilityEffect.objects.filter(query).select_related("capability")
-
-        # Build instance lookup maps
-        instance_by_condition: dict[int, ConditionInstance] = {
-            i.condition_id: i for i in active_instances
-        }
-        instance_by_stage: dict[int, ConditionInstance] = {
-            i.current_stage_id: i for i in active_instances if i.current_stage_id
-        }
-
-        for effect in effects:
-            instance = instance_by_condition.get(effect.condition_id) or instance_by_stage.get(
-                effect.stage_id
-            )
-            if not instance:
-                continue
-
-            modifier = effect.value
-            # effective_severity already folds in the stage multiplier, so scaling
-            # by severity and by the stage are mutually exclusive — if/elif, not two
-            # ifs, mirroring get_capability_status (#2708). Two ifs would double-apply
-            # the stage multiplier for a staged, severity-scaled effect.
-            if effect.scales_with_severity:
-                modifier = int(modifier * instance.effective_severity)
-            elif instance.current_stage:
-                modifier = int(modifier * instance.current_stage.severity_multiplier)
-
-            cap_id = effect.capability_id
-            totals[cap_id] = totals.get(cap_id, 0) + modifier
+    # Scaling is the digest's scale_effect_value — the same if/elif as
+    # get_capability_status (#2708).
+    totals = get_condition_effect_digest(character_sheet.character).capability_totals()
 
     # Thread-passive grants (#751 B2): fold engaged tier-0 role CAPABILITY_GRANT
     # PKs in so the obstacle/action-generation consumer
@@ -2259,40 +2174,12 @@ def get_check_modifier(
     Returns:
         CheckModifierResult with total and breakdown
     """
-    target = character_sheet.character
-    ctype = check_type
-
-    result = CheckModifierResult(total_modifier=0, breakdown=[])
-
-    active_instances = get_active_conditions(target)
-
-    for instance in active_instances:
-        # Get modifiers: condition-level OR stage-specific (if at a stage)
-        query = Q(condition=instance.condition)
-        if instance.current_stage:
-            query |= Q(stage=instance.current_stage)
-        modifiers = (
-            ConditionCheckModifier.objects.filter(query)
-            .filter(Q(check_type=ctype) | Q(check_category=ctype.category, check_type__isnull=True))
-            .select_related("check_category")
-        )
-
-        for mod in modifiers:
-            modifier_value = mod.modifier_value
-
-            # effective_severity already folds in the stage multiplier, so scaling
-            # by severity and by the stage are mutually exclusive — if/elif, not two
-            # ifs, mirroring get_condition_modifier_total. (Two ifs double-applied
-            # the stage multiplier for a staged, severity-scaled modifier.)
-            if mod.scales_with_severity:
-                modifier_value = int(modifier_value * instance.effective_severity)
-            elif instance.current_stage:
-                modifier_value = int(modifier_value * instance.current_stage.severity_multiplier)
-
-            result.total_modifier += modifier_value
-            result.breakdown.append((instance, modifier_value))
-
-    return result
+    breakdown = get_condition_effect_digest(character_sheet.character).check_contributions(
+        check_type
+    )
+    return CheckModifierResult(
+        total_modifier=sum(value for _instance, value in breakdown), breakdown=breakdown
+    )
 
 
 def condition_contributions(
@@ -2340,40 +2227,13 @@ def get_resistance_modifier(
     Returns:
         ResistanceModifierResult with total and breakdown
     """
-    target = character_sheet.character
-    dtype = damage_type
-
-    result = ResistanceModifierResult(total_modifier=0, breakdown=[])
-
-    active_instances = get_active_conditions(target)
-
-    for instance in active_instances:
-        # Get modifiers: condition-level OR stage-specific (if at a stage)
-        query = Q(condition=instance.condition)
-        if instance.current_stage:
-            query |= Q(stage=instance.current_stage)
-        modifiers = ConditionResistanceModifier.objects.filter(query)
-
-        if dtype:
-            modifiers = modifiers.filter(Q(damage_type=dtype) | Q(damage_type__isnull=True))
-        else:
-            modifiers = modifiers.filter(damage_type__isnull=True)
-
-        for mod in modifiers:
-            modifier_value = mod.modifier_value
-
-            # Honor scales_with_severity, consistent with the other numeric readers
-            # (get_condition_modifier_total / get_check_modifier). effective_severity
-            # already folds in the stage multiplier, so it's if/elif.
-            if mod.scales_with_severity:
-                modifier_value = int(modifier_value * instance.effective_severity)
-            elif instance.current_stage:
-                modifier_value = int(modifier_value * instance.current_stage.severity_multiplier)
-
-            result.total_modifier += modifier_value
-            result.breakdown.append((instance, modifier_value))
-
-    return result
+    # Honors scales_with_severity, consistent with the other numeric readers.
+    breakdown = get_condition_effect_digest(character_sheet.character).resistance_contributions(
+        damage_type.pk if damage_type else None
+    )
+    return ResistanceModifierResult(
+        total_modifier=sum(value for _instance, value in breakdown), breakdown=breakdown
+    )
 
 
 # =============================================================================
@@ -2443,47 +2303,13 @@ def _process_round_tick(
     """
     Process damage-over-time for a specific tick timing.
     """
-    result = RoundTickResult(
-        damage_dealt=[],
+    return RoundTickResult(
+        damage_dealt=get_condition_effect_digest(target).acute_damage(timing),
         progressed_conditions=[],
         expired_conditions=[],
         removed_conditions=[],
     )
 
-    active_instances = get_active_conditions(target)
-
-    for instance in active_instances:
-        # Get DoT effects: condition-level OR stage-specific (if at a stage)
-        query = Q(condition=instance.condition)
-        if instance.current_stage:
-            query |= Q(stage=instance.current_stage)
-        dot_effects = ConditionDamageOverTime.objects.filter(
-            query, tick_timing=timing, is_long_term=False
-        )
-
-        for dot in dot_effects:
-            damage = dot.base_damage
-
-            # effective_severity already folds in the stage multiplier, so scaling
-            # by severity and by the stage are mutually exclusive — if/elif, not two
-            # ifs, mirroring get_check_modifier / get_condition_modifier_total. (Two
-            # ifs double-applied the stage multiplier for a staged severity-scaled DoT.)
-            if dot.scales_with_severity:
-                damage = damage * instance.effective_severity
-            elif instance.current_stage:
-                damage = damage * instance.current_stage.severity_multiplier
-
-            # Scale by stacks
-            if dot.scales_with_stacks:
-                damage = damage * instance.stacks
-
-            damage = int(damage)
-
-            if damage > 0:
-                result.damage_dealt.append((dot.damage_type, damage))
-
-    return result
-
 
 def _process_duration_and_progression(
     target: "ObjectDB",  # noqa: OBJECTDB_PARAM
@@ -3096,6 +2922,75 @@ def decay_condition_severity(
     )
 
 
+def _decayed_stage_ids(
+    decays: list[tuple[ConditionInstance, int]],
+) -> dict[int, int | None]:
+    """The stage each ``(instance, new_severity)`` lands on, keyed by instance pk.
+
+    ``decay_condition_severity``'s stage walk — the highest threshold at or
+    below the new severity — answered for the whole batch from one query of
+    threshold stages rather than one per instance.
+    """
+    thresholds: dict[int, list[tuple[int, int]]] = {}
+    for condition_id, threshold, stage_id in (
+        ConditionStage.objects.filter(
+            condition_id__in={instance.condition_id for instance, _ in decays},
+            severity_threshold__isnull=False,
+        )
+        .order_by("condition_id", "-severity_threshold", "pk")
+        .values_list("condition_id", "severity_threshold", "pk")
+    ):
+        thresholds.setdefault(condition_id, []).append((threshold, stage_id))
+    return {
+        instance.pk: next(
+            (
+                stage_id
+                for threshold, stage_id in thresholds.get(instance.condition_id, [])
+                if threshold <= new_severity
+            ),
+            None,
+        )
+        for instance, new_severity in decays
+    }
+
+
+def _bulk_decay_severity(decays: list[tuple[ConditionInstance, int]]) -> None:
+    """Apply plain severity decay to many instances as set-based UPDATEs.
+
+    Only for instances where ``decay_condition_severity`` would do nothing but
+    write: no stage change, no corruption sync, no concealment to clear. Severity
+    drops by ``amount`` clamped at zero (one UPDATE per distinct amount) and the
+    instances that hit zero are marked resolved in one more.
+    """
+    if not decays:
+        return
+    by_amount: dict[int, list[int]] = {}
+    for instance, amount in decays:
+        by_amount.setdefault(amount, []).append(instance.pk)
+    resolving = [instance.pk for instance, amount in decays if instance.severity <= amount]
+    resolved_at = (get_ic_now() or timezone.now()) if resolving else None
+    with transaction.atomic():
+        for amount, amount_pks in by_amount.items():
+            ConditionInstance.objects.filter(pk__in=amount_pks).update(
+                severity=Greatest(F("severity") - amount, Value(0))
+            )
+        if resolving:
+            ConditionInstance.objects.filter(
+                pk__in=resolving, severity=0, resolved_at__isnull=True
+            ).update(resolved_at=resolved_at)
+
+    # update() bypasses save() and the identity map: bring the cached instances
+    # in step and drop each target's handler cache and digest once.
+    targets = {}
+    for instance, amount in decays:
+        instance.severity = max(0, instance.severity - amount)
+        if instance.severity == 0:
+            instance.resolved_at = resolved_at
+        targets[instance.target_id] = instance.target
+    for target in targets.values():
+        _invalidate_condition_handler(target)
+
+
 def decay_all_conditions_tick() -> DecayTickSummary:
     """Scheduler entry point. Decays all opt-in conditions by one tick.
 
@@ -3103,11 +2998,16 @@ def decay_all_conditions_tick() -> DecayTickSummary:
     - instances whose template sets passive_decay_blocked_in_engagement=True
       and whose target is an engaged character
     - instances where severity exceeds passive_decay_max_severity
+
+    The arithmetic is set-based (``_bulk_decay_severity``). Only instances whose
+    decay has a side effect — crossing a stage boundary (which emits
+    CONDITION_STAGE_CHANGED), a Corruption-kind template's resonance sync, or a
+    concealing condition resolving — go through ``decay_condition_severity`` one
+    at a time.
     """
     from world.mechanics.engagement import CharacterEngagement  # noqa: PLC0415
 
     examined = 0
-    ticked = 0
     engagement_blocked = 0
     severity_gated = 0
 
@@ -3115,7 +3015,7 @@ def decay_all_conditions_tick() -> DecayTickSummary:
         ConditionInstance.objects.filter(
             resolved_at__isnull=True,
             condition__passive_decay_per_day__gt=0,
-        ).select_related("condition", "current_stage", "target")
+        ).select_related("condition", "condition__category", "current_stage", "target")
     )
 
     # Resolve the engagement check in ONE query instead of one per instance —
@@ -3137,6 +3037,7 @@ def decay_all_conditions_tick() -> DecayTickSummary:
         else set()
     )
 
+    due: list[ConditionInstance] = []
     for instance in instances:
         examined += 1
         cond = instance.condition
@@ -3149,15 +3050,38 @@ def decay_all_conditions_tick() -> DecayTickSummary:
         ):
             severity_gated += 1
             continue
-        decay_condition_severity(instance, cond.passive_decay_per_day)
-        ticked += 1
+        due.append(instance)
+
+    new_stage_ids = (
+        _decayed_stage_ids(
+            [
+                (instance, max(0, instance.severity - instance.condition.passive_decay_per_day))
+                for instance in due
+            ]
+        )
+        if due
+        else {}
+    )
+    bulk: list[tuple[ConditionInstance, int]] = []
+    for instance in due:
+        cond = instance.condition
+        resolves = instance.severity <= cond.passive_decay_per_day
+        if (
+            new_stage_ids[instance.pk] != instance.current_stage_id
+            or cond.corruption_resonance_id is not None
+            or (resolves and cond.category.conceals_from_perception)
+        ):
+            decay_condition_severity(instance, cond.passive_decay_per_day)
+        else:
+            bulk.append((instance, cond.passive_decay_per_day))
+    _bulk_decay_severity(bulk)
 
     # Process NPC break-free attempts alongside decay (#2706).
     process_break_free_tick()
 
     return DecayTickSummary(
         examined=examined,
-        ticked=ticked,
+        ticked=len(due),
         engagement_blocked=engagement_blocked,
         severity_gated=severity_gated,
     )
@@ -3417,9 +3341,12 @@ def batch_chronic_effect_tick() -> ChronicTickSummary:
     NOT applied here (mirroring the spec; avoids the known double-severity
     scaling). base_damage is scaled only by effective_severity / stacks when the
     row opts in.
+
+    Health is written once for the whole tick by apply_clamped_chronic_damage_many,
+    which clamps each hit exactly as the single-sheet call would.
     """
     from actions.round_context import get_active_round_context  # noqa: PLC0415
-    from world.vitals.services import apply_clamped_chronic_damage  # noqa: PLC0415
+    from world.vitals.services import apply_clamped_chronic_damage_many  # noqa: PLC0415
 
     summary = ChronicTickSummary()
 
@@ -3447,20 +3374,26 @@ def batch_chronic_effect_tick() -> ChronicTickSummary:
     ):
         rows_by_condition.setdefault(dot.condition_id, []).append(dot)
 
+    # A character with several chronic conditions is only looked up once for
+    # round ownership, and every hit lands in one batched vitals write.
+    in_round: dict[int, bool] = {}
+    hits: list[tuple[int, int]] = []
     for instance in instances:
         summary.examined += 1
 
         sheet = _chronic_tick_sheet(instance)
-        if sheet is not None and get_active_round_context(sheet) is not None:
-            summary.active_round_skipped += 1
-            continue
+        if sheet is not None:
+            if sheet.pk not in in_round:
+                in_round[sheet.pk] = get_active_round_context(sheet) is not None
+            if in_round[sheet.pk]:
+                summary.active_round_skipped += 1
+                continue
 
         total = _compute_chronic_damage(instance, rows_by_condition.get(instance.condition_id, []))
         if total > 0 and sheet is not None:
-            removed = apply_clamped_chronic_damage(sheet, total)
-            if removed > 0:
-                summary.ticked += 1
+            hits.append((sheet.pk, total))
 
+    summary.ticked = sum(1 for removed in apply_clamped_chronic_damage_many(hits) if removed > 0)
     return summary
 
 
@@ -0,0 +1,133 @@
+"""Condition readers served from the per-target effect digest.
+
+``get_check_modifier``, ``get_capability_status``, ``get_resistance_modifier`` and
+friends read one ``ConditionEffectDigest`` per target: one instance query plus one
+query per effect model, however many conditions are active. Inside a
+``condition_digest_scope`` the digest is memoized until the condition services (or
+an instance save/delete) change the target's instances.
+"""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.utils import timezone
+
+from evennia_extensions.factories import ObjectDBFactory
+from world.character_sheets.factories import CharacterSheetFactory
+from world.checks.factories import CheckTypeFactory
+from world.conditions.digest import condition_digest_scope, prefetch_condition_digests
+from world.conditions.factories import (
+    CapabilityTypeFactory,
+    ConditionCapabilityEffectFactory,
+    ConditionCheckModifierFactory,
+    ConditionInstanceFactory,
+    ConditionResistanceModifierFactory,
+    ConditionStageFactory,
+    ConditionTemplateFactory,
+    DamageTypeFactory,
+)
+from world.conditions.services import (
+    apply_condition,
+    get_capability_status,
+    get_check_modifier,
+    get_resistance_modifier,
+    remove_condition,
+)
+
+
+class ConditionDigestTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.check_type = CheckTypeFactory(name="digest-check")
+        cls.capability = CapabilityTypeFactory(name="digest-capability")
+        cls.fire = DamageTypeFactory(name="digest-fire")
+        cls.templates = [ConditionTemplateFactory(name=f"digest-{n}") for n in range(4)]
+        for template in cls.templates:
+            ConditionCheckModifierFactory(
+                condition=template, check_type=cls.check_type, modifier_value=-5
+            )
+            ConditionCapabilityEffectFactory(
+                condition=template, capability=cls.capability, value=-2
+            )
+            ConditionResistanceModifierFactory(
+                condition=template, damage_type=cls.fire, modifier_value=3
+            )
+        cls.staged = ConditionTemplateFactory(name="digest-staged", has_progression=True)
+        cls.stage = ConditionStageFactory(condition=cls.staged, stage_order=2)
+        ConditionCheckModifierFactory(
+            stage=cls.stage, condition=None, check_type=cls.check_type, modifier_value=-4
+        )
+
+    def setUp(self):
+        self.sheet = CharacterSheetFactory(character=ObjectDBFactory(db_key="DigestTarget"))
+        self.target = self.sheet.character
+        for template in self.templates:
+            ConditionInstanceFactory(target=self.target, condition=template)
+        ConditionInstanceFactory(
+            target=self.target, condition=self.staged, current_stage=self.stage, severity=2
+        )
+
+    def test_readers_sum_every_active_instance(self):
+        result = get_check_modifier(self.sheet, self.check_type)
+        # Four condition-level -5s, plus the stage row scaled by its 1.5 multiplier.
+        self.assertEqual(result.total_modifier, -26)
+        self.assertEqual(len(result.breakdown), 5)
+        self.assertEqual(get_capability_status(self.sheet, self.capability).value, 0)
+        self.assertEqual(get_resistance_modifier(self.sheet, self.fire).total_modifier, 12)
+
+    def test_a_read_costs_the_same_queries_whatever_the_condition_count(self):
+        # Instances, then check-modifier rows.
+        with self.assertNumQueries(2):
+            get_check_modifier(self.sheet, self.check_type)
+
+    def test_scope_memoizes_until_a_condition_changes(self):
+        with condition_digest_scope():
+            get_check_modifier(self.sheet, self.check_type)
+            with self.assertNumQueries(0):
+                self.assertEqual(
+                    get_check_modifier(self.sheet, self.check_type).total_modifier, -26
+                )
+
+            remove_condition(self.target, self.templates[0])
+            self.assertEqual(get_check_modifier(self.sheet, self.check_type).total_modifier, -21)
+
+            apply_condition(self.target, self.templates[0])
+            self.assertEqual(get_check_modifier(self.sheet, self.check_type).total_modifier, -26)
+
+    def test_direct_instance_writes_drop_the_memoized_digest(self):
+        instance = self.target.condition_instances.get(condition=self.staged)
+        with condition_digest_scope():
+            get_check_modifier(self.sheet, self.check_type)
+            instance.current_stage = None
+            instance.save()
+            self.assertEqual(get_check_modifier(self.sheet, self.check_type).total_modifier, -20)
+
+    def test_lapsing_suppression_is_picked_up_without_a_write(self):
+        instance = self.target.condition_instances.get(condition=self.templates[0])
+        instance.is_suppressed = True
+        instance.suppressed_until = timezone.now() + timedelta(hours=1)
+        instance.save()
+        with condition_digest_scope():
+            self.assertEqual(get_check_modifier(self.sheet, self.check_type).total_modifier, -21)
+            later = timezone.now() + timedelta(hours=2)
+            with patch("django.utils.timezone.now", return_value=later):
+                self.assertEqual(
+                    get_check_modifier(self.sheet, self.check_type).total_modifier, -26
+                )
+
+    def test_prefetch_loads_every_participant_at_once(self):
+        other = CharacterSheetFactory(character=ObjectDBFactory(db_key="DigestOther"))
+        ConditionInstanceFactory(target=other.character, condition=self.templates[1])
+
+        with condition_digest_scope():
+            # Instances, then one query per effect model.
+            with self.assertNumQueries(6):
+                prefetch_condition_digests([self.target, other.character])
+            with self.assertNumQueries(0):
+                self.assertEqual(
+                    get_check_modifier(self.sheet, self.check_type).total_modifier, -26
+                )
+                self.assertEqual(get_check_modifier(other, self.check_type).total_modifier, -5)
+                self.assertEqual(get_resistance_modifier(other, self.fire).total_modifier, 3)
+                self.assertEqual(get_capability_status(other, self.capability).value, 0)
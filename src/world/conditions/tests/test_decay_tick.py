@@ -165,19 +165,19 @@ class DecayAllConditionsTickTests(TestCase):
         return len(ctx)
 
     def test_n_instances_bounded_query_count(self):
-        """Per-instance cost is 4 queries: stage lookup, savepoint, update, release.
-
-        The engagement gate used to add a fifth (one ``CharacterEngagement``
-        ``.exists()`` per instance); it is now hoisted into a single batched
-        lookup, mirroring ``_apply_ap_regen``'s locked_character_ids set.
-
-        The break-free NPC tick (#2706) adds one constant query (it filters
-        for behavior-altering conditions and finds none here).
+        """A plain decay costs no per-instance queries: the tick is set-based.
+
+        Seven statements whatever the population: the instance load, the
+        batched threshold-stage lookup, the severity UPDATE (one per distinct
+        decay amount) inside its savepoint pair, and the break-free NPC tick
+        (#2706), which filters for behavior-altering conditions and finds none.
+        The engagement gate is hoisted into one lookup and only runs when a
+        template opts into it, so it costs nothing here.
         """
-        self.assertEqual(self._tick_queries(add=10, expect_ticked=10), 43)
+        self.assertEqual(self._tick_queries(add=10, expect_ticked=10), 7)
 
-    def test_engagement_gate_does_not_scale_with_instance_count(self):
-        """The slope is what matters — a reintroduced N+1 would push it to 5.
+    def test_plain_decay_does_not_scale_with_instance_count(self):
+        """The slope is what matters — any per-instance write or lookup makes it non-zero.
 
         Asserting the *difference* between two sizes rather than a single total
         pins the invariant without re-pinning whatever fixed overhead the tick
@@ -185,4 +185,4 @@ class DecayAllConditionsTickTests(TestCase):
         """
         ten = self._tick_queries(add=10, expect_ticked=10)
         twenty = self._tick_queries(add=10, expect_ticked=20)
-        self.assertEqual(twenty - ten, 4 * 10)
+        self.assertEqual(twenty - ten, 0)
@@ -0,0 +1,187 @@
+"""Set-based decay and chronic ticks end where the per-instance services would.
+
+``decay_all_conditions_tick`` does its severity arithmetic as bulk UPDATEs and
+only routes stage crossings and side-effecting resolutions through
+``decay_condition_severity``; ``batch_chronic_effect_tick`` writes every hit in one
+batched vitals update. Each test seeds a mixed population, runs the old
+instance-at-a-time loop inside a rolled-back transaction to get the expected end
+state, then runs the tick on the untouched rows and compares.
+"""
+
+from datetime import UTC, datetime
+import random
+from unittest.mock import patch
+
+from django.db import transaction
+from django.test import TestCase
+
+from actions.round_context import get_active_round_context
+from evennia_extensions.factories import ObjectDBFactory
+from world.character_sheets.factories import CharacterSheetFactory
+from world.conditions.factories import (
+    ConditionCategoryFactory,
+    ConditionDamageOverTimeFactory,
+    ConditionInstanceFactory,
+    ConditionStageFactory,
+    ConditionTemplateFactory,
+)
+from world.conditions.models import ConditionInstance
+from world.conditions.services import (
+    _compute_chronic_damage,
+    batch_chronic_effect_tick,
+    decay_all_conditions_tick,
+    decay_condition_severity,
+)
+from world.mechanics.engagement import CharacterEngagement
+from world.mechanics.factories import CharacterEngagementFactory
+from world.scenes.constants import RoundStatus
+from world.scenes.factories import SceneRoundFactory, SceneRoundParticipantFactory
+from world.vitals.factories import CharacterVitalsFactory
+from world.vitals.models import CharacterVitals
+from world.vitals.services import apply_clamped_chronic_damage
+
+IC_NOW = datetime(2026, 3, 1, 12, 0, tzinfo=UTC)
+TICKS = 3
+
+
+class DecayTickParityTests(TestCase):
+    def setUp(self):
+        rng = random.Random(49)  # noqa: S311 — seeded population, not crypto
+        staged = ConditionTemplateFactory(passive_decay_per_day=2, has_progression=True)
+        stages = [
+            ConditionStageFactory(condition=staged, stage_order=order, severity_threshold=threshold)
+            for order, threshold in ((1, 1), (2, 4), (3, 7))
+        ]
+        templates = [
+            ConditionTemplateFactory(passive_decay_per_day=1),
+            ConditionTemplateFactory(passive_decay_per_day=3),
+            staged,
+            ConditionTemplateFactory(
+                passive_decay_per_day=2,
+                category=ConditionCategoryFactory(conceals_from_perception=True),
+            ),
+            ConditionTemplateFactory(passive_decay_per_day=1, passive_decay_max_severity=3),
+            ConditionTemplateFactory(
+                passive_decay_per_day=1, passive_decay_blocked_in_engagement=True
+            ),
+        ]
+        targets = [ObjectDBFactory(db_key=f"Decayer {n}") for n in range(6)]
+        targets += [CharacterEngagementFactory().character.character for _ in range(2)]
+        for target in targets:
+            for template in rng.sample(templates, 4):
+                severity = rng.randint(1, 9)
+                stage = None
+                if template == staged:
+                    stage = next(
+                        (s for s in reversed(stages) if s.severity_threshold <= severity), None
+                    )
+                ConditionInstanceFactory(
+                    target=target, condition=template, severity=severity, current_stage=stage
+                )
+
+    def _snapshot(self):
+        return {
+            row[0]: row[1:]
+            for row in ConditionInstance.objects.values_list(
+                "pk", "severity", "current_stage_id", "resolved_at"
+            )
+        }
+
+    def _per_instance_tick(self):
+        engaged = set(CharacterEngagement.objects.values_list("character_id", flat=True))
+        for instance in ConditionInstance.objects.filter(
+            resolved_at__isnull=True, condition__passive_decay_per_day__gt=0
+        ).select_related("condition", "current_stage", "target"):
+            cond = instance.condition
+            if cond.passive_decay_blocked_in_engagement and instance.target_id in engaged:
+                continue
+            if (
+                cond.passive_decay_max_severity is not None
+                and instance.severity > cond.passive_decay_max_severity
+            ):
+                continue
+            decay_condition_severity(instance, cond.passive_decay_per_day)
+
+    def test_bulk_decay_matches_per_instance_decay(self):
+        before = self._snapshot()
+        with patch("world.conditions.services.get_ic_now", return_value=IC_NOW):
+            with transaction.atomic():
+                for _ in range(TICKS):
+                    self._per_instance_tick()
+                expected = self._snapshot()
+                transaction.set_rollback(True)
+            ConditionInstance.flush_instance_cache(force=True)
+            self.assertEqual(self._snapshot(), before)
+
+            for _ in range(TICKS):
+                decay_all_conditions_tick()
+
+        self.assertEqual(self._snapshot(), expected)
+        # The population exercises every path: plain decay, stage walks and resolution.
+        changed = [pk for pk in before if before[pk] != expected[pk]]
+        self.assertGreater(len(changed), 10)
+        self.assertTrue(any(before[pk][1] != expected[pk][1] for pk in changed))
+        self.assertTrue(any(expected[pk][2] is not None for pk in changed))
+
+
+class ChronicTickParityTests(TestCase):
+    def setUp(self):
+        rng = random.Random(49)  # noqa: S311 — seeded population, not crypto
+        severe = ConditionTemplateFactory()
+        ConditionDamageOverTimeFactory(
+            condition=severe, base_damage=3, scales_with_stacks=False, is_long_term=True
+        )
+        flat = ConditionTemplateFactory()
+        ConditionDamageOverTimeFactory(
+            condition=flat,
+            base_damage=7,
+            scales_with_severity=False,
+            scales_with_stacks=False,
+            is_long_term=True,
+        )
+        self.sheets = []
+        for _ in range(12):
+            sheet = CharacterSheetFactory()
+            CharacterVitalsFactory(
+                character_sheet=sheet,
+                health=rng.randint(15, 100),
+                max_health=rng.choice((60, 100, 117)),
+            )
+            for template in rng.sample((severe, flat), rng.randint(1, 2)):
+                ConditionInstanceFactory(
+                    target=sheet.character, condition=template, severity=rng.randint(1, 4)
+                )
+            self.sheets.append(sheet)
+        rnd = SceneRoundFactory(status=RoundStatus.DECLARING, round_number=1)
+        SceneRoundParticipantFactory(scene_round=rnd, character_sheet=self.sheets[0])
+
+    def _health(self):
+        return dict(CharacterVitals.objects.values_list("character_sheet_id", "health"))
+
+    def _per_instance_tick(self):
+        for instance in ConditionInstance.objects.filter(resolved_at__isnull=True).select_related(
+            "condition", "target"
+        ):
+            sheet = instance.target.sheet_data
+            if get_active_round_context(sheet) is None:
+                apply_clamped_chronic_damage(sheet, _compute_chronic_damage(instance))
+
+    def test_batched_chronic_tick_matches_per_instance_tick(self):
+        before = self._health()
+        with transaction.atomic():
+            for _ in range(TICKS):
+                self._per_instance_tick()
+            expected = self._health()
+            transaction.set_rollback(True)
+        CharacterVitals.flush_instance_cache(force=True)
+        self.assertEqual(self._health(), before)
+
+        for _ in range(TICKS):
+            summary = batch_chronic_effect_tick()
+
+        self.assertEqual(self._health(), expected)
+        in_round = ConditionInstance.objects.filter(target=self.sheets[0].character).count()
+        self.assertEqual(summary.active_round_skipped, in_round)
+        self.assertEqual(expected[self.sheets[0].pk], before[self.sheets[0].pk])
+        # Some sheets reach the knockout floor and stop, others are still falling.
+        self.assertGreater(sum(1 for pk in before if expected[pk] < before[pk]), 6)
@@ -8,6 +8,7 @@ as sinks or transfers). Atomic, row-locked, audited.
 
 from __future__ import annotations
 
+from collections import Counter
 from datetime import timedelta
 import logging
 from typing import TYPE_CHECKING
@@ -57,11 +58,13 @@ from world.currency.types import (
     CollectionResult,
     DistributionResult,
     ImprovementResult,
+    MoneyDelivery,
 )
 
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from datetime import datetime
 
     from evennia.accounts.models import AccountDB
@@ -1640,6 +1643,52 @@ def deliver_mission_money(
     )
 
 
+def deliver_mission_money_many(deliveries: Iterable[MoneyDelivery]) -> list[CurrencyTransfer]:
+    """Batched ``deliver_mission_money``: one purse lock, one balance write, one ledger insert.
+
+    Each delivery still gets its own ``CurrencyTransfer`` row; a recipient with
+    several deliveries gets one balance write for their total. Non-positive
+    amounts are skipped, as ``deliver_mission_money`` skips them. Balances are
+    read ``FOR UPDATE`` as raw values — an idmapped purse may hold a stale
+    balance — and written back through the idmapped instances.
+    """
+    deliveries = [delivery for delivery in deliveries if delivery.amount > 0]
+    if not deliveries:
+        return []
+    purses = {
+        purse.character_sheet_id: purse
+        for purse in CharacterPurse.objects.filter(
+            character_sheet_id__in={delivery.recipient_sheet.pk for delivery in deliveries}
+        )
+    }
+    for delivery in deliveries:
+        if delivery.recipient_sheet.pk not in purses:
+            purses[delivery.recipient_sheet.pk] = get_or_create_purse(delivery.recipient_sheet)
+    totals: Counter[int] = Counter()
+    for delivery in deliveries:
+        totals[delivery.recipient_sheet.pk] += delivery.amount
+
+    with transaction.atomic():
+        balances = dict(
+            CharacterPurse.objects.select_for_update()
+            .filter(pk__in=[purse.pk for purse in purses.values()])
+            .values_list("pk", "balance")
+        )
+        for sheet_id, purse in purses.items():
+            purse.balance = balances[purse.pk] + totals[sheet_id]
+        CharacterPurse.objects.bulk_update(list(purses.values()), ["balance"])
+        return CurrencyTransfer.objects.bulk_create(
+            [
+                CurrencyTransfer(
+                    to_purse=purses[delivery.recipient_sheet.pk],
+                    amount=delivery.amount,
+                    reason=f"{delivery.reason_label}: {delivery.ref}"[:200],
+                )
+                for delivery in deliveries
+            ]
+        )
+
+
 FAME_COPPERS_PER_POINT = 10
 
 
@@ -868,3 +868,33 @@ class SinkWiringTests(TestCase):
         purse = get_or_create_purse(persona.character_sheet)
         purse.refresh_from_db()
         assert purse.balance == 300
+
+    def test_mission_money_many_mints_one_row_per_delivery(self) -> None:
+        from world.currency.models import CharacterPurse, CurrencyTransfer
+        from world.currency.services import deliver_mission_money_many, get_or_create_purse
+        from world.currency.types import MoneyDelivery
+
+        paid = PersonaFactory().character_sheet
+        fresh = PersonaFactory().character_sheet
+        purse = get_or_create_purse(paid)
+        CharacterPurse.objects.filter(pk=purse.pk).update(balance=50)
+
+        transfers = deliver_mission_money_many(
+            [
+                MoneyDelivery(recipient_sheet=paid, amount=100, ref="task:1"),
+                MoneyDelivery(recipient_sheet=paid, amount=25, ref="task:2"),
+                MoneyDelivery(recipient_sheet=fresh, amount=10, ref="task:3"),
+                MoneyDelivery(recipient_sheet=fresh, amount=0, ref="task:4"),
+            ]
+        )
+
+        assert len(transfers) == 3
+        balances = dict(
+            CharacterPurse.objects.values_list("character_sheet_id", "balance").filter(
+                character_sheet__in=[paid, fresh]
+            )
+        )
+        assert balances == {paid.pk: 175, fresh.pk: 10}
+        # The idmapped purse was written through, not left at its stale balance.
+        assert purse.balance == 175
+        assert CurrencyTransfer.objects.filter(reason="mission reward: task:2").count() == 1
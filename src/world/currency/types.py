@@ -3,6 +3,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from world.character_sheets.models import CharacterSheet
 
 
 @dataclass(frozen=True)
@@ -67,3 +71,13 @@ class DistributionResult:
     collection: CollectionResult
     debt_principal_paid: int
     allowance: AllowanceResult
+
+
+@dataclass(frozen=True)
+class MoneyDelivery:
+    """One reward mint for ``deliver_mission_money_many``."""
+
+    recipient_sheet: CharacterSheet
+    amount: int
+    ref: str
+    reason_label: str = "mission reward"
@@ -5,12 +5,12 @@ from __future__ import annotations
 import logging
 
 from typeclasses.scripts import Script
-from world.game_clock.services import get_ic_now
-from world.game_clock.task_registry import run_due_tasks
+from world.game_clock.task_registry import get_scheduler
 
 logger = logging.getLogger("world.game_clock.scheduler")
 
-# Tick interval in seconds (5 minutes)
+# Tick interval in seconds (5 minutes). Tasks run on the scheduler's own
+# timer at their due times; this repeat is the backstop that re-arms it.
 TICK_INTERVAL = 300
 
 # Canonical key for the singleton GameTickScript
@@ -28,8 +28,7 @@ class GameTickScript(Script):
         self.start_delay = True
 
     def at_repeat(self) -> None:
-        ic_now = get_ic_now()
-        executed = run_due_tasks(ic_now=ic_now)
+        executed = get_scheduler().run_now()
         if executed:
             logger.info("Tick completed, ran tasks: %s", ", ".join(executed))
 
@@ -1,19 +1,37 @@
-"""Task registry for the game clock scheduler."""
+"""Task registry for the game clock scheduler.
+
+``TaskScheduler`` drives the registry from a single reactor timer armed for
+the earliest next due time across all registered tasks, so a 30-second task
+runs every 30 seconds instead of at the next 5-minute ``GameTickScript``
+repeat. The script remains as a backstop that also re-arms the timer.
+"""
 
 from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from enum import Enum, IntEnum
 import logging
+from typing import TYPE_CHECKING
 
+from django.conf import settings
 from django.utils import timezone
 
 from world.game_clock.models import ScheduledTaskRecord
+from world.game_clock.types import ClockError
+
+if TYPE_CHECKING:
+    from twisted.internet.base import DelayedCall
+    from twisted.internet.interfaces import IReactorTime
 
 logger = logging.getLogger("world.game_clock.scheduler")
 
+# Longest the scheduler sleeps between passes — GameTickScript's TICK_INTERVAL.
+# Bounds IC-frequency tasks (whose real due time moves with the clock ratio)
+# and anything else whose next due time cannot be predicted.
+MAX_SCHEDULER_SLEEP = timedelta(seconds=300)
+
 
 class FrequencyType(Enum):
     REAL = "real"
@@ -110,16 +128,24 @@ def phase_transitioned_since_last_run(task_key: str) -> bool:
     return phase_from_ic_time(record.last_ic_run_at) != phase_from_ic_time(ic_now)
 
 
-def run_due_tasks(*, ic_now: datetime | None = None) -> list[str]:
+def run_due_tasks(
+    *,
+    ic_now: datetime | None = None,
+    now: datetime | None = None,
+    jitter: timedelta = timedelta(0),
+) -> list[str]:
     """Check all registered tasks and run any that are due.
 
     Tasks execute in ``CronPhase`` order (#2609). The sort is stable, so tasks
     sharing a phase keep registration order — the pre-#2609 behaviour for every
     task that has not opted into a band.
 
+    ``jitter`` lets real-interval tasks due within that window run in this
+    pass rather than each arming its own wake-up a few seconds later.
+
     Returns list of task_keys that were executed.
     """
-    now = timezone.now()
+    now = now or timezone.now()
     executed: list[str] = []
 
     for task_def in sorted(_registry, key=lambda task: task.phase):
@@ -129,7 +155,7 @@ def run_due_tasks(*, ic_now: datetime | None = None) -> list[str]:
         if not record.enabled:
             continue
 
-        if _is_task_due(record, task_def, now=now, ic_now=ic_now):
+        if _is_task_due(record, task_def, now=now, ic_now=ic_now, jitter=jitter):
             try:
                 task_def.callable()
                 record.last_run_at = now
@@ -150,6 +176,7 @@ def _is_task_due(
     *,
     now: datetime,
     ic_now: datetime | None,
+    jitter: timedelta = timedelta(0),
 ) -> bool:
     """Check whether a task is due to run."""
     if task_def.anchor_weekday is not None:
@@ -157,7 +184,7 @@ def _is_task_due(
     if task_def.frequency_type == FrequencyType.REAL:
         if record.last_run_at is None:
             return True
-        return (now - record.last_run_at) >= task_def.interval
+        return (now + jitter - record.last_run_at) >= task_def.interval
 
     # IC-frequency tasks
     if ic_now is None:
@@ -180,15 +207,150 @@ def _is_anchored_weekly_due(
     predates it (first run fires on the next anchor — no surprise rollover
     the moment the task ships).
     """
-    days_since_anchor = (now.weekday() - task_def.anchor_weekday) % 7
-    last_anchor = (now - timedelta(days=days_since_anchor)).replace(
-        hour=task_def.anchor_hour_utc, minute=0, second=0, microsecond=0
-    )
-    if last_anchor > now:
-        last_anchor -= timedelta(days=7)
+    last_anchor = _last_anchor_moment(task_def, now)
     if record.last_run_at is None:
         # Stamp a baseline so the first fire happens at the NEXT anchor.
         record.last_run_at = now
         record.save(update_fields=["last_run_at"])
         return False
     return record.last_run_at < last_anchor
+
+
+def _last_anchor_moment(task_def: CronDefinition, now: datetime) -> datetime:
+    """The most recent ``anchor_weekday`` at ``anchor_hour_utc`` at or before ``now``."""
+    days_since_anchor = (now.weekday() - task_def.anchor_weekday) % 7
+    last_anchor = (now - timedelta(days=days_since_anchor)).replace(
+        hour=task_def.anchor_hour_utc, minute=0, second=0, microsecond=0
+    )
+    if last_anchor > now:
+        last_anchor -= timedelta(days=7)
+    return last_anchor
+
+
+def next_due_at(
+    record: ScheduledTaskRecord | None,
+    task_def: CronDefinition,
+    *,
+    now: datetime,
+) -> datetime | None:
+    """Real time at which ``task_def`` next becomes due.
+
+    Mirrors ``_is_task_due``: a task that has never run is due ``now``. Returns
+    None when the task is disabled or its due time cannot be predicted — an
+    IC-frequency task with no running clock.
+    """
+    if record is not None and not record.enabled:
+        return None
+    last_run_at = record.last_run_at if record is not None else None
+    if task_def.anchor_weekday is not None:
+        if last_run_at is None:
+            return now  # The first pass stamps the baseline.
+        return _last_anchor_moment(task_def, last_run_at) + timedelta(days=7)
+    if task_def.frequency_type == FrequencyType.REAL:
+        return now if last_run_at is None else last_run_at + task_def.interval
+    last_ic_run_at = record.last_ic_run_at if record is not None else None
+    return now if last_ic_run_at is None else _real_time_for_ic(last_ic_run_at + task_def.interval)
+
+
+def _real_time_for_ic(ic_due: datetime) -> datetime | None:
+    """Real time of an IC due moment; None while the clock cannot convert."""
+    from world.game_clock.services import get_real_time_for_ic_date  # noqa: PLC0415
+
+    try:
+        return get_real_time_for_ic_date(ic_due)
+    except ClockError:
+        return None
+
+
+class TaskScheduler:
+    """Runs the registry from one timer armed for the earliest due task.
+
+    Each pass runs whatever is due, then asks every registered task for its
+    next due time and arms a single ``callLater`` for the earliest, capped at
+    ``MAX_SCHEDULER_SLEEP``. Time comes from ``clock`` — the reactor in the
+    server, a ``twisted.internet.task.Clock`` in tests — so a test advances
+    the clock instead of sleeping.
+    """
+
+    def __init__(
+        self,
+        clock: IReactorTime | None = None,
+        *,
+        jitter: timedelta = timedelta(0),
+    ) -> None:
+        if clock is None:
+            from twisted.internet import reactor  # noqa: PLC0415
+
+            clock = reactor  # ty: ignore[invalid-assignment]
+        self._clock = clock
+        self.jitter = jitter
+        self._pending: DelayedCall | None = None
+
+    def now(self) -> datetime:
+        """Current time according to the scheduler's clock."""
+        return datetime.fromtimestamp(self._clock.seconds(), tz=UTC)
+
+    @property
+    def next_wakeup(self) -> datetime | None:
+        """When the armed timer fires; None when the scheduler is stopped."""
+        if self._pending is None or not self._pending.active():
+            return None
+        return datetime.fromtimestamp(self._pending.getTime(), tz=UTC)
+
+    def start(self) -> None:
+        """Run anything already due and arm the first timer."""
+        self.run_now()
+
+    def stop(self) -> None:
+        """Cancel the armed timer."""
+        if self._pending is not None and self._pending.active():
+            self._pending.cancel()
+        self._pending = None
+
+    def run_now(self) -> list[str]:
+        """Run every due task, then re-arm for the next one.
+
+        Returns list of task_keys that were executed.
+        """
+        self.stop()
+        now = self.now()
+        from world.game_clock.services import get_ic_now  # noqa: PLC0415
+
+        try:
+            return run_due_tasks(ic_now=get_ic_now(real_now=now), now=now, jitter=self.jitter)
+        finally:
+            self._arm(now)
+
+    def _arm(self, now: datetime) -> None:
+        """Arm the single timer for the earliest next due time."""
+        wake_at = now + MAX_SCHEDULER_SLEEP
+        records = {
+            record.task_key: record
+            for record in ScheduledTaskRecord.objects.filter(
+                task_key__in=[task.task_key for task in _registry]
+            )
+        }
+        for task_def in _registry:
+            due = next_due_at(records.get(task_def.task_key), task_def, now=now)
+            if due is None:
+                continue
+            if due <= now:
+                # Still due after this pass, so its last run failed: retry a
+                # full interval later rather than spinning on it.
+                due = now + min(task_def.interval, MAX_SCHEDULER_SLEEP)
+            wake_at = min(wake_at, due)
+        delay = (wake_at - now).total_seconds()
+        self._pending = self._clock.callLater(delay, self.run_now)
+
+
+_scheduler: TaskScheduler | None = None
+
+
+def get_scheduler() -> TaskScheduler:
+    """The process-wide scheduler, using the reactor and configured jitter."""
+    global _scheduler  # noqa: PLW0603
+    if _scheduler is None:
+        _scheduler = TaskScheduler(
+            jitter=timedelta(seconds=settings.GAME_CLOCK_SCHEDULER_JITTER_SECONDS)
+        )
+    return _scheduler
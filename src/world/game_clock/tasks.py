@@ -783,7 +783,7 @@ def register_all_tasks() -> None:
             task_key="combat.timer_check",
             callable=check_and_resolve_timed_encounters,
             interval=timedelta(seconds=30),
-            description="Auto-resolve expired timed combat rounds.",
+            description="Safety net: auto-resolve timed combat rounds whose timer was lost.",
         )
     )
 
@@ -991,7 +991,7 @@ def _register_weekly_money_tasks() -> None:
 
 
 def _register_late_tasks(roll_and_echo_weather: object) -> None:
-    """Register summons expiry, weather, and area quality cron tasks.
+    """Register summons expiry, instance pool, weather, and area quality cron tasks.
 
     Extracted from ``register_all_tasks`` to keep that function under the
     ruff PLR0915 statement limit.
@@ -1010,6 +1010,21 @@ def _register_late_tasks(roll_and_echo_weather: object) -> None:
             ),
         )
     )
+
+    from world.instances.services import replenish_instance_room_pool
+
+    register_task(
+        CronDefinition(
+            task_key="instances.pool_replenish",
+            callable=replenish_instance_room_pool,
+            interval=timedelta(minutes=5),
+            description=(
+                "Top the pre-warmed instanced room pool up to "
+                "INSTANCE_ROOM_POOL_LOW_WATER so mission, captivity and GM scene "
+                "starts claim a room instead of building one."
+            ),
+        )
+    )
     register_task(
         CronDefinition(
             task_key="weather.roll",
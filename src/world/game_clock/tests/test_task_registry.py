@@ -1,16 +1,19 @@
 """Tests for the game clock task registry."""
 
-from datetime import UTC, timedelta
+from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock
 
 from django.test import TestCase
 from django.utils import timezone
+from twisted.internet.task import Clock
 
 from world.game_clock.models import ScheduledTaskRecord
 from world.game_clock.task_registry import (
+    MAX_SCHEDULER_SLEEP,
     CronDefinition,
     CronPhase,
     FrequencyType,
+    TaskScheduler,
     clear_registry,
     get_registered_tasks,
     register_task,
@@ -328,3 +331,80 @@ class CronPhaseOrderingTests(TestCase):
         run_due_tasks()
 
         assert self.calls == ["upkeep", "unphased", "cleanup"]
+
+
+class TaskSchedulerTests(TestCase):
+    """Sub-tick scheduling: one timer armed for the earliest due task."""
+
+    START = datetime(2026, 3, 2, 12, 0, tzinfo=UTC)
+
+    def setUp(self) -> None:
+        clear_registry()
+        self.clock = Clock()
+        self.clock.advance(self.START.timestamp())
+        self.scheduler = TaskScheduler(self.clock)
+
+    def tearDown(self) -> None:
+        self.scheduler.stop()
+        clear_registry()
+
+    def _register(self, key: str, seconds: int, fn: MagicMock | None = None) -> MagicMock:
+        fn = fn or MagicMock()
+        register_task(
+            CronDefinition(task_key=key, callable=fn, interval=timedelta(seconds=seconds))
+        )
+        return fn
+
+    def test_short_interval_task_runs_at_its_own_cadence(self) -> None:
+        fn = self._register("fast", 30)
+
+        self.scheduler.start()
+        self.clock.advance(29)
+        self.assertEqual(fn.call_count, 1)
+        self.clock.advance(1)
+        self.assertEqual(fn.call_count, 2)
+        self.clock.pump([30] * 9)
+        self.assertEqual(fn.call_count, 11)
+
+    def test_single_timer_armed_for_the_earliest_due_task(self) -> None:
+        self._register("fast", 30)
+        self._register("slow", 120)
+
+        self.scheduler.start()
+
+        self.assertEqual(len(self.clock.getDelayedCalls()), 1)
+        self.assertEqual(self.scheduler.next_wakeup, self.START + timedelta(seconds=30))
+
+    def test_jitter_batches_tasks_due_close_together(self) -> None:
+        self.scheduler.jitter = timedelta(seconds=5)
+        first = self._register("first", 30)
+        second = self._register("second", 33)
+        self.scheduler.start()
+
+        self.clock.advance(30)
+
+        self.assertEqual(first.call_count, 2)
+        self.assertEqual(second.call_count, 2)
+
+    def test_long_intervals_are_capped_at_the_backstop(self) -> None:
+        self._register("daily", 86400)
+
+        self.scheduler.start()
+
+        self.assertEqual(self.scheduler.next_wakeup, self.START + MAX_SCHEDULER_SLEEP)
+
+    def test_failing_task_retries_after_its_interval(self) -> None:
+        self._register("broken", 60, MagicMock(side_effect=RuntimeError("boom")))
+
+        self.scheduler.start()
+
+        self.assertEqual(self.scheduler.next_wakeup, self.START + timedelta(seconds=60))
+
+    def test_stamps_runs_with_the_scheduler_clock(self) -> None:
+        self._register("fast", 30)
+
+        self.scheduler.start()
+        self.clock.advance(30)
+
+        record = ScheduledTaskRecord.objects.get(task_key="fast")
+        self.assertEqual(record.last_run_at, self.START + timedelta(seconds=30))
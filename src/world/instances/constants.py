@@ -4,3 +4,5 @@ from django.db import models
 class InstanceStatus(models.TextChoices):
     ACTIVE = "active", "Active"
     COMPLETED = "completed", "Completed"
+    # Scrubbed and unowned, waiting in the pre-warmed pool for spawn_instanced_room.
+    POOLED = "pooled", "Pooled"
@@ -1,15 +1,46 @@
-from django.db import transaction
+"""Lifecycle of temporary instanced rooms.
+
+Rooms come from a pre-warmed pool where one is available: building a room with
+``create_object`` runs typeclass hooks, lock, attribute and tag writes and
+profile creation, which is too slow to do on every mission start during an
+event. ``replenish_instance_room_pool`` (cron) keeps ``POOLED`` rooms on hand
+up to ``settings.INSTANCE_ROOM_POOL_LOW_WATER``; ``spawn_instanced_room``
+claims one and ``complete_instanced_room`` scrubs an ephemeral room back into
+the pool (up to ``settings.INSTANCE_ROOM_POOL_MAX``) instead of deleting it.
+
+Scrubbing removes exactly what deleting the room would: scripts, exits,
+contents, attributes, tags, and every database row that cascades from the
+room (triggers, decorations, grants, ...), with ``SET_NULL`` references
+nulled. Only the room's own scaffold rows (``_POOL_SCAFFOLD_MODELS``) survive,
+reset to their defaults.
+"""
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import Model
+from django.db.models.deletion import Collector, ProtectedError, RestrictedError
 from django.utils import timezone
 from evennia.objects.models import ObjectDB
 from evennia.utils.create import create_object
 
-from evennia_extensions.models import ObjectDisplayData, RoomProfile
+from evennia_extensions.models import ObjectDisplayData, ObjectKindRecord, RoomProfile
 from world.character_sheets.models import CharacterSheet
 from world.gm.models import GMProfile
 from world.instances.constants import InstanceStatus
 from world.instances.models import InstancedRoom
 from world.scenes.models import Scene
 
+INSTANCE_ROOM_TYPECLASS = "typeclasses.rooms.Room"
+
+#: Key a room carries while it waits in the pool.
+POOLED_ROOM_KEY = "Pooled Instance Room"
+
+# Rows that make up a room shell; everything else hanging off a pooled room is
+# per-owner state and is deleted by the scrub.
+_POOL_SCAFFOLD_MODELS: frozenset[type[Model]] = frozenset(
+    {ObjectDB, RoomProfile, ObjectDisplayData, ObjectKindRecord, InstancedRoom}
+)
+
 
 def spawn_instanced_room(  # noqa: PLR0913 — one owner-kind arg per caller (player vs GM)
     name: str,
@@ -19,36 +50,42 @@ def spawn_instanced_room(  # noqa: PLR0913 — one owner-kind arg per caller (pl
     source_key: str = "",
     gm_owner: GMProfile | None = None,
 ) -> ObjectDB:
-    """Create a temporary instanced room, its RoomProfile, and lifecycle record.
+    """Claim a pooled instanced room, or create one, and assign it to its owner.
 
     Temporary instanced rooms are never publicly listed — the profile always
     ends with ``is_public=False``, regardless of the model default, so a GM
     scene room, mission room, or captivity room never leaks into public room
     browsing or derives a PUBLIC scene privacy from a stale default.
     """
-    room = create_object(
-        typeclass="typeclasses.rooms.Room",
-        key=name,
-        nohome=True,
-    )
-    profile, _created = RoomProfile.objects.get_or_create(objectdb=room)
-    RoomProfile.objects.filter(pk=profile.pk).update(is_public=False)
-    profile.is_public = False
-    display_data, _created = ObjectDisplayData.objects.get_or_create(object=room)
-    display_data.permanent_description = description
-    display_data.save(update_fields=["permanent_description"])
-    InstancedRoom.objects.create(
-        room=profile,
-        owner=owner,
-        gm_owner=gm_owner,
-        return_location=return_location,
-        source_key=source_key,
-    )
+    with transaction.atomic():
+        instance = (
+            InstancedRoom.objects.select_for_update(skip_locked=True)
+            .filter(status=InstanceStatus.POOLED)
+            .order_by("pk")
+            .first()
+        )
+        if instance is None:
+            room, profile = _create_instance_room(name)
+            instance = InstancedRoom(room=profile)
+        else:
+            room = ObjectDB.objects.get(pk=instance.room_id)
+            room.key = name
+        display_data, _created = ObjectDisplayData.objects.get_or_create(object=room)
+        display_data.permanent_description = description
+        display_data.save(update_fields=["permanent_description"])
+        instance.owner = owner
+        instance.gm_owner = gm_owner
+        instance.return_location = return_location
+        instance.source_key = source_key
+        instance.status = InstanceStatus.ACTIVE
+        instance.created_at = timezone.now()
+        instance.completed_at = None
+        instance.save()
     return room
 
 
 def complete_instanced_room(room: ObjectDB) -> None:
-    """Mark room completed, relocate occupants, delete if no history."""
+    """Mark room completed, relocate occupants, pool or delete it if no history."""
     with transaction.atomic():
         instance = InstancedRoom.objects.select_for_update().get(room_id=room.pk)
         if instance.status == InstanceStatus.COMPLETED:
@@ -68,11 +105,128 @@ def complete_instanced_room(room: ObjectDB) -> None:
             if hasattr(obj, "sessions") and obj.sessions.all():
                 obj.move_to(fallback, quiet=True)
 
-    # Keep room if meaningful data exists, delete if ephemeral
-    if not _has_meaningful_data(room):
+    # Keep room if meaningful data exists, recycle or delete if ephemeral
+    if _has_meaningful_data(room):
+        return
+    if not _pool_has_room() or not _return_to_pool(room, instance):
         room.delete()
 
 
+def replenish_instance_room_pool() -> int:
+    """Top the pool up to ``settings.INSTANCE_ROOM_POOL_LOW_WATER``. Cron task.
+
+    Returns:
+        The number of rooms created.
+    """
+    missing = settings.INSTANCE_ROOM_POOL_LOW_WATER - _pooled_count()
+    for _ in range(max(missing, 0)):
+        with transaction.atomic():
+            room, profile = _create_instance_room(POOLED_ROOM_KEY)
+            ObjectDisplayData.objects.get_or_create(object=room)
+            InstancedRoom.objects.create(room=profile, status=InstanceStatus.POOLED)
+    return max(missing, 0)
+
+
 def _has_meaningful_data(room: ObjectDB) -> bool:
     """Check if this room has data worth preserving."""
     return Scene.objects.filter(location=room).exists()
+
+
+def _create_instance_room(name: str) -> tuple[ObjectDB, RoomProfile]:
+    room = create_object(typeclass=INSTANCE_ROOM_TYPECLASS, key=name, nohome=True)
+    profile, _created = RoomProfile.objects.get_or_create(objectdb=room)
+    RoomProfile.objects.filter(pk=profile.pk).update(is_public=False)
+    profile.is_public = False
+    return room, profile
+
+
+def _pooled_count() -> int:
+    return InstancedRoom.objects.filter(status=InstanceStatus.POOLED).count()
+
+
+def _pool_has_room() -> bool:
+    return _pooled_count() < settings.INSTANCE_ROOM_POOL_MAX
+
+
+def _return_to_pool(room: ObjectDB, instance: InstancedRoom) -> bool:
+    """Scrub ``room`` back to a fresh shell and mark it ``POOLED``.
+
+    Returns:
+        False when the room cannot be pooled (a swapped typeclass, or a
+        protected reference that would also block deleting it); the caller
+        deletes it instead.
+    """
+    if room.typeclass_path != INSTANCE_ROOM_TYPECLASS:
+        return False
+    try:
+        Collector(using=DEFAULT_DB_ALIAS).collect([room])
+    except (ProtectedError, RestrictedError):
+        return False
+
+    with transaction.atomic():
+        # What DefaultObject.delete does before removing the row.
+        room.scripts.remove()
+        room.clear_exits()
+        room.clear_contents()
+        room.attributes.clear()
+        room.nicks.clear()
+        room.aliases.clear()
+        room.permissions.clear()
+        room.tags.clear()
+        room.db_cmdset_storage = ""
+        room.db_key = POOLED_ROOM_KEY
+        room.save(update_fields=["db_cmdset_storage", "db_key"])
+        room.locks.clear()
+        room.basetype_setup()
+        # Collected only now, so exits and contents already handled above are
+        # not swept up in the location SET_NULL updates.
+        collector = Collector(using=DEFAULT_DB_ALIAS)
+        collector.collect([room])
+        _delete_dependents(collector)
+
+        _reset_to_defaults(RoomProfile.objects.get(pk=room.pk), is_public=False)
+        display_data = ObjectDisplayData.objects.filter(object_id=room.pk).first()
+        if display_data is not None:
+            _reset_to_defaults(display_data)
+
+        instance.owner = None
+        instance.gm_owner = None
+        instance.return_location = None
+        instance.source_key = ""
+        instance.status = InstanceStatus.POOLED
+        instance.completed_at = None
+        instance.save()
+
+    # In-memory state (ndb, handler caches, the active scene) must not follow
+    # the room to its next owner; the next lookup loads a fresh instance.
+    room.flush_from_cache(force=True)
+    return True
+
+
+def _delete_dependents(collector: Collector) -> None:
+    """Delete what ``collector`` gathered for a room, except the room's scaffold rows."""
+    scaffold = _POOL_SCAFFOLD_MODELS
+    scrub = Collector(using=collector.using, origin=collector.origin)
+    scrub.data = {
+        model: instances
+        for model, instances in collector.data.items()
+        if model._meta.concrete_model not in scaffold  # noqa: SLF001
+    }
+    scrub.fast_deletes = [qs for qs in collector.fast_deletes if qs.model not in scaffold]
+    scrub.field_updates = collector.field_updates
+    scrub.dependencies = {
+        model: dependencies - scaffold for model, dependencies in collector.dependencies.items()
+    }
+    scrub.delete()
+
+
+def _reset_to_defaults(row: Model, **overrides: object) -> None:
+    """Reset every plain field of ``row`` to its model default and save it."""
+    for field in row._meta.concrete_fields:  # noqa: SLF001
+        if field.primary_key or field.one_to_one or getattr(field, "auto_now_add", False):
+            continue
+        setattr(row, field.attname, field.get_default())
+    for attname, value in overrides.items():
+        setattr(row, attname, value)
+    row.save()
+    row.flush_from_cache(force=True)
@@ -3,7 +3,7 @@
 from unittest.mock import MagicMock, PropertyMock, patch
 
 from django.core.exceptions import ValidationError
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from evennia.objects.models import ObjectDB
 
 from evennia_extensions.factories import ObjectDBFactory, RoomProfileFactory
@@ -12,7 +12,12 @@ from world.character_sheets.factories import CharacterSheetFactory
 from world.instances.constants import InstanceStatus
 from world.instances.factories import InstancedRoomFactory
 from world.instances.models import InstancedRoom
-from world.instances.services import complete_instanced_room, spawn_instanced_room
+from world.instances.services import (
+    POOLED_ROOM_KEY,
+    complete_instanced_room,
+    replenish_instance_room_pool,
+    spawn_instanced_room,
+)
 from world.scenes.factories import SceneFactory
 
 
@@ -343,6 +348,140 @@ class CompleteInstancedRoomTests(TestCase):
         assert instance.completed_at == first_completed_at
 
 
+@override_settings(INSTANCE_ROOM_POOL_LOW_WATER=2, INSTANCE_ROOM_POOL_MAX=2)
+class InstancedRoomPoolTests(TestCase):
+    """Test the pre-warmed pool behind spawn and complete."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.return_room = ObjectDBFactory(
+            db_key="Gatehouse",
+            db_typeclass_path="typeclasses.rooms.Room",
+        )
+        cls.sheet = CharacterSheetFactory()
+
+    def _pooled(self):
+        return InstancedRoom.objects.filter(status=InstanceStatus.POOLED)
+
+    def test_replenish_tops_up_to_low_water(self):
+        assert replenish_instance_room_pool() == 2
+        assert replenish_instance_room_pool() == 0
+
+        instance = self._pooled().first()
+        assert self._pooled().count() == 2
+        assert instance.owner is None
+        assert instance.room.objectdb.db_key == POOLED_ROOM_KEY
+        assert instance.room.is_public is False
+
+    def test_spawn_claims_a_pooled_room(self):
+        replenish_instance_room_pool()
+        rooms_before = ObjectDB.objects.count()
+
+        room = spawn_instanced_room(
+            name="Bandit Camp",
+            description="Tents and embers.",
+            owner=self.sheet,
+            return_location=self.return_room,
+            source_key="mission.bandits",
+        )
+
+        assert ObjectDB.objects.count() == rooms_before
+        assert self._pooled().count() == 1
+        assert room.db_key == "Bandit Camp"
+        assert ObjectDisplayData.objects.get(object=room).permanent_description == (
+            "Tents and embers."
+        )
+        instance = InstancedRoom.objects.get(room_id=room.pk)
+        assert instance.status == InstanceStatus.ACTIVE
+        assert instance.owner == self.sheet
+        assert instance.source_key == "mission.bandits"
+
+    def test_complete_returns_ephemeral_room_to_pool(self):
+        room = spawn_instanced_room(
+            name="Ephemeral Room",
+            description="Back to the pool.",
+            owner=self.sheet,
+            return_location=self.return_room,
+        )
+
+        complete_instanced_room(room)
+
+        instance = InstancedRoom.objects.get(room_id=room.pk)
+        assert instance.status == InstanceStatus.POOLED
+        assert instance.owner is None
+        assert instance.return_location is None
+        assert instance.completed_at is None
+        assert ObjectDB.objects.get(pk=room.pk).db_key == POOLED_ROOM_KEY
+        assert ObjectDisplayData.objects.get(object_id=room.pk).permanent_description == ""
+
+    def test_complete_deletes_room_when_pool_is_full(self):
+        replenish_instance_room_pool()
+        room = spawn_instanced_room(
+            name="Overflow Room",
+            description="Pool is full.",
+            owner=self.sheet,
+            return_location=self.return_room,
+        )
+        replenish_instance_room_pool()
+
+        complete_instanced_room(room)
+
+        assert not ObjectDB.objects.filter(pk=room.pk).exists()
+
+    def test_reused_room_carries_nothing_from_its_previous_owner(self):
+        from flows.factories import TriggerFactory
+        from flows.models import Trigger
+        from world.gm.factories import GMProfileFactory, StoryRoomGrantFactory
+        from world.gm.models import StoryRoomGrant
+
+        room = spawn_instanced_room(
+            name="Ritual Chamber",
+            description="Candles everywhere.",
+            owner=self.sheet,
+            return_location=self.return_room,
+        )
+        room.db.altar_lit = True
+        room.tags.add("blood-soaked")
+        room.ndb.active_scene = MagicMock()
+        RoomProfile.objects.filter(pk=room.pk).update(is_outdoor=True)
+        candle = ObjectDBFactory(db_key="ritual candle", location=room, home=self.return_room)
+        ObjectDBFactory(
+            db_key="ritual door",
+            db_typeclass_path="typeclasses.exits.Exit",
+            location=room,
+            destination=self.return_room,
+        )
+        TriggerFactory(obj=room)
+        StoryRoomGrantFactory(
+            room=RoomProfile.objects.get(pk=room.pk),
+            character=self.sheet,
+            granted_by=GMProfileFactory(),
+        )
+        complete_instanced_room(room)
+
+        reused = spawn_instanced_room(
+            name="Quiet Study",
+            description="Dust and books.",
+            owner=CharacterSheetFactory(),
+            return_location=None,
+        )
+
+        assert reused.pk == room.pk
+        assert reused is not room
+        assert reused.attributes.all() == []
+        assert reused.tags.all() == []
+        assert reused.ndb.active_scene is None
+        assert reused.contents == []
+        assert reused.exits == []
+        assert ObjectDB.objects.get(pk=candle.pk).db_location == self.return_room
+        assert not Trigger.objects.filter(obj_id=room.pk).exists()
+        assert not StoryRoomGrant.objects.filter(room_id=room.pk).exists()
+        profile = RoomProfile.objects.get(pk=room.pk)
+        assert profile.is_outdoor is False
+        assert profile.is_public is False
+        assert reused.display_data.permanent_description == "Dust and books."
+
+
 class InstancedRoomFactoryTests(TestCase):
     """Test InstancedRoomFactory creates valid objects."""
 
@@ -53,6 +53,7 @@ from world.magic.services.soulfray import (
 from world.magic.services.techniques import (
     calculate_effective_anima_cost,
     get_runtime_technique_stats,
+    technique_stats_scope,
     use_technique,
 )
 from world.magic.services.threads import (
@@ -135,6 +136,7 @@ __all__ = [
     "staff_clear_alteration",
     "survivability_baseline",
     "survivability_save_baselines",
+    "technique_stats_scope",
     "threads_blocked_by_cap",
     "update_thread_narrative",
     "use_technique",
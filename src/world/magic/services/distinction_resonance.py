@@ -15,6 +15,7 @@ already holds once sustained investment in a Resonance crosses an authored thres
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from decimal import Decimal
 import logging
 from typing import TYPE_CHECKING
@@ -62,6 +63,36 @@ def distinction_earn_rate_for(
     )
 
 
+def distinction_earn_rates_for(
+    pairs: Iterable[tuple[int, int]],
+) -> dict[tuple[int, int], Decimal]:
+    """``distinction_earn_rate_for`` for many (sheet pk, resonance pk) pairs in one query.
+
+    Backs ``grant_resonance_many``. Pairs without a bonus are absent from the
+    returned mapping rather than mapped to 0.
+    """
+    from world.distinctions.models import CharacterDistinction  # noqa: PLC0415
+
+    wanted = set(pairs)
+    if not wanted:
+        return {}
+    rows = CharacterDistinction.objects.filter(
+        character_id__in={sheet_id for sheet_id, _ in wanted},
+        distinction__resonance_grants__resonance_id__in={res_id for _, res_id in wanted},
+    ).values_list(
+        "character_id",
+        "distinction__resonance_grants__resonance_id",
+        "rank",
+        "distinction__resonance_grants__earn_rate_bonus_per_rank",
+    )
+    rates: dict[tuple[int, int], Decimal] = {}
+    for sheet_id, resonance_id, rank, bonus in rows:
+        key = (sheet_id, resonance_id)
+        if key in wanted:
+            rates[key] = rates.get(key, Decimal(0)) + Decimal(rank) * bonus
+    return rates
+
+
 @transaction.atomic
 def reconcile_distinction_resonance_grants(character_distinction: CharacterDistinction) -> None:
     """Reconcile a ``CharacterDistinction`` into the character's resonance standing.
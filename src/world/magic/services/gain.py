@@ -59,6 +59,7 @@ Accessor reference (verified 2026-04-23 during implementation):
 from __future__ import annotations
 
 from decimal import Decimal
+from itertools import batched
 import logging
 import math
 from typing import TYPE_CHECKING
@@ -93,6 +94,7 @@ from world.magic.models import (
 )
 from world.magic.types import (
     ResonanceDailyTickSummary,
+    ResonanceGrantRequest,
     ResonanceWeeklySettlementSummary,
     SettlementResult,
 )
@@ -102,6 +104,9 @@ from world.scenes.place_models import InteractionReceiver
 
 logger = logging.getLogger(__name__)
 
+#: Sheets the daily trickle ticks gather into one ``grant_resonance_many`` call.
+TRICKLE_SHEET_BATCH_SIZE = 200
+
 
 def account_for_sheet(sheet: CharacterSheet) -> AccountDB | None:
     """Resolve a CharacterSheet to the Account currently playing it.
@@ -1098,44 +1103,42 @@ def residence_trickle_tick() -> ResonanceDailyTickSummary:
     """Daily residence-trickle tick (Spec C §5.3).
 
     Iterates sheets with a declared residence; for each matching
-    (residence-tagged ∩ sheet-claimed) resonance, fires a single
-    grant_resonance call worth cfg.residence_daily_trickle_per_resonance.
-
-    Per-character grants are wrapped in nested atomic blocks so a single
-    failure doesn't poison the whole tick. Non-residence sheets are skipped.
+    (residence-tagged ∩ sheet-claimed) resonance, grants
+    cfg.residence_daily_trickle_per_resonance. Non-residence sheets and
+    protagonism-locked sheets are skipped.
+
+    Works ``TRICKLE_SHEET_BATCH_SIZE`` sheets at a time: the lock check, the
+    residence match and the grants (``grant_resonance_many``) each cost a fixed
+    handful of queries per batch rather than per sheet. A failed batch is
+    logged and skipped; the rest of the tick goes ahead.
     """
     from world.magic.constants import GainSource  # noqa: PLC0415
-    from world.magic.services.resonance import grant_resonance  # noqa: PLC0415
 
     cfg = get_resonance_gain_config()
     grants_issued = 0
     sheets_processed = 0
 
-    sheets_with_residence = CharacterSheet.objects.exclude(current_residence__isnull=True)
-
-    for sheet in sheets_with_residence.iterator():
-        if sheet.is_protagonism_locked:
-            continue
-        sheets_processed += 1
-        matched = get_residence_resonances(sheet)
-        rp = sheet.current_residence
-        if rp is None or not matched:
-            continue
-
-        for resonance in matched:
-            try:
-                with transaction.atomic():
-                    grant_resonance(
-                        sheet,
-                        resonance,
-                        cfg.residence_daily_trickle_per_resonance,
-                        source=GainSource.ROOM_RESIDENCE,
-                        room_profile=rp,
-                    )
-                    grants_issued += 1
-            except Exception:
-                logger.exception("resonance trickle skipped a sheet (audit: was silent)")
-                continue
+    sheets_with_residence = CharacterSheet.objects.exclude(
+        current_residence__isnull=True
+    ).select_related("current_residence")
+
+    for batch in batched(sheets_with_residence.iterator(), TRICKLE_SHEET_BATCH_SIZE, strict=False):
+        locked_ids = CharacterSheet.protagonism_locked_ids(sheet.pk for sheet in batch)
+        sheets = [sheet for sheet in batch if sheet.pk not in locked_ids]
+        sheets_processed += len(sheets)
+        matched = _residence_resonances_by_sheet(sheets)
+        requests = [
+            ResonanceGrantRequest(
+                character_sheet=sheet,
+                resonance=resonance,
+                amount=cfg.residence_daily_trickle_per_resonance,
+                source=GainSource.ROOM_RESIDENCE,
+                room_profile=sheet.current_residence,
+            )
+            for sheet in sheets
+            for resonance in matched.get(sheet.pk, ())
+        ]
+        grants_issued += _grant_trickle_batch(requests)
 
     return ResonanceDailyTickSummary(
         residence_grants_issued=grants_issued,
@@ -1143,8 +1146,68 @@ def residence_trickle_tick() -> ResonanceDailyTickSummary:
     )
 
 
-def outfit_daily_trickle_for_character(sheet: CharacterSheet) -> int:
-    """Daily resonance trickle from worn facet-bearing items (Spec D §5.1).
+def _residence_resonances_by_sheet(
+    sheets: list[CharacterSheet],
+) -> dict[int, list[Resonance]]:
+    """``get_residence_resonances`` for many sheets: three queries in all."""
+    room_ids = {sheet.current_residence_id for sheet in sheets if sheet.current_residence_id}
+    if not room_ids:
+        return {}
+    tagged: dict[int, set[int]] = {}
+    for room_id, resonance_id in LocationValueModifier.objects.filter(
+        parent_type=LocationParentType.ROOM,
+        room_profile_id__in=room_ids,
+        key_type=KeyType.RESONANCE,
+        value__gt=0,
+    ).values_list("room_profile_id", "resonance_id"):
+        tagged.setdefault(room_id, set()).add(resonance_id)
+    claimed: dict[int, set[int]] = {}
+    for sheet_id, resonance_id in CharacterResonance.objects.filter(
+        character_sheet_id__in=[sheet.pk for sheet in sheets]
+    ).values_list("character_sheet_id", "resonance_id"):
+        claimed.setdefault(sheet_id, set()).add(resonance_id)
+
+    matched_ids = {
+        sheet.pk: tagged.get(sheet.current_residence_id, set()) & claimed.get(sheet.pk, set())
+        for sheet in sheets
+    }
+    resonances = Resonance.objects.in_bulk(set().union(*matched_ids.values()))
+    return {
+        sheet_id: [resonances[pk] for pk in sorted(ids)]
+        for sheet_id, ids in matched_ids.items()
+        if ids
+    }
+
+
+def _grant_trickle_batch(requests: list[ResonanceGrantRequest]) -> int:
+    """Apply one batch of trickle grants; returns how many were granted.
+
+    Rejected requests and a failed batch are logged rather than raised, so
+    one bad batch never poisons the rest of a tick.
+    """
+    from world.magic.services.resonance import grant_resonance_many  # noqa: PLC0415
+
+    if not requests:
+        return 0
+    try:
+        result = grant_resonance_many(requests)
+    except Exception:
+        logger.exception(
+            "Resonance trickle batch of %d grants failed; the batch was skipped.",
+            len(requests),
+        )
+        return 0
+    for failure in result.failures:
+        logger.warning(
+            "Resonance trickle skipped a grant for sheet %s: %s",
+            failure.request.character_sheet.pk,
+            failure.reason,
+        )
+    return len(result.grants)
+
+
+def outfit_trickle_requests_for_character(sheet: CharacterSheet) -> list[ResonanceGrantRequest]:
+    """Daily resonance trickle owed for worn facet-bearing items (Spec D §5.1).
 
     Note: "outfit" here refers to the character's *current loadout* (whatever
     is worn right now), not the saved Outfit entity in
@@ -1155,22 +1218,17 @@ def outfit_daily_trickle_for_character(sheet: CharacterSheet) -> int:
     For each equipped item:
       For each ItemFacet on the item:
         If the wearer has a Thread on that Facet:
-          grant_resonance(
-            sheet,
-            thread.resonance,
-            amount=trickle_for(item, item_facet, thread),
-            source=GainSource.OUTFIT_TRICKLE,
-            outfit_item_facet=item_facet,
-          )
+          grant thread.resonance, amount=trickle_for(item, item_facet, thread),
+          source=GainSource.OUTFIT_TRICKLE, outfit_item_facet=item_facet
 
-    Returns: count of grants issued for this sheet.
+    Reads only the cached equipment and thread handlers; granting is left to
+    the caller (``grant_resonance_many``).
     """
     from world.magic.constants import GainSource  # noqa: PLC0415
-    from world.magic.services.resonance import grant_resonance  # noqa: PLC0415
 
     config = get_resonance_gain_config()
     base = config.outfit_daily_trickle_per_item_resonance
-    grants_issued = 0
+    requests: list[ResonanceGrantRequest] = []
 
     for item_facet in sheet.character.equipped_items.iter_item_facets():
         item = item_facet.item_instance
@@ -1186,16 +1244,32 @@ def outfit_daily_trickle_for_character(sheet: CharacterSheet) -> int:
         if amount <= 0:
             continue
 
-        grant_resonance(
-            sheet,
-            thread.resonance,
-            amount=amount,
-            source=GainSource.OUTFIT_TRICKLE,
-            outfit_item_facet=item_facet,
+        requests.append(
+            ResonanceGrantRequest(
+                character_sheet=sheet,
+                resonance=thread.resonance,
+                amount=amount,
+                source=GainSource.OUTFIT_TRICKLE,
+                outfit_item_facet=item_facet,
+            )
         )
-        grants_issued += 1
 
-    return grants_issued
+    return requests
+
+
+def outfit_daily_trickle_for_character(sheet: CharacterSheet) -> int:
+    """Grant one sheet's daily outfit trickle (Spec D §5.1).
+
+    See ``outfit_trickle_requests_for_character`` for what is owed.
+
+    Returns: count of grants issued for this sheet.
+    """
+    from world.magic.services.resonance import grant_resonance_many  # noqa: PLC0415
+
+    requests = outfit_trickle_requests_for_character(sheet)
+    if not requests:
+        return 0
+    return len(grant_resonance_many(requests).grants)
 
 
 def outfit_trickle_tick() -> int:
@@ -1208,8 +1282,9 @@ def outfit_trickle_tick() -> int:
     and turns a per-playerbase scan into work proportional to the (much
     smaller) set of characters who have actually woven a facet thread.
 
-    Skips protagonism-locked sheets. Each sheet is processed in its own atomic
-    block so a single failure does not poison the whole tick.
+    Skips protagonism-locked sheets. Works ``TRICKLE_SHEET_BATCH_SIZE`` sheets
+    at a time through ``grant_resonance_many``; a sheet whose equipment walk
+    fails is logged and skipped, as is a failed batch.
 
     Returns: total count of grants issued across all sheets.
     """
@@ -1229,16 +1304,20 @@ def outfit_trickle_tick() -> int:
     if not facet_thread_owner_ids:
         return 0
 
-    sheets = CharacterSheet.objects.filter(pk__in=facet_thread_owner_ids)
-    for sheet in sheets.iterator():
-        if sheet.is_protagonism_locked:
-            continue
-        try:
-            with transaction.atomic():
-                total_grants += outfit_daily_trickle_for_character(sheet)
-        except Exception:
-            logger.exception("Outfit resonance trickle failed for sheet %s", sheet.pk)
-            continue
+    sheets = CharacterSheet.objects.filter(pk__in=facet_thread_owner_ids).select_related(
+        "character"
+    )
+    for batch in batched(sheets.iterator(), TRICKLE_SHEET_BATCH_SIZE, strict=False):
+        locked_ids = CharacterSheet.protagonism_locked_ids(sheet.pk for sheet in batch)
+        requests: list[ResonanceGrantRequest] = []
+        for sheet in batch:
+            if sheet.pk in locked_ids:
+                continue
+            try:
+                requests.extend(outfit_trickle_requests_for_character(sheet))
+            except Exception:
+                logger.exception("Outfit resonance trickle failed for sheet %s", sheet.pk)
+        total_grants += _grant_trickle_batch(requests)
 
     return total_grants
 
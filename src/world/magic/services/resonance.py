@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Iterable, Mapping
 from decimal import Decimal
 import logging
 import math
@@ -42,6 +42,9 @@ from world.magic.services.threads import (
 from world.magic.types import (
     PullPreviewResult,
     ResolvedPullEffect,
+    ResonanceBatchGrantResult,
+    ResonanceGrantFailure,
+    ResonanceGrantRequest,
     ResonancePullResult,
     ThreadImbueResult,
 )
@@ -233,6 +236,184 @@ def grant_resonance(  # noqa: PLR0913
     return cr
 
 
+def grant_resonance_many(requests: Iterable[ResonanceGrantRequest]) -> ResonanceBatchGrantResult:
+    """Apply many resonance grants with one lock, one balance write and one ledger insert.
+
+    The batched form of ``grant_resonance`` behind the daily trickle ticks, which
+    used to call it once per (sheet, resonance) or (sheet, item facet), each with
+    its own earn-rate query, balance read/write and ledger insert. Per request it
+    applies the same rules: positive amount, source/kwarg shape, and the
+    distinction earn-rate scaling for ``ACCELERATED_GAIN_SOURCES``. A request that
+    fails them is reported in ``failures`` and the rest of the batch goes ahead.
+
+    The writes are all-or-nothing: the affected ``CharacterResonance`` rows are
+    locked with one ``SELECT ... FOR UPDATE``, missing rows are ``bulk_create``d,
+    existing balances are ``bulk_update``d from the locked values and the
+    ``ResonanceGrant`` ledger is written with one ``bulk_create``. The follow-on
+    aura recompute runs once per sheet rather than once per grant, and each aura
+    or distinction rank-up step runs in its own savepoint so a failure there
+    forfeits only that step (logged), never the grants.
+
+    There is no balance cap to apply: the only resonance cap in the game is the
+    endorsement ``same_pair_daily_cap``, enforced where endorsements are made.
+    """
+    from world.magic.services.distinction_resonance import (  # noqa: PLC0415
+        distinction_earn_rates_for,
+    )
+
+    valid, failures = _partition_grant_requests(requests)
+    if not valid:
+        return ResonanceBatchGrantResult(failures=failures)
+
+    earn_rates = distinction_earn_rates_for(
+        (request.character_sheet.pk, request.resonance.pk)
+        for request in valid
+        if request.source in ACCELERATED_GAIN_SOURCES
+    )
+    ledger: list[ResonanceGrant] = []
+    totals: dict[tuple[int, int], int] = {}
+    for request in valid:
+        key = (request.character_sheet.pk, request.resonance.pk)
+        amount = request.amount
+        earn_rate_bonus = earn_rates.get(key, Decimal(0))
+        if request.source in ACCELERATED_GAIN_SOURCES and earn_rate_bonus > 0:
+            amount = int(amount * (1 + earn_rate_bonus / Decimal(100)))
+        totals[key] = totals.get(key, 0) + amount
+        ledger.append(
+            ResonanceGrant(
+                character_sheet=request.character_sheet,
+                resonance=request.resonance,
+                amount=amount,
+                source=request.source,
+                source_room_profile=request.room_profile,
+                outfit_item_facet=request.outfit_item_facet,
+            )
+        )
+
+    with transaction.atomic():
+        _apply_balance_totals(totals)
+        ResonanceGrant.objects.bulk_create(ledger)
+
+    _after_batched_grants(valid)
+    return ResonanceBatchGrantResult(grants=ledger, failures=failures)
+
+
+def _partition_grant_requests(
+    requests: Iterable[ResonanceGrantRequest],
+) -> tuple[list[ResonanceGrantRequest], list[ResonanceGrantFailure]]:
+    """Split requests into those ``grant_resonance`` would accept and the rejects."""
+    valid: list[ResonanceGrantRequest] = []
+    failures: list[ResonanceGrantFailure] = []
+    for request in requests:
+        try:
+            if request.amount <= 0:
+                msg = "Resonance grant amount must be positive."
+                raise InvalidImbueAmount(msg)
+            _validate_grant_source_shape(
+                request.source,
+                room_profile=request.room_profile,
+                outfit_item_facet=request.outfit_item_facet,
+            )
+        except (InvalidImbueAmount, ValueError) as exc:
+            failures.append(ResonanceGrantFailure(request=request, reason=str(exc)))
+            continue
+        valid.append(request)
+    return valid, failures
+
+
+def _after_batched_grants(granted: list[ResonanceGrantRequest]) -> None:
+    """Aura recompute per sheet, then distinction rank-up per accelerated pair.
+
+    Each step runs in its own savepoint; a failure is logged and forfeits only
+    that step.
+    """
+    from world.magic.services.aura import (  # noqa: PLC0415
+        fire_aura_threshold_crossings,
+        recompute_aura,
+    )
+    from world.magic.services.distinction_resonance import (  # noqa: PLC0415
+        check_distinction_rank_thresholds,
+    )
+
+    sheets = {request.character_sheet.pk: request.character_sheet for request in granted}
+    for sheet in sheets.values():
+        try:
+            with transaction.atomic():
+                drift = recompute_aura(sheet)
+                if drift is not None:
+                    fire_aura_threshold_crossings(sheet, drift)
+        except Exception:
+            logger.exception(
+                "Aura recompute failed after batched resonance grants for character "
+                "sheet #%s — the grants stand.",
+                sheet.pk,
+            )
+
+    # Distinction rank-up, once per accelerated (sheet, resonance) pair — see the
+    # matching step in grant_resonance for why only these sources.
+    checked: set[tuple[int, int]] = set()
+    for request in granted:
+        key = (request.character_sheet.pk, request.resonance.pk)
+        if request.source not in ACCELERATED_GAIN_SOURCES or key in checked:
+            continue
+        checked.add(key)
+        try:
+            with transaction.atomic():
+                check_distinction_rank_thresholds(request.character_sheet, request.resonance)
+        except Exception:
+            logger.exception(
+                "Endorsement-threshold distinction rank-up check failed for "
+                "character sheet #%s / resonance #%s — resonance grant stands, "
+                "rank-up forfeited.",
+                request.character_sheet.pk,
+                request.resonance.pk,
+            )
+
+
+def _apply_balance_totals(totals: Mapping[tuple[int, int], int]) -> None:
+    """Add each (sheet pk, resonance pk) total to its CharacterResonance, creating it if missing.
+
+    Must run inside a transaction. The existing balances are read ``FOR UPDATE``
+    as raw values — an idmapped instance may hold a stale balance — and written
+    back through the idmapped instances, so in-process readers see the result.
+    """
+    locked = (
+        CharacterResonance.objects.select_for_update()
+        .filter(
+            character_sheet_id__in={sheet_id for sheet_id, _ in totals},
+            resonance_id__in={resonance_id for _, resonance_id in totals},
+        )
+        .values_list("pk", "character_sheet_id", "resonance_id", "balance", "lifetime_earned")
+    )
+    fresh = {
+        pk: ((sheet_id, resonance_id), balance, lifetime_earned)
+        for pk, sheet_id, resonance_id, balance, lifetime_earned in locked
+        if (sheet_id, resonance_id) in totals
+    }
+    uncached = [pk for pk in fresh if CharacterResonance.get_cached_instance(pk) is None]
+    loaded = CharacterResonance.objects.in_bulk(uncached) if uncached else {}
+    updated: list[CharacterResonance] = []
+    for pk, (key, balance, lifetime_earned) in fresh.items():
+        row = CharacterResonance.get_cached_instance(pk) or loaded[pk]
+        row.balance = balance + totals[key]
+        row.lifetime_earned = lifetime_earned + totals[key]
+        updated.append(row)
+    CharacterResonance.objects.bulk_update(updated, ["balance", "lifetime_earned"])
+    seen = {key for key, _, _ in fresh.values()}
+    CharacterResonance.objects.bulk_create(
+        [
+            CharacterResonance(
+                character_sheet_id=sheet_id,
+                resonance_id=resonance_id,
+                balance=amount,
+                lifetime_earned=amount,
+            )
+            for (sheet_id, resonance_id), amount in totals.items()
+            if (sheet_id, resonance_id) not in seen
+        ]
+    )
+
+
 def _validate_grant_source_shape(  # noqa: PLR0913
     source: str,
     *,
@@ -0,0 +1,327 @@
+"""Persistent, incremental cache for the technique combat-power corpus (#3279).
+
+``technique_power_eval.evaluate_all_with_reference`` re-prices every technique
+in the catalog on each call. The Game Tuning "Techniques" panel used to keep
+the whole result in the default (per-process, in-memory) cache, so every
+restart — and every process — paid for a full run, and a single technique edit
+meant either stale numbers or a full re-run.
+
+:func:`evaluate_corpus` instead caches one ``TechniquePowerReport`` per
+technique in the ``technique_power`` cache alias (file-backed, shared by every
+process on the host, survives restarts — see ``CACHES`` in settings). Each
+entry is keyed by three content hashes:
+
+* the **context** fingerprint — the panel knobs plus every global table the
+  evaluator reads (the matchup bands derived from ``CheckRank``/``ResultChart``,
+  the damage multiplier table, the covenant anchor delta) and
+  :data:`EVALUATOR_VERSION`;
+* the **reference** frame the report was priced against (pass 1's placeholder
+  or pass 2's median);
+* the **technique** fingerprint — its own row plus every row the evaluator
+  reads for it: damage profiles, applied/removed conditions, treatments,
+  capability grants, function tags, and for each applied condition its
+  template, modifier effects, damage-over-time rows and the protective
+  ``MODIFY_PAYLOAD`` flow steps of its reactive triggers.
+
+Hashing the whole catalog is a handful of ``values()`` queries, so after an
+edit only the changed technique misses (plus the rest of pass 2 when the edit
+moves the median attack DE, which changes the reference for everyone). Misses
+above :data:`_POOL_MIN_TECHNIQUES` — a cold start — are spread across a spawn
+process pool of ``settings.TECHNIQUE_POWER_EVAL_WORKERS`` workers, each with
+its own Django setup and DB connection; ``0`` or ``1`` evaluates inline.
+
+Bump :data:`EVALUATOR_VERSION` whenever ``technique_power_eval``'s arithmetic
+changes — cached reports are otherwise indistinguishable from fresh ones.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+import hashlib
+import json
+import logging
+import multiprocessing
+import statistics
+from typing import TYPE_CHECKING, Any
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Model
+
+from flows.consts import FlowActionChoices
+from flows.models.flows import FlowStepDefinition
+from world.conditions.models import (
+    ConditionDamageOverTime,
+    ConditionModifierEffect,
+    ConditionTemplate,
+    DamageSuccessLevelMultiplier,
+)
+from world.magic.models.techniques import (
+    Technique,
+    TechniqueAppliedCondition,
+    TechniqueCapabilityGrant,
+    TechniqueDamageProfile,
+    TechniqueFunctionTag,
+    TechniqueRemovedCondition,
+    TechniqueTreatment,
+)
+from world.magic.services import technique_power_eval
+from world.magic.types.technique_power import EvalContext, ReferenceFrame, TechniquePowerReport
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+logger = logging.getLogger(__name__)
+
+#: Bump when the evaluator's arithmetic changes; part of every cache key.
+EVALUATOR_VERSION = 1
+
+_CACHE_ALIAS = "technique_power"
+#: Below this many misses a pool's spawn + django.setup() cost outweighs the work.
+_POOL_MIN_TECHNIQUES = 32
+#: Hex digits kept from each sha256 — three of them plus a prefix stay well
+#: under the 250-char key length Django's cache key validation warns about.
+_DIGEST_CHARS = 32
+
+_PLACEHOLDER_REFERENCE = ReferenceFrame(outgoing_dpr=0.0, incoming_dpr=0.0, source_label="pending")
+
+
+def _digest(payload: Any) -> str:
+    encoded = json.dumps(payload, sort_keys=True, cls=DjangoJSONEncoder).encode()
+    return hashlib.sha256(encoded).hexdigest()[:_DIGEST_CHARS]
+
+
+def _columns(model: type[Model]) -> list[str]:
+    return [field.attname for field in model._meta.concrete_fields]  # noqa: SLF001
+
+
+def _rows_by(
+    model: type[Model], key: str, ids: Iterable[int], *extra: str
+) -> dict[int, list[dict[str, Any]]]:
+    """Every row of *model* whose *key* is in *ids*, grouped by that key, pk-ordered."""
+    grouped: dict[int, list[dict[str, Any]]] = {}
+    for row in (
+        model.objects.filter(**{f"{key}__in": list(ids)})
+        .order_by("pk")
+        .values(*_columns(model), *extra)
+    ):
+        grouped.setdefault(row[key], []).append(row)
+    return grouped
+
+
+def _condition_fingerprints(condition_ids: set[int]) -> dict[int, str]:
+    """Content hash per applied-condition template, covering what the valuators read."""
+    templates = _rows_by(ConditionTemplate, "id", condition_ids)
+    effects = _rows_by(
+        ConditionModifierEffect, "condition_id", condition_ids, "modifier_target__name"
+    )
+    dots = _rows_by(ConditionDamageOverTime, "condition_id", condition_ids)
+    through = ConditionTemplate.reactive_triggers.through
+    trigger_links = list(
+        through.objects.filter(conditiontemplate_id__in=condition_ids)
+        .order_by("pk")
+        .values("conditiontemplate_id", "triggerdefinition__flow_definition_id")
+    )
+    flow_ids = {link["triggerdefinition__flow_definition_id"] for link in trigger_links}
+    steps: dict[int, list[dict[str, Any]]] = {}
+    for step in (
+        FlowStepDefinition.objects.filter(
+            flow_id__in=flow_ids, action=FlowActionChoices.MODIFY_PAYLOAD
+        )
+        .order_by("pk")
+        .values("flow_id", "parameters")
+    ):
+        steps.setdefault(step["flow_id"], []).append(step)
+    flow_steps: dict[int, list[list[dict[str, Any]]]] = {}
+    for link in trigger_links:
+        flow_steps.setdefault(link["conditiontemplate_id"], []).append(
+            steps.get(link["triggerdefinition__flow_definition_id"], [])
+        )
+    return {
+        condition_id: _digest(
+            {
+                "template": templates.get(condition_id, []),
+                "effects": effects.get(condition_id, []),
+                "dots": dots.get(condition_id, []),
+                "protective_steps": flow_steps.get(condition_id, []),
+            }
+        )
+        for condition_id in condition_ids
+    }
+
+
+def technique_fingerprints() -> dict[int, str]:
+    """Content hash per technique, in the catalog's default order.
+
+    Covers the technique's own row and every row ``evaluate_technique`` reads
+    for it, so any edit that could change its report changes its hash.
+    """
+    techniques = list(
+        Technique.objects.values(*_columns(Technique), "gift__name", "effect_type__category")
+    )
+    ids = [row["id"] for row in techniques]
+    damage = _rows_by(TechniqueDamageProfile, "technique_id", ids)
+    applied = _rows_by(TechniqueAppliedCondition, "technique_id", ids)
+    removed = _rows_by(TechniqueRemovedCondition, "technique_id", ids, "condition__name")
+    treatments = _rows_by(
+        TechniqueTreatment,
+        "technique_id",
+        ids,
+        "treatment_template__name",
+        "treatment_template__mend_on_crit",
+        "treatment_template__mend_on_success",
+        "treatment_template__mend_on_partial",
+    )
+    grants = _rows_by(TechniqueCapabilityGrant, "technique_id", ids)
+    tags = _rows_by(TechniqueFunctionTag, "technique_id", ids)
+    conditions = _condition_fingerprints(
+        {row["condition_id"] for rows in applied.values() for row in rows}
+    )
+    return {
+        row["id"]: _digest(
+            {
+                "technique": row,
+                "damage": damage.get(row["id"], []),
+                "applied": applied.get(row["id"], []),
+                "conditions": [
+                    conditions[applied_row["condition_id"]]
+                    for applied_row in applied.get(row["id"], [])
+                ],
+                "removed": removed.get(row["id"], []),
+                "treatments": treatments.get(row["id"], []),
+                "grants": grants.get(row["id"], []),
+                "tags": tags.get(row["id"], []),
+            }
+        )
+        for row in techniques
+    }
+
+
+def context_fingerprint(context: EvalContext) -> str:
+    """Hash of the panel knobs plus every catalog-wide input the evaluator reads."""
+    bands = technique_power_eval._matchup_bands(context)  # noqa: SLF001
+    return _digest(
+        {
+            "version": EVALUATOR_VERSION,
+            "context": asdict(context),
+            "bands": [(band.success_level, band.probability) for band in bands],
+            "multipliers": list(
+                DamageSuccessLevelMultiplier.objects.order_by("pk").values(
+                    *_columns(DamageSuccessLevelMultiplier)
+                )
+            ),
+            "amplified_delta": technique_power_eval._amplified_power_delta(context),  # noqa: SLF001
+        }
+    )
+
+
+def _evaluate_inline(
+    technique_ids: list[int], context: EvalContext, reference: ReferenceFrame
+) -> list[TechniquePowerReport]:
+    """Evaluate *technique_ids* sharing one band computation and multiplier cache."""
+    bands = technique_power_eval._matchup_bands(context)  # noqa: SLF001
+    multiplier_cache: dict = {}
+    return [
+        technique_power_eval.evaluate_technique(
+            technique,
+            context,
+            reference,
+            _multiplier_cache=multiplier_cache,
+            _bands=bands,
+        )
+        for technique in Technique.objects.filter(pk__in=technique_ids).select_related(
+            "gift", "effect_type"
+        )
+    ]
+
+
+def _init_worker() -> None:
+    """Pool initializer: spawn workers start from a bare interpreter."""
+    import django  # noqa: PLC0415
+
+    django.setup()
+
+
+def _evaluate(
+    technique_ids: list[int], context: EvalContext, reference: ReferenceFrame
+) -> list[TechniquePowerReport]:
+    """Evaluate *technique_ids*, over a process pool when there are enough of them."""
+    workers = settings.TECHNIQUE_POWER_EVAL_WORKERS
+    if workers <= 1 or len(technique_ids) < _POOL_MIN_TECHNIQUES:
+        return _evaluate_inline(technique_ids, context, reference)
+    chunks = [technique_ids[i::workers] for i in range(workers)]
+    # spawn, not fork: the Server process runs Twisted threads and holds DB
+    # connections, neither of which survives a fork safely.
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+    ) as pool:
+        results = pool.map(_evaluate_inline, chunks, [context] * workers, [reference] * workers)
+        return [report for chunk in results for report in chunk]
+
+
+def _cached_reports(
+    fingerprints: dict[int, str],
+    context: EvalContext,
+    context_key: str,
+    reference: ReferenceFrame,
+) -> tuple[dict[int, TechniquePowerReport], int]:
+    """Reports for every technique in *fingerprints*; returns ``(reports, misses)``."""
+    store = caches[_CACHE_ALIAS]
+    reference_key = _digest(asdict(reference))
+    keys = {
+        technique_id: f"tp:{context_key}:{reference_key}:{fingerprint}"
+        for technique_id, fingerprint in fingerprints.items()
+    }
+    hits = store.get_many(keys.values())
+    reports = {technique_id: hits[key] for technique_id, key in keys.items() if key in hits}
+    missing = [technique_id for technique_id in keys if technique_id not in reports]
+    if missing:
+        fresh = {report.technique_id: report for report in _evaluate(missing, context, reference)}
+        store.set_many({keys[technique_id]: report for technique_id, report in fresh.items()})
+        reports.update(fresh)
+    return reports, len(missing)
+
+
+def evaluate_corpus(context: EvalContext) -> tuple[list[TechniquePowerReport], ReferenceFrame]:
+    """Cached, incremental equivalent of ``evaluate_all_with_reference``.
+
+    Same two passes, same reports, same order (the catalog's default
+    ordering); only techniques whose fingerprint — or whose reference frame —
+    changed since they were last priced are evaluated.
+    """
+    context_key = context_fingerprint(context)
+    fingerprints = technique_fingerprints()
+    attack_ids = set(
+        TechniqueDamageProfile.objects.values_list("technique_id", flat=True).distinct()
+    )
+
+    baselines, pass1_misses = _cached_reports(
+        {pk: fp for pk, fp in fingerprints.items() if pk in attack_ids},
+        context,
+        context_key,
+        _PLACEHOLDER_REFERENCE,
+    )
+    if baselines:
+        median = statistics.median(report.baseline_de for report in baselines.values())
+        reference = ReferenceFrame(
+            outgoing_dpr=median,
+            incoming_dpr=median,
+            source_label="median-attack estimate",
+        )
+    else:
+        reference = ReferenceFrame(
+            outgoing_dpr=0.0, incoming_dpr=0.0, source_label="no attack techniques"
+        )
+
+    reports, pass2_misses = _cached_reports(fingerprints, context, context_key, reference)
+    logger.info(
+        "Technique power corpus: %d techniques, %d pass-1 and %d pass-2 evaluations",
+        len(fingerprints),
+        pass1_misses,
+        pass2_misses,
+    )
+    return [reports[technique_id] for technique_id in fingerprints], reference
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager
+import contextvars
 from dataclasses import replace
 from decimal import ROUND_HALF_UP, Decimal
 import logging
@@ -44,7 +46,7 @@ from world.mechanics.constants import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Sequence
+    from collections.abc import Callable, Iterator, Sequence
     from typing import Any
 
     from evennia.objects.models import ObjectDB
@@ -501,6 +503,48 @@ def _derive_power(  # noqa: PLR0913 — internal helper, one kwarg per orthogona
     return builder.clamp_floor().build()
 
 
+# ---------------------------------------------------------------------------
+# Runtime-stat memoization
+# ---------------------------------------------------------------------------
+
+# character pk -> (technique pk, apply_variant, character_technique pk,
+# preferred_resonance pk) -> stats. Grouped by character so an engagement or
+# modifier write drops only that character's entries.
+_StatsKey = tuple[int, bool, int | None, int | None]
+_technique_stats_memo: contextvars.ContextVar[
+    dict[int, dict[_StatsKey, RuntimeTechniqueStats]] | None
+] = contextvars.ContextVar("technique_stats_memo", default=None)
+
+
+@contextmanager
+def technique_stats_scope() -> Iterator[None]:
+    """Memoize ``get_runtime_technique_stats`` for one cast or one combat round.
+
+    Within the scope, repeated calls for the same (technique, character,
+    variant flag, character technique, preferred resonance) — the variant and
+    base-form reads of one cast, every cast of a round — resolve the variant,
+    modifier totals and engagement once. ``use_technique`` opens one per cast
+    and ``resolve_round`` one per round; a nested scope joins the outer one.
+    ``CharacterEngagement`` and ``CharacterModifier`` writes drop the
+    character's entries through :func:`invalidate_technique_stats`.
+    """
+    if _technique_stats_memo.get() is not None:
+        yield
+        return
+    token = _technique_stats_memo.set({})
+    try:
+        yield
+    finally:
+        _technique_stats_memo.reset(token)
+
+
+def invalidate_technique_stats(character_pk: int) -> None:
+    """Forget memoized runtime stats for one character (sheet pk == character pk)."""
+    memo = _technique_stats_memo.get()
+    if memo is not None:
+        memo.pop(character_pk, None)
+
+
 def get_runtime_technique_stats(
     technique: Technique,
     character: ObjectDB | None,
@@ -511,6 +555,8 @@ def get_runtime_technique_stats(
 ) -> RuntimeTechniqueStats:
     """Calculate runtime intensity and control for a technique.
 
+    Memoized inside a :func:`technique_stats_scope`.
+
     Combines base values with identity modifiers (from CharacterModifier),
     process modifiers (from CharacterEngagement), social safety bonus
     (when not engaged), and IntensityTier control modifier.
@@ -533,6 +579,42 @@ def get_runtime_technique_stats(
             control=technique.control,
         )
 
+    memo = _technique_stats_memo.get()
+    if memo is None:
+        return _compute_runtime_technique_stats(
+            technique,
+            character,
+            apply_variant=apply_variant,
+            character_technique=character_technique,
+            preferred_resonance=preferred_resonance,
+        )
+    key = (
+        technique.pk,
+        apply_variant,
+        character_technique.pk if character_technique is not None else None,
+        preferred_resonance.pk if preferred_resonance is not None else None,
+    )
+    character_memo = memo.setdefault(character.pk, {})
+    if key not in character_memo:
+        character_memo[key] = _compute_runtime_technique_stats(
+            technique,
+            character,
+            apply_variant=apply_variant,
+            character_technique=character_technique,
+            preferred_resonance=preferred_resonance,
+        )
+    return character_memo[key]
+
+
+def _compute_runtime_technique_stats(
+    technique: Technique,
+    character: ObjectDB,
+    *,
+    apply_variant: bool,
+    character_technique,
+    preferred_resonance,
+) -> RuntimeTechniqueStats:
+    """Compute ``get_runtime_technique_stats`` without the memo."""
     # Fetch the sheet once here so both the variant resolver and the identity-stream
     # block below share the same result without a second DB round-trip (#1581 fix).
     sheet = _get_character_sheet(character)
@@ -1035,6 +1117,7 @@ def _charge_cast_pull(
     return pull_flat_bonus, effective_power, pull_result.resolved_effects
 
 
+@technique_stats_scope()
 def use_technique(  # noqa: PLR0913, PLR0915 — orchestrator; multiple small responsibilities
     *,
     character: ObjectDB,
@@ -0,0 +1,142 @@
+"""Tests for grant_resonance_many, the batched grant behind the daily trickle ticks."""
+
+from decimal import Decimal
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from evennia_extensions.factories import RoomProfileFactory
+from world.character_sheets.factories import CharacterSheetFactory
+from world.distinctions.factories import CharacterDistinctionFactory, DistinctionFactory
+from world.magic.constants import GainSource
+from world.magic.factories import (
+    CharacterResonanceFactory,
+    DistinctionResonanceGrantFactory,
+    ResonanceFactory,
+)
+from world.magic.models import CharacterResonance, ResonanceGrant
+from world.magic.services.gain import (
+    get_resonance_gain_config,
+    residence_trickle_tick,
+    set_residence,
+    tag_room_resonance,
+)
+from world.magic.services.resonance import grant_resonance_many
+from world.magic.types import ResonanceGrantRequest
+
+
+def _residence_request(sheet, resonance, amount, room_profile) -> ResonanceGrantRequest:
+    return ResonanceGrantRequest(
+        character_sheet=sheet,
+        resonance=resonance,
+        amount=amount,
+        source=GainSource.ROOM_RESIDENCE,
+        room_profile=room_profile,
+    )
+
+
+class GrantResonanceManyTests(TestCase):
+    def test_applies_balances_and_writes_the_ledger(self) -> None:
+        sheet = CharacterSheetFactory()
+        held = ResonanceFactory()
+        new = ResonanceFactory()
+        rp = RoomProfileFactory()
+        CharacterResonanceFactory(character_sheet=sheet, resonance=held, balance=4)
+
+        result = grant_resonance_many(
+            [
+                _residence_request(sheet, held, 3, rp),
+                _residence_request(sheet, held, 2, rp),
+                _residence_request(sheet, new, 7, rp),
+            ]
+        )
+
+        self.assertEqual(len(result.grants), 3)
+        self.assertEqual(result.failures, [])
+        balances = dict(
+            CharacterResonance.objects.filter(character_sheet=sheet).values_list(
+                "resonance_id", "balance"
+            )
+        )
+        self.assertEqual(balances, {held.pk: 9, new.pk: 7})
+        self.assertEqual(
+            ResonanceGrant.objects.filter(character_sheet=sheet, source_room_profile=rp).count(),
+            3,
+        )
+
+    def test_rejects_are_reported_without_aborting_the_batch(self) -> None:
+        sheet = CharacterSheetFactory()
+        resonance = ResonanceFactory()
+        rp = RoomProfileFactory()
+        missing_room = _residence_request(sheet, resonance, 5, None)
+        zero = _residence_request(sheet, resonance, 0, rp)
+
+        result = grant_resonance_many(
+            [missing_room, zero, _residence_request(sheet, resonance, 5, rp)]
+        )
+
+        self.assertEqual([failure.request for failure in result.failures], [missing_room, zero])
+        self.assertIn("room_profile", result.failures[0].reason)
+        self.assertEqual(len(result.grants), 1)
+        self.assertEqual(
+            CharacterResonance.objects.get(character_sheet=sheet, resonance=resonance).balance, 5
+        )
+
+    def test_accelerated_sources_take_the_distinction_earn_rate(self) -> None:
+        sheet = CharacterSheetFactory()
+        resonance = ResonanceFactory()
+        distinction = DistinctionFactory()
+        DistinctionResonanceGrantFactory(
+            distinction=distinction,
+            resonance=resonance,
+            earn_rate_bonus_per_rank=Decimal(50),
+        )
+        CharacterDistinctionFactory(character=sheet, distinction=distinction, rank=1)
+
+        result = grant_resonance_many(
+            [_residence_request(sheet, resonance, 10, RoomProfileFactory())]
+        )
+
+        self.assertEqual(result.grants[0].amount, 15)
+
+    def test_refreshes_a_stale_idmapped_balance(self) -> None:
+        sheet = CharacterSheetFactory()
+        resonance = ResonanceFactory()
+        row = CharacterResonanceFactory(character_sheet=sheet, resonance=resonance, balance=1)
+        CharacterResonance.objects.filter(pk=row.pk).update(balance=10)
+
+        grant_resonance_many([_residence_request(sheet, resonance, 5, RoomProfileFactory())])
+
+        self.assertEqual(row.balance, 15)
+        row.refresh_from_db()
+        self.assertEqual(row.balance, 15)
+
+
+class ResidenceTrickleTickBatchingTests(TestCase):
+    def _resident(self, rp, resonance) -> None:
+        sheet = CharacterSheetFactory()
+        CharacterResonanceFactory(character_sheet=sheet, resonance=resonance)
+        set_residence(sheet, rp)
+
+    def test_one_ledger_insert_for_every_resident(self) -> None:
+        rp = RoomProfileFactory()
+        resonance = ResonanceFactory()
+        tag_room_resonance(rp, resonance)
+        for _ in range(6):
+            self._resident(rp, resonance)
+
+        with CaptureQueriesContext(connection) as ctx:
+            summary = residence_trickle_tick()
+
+        self.assertEqual(summary.residence_grants_issued, 6)
+        ledger_inserts = [
+            query
+            for query in ctx.captured_queries
+            if query["sql"].startswith(f'INSERT INTO "{ResonanceGrant._meta.db_table}"')
+        ]
+        self.assertEqual(len(ledger_inserts), 1)
+        self.assertEqual(
+            set(CharacterResonance.objects.values_list("balance", flat=True)),
+            {get_resonance_gain_config().residence_daily_trickle_per_resonance},
+        )
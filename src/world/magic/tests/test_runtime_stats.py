@@ -4,7 +4,7 @@ from django.test import TestCase
 
 from world.character_sheets.factories import CharacterSheetFactory
 from world.magic.factories import IntensityTierFactory, TechniqueFactory
-from world.magic.services import get_runtime_technique_stats
+from world.magic.services import get_runtime_technique_stats, technique_stats_scope
 from world.mechanics.constants import (
     TECHNIQUE_STAT_CATEGORY_NAME,
     TECHNIQUE_STAT_CONTROL,
@@ -281,3 +281,67 @@ class RuntimeStatsIntensityTierTests(TestCase):
         assert result.intensity == 22  # 12 + 10
         # Major tier (threshold 20), control_modifier=-5
         assert result.control == 0  # 5 + (-5)
+
+
+class RuntimeStatsMemoTests(TestCase):
+    """technique_stats_scope memoizes per cast/round and drops stale entries."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.technique = TechniqueFactory(intensity=5, control=3)
+        cls.category = ModifierCategoryFactory(name=TECHNIQUE_STAT_CATEGORY_NAME)
+        cls.intensity_target = ModifierTargetFactory(
+            category=cls.category, name=TECHNIQUE_STAT_INTENSITY
+        )
+
+    def test_repeat_reads_in_scope_cost_no_queries(self) -> None:
+        sheet = CharacterSheetFactory()
+
+        with technique_stats_scope():
+            first = get_runtime_technique_stats(self.technique, sheet.character)
+            with self.assertNumQueries(0):
+                for _ in range(3):
+                    self.assertEqual(
+                        get_runtime_technique_stats(self.technique, sheet.character), first
+                    )
+
+    def test_engagement_write_invalidates(self) -> None:
+        sheet = CharacterSheetFactory()
+
+        with technique_stats_scope():
+            self.assertEqual(
+                get_runtime_technique_stats(self.technique, sheet.character).control, 13
+            )
+            CharacterEngagementFactory(character=sheet, control_modifier=2)
+            self.assertEqual(
+                get_runtime_technique_stats(self.technique, sheet.character).control, 5
+            )
+
+    def test_modifier_write_invalidates(self) -> None:
+        sheet = CharacterSheetFactory()
+
+        with technique_stats_scope():
+            self.assertEqual(
+                get_runtime_technique_stats(self.technique, sheet.character).intensity, 5
+            )
+            modifier = CharacterModifierFactory(
+                character=sheet,
+                source=DistinctionModifierSourceFactory(),
+                target=self.intensity_target,
+                value=4,
+            )
+            self.assertEqual(
+                get_runtime_technique_stats(self.technique, sheet.character).intensity, 9
+            )
+            modifier.delete()
+            self.assertEqual(
+                get_runtime_technique_stats(self.technique, sheet.character).intensity, 5
+            )
+
+    def test_nested_scope_shares_the_outer_memo(self) -> None:
+        sheet = CharacterSheetFactory()
+
+        with technique_stats_scope():
+            get_runtime_technique_stats(self.technique, sheet.character)
+            with technique_stats_scope(), self.assertNumQueries(0):
+                get_runtime_technique_stats(self.technique, sheet.character)
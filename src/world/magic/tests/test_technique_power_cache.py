@@ -0,0 +1,109 @@
+"""Tests for the persistent technique power corpus cache (#3279)."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.test import TestCase
+
+from world.conditions.factories import DamageSuccessLevelMultiplierFactory
+from world.magic.factories import TechniqueDamageProfileFactory, TechniqueFactory
+from world.magic.services import technique_power_cache, technique_power_eval
+from world.magic.types.technique_power import EvalContext
+from world.traits.factories import (
+    CheckOutcomeFactory,
+    CheckRankFactory,
+    ResultChartFactory,
+    ResultChartOutcomeFactory,
+)
+from world.traits.models import ResultChart
+
+
+class TechniquePowerCacheTests(TestCase):
+    """``evaluate_corpus`` matches the uncached evaluator and only re-prices edits."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        CheckRankFactory(rank=0, min_points=0)
+        chart = ResultChartFactory(rank_difference=0, name="Even")
+        ResultChartOutcomeFactory(
+            chart=chart,
+            outcome=CheckOutcomeFactory(name="Partial", success_level=1),
+            min_roll=1,
+            max_roll=50,
+        )
+        ResultChartOutcomeFactory(
+            chart=chart,
+            outcome=CheckOutcomeFactory(name="Full", success_level=3),
+            min_roll=51,
+            max_roll=100,
+        )
+        DamageSuccessLevelMultiplierFactory(min_success_level=1, multiplier=Decimal("1.00"))
+
+        for base_damage in (4, 6, 9):
+            TechniqueDamageProfileFactory(
+                technique=TechniqueFactory(intensity=4, damage_profile=False),
+                base_damage=base_damage,
+                minimum_success_level=1,
+            )
+        cls.utility = TechniqueFactory(intensity=2, damage_profile=False)
+        TechniqueFactory(intensity=3, damage_profile=False)
+
+    def setUp(self) -> None:
+        ResultChart.clear_cache()
+        caches["technique_power"].clear()
+        self.addCleanup(caches["technique_power"].clear)
+        self.context = EvalContext()
+
+    def _evaluate_counting(self) -> tuple[list, int]:
+        with patch.object(
+            technique_power_eval,
+            "evaluate_technique",
+            wraps=technique_power_eval.evaluate_technique,
+        ) as spy:
+            reports, _reference = technique_power_cache.evaluate_corpus(self.context)
+        return reports, spy.call_count
+
+    def test_matches_uncached_evaluation(self) -> None:
+        expected = technique_power_eval.evaluate_all_with_reference(self.context)
+
+        self.assertEqual(technique_power_cache.evaluate_corpus(self.context), expected)
+
+    def test_warm_cache_evaluates_nothing(self) -> None:
+        first, cold_calls = self._evaluate_counting()
+        second, warm_calls = self._evaluate_counting()
+
+        self.assertEqual(cold_calls, 3 + 5)
+        self.assertEqual(warm_calls, 0)
+        self.assertEqual(second, first)
+
+    def test_editing_one_technique_reprices_only_that_technique(self) -> None:
+        self._evaluate_counting()
+        self.utility.intensity = 5
+        self.utility.save()
+
+        reports, calls = self._evaluate_counting()
+
+        self.assertEqual(calls, 1)
+        [report] = [r for r in reports if r.technique_id == self.utility.pk]
+        self.assertEqual(report.baseline_power, 5)
+
+    def test_fingerprint_changes_only_for_edited_technique(self) -> None:
+        before = technique_power_cache.technique_fingerprints()
+        self.utility.intensity = 5
+        self.utility.save()
+
+        after = technique_power_cache.technique_fingerprints()
+
+        changed = {pk for pk in before if before[pk] != after[pk]}
+        self.assertEqual(changed, {self.utility.pk})
+
+    def test_context_change_misses_the_cache(self) -> None:
+        self._evaluate_counting()
+        self.context = EvalContext(level=self.context.level + 1)
+
+        _reports, calls = self._evaluate_counting()
+
+        self.assertEqual(calls, 3 + 5)
@@ -21,7 +21,10 @@ from world.magic.types.alterations import (
 )
 from world.magic.types.aura import AffinityType, AuraDrift, AuraPercentages
 from world.magic.types.gain import (
+    ResonanceBatchGrantResult,
     ResonanceDailyTickSummary,
+    ResonanceGrantFailure,
+    ResonanceGrantRequest,
     ResonanceWeeklySettlementSummary,
     SettlementResult,
 )
@@ -69,7 +72,10 @@ __all__ = [
     "PullActionContext",
     "PullPreviewResult",
     "ResolvedPullEffect",
+    "ResonanceBatchGrantResult",
     "ResonanceDailyTickSummary",
+    "ResonanceGrantFailure",
+    "ResonanceGrantRequest",
     "ResonanceInvolvement",
     "ResonancePullResult",
     "ResonanceWeeklySettlementSummary",
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from evennia_extensions.models import RoomProfile
     from world.character_sheets.models import CharacterSheet
+    from world.items.models import ItemFacet
+    from world.magic.models import Resonance, ResonanceGrant
 
 
 @dataclass(frozen=True)
@@ -34,3 +37,36 @@ class ResonanceWeeklySettlementSummary:
     endorsers_settled: int = 0
     total_endorsements_settled: int = 0
     total_granted: int = 0
+
+
+@dataclass(frozen=True)
+class ResonanceGrantRequest:
+    """One grant for ``grant_resonance_many`` — the batched ``grant_resonance``.
+
+    Carries the typed source FKs the batched (tick-driven) sources need:
+    ``room_profile`` for ROOM_RESIDENCE, ``outfit_item_facet`` for
+    OUTFIT_TRICKLE. Sources without a typed FK need neither.
+    """
+
+    character_sheet: CharacterSheet
+    resonance: Resonance
+    amount: int
+    source: str
+    room_profile: RoomProfile | None = None
+    outfit_item_facet: ItemFacet | None = None
+
+
+@dataclass(frozen=True)
+class ResonanceGrantFailure:
+    """A request ``grant_resonance_many`` rejected, and why."""
+
+    request: ResonanceGrantRequest
+    reason: str
+
+
+@dataclass(frozen=True)
+class ResonanceBatchGrantResult:
+    """Outcome of ``grant_resonance_many``: the ledger rows written and the rejects."""
+
+    grants: list[ResonanceGrant] = field(default_factory=list)
+    failures: list[ResonanceGrantFailure] = field(default_factory=list)
@@ -0,0 +1,49 @@
+"""Record the indexed kind of every object that has none yet.
+
+``ObjectKindRecord`` rows are written when an object is created or swaps
+typeclass; objects older than the column have none, so kind-filtered queries
+(``evennia_extensions.services.object_kinds.objects_of_kind``) skip them until
+this has run. Safe to re-run: objects that already have a row are left alone.
+
+Run as: ``arx manage backfill_object_kinds [--batch-size N]``
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand
+from evennia.objects.models import ObjectDB
+
+from evennia_extensions.models import ObjectKindRecord
+from evennia_extensions.services.object_kinds import derive_object_kind
+
+
+class Command(BaseCommand):
+    help = "Create missing ObjectKindRecord rows from each object's typeclass."
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument(
+            "--batch-size", type=int, default=1000, help="Rows inserted per statement."
+        )
+
+    def handle(self, *_args: Any, **options: Any) -> None:
+        batch_size: int = options["batch_size"]
+        missing = ObjectDB.objects.filter(kind_record__isnull=True).order_by("pk")
+        batch: list[ObjectKindRecord] = []
+        created = 0
+        for obj in missing.iterator(chunk_size=batch_size):
+            batch.append(ObjectKindRecord(objectdb_id=obj.pk, kind=derive_object_kind(obj)))
+            if len(batch) >= batch_size:
+                created += self._flush(batch)
+        created += self._flush(batch)
+        self.stdout.write(f"Recorded the kind of {created} objects.")
+
+    @staticmethod
+    def _flush(batch: list[ObjectKindRecord]) -> int:
+        if not batch:
+            return 0
+        ObjectKindRecord.objects.bulk_create(batch, ignore_conflicts=True)
+        count = len(batch)
+        batch.clear()
+        return count
@@ -0,0 +1,53 @@
+"""Stamp ``next_evaluation_at`` on ACTIVE projects that predate the column.
+
+``scan_active_projects`` only loads projects whose ``next_evaluation_at`` has
+passed, and ``Project.save()`` maintains it; a project last saved before the
+column existed has none, so the lifecycle tick skips it until this has run.
+Safe to re-run: projects that already have a value are left alone.
+
+Run as: ``arx manage backfill_project_evaluation_times [--batch-size N]``
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from world.projects.constants import ProjectStatus
+from world.projects.models import Project
+
+
+class Command(BaseCommand):
+    help = "Compute next_evaluation_at for ACTIVE projects that have none."
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument(
+            "--batch-size", type=int, default=500, help="Rows updated per statement."
+        )
+
+    def handle(self, *_args: Any, **options: Any) -> None:
+        batch_size: int = options["batch_size"]
+        missing = Project.objects.filter(
+            status=ProjectStatus.ACTIVE, next_evaluation_at__isnull=True
+        ).order_by("pk")
+        batch: list[Project] = []
+        stamped = 0
+        for project in missing.iterator(chunk_size=batch_size):
+            project.next_evaluation_at = project.compute_next_evaluation_at()
+            if project.next_evaluation_at is None:
+                continue
+            batch.append(project)
+            if len(batch) >= batch_size:
+                stamped += self._flush(batch)
+        stamped += self._flush(batch)
+        self.stdout.write(f"Scheduled {stamped} active projects for evaluation.")
+
+    @staticmethod
+    def _flush(batch: list[Project]) -> int:
+        if not batch:
+            return 0
+        Project.objects.bulk_update(batch, ["next_evaluation_at"])
+        count = len(batch)
+        batch.clear()
+        return count
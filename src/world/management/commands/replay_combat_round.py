@@ -0,0 +1,91 @@
+"""Re-run a recorded combat round and check it reproduces the same outcome.
+
+Thin wrapper around ``world.combat.round_profiler.replay_round``. The record is
+a JSON file written under ``settings.COMBAT_ROUND_REPLAY_DIR`` by a profiled
+``resolve_round``; point the command at a DB snapshot taken before that round.
+The replay rolls back unless ``--commit`` is given, so it can be run
+repeatedly — each run prints fresh per-phase timings next to the recorded ones.
+
+Run as: ``arx manage replay_combat_round <record.json> [--commit]``
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from evennia.utils.idmapper.models import flush_cache
+
+from world.combat.models import CombatEncounter
+from world.combat.round_profiler import load_replay_record, replay_round
+from world.combat.types import PhaseTiming, RoundReplayRecord
+
+
+class _ReplayRollback(Exception):
+    """Unwinds the replay's transaction once its outcome has been captured."""
+
+
+class Command(BaseCommand):
+    help = "Re-run a recorded combat round with its RNG seed and compare the outcome."
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument("record", type=Path, help="Replay record JSON file.")
+        parser.add_argument(
+            "--commit",
+            action="store_true",
+            help="Keep the replayed round instead of rolling it back.",
+        )
+
+    def handle(self, *_args: Any, **options: Any) -> None:
+        path: Path = options["record"]
+        try:
+            record = load_replay_record(path)
+        except (OSError, ValueError, TypeError, KeyError) as exc:
+            msg = f"Could not read replay record {path}: {exc}"
+            raise CommandError(msg) from exc
+
+        replayed = self._replay(record, commit=options["commit"])
+
+        self.stdout.write(
+            f"Encounter {record.encounter_id}, round {record.round_number}, seed {record.seed}:"
+        )
+        self._write_phases(record.phases, replayed.phases)
+        if replayed.outcome != record.outcome:
+            differing = sorted(
+                key
+                for key in record.outcome.keys() | replayed.outcome.keys()
+                if record.outcome.get(key) != replayed.outcome.get(key)
+            )
+            msg = f"Replay diverged from the recorded outcome in: {', '.join(differing)}"
+            raise CommandError(msg)
+        self.stdout.write(self.style.SUCCESS("Outcome matches the recording."))
+
+    def _replay(self, record: RoundReplayRecord, *, commit: bool) -> RoundReplayRecord:
+        replayed: RoundReplayRecord | None = None
+        try:
+            with transaction.atomic():
+                replayed = replay_round(record)
+                if not commit:
+                    raise _ReplayRollback
+        except _ReplayRollback:
+            # The identity map still holds the rolled-back rows.
+            flush_cache()
+        except CombatEncounter.DoesNotExist as exc:
+            msg = f"Encounter {record.encounter_id} does not exist in this database."
+            raise CommandError(msg) from exc
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+        return replayed
+
+    def _write_phases(self, recorded: list[PhaseTiming], replayed: list[PhaseTiming]) -> None:
+        recorded_by_phase = {timing.phase: timing for timing in recorded}
+        self.stdout.write(f"  {'phase':<22} {'recorded':>18} {'replayed':>18}")
+        for timing in replayed:
+            before = recorded_by_phase.get(timing.phase)
+            before_text = f"{before.wall_ms:.1f} ms/{before.queries} q" if before else "-"
+            self.stdout.write(
+                f"  {timing.phase:<22} {before_text:>18} "
+                f"{f'{timing.wall_ms:.1f} ms/{timing.queries} q':>18}"
+            )
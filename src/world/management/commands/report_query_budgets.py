@@ -0,0 +1,83 @@
+"""Rank views by queries per request from a recorded query-budget session.
+
+Reads the JSON lines ``web.api.query_budget`` appends to
+``settings.QUERY_BUDGET_RECORD_PATH`` while ``QUERY_BUDGET_MODE`` is ``warn`` or
+``raise``: run the server (or a test suite) with both set, click through, then
+point this command at the file. Each view gets its request count, mean and
+worst queries per request, declared budget and overrun count, plus the SQL
+shape it repeated most — the likeliest N+1.
+
+Run as: ``arx manage report_query_budgets [path] [--top N]``
+"""
+
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from web.api.query_budget import RequestQueryReport, load_recorded_session
+
+_SHAPE_WIDTH = 120
+
+
+class Command(BaseCommand):
+    help = "Report the views with the most queries per request from a recorded session."
+
+    def add_arguments(self, parser: Any) -> None:
+        parser.add_argument(
+            "path",
+            nargs="?",
+            type=Path,
+            help="Recorded session file (default: settings.QUERY_BUDGET_RECORD_PATH).",
+        )
+        parser.add_argument("--top", type=int, default=10, help="How many views to list.")
+
+    def handle(self, *_args: Any, **options: Any) -> None:
+        path: Path | None = options["path"]
+        if path is None:
+            if not settings.QUERY_BUDGET_RECORD_PATH:
+                msg = "No session file given and QUERY_BUDGET_RECORD_PATH is not set."
+                raise CommandError(msg)
+            path = Path(settings.QUERY_BUDGET_RECORD_PATH)
+        try:
+            reports = load_recorded_session(path)
+        except (OSError, ValueError, TypeError, KeyError) as exc:
+            msg = f"Could not read query budget session {path}: {exc}"
+            raise CommandError(msg) from exc
+        if not reports:
+            self.stdout.write(f"No requests recorded in {path}.")
+            return
+
+        by_view: dict[str, list[RequestQueryReport]] = defaultdict(list)
+        for report in reports:
+            by_view[report.view].append(report)
+        ranked = sorted(
+            by_view.items(),
+            key=lambda item: sum(r.queries for r in item[1]) / len(item[1]),
+            reverse=True,
+        )
+        self.stdout.write(f"{len(reports)} requests over {len(by_view)} views in {path}:")
+        for view, view_reports in ranked[: options["top"]]:
+            self._write_view(view, view_reports)
+
+    def _write_view(self, view: str, reports: list[RequestQueryReport]) -> None:
+        counts = [report.queries for report in reports]
+        budget = reports[-1].budget
+        over = sum(report.over_budget for report in reports)
+        self.stdout.write(
+            f"  {view}: {len(reports)} requests, "
+            f"mean {sum(counts) / len(counts):.1f}, max {max(counts)} queries/request, "
+            f"budget {budget if budget is not None else '-'}, {over} over budget"
+        )
+        # The shape a view repeats most, weighted by how often it repeated it.
+        shapes: Counter[str] = Counter()
+        for report in reports:
+            for shape, count in report.repeated_shapes:
+                shapes[shape] += count
+        if shapes:
+            shape, count = shapes.most_common(1)[0]
+            self.stdout.write(f"    most repeated ({count}x): {shape[:_SHAPE_WIDTH]}")
@@ -76,5 +76,24 @@ class CharacterEngagement(SharedMemoryModel):
         verbose_name = "Character Engagement"
         verbose_name_plural = "Character Engagements"
 
+    def save(self, *args: object, **kwargs: object) -> None:
+        """Save, then drop the character's memoized technique runtime stats.
+
+        The process modifiers feed ``get_runtime_technique_stats``.
+        """
+        from world.magic.services.techniques import invalidate_technique_stats  # noqa: PLC0415
+
+        super().save(*args, **kwargs)
+        invalidate_technique_stats(self.character_id)
+
+    def delete(self, *args: object, **kwargs: object) -> object:
+        """Delete, then drop the character's memoized technique runtime stats."""
+        from world.magic.services.techniques import invalidate_technique_stats  # noqa: PLC0415
+
+        character_id = self.character_id
+        result = super().delete(*args, **kwargs)
+        invalidate_technique_stats(character_id)
+        return result
+
     def __str__(self) -> str:
         return f"{self.character} \u2014 {self.get_engagement_type_display()}"
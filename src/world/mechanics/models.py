@@ -461,6 +461,22 @@ class CharacterModifier(SharedMemoryModel):
         """Get the modifier target. Uses the direct FK."""
         return self.target
 
+    def save(self, *args: object, **kwargs: object) -> None:
+        """Save, then drop the character's memoized technique runtime stats."""
+        from world.magic.services.techniques import invalidate_technique_stats  # noqa: PLC0415
+
+        super().save(*args, **kwargs)
+        invalidate_technique_stats(self.character_id)
+
+    def delete(self, *args: object, **kwargs: object) -> object:
+        """Delete, then drop the character's memoized technique runtime stats."""
+        from world.magic.services.techniques import invalidate_technique_stats  # noqa: PLC0415
+
+        character_id = self.character_id
+        result = super().delete(*args, **kwargs)
+        invalidate_technique_stats(character_id)
+        return result
+
     def __str__(self) -> str:
         type_name = self.target.name if self.target_id else "Unknown"
         return f"{self.character} {type_name}: {self.value:+d} ({self.source})"
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.16 on 2026-10-18 23:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("arxii", "0162_traditioncodexgrant_is_perspective_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="roomprofile",
+            name="arrival_features",
+            field=models.PositiveSmallIntegerField(
+                default=0,
+                help_text="ArrivalFeature bitmask: which on-arrival hooks (traps, clue triggers, posted NPCs, room-trigger missions) have content here. Maintained by those content models on save/delete; Character.at_post_move skips hooks whose bit is clear.",
+            ),
+        ),
+    ]
@@ -0,0 +1,30 @@
+"""Full-text search column and per-partition GIN index on arxii_interaction.
+
+Raw SQL because the column is a Postgres generated ``tsvector`` that has no
+model field (see ``world/scenes/sql/interaction_fulltext_forward.sql``). The
+same file is listed in ``tools/build_schema.py``'s ``SQL_FILES`` so both schema
+paths carry it.
+"""
+
+from pathlib import Path
+
+from django.db import migrations
+
+_WORLD_DIR = Path(__file__).resolve().parent.parent
+
+
+def _read_sql(subpackage: str, filename: str) -> str:
+    return (_WORLD_DIR / subpackage / "sql" / filename).read_text()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("arxii", "0163_room_profile_arrival_features"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=_read_sql("scenes", "interaction_fulltext_forward.sql"),
+            reverse_sql=_read_sql("scenes", "interaction_fulltext_reverse.sql"),
+        ),
+    ]
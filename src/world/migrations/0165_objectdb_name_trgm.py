@@ -0,0 +1,30 @@
+"""Trigram GIN index on ``objects_objectdb.db_key`` for name autocomplete.
+
+Raw SQL because the index is on an expression over Evennia's own table, with an
+operator class from the ``pg_trgm`` extension (see
+``evennia_extensions/sql/objectdb_name_trgm_forward.sql``). The same file is
+listed in ``tools/build_schema.py``'s ``SQL_FILES`` so both schema paths carry it.
+"""
+
+from pathlib import Path
+
+from django.db import migrations
+
+_SRC_DIR = Path(__file__).resolve().parent.parent.parent
+
+
+def _read_sql(package: str, filename: str) -> str:
+    return (_SRC_DIR / package / "sql" / filename).read_text()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("arxii", "0164_interaction_fulltext"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=_read_sql("evennia_extensions", "objectdb_name_trgm_forward.sql"),
+            reverse_sql=_read_sql("evennia_extensions", "objectdb_name_trgm_reverse.sql"),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.16 on 2026-10-19 00:36
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("arxii", "0165_objectdb_name_trgm"),
+        ("objects", "0013_defaultobject_alter_objectdb_id_defaultcharacter_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ObjectKindRecord",
+            fields=[
+                (
+                    "objectdb",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="kind_record",
+                        serialize=False,
+                        to="objects.objectdb",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("character", "Character"),
+                            ("gm_character", "GM Character"),
+                            ("staff_character", "Staff Character"),
+                            ("companion", "Companion"),
+                            ("room", "Room"),
+                            ("exit", "Exit"),
+                            ("item", "Item"),
+                        ],
+                        db_index=True,
+                        help_text="What this object is, derived from its typeclass.",
+                        max_length=20,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Object Kind",
+                "verbose_name_plural": "Object Kinds",
+            },
+        ),
+    ]
@@ -0,0 +1,93 @@
+# Generated by Django 5.2.16 on 2026-10-19 00:54
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("arxii", "0166_object_kind_record"),
+        ("objects", "0013_defaultobject_alter_objectdb_id_defaultcharacter_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PacedActionStep",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("travel", "Travel"),
+                            ("servant_fetch_item", "Servant errand"),
+                            ("servant_fetch_outfit", "Servant errand"),
+                            ("servant_meal", "Meal preparation"),
+                            ("servant_bath", "Bath preparation"),
+                        ],
+                        help_text="Which step handler runs this action.",
+                        max_length=30,
+                    ),
+                ),
+                (
+                    "lane",
+                    models.CharField(
+                        blank=True,
+                        choices=[
+                            ("travel", "Travel"),
+                            ("servant_fetch", "Servant fetch"),
+                        ],
+                        help_text="Supersession lane; blank for actions that may run side by side.",
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "step",
+                    models.PositiveSmallIntegerField(
+                        default=0, help_text="Index of the next step to run."
+                    ),
+                ),
+                (
+                    "state",
+                    models.JSONField(
+                        blank=True,
+                        default=dict,
+                        help_text="Handler-specific state (object pks, names), JSON-safe only.",
+                    ),
+                ),
+                (
+                    "next_step_at",
+                    models.DateTimeField(db_index=True, help_text="When the next step is due."),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "owner",
+                    models.ForeignKey(
+                        help_text="The character performing the action.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="paced_actions",
+                        to="objects.objectdb",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Paced Action Step",
+                "verbose_name_plural": "Paced Action Steps",
+                "constraints": [
+                    models.UniqueConstraint(
+                        condition=models.Q(("lane", ""), _negated=True),
+                        fields=("owner", "lane"),
+                        name="paced_action_one_per_owner_lane",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.16 on 2026-10-19 01:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("arxii", "0167_paced_action_step"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="instancedroom",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("active", "Active"),
+                    ("completed", "Completed"),
+                    ("pooled", "Pooled"),
+                ],
+                default="active",
+                max_length=20,
+            ),
+        ),
+    ]
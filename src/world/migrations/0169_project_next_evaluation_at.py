@@ -0,0 +1,49 @@
+# Generated by Django 5.2.16 on 2026-10-19 01:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("arxii", "0168_instancedroom_pooled_status"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="contribution",
+            name="stat_recorded",
+            # Existing rows were credited live by the old per-contribution increment.
+            field=models.BooleanField(
+                default=True,
+                help_text="Whether this contribution has been credited to the contributor's projects.total_contributed stat. Credited in batches by the lifecycle tick.",
+            ),
+            preserve_default=False,
+        ),
+        migrations.AlterField(
+            model_name="contribution",
+            name="stat_recorded",
+            field=models.BooleanField(
+                default=False,
+                help_text="Whether this contribution has been credited to the contributor's projects.total_contributed stat. Credited in batches by the lifecycle tick.",
+            ),
+        ),
+        migrations.AddField(
+            model_name="project",
+            name="next_evaluation_at",
+            field=models.DateTimeField(
+                blank=True,
+                db_index=True,
+                help_text="When scan_active_projects next needs to look at this project: its time_limit, or the save that carried progress past threshold_target. Null when no scan will ever complete it (not ACTIVE). Maintained by save().",
+                null=True,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="contribution",
+            index=models.Index(
+                condition=models.Q(("stat_recorded", False)),
+                fields=["occurred_at"],
+                name="contribution_stat_pending_idx",
+            ),
+        ),
+    ]
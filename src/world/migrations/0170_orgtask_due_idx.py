@@ -0,0 +1,21 @@
+# Generated by Django 5.2.16 on 2026-10-19 01:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("arxii", "0169_project_next_evaluation_at"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="orgtask",
+            index=models.Index(
+                condition=models.Q(("status", "assigned")),
+                fields=["deadline"],
+                name="orgtask_due_idx",
+            ),
+        ),
+    ]
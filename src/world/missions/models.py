@@ -25,6 +25,8 @@ from django.utils import timezone
 from evennia.utils.idmapper.models import SharedMemoryModel
 
 from core.natural_keys import NaturalKeyManager, NaturalKeyMixin
+from evennia_extensions.constants import ArrivalFeature
+from evennia_extensions.mixins import ArrivalFeatureContentMixin
 from world.contributors.models import CreditedContent
 from world.missions.constants import (
     LEGEND_RISK_FLOOR_TIER,
@@ -2027,7 +2029,7 @@ class MissionSupportDeclaration(SharedMemoryModel):
         return f"support by {self.participant} @ {self.snapshot}"
 
 
-class MissionGiver(SharedMemoryModel):
+class MissionGiver(ArrivalFeatureContentMixin, SharedMemoryModel):
     """An abstracted offer point publishing a curated set of mission templates.
 
     A giver is the player-facing "front door" (a guild-hall guildmaster, a
@@ -2094,6 +2096,17 @@ class MissionGiver(SharedMemoryModel):
         ),
     )
 
+    # ``target`` is an ObjectDB FK, and a room's RoomProfile pk *is* its ObjectDB
+    # pk — so ``target_id`` doubles as the room-profile id (no-op for non-rooms).
+    arrival_feature = ArrivalFeature.MISSION_TRIGGER
+    arrival_room_field = "target_id"
+
+    @classmethod
+    def arrival_content(cls, room_profile_id: int) -> "models.QuerySet[MissionGiver]":
+        return cls.objects.filter(
+            target_id=room_profile_id, giver_kind=GiverKind.ROOM_TRIGGER, is_active=True
+        )
+
     def clean(self) -> None:
         super().clean()
         if self.target_id is None:
@@ -25,6 +25,8 @@ from core.descriptors import ReverseOneToOneOrNone
 from core.managers import ArxSharedMemoryManager
 from core.mixins import DiscriminatorMixin
 from core.natural_keys import NaturalKeyManager, NaturalKeyMixin
+from evennia_extensions.constants import ArrivalFeature
+from evennia_extensions.mixins import ArrivalFeatureContentMixin
 from world.contributors.models import CreditedContent
 from world.npc_services.constants import (
     DrawMode,
@@ -1466,7 +1468,7 @@ class NPCSourceType(models.TextChoices):
     NPC_ASSET = "npc_asset", "NPC Asset"
 
 
-class NPCAssignment(SharedMemoryModel, DiscriminatorMixin):
+class NPCAssignment(ArrivalFeatureContentMixin, SharedMemoryModel, DiscriminatorMixin):
     """An NPC posted to a room in a specific role by an owner persona (#2178).
 
     A join model with a discriminator FK to either a Functionary (class-1
@@ -1527,6 +1529,17 @@ class NPCAssignment(SharedMemoryModel, DiscriminatorMixin):
         help_text="When this assignment was retired. Null while active.",
     )
 
+    arrival_feature = ArrivalFeature.POSTED_NPC
+    arrival_room_field = "room_id"
+
+    @classmethod
+    def arrival_content(cls, room_profile_id: int) -> models.QuerySet[NPCAssignment]:
+        return cls.objects.filter(
+            room_id=room_profile_id,
+            assignment_role__in=(AssignmentRole.GUARD, AssignmentRole.DOORMAN),
+            is_active=True,
+        )
+
     DISCRIMINATOR_FIELD = "source_type"
     DISCRIMINATOR_MAP = {
         NPCSourceType.FUNCTIONARY: "functionary",
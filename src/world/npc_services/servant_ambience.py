@@ -1,6 +1,6 @@
 """Servant pampering ambience: meal + bath prep (#2989).
 
-Same delay+departure/arrival-echo shape as ``servant_fetch.py`` — the core
+Same paced departure/arrival-echo shape as ``servant_fetch.py`` — the core
 feel is PAMPERING (ratified amendment 2): a servant is called, departs,
 returns, and the character feels attended. Meal prep is pure ambience — no
 mechanical payoff (the "appetites"/"catering" tie-ins the original issue
@@ -19,16 +19,17 @@ actor's location + an active SERVANT ``NPCAssignment`` in reach.
 
 from __future__ import annotations
 
-from collections.abc import Callable
 from typing import TYPE_CHECKING
 
-from evennia.utils import delay
-
+from actions.constants import PacedActionKind
+from actions.pacing import schedule_paced_action
 from world.npc_services.servant_fetch import find_servant
 
 if TYPE_CHECKING:
     from evennia.objects.models import ObjectDB
 
+    from actions.models import PacedActionStep
+
 #: Default delay (seconds) before meal/bath prep completes.
 DEFAULT_AMBIENCE_DELAY_SECONDS: float = 5.0
 
@@ -38,12 +39,18 @@ DEFAULT_AMBIENCE_DELAY_SECONDS: float = 5.0
 BATH_FATIGUE_RECOVERY: int = 10
 
 # Authored pose text, module constants so a future content pass can vary
-# them without touching the delay/echo plumbing.
+# them without touching the pacing/echo plumbing.
 MEAL_DEPARTURE_TEXT = "{servant} bows and departs to prepare a meal for {actor}."
 MEAL_ARRIVAL_TEXT = "{servant} returns bearing a meal, laid out for {actor}."
 BATH_DEPARTURE_TEXT = "{servant} bows and departs to draw a bath for {actor}."
 BATH_ARRIVAL_TEXT = "{servant} returns to announce the bath is ready for {actor}."
 
+# (departure, arrival) pose text by paced-action kind.
+_PAMPER_TEXTS: dict[str, tuple[str, str]] = {
+    PacedActionKind.SERVANT_MEAL: (MEAL_DEPARTURE_TEXT, MEAL_ARRIVAL_TEXT),
+    PacedActionKind.SERVANT_BATH: (BATH_DEPARTURE_TEXT, BATH_ARRIVAL_TEXT),
+}
+
 
 def can_servant_pamper(*, actor: ObjectDB) -> bool:
     """Eligibility: may a servant prepare a meal/bath for this actor?
@@ -80,13 +87,7 @@ def prepare_meal(actor: ObjectDB, delay_seconds: float = DEFAULT_AMBIENCE_DELAY_
     Returns True if the prep was queued (does not itself check eligibility —
     callers gate via ``can_servant_pamper``).
     """
-    return _queue_pamper(
-        actor,
-        delay_seconds=delay_seconds,
-        departure_text=MEAL_DEPARTURE_TEXT,
-        arrival_text=MEAL_ARRIVAL_TEXT,
-        on_complete=None,
-    )
+    return _queue_pamper(actor, PacedActionKind.SERVANT_MEAL, delay_seconds=delay_seconds)
 
 
 def prepare_bath(actor: ObjectDB, delay_seconds: float = DEFAULT_AMBIENCE_DELAY_SECONDS) -> bool:
@@ -95,84 +96,63 @@ def prepare_bath(actor: ObjectDB, delay_seconds: float = DEFAULT_AMBIENCE_DELAY_
     Returns True if the prep was queued (does not itself check eligibility —
     callers gate via ``can_servant_pamper``).
     """
-    return _queue_pamper(
-        actor,
-        delay_seconds=delay_seconds,
-        departure_text=BATH_DEPARTURE_TEXT,
-        arrival_text=BATH_ARRIVAL_TEXT,
-        on_complete=_recover_bath_fatigue,
-    )
+    return _queue_pamper(actor, PacedActionKind.SERVANT_BATH, delay_seconds=delay_seconds)
 
 
-def _queue_pamper(
-    actor: ObjectDB,
-    *,
-    delay_seconds: float,
-    departure_text: str,
-    arrival_text: str,
-    on_complete: Callable[[ObjectDB], None] | None,
-) -> bool:
-    """Shared delay+echo plumbing for ``prepare_meal``/``prepare_bath``.
-
-    Simpler than ``servant_fetch.servant_fetch_item``'s token/cancellation
-    dance — ambience has no state to roll back on cancellation (nothing
-    moves), so there's no ``actor.ndb.active_fetch_token`` to register: a
-    departed character simply never sees the arrival echo (the pending
-    ``delay()`` callback still fires but checks ``actor.location`` against
-    the room it was queued in before messaging or applying any effect).
+def _queue_pamper(actor: ObjectDB, kind: PacedActionKind, *, delay_seconds: float) -> bool:
+    """Shared paced-action+echo plumbing for ``prepare_meal``/``prepare_bath``.
+
+    Simpler than ``servant_fetch.servant_fetch_item``'s cancellation — ambience
+    has no state to roll back (nothing moves), so the prep takes no lane and
+    is never cancelled: a departed character simply never sees the arrival
+    echo (``complete_pamper`` checks ``actor.location`` against the room the
+    prep was queued in before messaging or applying any effect).
     """
     from flows.scene_data_manager import SceneDataManager  # noqa: PLC0415
     from flows.service_functions.communication import message_location  # noqa: PLC0415
 
     servant = find_servant(actor.location)
     servant_name = servant.get_active_target_name() if servant else "A servant"
+    departure_text, _arrival_text = _PAMPER_TEXTS[kind]
 
     sdm = SceneDataManager()
     actor_state = sdm.initialize_state_for_object(actor)
-    origin_room = actor.location
     message_location(
         actor_state,
         departure_text.format(servant=servant_name, actor="$You()"),
     )
 
-    delay(
-        delay_seconds,
-        _complete_pamper,
+    schedule_paced_action(
         actor,
-        origin_room,
-        servant_name,
-        arrival_text,
-        on_complete,
+        kind,
+        delay_seconds=delay_seconds,
+        state={"room": actor.location.pk, "servant": servant_name},
     )
     return True
 
 
-def _complete_pamper(
-    actor: ObjectDB,
-    origin_room: ObjectDB,
-    servant_name: str,
-    arrival_text: str,
-    on_complete: Callable[[ObjectDB], None] | None,
-) -> None:
-    """Delayed completion: arrival echo, plus an optional mechanical payoff.
+def complete_pamper(paced: PacedActionStep) -> None:
+    """Paced-action step: arrival echo, plus the bath's mechanical payoff.
 
     No-ops if the actor left the room the prep was queued in.
     """
-    if actor.location != origin_room:
+    actor = paced.owner
+    if actor.location is None or actor.location.pk != paced.state["room"]:
         return
 
     from flows.scene_data_manager import SceneDataManager  # noqa: PLC0415
     from flows.service_functions.communication import message_location  # noqa: PLC0415
 
+    _departure_text, arrival_text = _PAMPER_TEXTS[paced.kind]
     sdm = SceneDataManager()
     actor_state = sdm.initialize_state_for_object(actor)
     message_location(
         actor_state,
-        arrival_text.format(servant=servant_name, actor="$You()"),
+        arrival_text.format(servant=paced.state["servant"], actor="$You()"),
     )
 
-    if on_complete is not None:
-        on_complete(actor)
+    if paced.kind == PacedActionKind.SERVANT_BATH:
+        _recover_bath_fatigue(actor)
 
 
 def _recover_bath_fatigue(actor: ObjectDB) -> None:
@@ -11,25 +11,25 @@ service functions (``pick_up``, ``take_out``, ``apply_outfit``) raise
 ``NotReachable`` unchanged. Only the action's ``execute()`` catches it
 and delegates here.
 
-Cancellation mirrors ``TravelAction``: a ``.ndb.active_fetch_token``
-makes stale callbacks no-op when the actor moves before the delay fires.
-``cancel_servant_fetch`` is called from ``Character.at_post_move``.
+The errand is a paced action (``actions.pacing``) in the actor's
+SERVANT_FETCH lane, so it survives a reload, and a second fetch supersedes
+the first. ``cancel_servant_fetch`` is called from ``Character.at_post_move``
+so an errand never delivers to a character who has left.
 """
 
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
-import uuid
-
-from django.db import transaction
-from evennia.utils import delay
 
+from actions.constants import PacedActionKind, PacedActionLane
+from actions.pacing import cancel_paced_action, schedule_paced_action
 from world.areas.services import get_room_profile
 from world.npc_services.models import AssignmentRole, NPCAssignment
 
 if TYPE_CHECKING:
     from evennia.objects.models import ObjectDB
 
+    from actions.models import PacedActionStep
     from world.items.models import ItemInstance, Outfit
 
 
@@ -136,11 +136,11 @@ def servant_fetch_item(
 ) -> bool:
     """Queue a delayed item fetch with room echoes.
 
-    Emits a departure echo to the actor's room, schedules a delayed
-    callback via ``evennia.utils.delay()``, and stores the cancellation
-    token on ``actor.ndb``. The callback is ``@transaction.atomic`` and:
+    Emits a departure echo to the actor's room and schedules a
+    SERVANT_FETCH_ITEM paced action. Its step (``complete_item_fetch``) runs
+    in a transaction and:
 
-    1. Checks the token (stale → no-op, actor moved).
+    1. No-ops if the item no longer exists.
     2. Moves the item's ``game_object`` to the actor (into inventory).
     3. Clears ``contained_in`` if set.
     4. Sets ``holder_character_sheet`` if the item was unowned.
@@ -172,40 +172,28 @@ def servant_fetch_item(
         f"{servant_name} bows and departs to fetch {item_name}.",
     )
 
-    # Cancellation token.
-    token = uuid.uuid4()
-    actor.ndb.active_fetch_token = token
-    task = delay(
-        delay_seconds,
-        _complete_item_fetch,
+    schedule_paced_action(
         actor,
-        item_instance,
-        token,
-        servant_name,
+        PacedActionKind.SERVANT_FETCH_ITEM,
+        delay_seconds=delay_seconds,
+        state={"item_instance": item_instance.pk, "servant": servant_name},
     )
-    actor.ndb.active_fetch_task = task
     return True
 
 
-@transaction.atomic
-def _complete_item_fetch(
-    actor: ObjectDB,
-    item_instance: ItemInstance,
-    token: uuid.UUID,
-    servant_name: str,
-) -> None:
-    """Delayed completion: move the item to the actor and emit arrival echo.
-
-    Wrapped in ``@transaction.atomic`` so partial failures (move succeeds
-    but holder save fails) roll back — mirroring the ``pick_up`` / ``take_out``
-    service functions' own atomicity.
+def complete_item_fetch(paced: PacedActionStep) -> None:
+    """Paced-action step: move the item to the actor and emit arrival echo.
+
+    Runs inside the paced-action step's transaction, so partial failures (move
+    succeeds but holder save fails) roll back — mirroring the ``pick_up`` /
+    ``take_out`` service functions' own atomicity.
     """
-    # Stale callback — actor moved or a new fetch superseded this one.
-    current_token = actor.ndb.active_fetch_token
-    if current_token != token:
-        return
+    from world.items.models import ItemInstance  # noqa: PLC0415
 
-    if item_instance.game_object is None:
+    actor = paced.owner
+    servant_name = paced.state["servant"]
+    item_instance = ItemInstance.objects.filter(pk=paced.state["item_instance"]).first()
+    if item_instance is None or item_instance.game_object is None:
         return
 
     # Clear container nesting if any.
@@ -241,10 +229,6 @@ def _complete_item_fetch(
         f"{servant_name} returns with {item_name} and hands it to $You().",
     )
 
-    # Clear token.
-    actor.ndb.active_fetch_token = None
-    actor.ndb.active_fetch_task = None
-
 
 def servant_fetch_outfit(
     *,
@@ -258,14 +242,14 @@ def servant_fetch_outfit(
     them via the existing ``equip()`` service. The wardrobe stays in place
     — narratively correct (a servant brings clothes, not the armoire).
 
-    The completion callback is ``@transaction.atomic`` and:
-    1. Checks the token (stale → no-op).
+    The SERVANT_FETCH_OUTFIT step (``complete_outfit_fetch``) runs in a
+    transaction and:
+    1. No-ops if the outfit no longer exists.
     2. For each outfit slot: moves the piece's ``game_object`` to the
        actor (NOT to the room — ``equip()``'s ``can_equip`` checks
        ``is_in_possession``, which requires ``game_object.location == actor``).
        Clears ``contained_in``, then calls ``equip()``.
     3. Emits an arrival echo.
-    4. Clears the token.
 
     Args:
         actor: The character requesting the outfit.
@@ -291,37 +275,20 @@ def servant_fetch_outfit(
         f"{servant_name} bows and departs to fetch your {outfit.name}.",
     )
 
-    # Cancellation token.
-    token = uuid.uuid4()
-    actor.ndb.active_fetch_token = token
-    task = delay(
-        delay_seconds,
-        _complete_outfit_fetch,
+    schedule_paced_action(
         actor,
-        outfit,
-        token,
-        servant_name,
+        PacedActionKind.SERVANT_FETCH_OUTFIT,
+        delay_seconds=delay_seconds,
+        state={"outfit": outfit.pk, "servant": servant_name},
     )
-    actor.ndb.active_fetch_task = task
     return True
 
 
-@transaction.atomic
-def _complete_outfit_fetch(
-    actor: ObjectDB,
-    outfit: Outfit,
-    token: uuid.UUID,
-    servant_name: str,
-) -> None:
-    """Delayed completion: bring outfit pieces and equip them.
+def complete_outfit_fetch(paced: PacedActionStep) -> None:
+    """Paced-action step: bring outfit pieces and equip them.
 
-    Wrapped in ``@transaction.atomic`` so partial failures roll back.
+    Runs inside the paced-action step's transaction, so partial failures roll back.
     """
-    # Stale callback.
-    current_token = actor.ndb.active_fetch_token
-    if current_token != token:
-        return
-
     from flows.object_states.item_state import ItemState  # noqa: PLC0415
     from flows.scene_data_manager import SceneDataManager  # noqa: PLC0415
     from flows.service_functions.communication import (  # noqa: PLC0415
@@ -329,6 +296,13 @@ def _complete_outfit_fetch(
     )
     from flows.service_functions.inventory import equip  # noqa: PLC0415
     from world.items.exceptions import InventoryError  # noqa: PLC0415
+    from world.items.models import Outfit  # noqa: PLC0415
+
+    actor = paced.owner
+    servant_name = paced.state["servant"]
+    outfit = Outfit.objects.filter(pk=paced.state["outfit"]).first()
+    if outfit is None:
+        return
 
     sdm = SceneDataManager()
     actor_state = sdm.initialize_state_for_object(actor)
@@ -359,23 +333,11 @@ def _complete_outfit_fetch(
         f"{servant_name} returns with your {outfit.name} and helps you change.",
     )
 
-    # Clear token.
-    actor.ndb.active_fetch_token = None
-    actor.ndb.active_fetch_task = None
-
 
 def cancel_servant_fetch(actor: ObjectDB) -> None:
     """Cancel an in-progress servant fetch, if any.
 
     Called from ``Character.at_post_move`` when the actor leaves the room.
-    Cancels the pending delay task and clears the token so the stale
-    callback no-ops.
+    Query-free when no fetch is pending.
     """
-    token = actor.ndb.active_fetch_token
-    if token is None:
-        return
-    task = actor.ndb.active_fetch_task
-    if task is not None:
-        task.cancel()
-    actor.ndb.active_fetch_token = None
-    actor.ndb.active_fetch_task = None
+    cancel_paced_action(actor, PacedActionLane.SERVANT_FETCH)
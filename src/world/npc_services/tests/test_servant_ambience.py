@@ -1,15 +1,16 @@
 """Tests for servant pampering ambience: meal + bath prep (#2989).
 
 Mocks ``is_owner``/``is_tenant`` since the real AreaClosure walk is
-Postgres-only (mirrors ``test_servant_fetch.py``'s idiom). The delay is
-called with ``evennia.utils.delay`` mocked to fire the completion callback
-synchronously so tests don't need a real reactor tick.
+Postgres-only (mirrors ``test_servant_fetch.py``'s idiom). The paced
+completion step is run directly via ``actions.test_helpers`` so tests don't
+need a real reactor tick.
 """
 
 from unittest.mock import patch
 
 from django.test import TestCase
 
+from actions.test_helpers import run_paced_actions_to_completion
 from evennia_extensions.factories import CharacterFactory, ObjectDBFactory, RoomProfileFactory
 from world.areas.factories import AreaFactory
 from world.character_sheets.factories import CharacterSheetFactory
@@ -24,11 +25,6 @@ from world.npc_services.servant_ambience import (
 from world.scenes.factories import PersonaFactory
 
 
-def _immediate_delay(_seconds, callback, *args, **kwargs):
-    """Test double for ``evennia.utils.delay`` — fires the callback synchronously."""
-    callback(*args, **kwargs)
-
-
 class CanServantPamperTests(TestCase):
     def setUp(self) -> None:
         self.area = AreaFactory()
@@ -116,7 +112,6 @@ class PrepareMealBathTests(TestCase):
 
     def test_prepare_meal_delivers_departure_and_arrival_echo(self):
         with (
-            patch("world.npc_services.servant_ambience.delay", side_effect=_immediate_delay),
             patch(
                 "world.npc_services.servant_ambience.find_servant",
                 return_value=self.servant,
@@ -124,6 +119,7 @@ class PrepareMealBathTests(TestCase):
             patch.object(self.room, "msg_contents") as mock_echo,
         ):
             result = prepare_meal(self.char)
+            run_paced_actions_to_completion()
             self.assertTrue(result)
             self.assertEqual(mock_echo.call_count, 2)
 
@@ -136,7 +132,6 @@ class PrepareMealBathTests(TestCase):
         before = pool.get_current(ActionCategory.PHYSICAL)
 
         with (
-            patch("world.npc_services.servant_ambience.delay", side_effect=_immediate_delay),
             patch(
                 "world.npc_services.servant_ambience.find_servant",
                 return_value=self.servant,
@@ -144,6 +139,7 @@ class PrepareMealBathTests(TestCase):
             patch.object(self.room, "msg_contents"),
         ):
             prepare_bath(self.char)
+            run_paced_actions_to_completion()
 
         pool.refresh_from_db()
         after = pool.get_current(ActionCategory.PHYSICAL)
@@ -152,13 +148,7 @@ class PrepareMealBathTests(TestCase):
     def test_ambience_no_ops_when_actor_left_room(self):
         other_room = ObjectDBFactory(db_key="elsewhere", db_typeclass_path="typeclasses.rooms.Room")
 
-        def _move_then_call(_seconds, callback, actor, origin_room, *rest):
-            actor.location = other_room
-            actor.save()
-            callback(actor, origin_room, *rest)
-
         with (
-            patch("world.npc_services.servant_ambience.delay", side_effect=_move_then_call),
             patch(
                 "world.npc_services.servant_ambience.find_servant",
                 return_value=self.servant,
@@ -166,6 +156,9 @@ class PrepareMealBathTests(TestCase):
             patch.object(self.room, "msg_contents") as mock_echo,
         ):
             prepare_meal(self.char)
+            self.char.location = other_room
+            self.char.save()
+            run_paced_actions_to_completion()
             # Only the departure echo fires; the arrival echo no-ops.
             self.assertEqual(mock_echo.call_count, 1)
 
@@ -6,10 +6,12 @@ at the service boundary rather than relying on real closure data.
 """
 
 from unittest.mock import patch
-import uuid
 
 from django.test import TestCase
 
+from actions.constants import PacedActionKind, PacedActionLane
+from actions.pacing import pending_paced_action, schedule_paced_action
+from actions.test_helpers import run_paced_actions_to_completion
 from evennia_extensions.factories import (
     CharacterFactory,
     ObjectDBFactory,
@@ -250,7 +252,7 @@ class CanServantFetchTests(TestCase):
 
 
 class ServantFetchItemTests(TestCase):
-    """Tests for servant_fetch_item and _complete_item_fetch."""
+    """Tests for servant_fetch_item and complete_item_fetch."""
 
     def setUp(self) -> None:
         self.area = AreaFactory()
@@ -278,16 +280,15 @@ class ServantFetchItemTests(TestCase):
     def test_fetch_moves_item_to_actor(self):
         """After the delay fires, item is in actor's possession."""
         with (
-            patch("world.npc_services.servant_fetch.delay") as mock_delay,
             patch(
                 "world.npc_services.servant_fetch.find_servant",
                 return_value=self.servant,
             ),
         ):
-            mock_delay.side_effect = lambda _seconds, callback, *args: callback(*args)
             result = servant_fetch_item(
                 actor=self.char, item_instance=self.item_instance, delay_seconds=0
             )
+            run_paced_actions_to_completion()
         self.assertTrue(result)
         self.item_instance.refresh_from_db()
         self.assertEqual(self.item_instance.game_object.location, self.char)
@@ -297,14 +298,13 @@ class ServantFetchItemTests(TestCase):
         self.item_instance.holder_character_sheet = None
         self.item_instance.save()
         with (
-            patch("world.npc_services.servant_fetch.delay") as mock_delay,
             patch(
                 "world.npc_services.servant_fetch.find_servant",
                 return_value=self.servant,
             ),
         ):
-            mock_delay.side_effect = lambda _seconds, callback, *args: callback(*args)
             servant_fetch_item(actor=self.char, item_instance=self.item_instance, delay_seconds=0)
+            run_paced_actions_to_completion()
         self.item_instance.refresh_from_db()
         self.assertEqual(self.item_instance.holder_character_sheet, self.char.sheet_data)
 
@@ -314,48 +314,39 @@ class ServantFetchItemTests(TestCase):
         self.item_instance.contained_in = container
         self.item_instance.save()
         with (
-            patch("world.npc_services.servant_fetch.delay") as mock_delay,
             patch(
                 "world.npc_services.servant_fetch.find_servant",
                 return_value=self.servant,
             ),
         ):
-            mock_delay.side_effect = lambda _seconds, callback, *args: callback(*args)
             servant_fetch_item(actor=self.char, item_instance=self.item_instance, delay_seconds=0)
+            run_paced_actions_to_completion()
         self.item_instance.refresh_from_db()
         self.assertIsNone(self.item_instance.contained_in)
 
-    def test_fetch_sets_ndb_token(self):
-        """Fetch sets the cancellation token on the actor."""
+    def test_fetch_queues_paced_errand(self):
+        """Fetch persists a pending errand in the actor's servant-fetch lane."""
         with (
-            patch("world.npc_services.servant_fetch.delay"),
             patch(
                 "world.npc_services.servant_fetch.find_servant",
                 return_value=self.servant,
             ),
         ):
             servant_fetch_item(actor=self.char, item_instance=self.item_instance, delay_seconds=5.0)
-        self.assertIsNotNone(self.char.ndb.active_fetch_token)
+        self.assertIsNotNone(pending_paced_action(self.char, PacedActionLane.SERVANT_FETCH))
 
-    def test_stale_callback_no_ops(self):
-        """A stale token (actor moved) → no item delivery."""
+    def test_cancelled_errand_no_ops(self):
+        """The actor moved (errand cancelled) → no item delivery."""
         with (
-            patch("world.npc_services.servant_fetch.delay") as mock_delay,
             patch(
                 "world.npc_services.servant_fetch.find_servant",
                 return_value=self.servant,
             ),
         ):
-            captured = []
-            mock_delay.side_effect = lambda _seconds, callback, *args: captured.append(
-                (callback, args)
-            )
             servant_fetch_item(actor=self.char, item_instance=self.item_instance, delay_seconds=5.0)
-            # Simulate the actor moving (token invalidated).
-            self.char.ndb.active_fetch_token = uuid.uuid4()
-            # Now fire the stale callback.
-            callback, args = captured[0]
-            callback(*args)
+            # Simulate the actor moving.
+            cancel_servant_fetch(self.char)
+            run_paced_actions_to_completion()
 
         # Item should NOT have moved.
         self.item_instance.refresh_from_db()
@@ -363,27 +354,22 @@ class ServantFetchItemTests(TestCase):
 
 
 class CancelServantFetchTests(TestCase):
-    def test_cancel_clears_token_and_task(self):
-        from unittest.mock import Mock
-
+    def test_cancel_drops_pending_errand(self):
         char = CharacterFactory(db_key="mover")
-        char.ndb.active_fetch_token = uuid.uuid4()
-        mock_task = Mock()
-        char.ndb.active_fetch_task = mock_task
+        schedule_paced_action(char, PacedActionKind.SERVANT_FETCH_ITEM, delay_seconds=5.0)
         cancel_servant_fetch(char)
-        mock_task.cancel.assert_called_once()
-        self.assertIsNone(char.ndb.active_fetch_token)
-        self.assertIsNone(char.ndb.active_fetch_task)
+        self.assertIsNone(pending_paced_action(char, PacedActionLane.SERVANT_FETCH))
+        self.assertFalse(char.paced_actions.exists())
 
     def test_cancel_noop_when_no_fetch(self):
         char = CharacterFactory(db_key="idle")
-        # Should not raise.
-        cancel_servant_fetch(char)
-        self.assertIsNone(char.ndb.active_fetch_token)
+        # Should not raise, nor query.
+        with self.assertNumQueries(0):
+            cancel_servant_fetch(char)
 
 
 class ServantFetchOutfitTests(TestCase):
-    """Tests for servant_fetch_outfit and _complete_outfit_fetch."""
+    """Tests for servant_fetch_outfit and complete_outfit_fetch."""
 
     def setUp(self) -> None:
         self.area = AreaFactory()
@@ -429,7 +415,6 @@ class ServantFetchOutfitTests(TestCase):
         from world.items.models import EquippedItem
 
         with (
-            patch("world.npc_services.servant_fetch.delay") as mock_delay,
             patch(
                 "world.npc_services.servant_fetch.find_servant",
                 return_value=NPCAssignment.objects.filter(
@@ -437,8 +422,8 @@ class ServantFetchOutfitTests(TestCase):
                 ).first(),
             ),
         ):
-            mock_delay.side_effect = lambda _seconds, callback, *args: callback(*args)
             result = servant_fetch_outfit(actor=self.char, outfit=self.outfit, delay_seconds=0)
+            run_paced_actions_to_completion()
         self.assertTrue(result)
         # The piece should now be on the actor.
         self.piece.refresh_from_db()
@@ -450,12 +435,11 @@ class ServantFetchOutfitTests(TestCase):
             ).exists()
         )
 
-    def test_outfit_fetch_stale_callback_no_ops(self):
-        """Stale token → no equip, pieces stay in other room."""
+    def test_outfit_fetch_cancelled_errand_no_ops(self):
+        """Cancelled errand → no equip, pieces stay in other room."""
         from world.items.models import EquippedItem
 
         with (
-            patch("world.npc_services.servant_fetch.delay") as mock_delay,
             patch(
                 "world.npc_services.servant_fetch.find_servant",
                 return_value=NPCAssignment.objects.filter(
@@ -463,15 +447,10 @@ class ServantFetchOutfitTests(TestCase):
                 ).first(),
             ),
         ):
-            captured = []
-            mock_delay.side_effect = lambda _seconds, callback, *args: captured.append(
-                (callback, args)
-            )
             servant_fetch_outfit(actor=self.char, outfit=self.outfit, delay_seconds=5.0)
             # Simulate actor moving.
-            self.char.ndb.active_fetch_token = uuid.uuid4()
-            callback, args = captured[0]
-            callback(*args)
+            cancel_servant_fetch(self.char)
+            run_paced_actions_to_completion()
 
         self.piece.refresh_from_db()
         self.assertEqual(self.piece.game_object.location, self.other_room)
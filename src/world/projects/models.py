@@ -10,8 +10,11 @@ See: docs/superpowers/specs/2026-05-30-projects-buildings-sanctum-design.md
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.utils import timezone
 from evennia.utils.idmapper.models import SharedMemoryModel
 
 from world.projects.constants import (
@@ -22,6 +25,9 @@ from world.projects.constants import (
     ProjectStatus,
 )
 
+if TYPE_CHECKING:
+    from datetime import datetime
+
 
 class Project(SharedMemoryModel):
     """A delayed multi-tick endeavor with contributions and an outcome roll.
@@ -88,6 +94,17 @@ class Project(SharedMemoryModel):
 
     description = models.TextField(blank=True)
 
+    next_evaluation_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        db_index=True,
+        help_text=(
+            "When scan_active_projects next needs to look at this project: its "
+            "time_limit, or the save that carried progress past threshold_target. "
+            "Null when no scan will ever complete it (not ACTIVE). Maintained by save()."
+        ),
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -101,6 +118,32 @@ class Project(SharedMemoryModel):
     def __str__(self) -> str:
         return f"Project<{self.kind}>(#{self.pk}, {self.status})"
 
+    def save(self, *args, **kwargs) -> None:
+        self.next_evaluation_at = self.compute_next_evaluation_at()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "next_evaluation_at"}
+        super().save(*args, **kwargs)
+
+    def compute_next_evaluation_at(self) -> datetime | None:
+        """The earliest moment this project can become completion-ready.
+
+        Mirrors ``services._project_is_completion_ready``: a SINGLE_THRESHOLD
+        project is due at its time limit, or now once progress meets the
+        threshold; a TIERED_PERIOD project only at its time limit.
+        """
+        if self.status != ProjectStatus.ACTIVE or self.time_limit is None:
+            return None
+        if self.completion_mode == CompletionMode.SINGLE_THRESHOLD:
+            if self.threshold_target is None:
+                return None
+            if self.current_progress >= self.threshold_target:
+                return min(self.time_limit, timezone.now())
+            return self.time_limit
+        if self.completion_mode == CompletionMode.TIERED_PERIOD:
+            return self.time_limit
+        return None
+
     def clean(self) -> None:
         super().clean()
         if (
@@ -165,11 +208,25 @@ class Contribution(SharedMemoryModel):
         default=ContributionPrivacy.PRIVATE,
     )
     occurred_at = models.DateTimeField(auto_now_add=True)
+    stat_recorded = models.BooleanField(
+        default=False,
+        help_text=(
+            "Whether this contribution has been credited to the contributor's "
+            "projects.total_contributed stat. Credited in batches by the lifecycle tick."
+        ),
+    )
 
     class Meta:
         ordering = ["-occurred_at"]
         indexes = [
             models.Index(fields=["project", "contributor_persona"]),
+            # Partial index — only the few contributions since the last tick are
+            # uncredited, so the tick's lookup never scans the full table.
+            models.Index(
+                fields=["occurred_at"],
+                condition=models.Q(stat_recorded=False),
+                name="contribution_stat_pending_idx",
+            ),
         ]
 
     def __str__(self) -> str:
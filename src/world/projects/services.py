@@ -6,6 +6,7 @@ See: docs/superpowers/specs/2026-05-30-projects-buildings-sanctum-design.md
 
 from __future__ import annotations
 
+from collections import Counter
 from collections.abc import Callable
 import logging
 from typing import TYPE_CHECKING
@@ -58,8 +59,8 @@ def add_contribution(  # noqa: PLR0913
     CHECK contributions are recorded; cron tick applies their progress effect
     after the check resolves.
 
-    Also increments the contributor's `projects.total_contributed` stat for
-    achievement tracking (if the StatDefinition exists).
+    The contributor's `projects.total_contributed` achievement stat is
+    credited by the next lifecycle tick, not here.
     """
     if project.status != ProjectStatus.ACTIVE:
         msg = (
@@ -108,8 +109,8 @@ def add_contribution(  # noqa: PLR0913
         project.current_progress += progress_delta
         project.save(update_fields=["current_progress", "updated_at"])
 
-    # Increment the contributor's project-contribution achievement stat.
-    _increment_contribution_stat(contributor_persona)
+    # The contributor's projects.total_contributed stat is credited in batches
+    # by the lifecycle tick (see _flush_contribution_stats).
 
     _maybe_grant_project_contribution_resonance(project, contributor_persona)
 
@@ -299,20 +300,39 @@ def _ensure_contribution_stat_def() -> StatDefinition:
     return stat_def
 
 
-def _increment_contribution_stat(persona: Persona) -> None:
-    """Increment the projects.total_contributed StatTracker for this persona.
+def _flush_contribution_stats() -> int:
+    """Credit every uncredited contribution to its contributor's stat, one increment per sheet.
 
-    Lazily creates the StatDefinition row if it does not exist yet, matching the
-    pattern used by combat achievement counters. No import-time / app-ready DB
-    queries are performed here.
+    Runs at the top of each lifecycle tick: a persona who contributed five
+    times since the last tick gets one ``projects.total_contributed`` increment
+    of 5 (and one achievement check) instead of five. The flag flip and the
+    increments share a transaction, so a failure leaves the batch for the
+    next tick rather than double-counting it.
+
+    Returns:
+        The number of contributions credited.
     """
-    stat_def = _ensure_contribution_stat_def()
-    # The stats handler API varies — best to call via the persona's character_sheet.
-    # Defensive guard: if the API doesn't exist as assumed, skip silently.
-    import contextlib  # noqa: PLC0415
+    from world.character_sheets.models import CharacterSheet  # noqa: PLC0415
 
-    with contextlib.suppress(AttributeError):
-        persona.character_sheet.stats.increment(stat_def, 1)
+    pending = list(
+        Contribution.objects.filter(stat_recorded=False).values_list(
+            "pk", "contributor_persona__character_sheet_id"
+        )
+    )
+    if not pending:
+        return 0
+    per_sheet = Counter(sheet_id for _pk, sheet_id in pending)
+    stat_def = _ensure_contribution_stat_def()
+    sheets = CharacterSheet.objects.in_bulk(per_sheet)
+    with transaction.atomic():
+        # .update() leaves cached Contribution instances' flag stale; nothing
+        # reads it but this query.
+        Contribution.objects.filter(pk__in=[pk for pk, _sheet_id in pending]).update(
+            stat_recorded=True
+        )
+        for sheet_id, count in per_sheet.items():
+            sheets[sheet_id].stats.increment(stat_def, count)
+    return len(pending)
 
 
 # ---------------------------------------------------------------------------
@@ -502,15 +522,27 @@ def _project_is_completion_ready(project: Project, now: datetime) -> bool:
 
 
 def scan_active_projects() -> int:
-    """Cron tick: scan ACTIVE projects, transition completion-ready ones to RESOLVING.
+    """Cron tick: transition completion-ready ACTIVE projects to RESOLVING.
+
+    Only projects whose ``next_evaluation_at`` has passed are loaded — their
+    time limit has arrived or a contribution carried them past their threshold
+    — so a tick in which no project crossed either costs one indexed query.
+    Uncredited contribution stats are flushed first (``_flush_contribution_stats``).
 
     Returns count of projects transitioned. Resolution itself (handler call +
     outcome_tier set) is done by resolve_project, called separately.
     """
+    try:
+        _flush_contribution_stats()
+    except Exception:
+        logger.exception("Crediting project contribution stats failed; retrying next tick.")
+
     now = timezone.now()
     transitioned = 0
-    active = Project.objects.filter(status=ProjectStatus.ACTIVE)
-    for project in active:
+    due = Project.objects.filter(status=ProjectStatus.ACTIVE, next_evaluation_at__lte=now).order_by(
+        "next_evaluation_at", "pk"
+    )
+    for project in due:
         if not _project_is_completion_ready(project, now):
             continue
         # Per-project atomic + try/except isolation: a handler failure rolls the
@@ -535,6 +567,7 @@ def scan_active_projects() -> int:
             # reference (refresh_from_db does not reliably re-fetch it — see
             # the note on save() vs .update() above).
             project.status = ProjectStatus.ACTIVE
+            project.next_evaluation_at = project.compute_next_evaluation_at()
             logger.exception(
                 "Resolution failed for project #%s; leaving it ACTIVE for retry.",
                 project.pk,
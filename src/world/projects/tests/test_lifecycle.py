@@ -1,23 +1,31 @@
 """Integration tests for the cron-driven Project lifecycle."""
 
 from datetime import timedelta
+from io import StringIO
 
+from django.core.management import call_command
 from django.test import TestCase
 from django.utils import timezone
 
+from world.achievements.services import get_stat
 from world.projects.constants import (
     CompletionMode,
+    ContributionKind,
     ProjectKind,
     ProjectStatus,
 )
 from world.projects.factories import ProjectFactory
+from world.projects.models import Contribution, Project
 from world.projects.services import (
+    _ensure_contribution_stat_def,
+    add_contribution,
     clear_kind_handlers,
     register_kind_handler,
     restore_registries,
     scan_active_projects,
     snapshot_registries,
 )
+from world.scenes.factories import PersonaFactory
 
 
 class SingleThresholdLifecycleTests(TestCase):
@@ -99,3 +107,77 @@ class TieredPeriodLifecycleTests(TestCase):
         scan_active_projects()
         project.refresh_from_db()
         self.assertEqual(project.status, ProjectStatus.RESOLVING)
+
+
+class NextEvaluationTests(TestCase):
+    def setUp(self) -> None:
+        self.addCleanup(restore_registries, snapshot_registries())
+        clear_kind_handlers()
+        register_kind_handler(ProjectKind.TEST_KIND, lambda _project, _tier: None)
+
+    def test_active_project_is_due_at_its_time_limit(self) -> None:
+        project = ProjectFactory(status=ProjectStatus.ACTIVE, current_progress=10)
+
+        self.assertEqual(project.next_evaluation_at, project.time_limit)
+
+    def test_inactive_project_is_never_due(self) -> None:
+        project = ProjectFactory(status=ProjectStatus.ACTIVE)
+
+        project.status = ProjectStatus.CANCELLED
+        project.save(update_fields=["status", "updated_at"])
+
+        due = Project.objects.filter(pk=project.pk).values_list("next_evaluation_at", flat=True)
+        self.assertIsNone(due.get())
+
+    def test_contribution_crossing_the_threshold_makes_it_due(self) -> None:
+        project = ProjectFactory(
+            status=ProjectStatus.ACTIVE, current_progress=95, threshold_target=100
+        )
+
+        add_contribution(
+            project=project,
+            contributor_persona=PersonaFactory(),
+            kind=ContributionKind.AP,
+            ap_amount=5,
+        )
+        scan_active_projects()
+
+        project.refresh_from_db()
+        self.assertEqual(project.status, ProjectStatus.RESOLVING)
+
+    def test_quiet_tick_costs_two_queries(self) -> None:
+        ProjectFactory(status=ProjectStatus.ACTIVE, current_progress=10)
+
+        # One for uncredited contribution stats, one for due projects.
+        with self.assertNumQueries(2):
+            self.assertEqual(scan_active_projects(), 0)
+
+    def test_backfill_schedules_projects_that_predate_the_column(self) -> None:
+        project = ProjectFactory(status=ProjectStatus.ACTIVE)
+        Project.objects.filter(pk=project.pk).update(next_evaluation_at=None)
+
+        call_command("backfill_project_evaluation_times", stdout=StringIO())
+
+        due = Project.objects.filter(pk=project.pk).values_list("next_evaluation_at", flat=True)
+        self.assertEqual(due.get(), project.time_limit)
+
+
+class ContributionStatBatchingTests(TestCase):
+    def test_stats_are_credited_once_per_sheet_per_tick(self) -> None:
+        project = ProjectFactory(status=ProjectStatus.ACTIVE)
+        persona = PersonaFactory()
+        for _ in range(3):
+            add_contribution(
+                project=project,
+                contributor_persona=persona,
+                kind=ContributionKind.AP,
+                ap_amount=1,
+            )
+        stat_def = _ensure_contribution_stat_def()
+        self.assertEqual(get_stat(persona.character_sheet, stat_def), 0)
+
+        scan_active_projects()
+        scan_active_projects()
+
+        self.assertEqual(get_stat(persona.character_sheet, stat_def), 3)
+        self.assertFalse(Contribution.objects.filter(stat_recorded=False).exists())
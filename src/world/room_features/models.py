@@ -18,6 +18,8 @@ from evennia.utils.idmapper.models import SharedMemoryModel
 from core.descriptors import ReverseOneToOneOrNone
 from core.mixins import DiscriminatorMixin
 from core.natural_keys import NaturalKeyManager, NaturalKeyMixin
+from evennia_extensions.constants import ArrivalFeature
+from evennia_extensions.mixins import ArrivalFeatureContentMixin
 from world.locations.constants import HolderType
 from world.room_features.constants import (
     BRIG_CAPACITY_PER_LEVEL,
@@ -311,7 +313,7 @@ class RoomFeatureProgressionDetails(SharedMemoryModel):
         )
 
 
-class Trap(SharedMemoryModel):
+class Trap(ArrivalFeatureContentMixin, SharedMemoryModel):
     """A room-anchored hazard resolved through the shared check / pool path.
 
     On entry an armed trap the entrant has not yet resolved runs a detection
@@ -435,6 +437,13 @@ class Trap(SharedMemoryModel):
         ),
     )
 
+    arrival_feature = ArrivalFeature.TRAPS
+    arrival_room_field = "room_profile_id"
+
+    @classmethod
+    def arrival_content(cls, room_profile_id: int) -> models.QuerySet[Trap]:
+        return cls.objects.filter(room_profile_id=room_profile_id, is_armed=True)
+
     class Meta:
         ordering = ["room_profile_id", "name"]
 
@@ -3,13 +3,16 @@ Roster system services.
 
 This module is organized into logical groups:
 - gallery_services: Cloudinary and media management services
+- media_storage: pluggable storage backends (Cloudinary, local disk)
 """
 
 # Import all services for backward compatibility
 from world.roster.services.gallery_services import CloudinaryGalleryService
 from world.roster.services.media_scan import MediaScanService
+from world.roster.services.media_storage import get_media_backend
 
 __all__ = [
     "CloudinaryGalleryService",
     "MediaScanService",
+    "get_media_backend",
 ]
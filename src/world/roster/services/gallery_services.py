@@ -1,31 +1,38 @@
 """Gallery and media services for the roster system.
-Handles Cloudinary integration for tenure media storage."""
+Stores tenure media through the configured media storage backend
+(``media_storage``: Cloudinary or local disk)."""
 
 from __future__ import annotations
 
+from collections.abc import Callable
 import logging
 from typing import TYPE_CHECKING, cast
 import uuid
 
-import cloudinary
-import cloudinary.api
-import cloudinary.uploader
-from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.files.uploadedfile import UploadedFile
 
 from evennia_extensions.models import Artist, Media, PlayerData
 from world.roster.models import RosterTenure, TenureMedia
 from world.roster.services.media_scan import MediaScanService
+from world.roster.services.media_storage import IMAGE_EXTENSIONS, get_media_backend
 
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:  # pragma: no cover - for type hints only
     from world.roster.models import TenureGallery
 
+#: Run on every upload before it reaches the storage backend; a hook rejects
+#: the upload by raising.
+UPLOAD_HOOKS: list[Callable[[UploadedFile], object]] = [MediaScanService.scan_image]
+
 
 class CloudinaryGalleryService:
-    """Service for managing Cloudinary uploads and tenure media."""
+    """Service for managing media uploads and tenure media.
+
+    Named for its original Cloudinary-only implementation; storage now goes
+    through ``media_storage.get_media_backend()``.
+    """
 
     @staticmethod
     def generate_tenure_folder(tenure: RosterTenure) -> str:
@@ -54,7 +61,7 @@ class CloudinaryGalleryService:
         gallery: TenureGallery | None = None,
         created_by: Artist | None = None,
     ) -> Media:
-        """Upload an image to Cloudinary and create media records.
+        """Upload an image to the media backend and create media records.
 
         Args:
             player_data: Owner of the uploaded media
@@ -72,41 +79,29 @@ class CloudinaryGalleryService:
         Raises:
             ValidationError: If upload fails or file is invalid
         """
-        if not hasattr(settings, "CLOUDINARY_CLOUD_NAME") or not settings.CLOUDINARY_CLOUD_NAME:
-            msg = "Cloudinary is not configured"
-            raise ValidationError(msg)
+        backend = get_media_backend()
+        if not backend.is_configured():
+            raise ValidationError(backend.not_configured_message)
 
-        allowed_types = ["image/jpeg", "image/png", "image/gif", "image/webp"]
-        if hasattr(image_file, "content_type") and image_file.content_type not in allowed_types:
+        if hasattr(image_file, "content_type") and image_file.content_type not in IMAGE_EXTENSIONS:
             msg = f"Unsupported file type: {image_file.content_type}"
             raise ValidationError(msg)
 
-        MediaScanService.scan_image(image_file)
+        for hook in UPLOAD_HOOKS:
+            hook(image_file)
 
         if tenure:
             folder = cls.generate_tenure_folder(tenure)
         else:
             folder = f"player_{player_data.account.pk}"
-        public_id = f"{folder}/{uuid.uuid4().hex}"
 
         try:
-            result = cloudinary.uploader.upload(
-                image_file,
-                public_id=public_id,
-                folder=folder,
-                resource_type="image",
-                quality="auto",
-                fetch_format="auto",
-                eager=[
-                    {"width": 300, "height": 300, "crop": "fill"},
-                    {"width": 150, "height": 150, "crop": "fill"},
-                ],
-            )
+            stored = backend.store(image_file, folder=folder)
 
             media = Media.objects.create(
                 player_data=player_data,
-                cloudinary_public_id=result["public_id"],
-                cloudinary_url=result["secure_url"],
+                cloudinary_public_id=stored.public_id,
+                cloudinary_url=stored.url,
                 media_type=media_type,
                 title=title,
                 description=description,
@@ -124,7 +119,10 @@ class CloudinaryGalleryService:
 
     @classmethod
     def delete_media(cls, media: Media) -> bool:
-        """Delete media from Cloudinary and remove the database record.
+        """Delete media from the backend and remove the database record.
+
+        The stored file is kept while another ``Media`` row still shares it
+        (the local backend deduplicates identical uploads).
 
         Args:
             media: The Media to delete
@@ -132,14 +130,17 @@ class CloudinaryGalleryService:
         Returns:
             bool: True if successful, False otherwise
         """
+        public_id = media.cloudinary_public_id
+        shared = Media.objects.filter(cloudinary_public_id=public_id).exclude(pk=media.pk).exists()
         try:
-            cloudinary.uploader.destroy(media.cloudinary_public_id)
+            if not shared:
+                get_media_backend().delete(public_id)
             media.delete()
             return True
         except Exception:
             logger.exception(
-                "Cloudinary destroy failed for %s; DB row removed, remote asset orphaned",
-                media.cloudinary_public_id,
+                "Media backend delete failed for %s; DB row removed, stored file orphaned",
+                public_id,
             )
             media.delete()
             return False
@@ -198,23 +199,15 @@ class CloudinaryGalleryService:
         crop: str = "fill",
     ) -> str:
         """
-        Generate a Cloudinary URL with transformations.
+        Generate a URL for a stored image at the requested size.
 
         Args:
-            public_id: The Cloudinary public ID
+            public_id: The backend key (``Media.cloudinary_public_id``)
             width: Desired width
             height: Desired height
             crop: Crop mode (fill, scale, fit, etc.)
 
         Returns:
-            str: Transformed Cloudinary URL
+            str: URL of the transformed image, or the closest stored rendition
         """
-        transformation: dict[str, int | str] = {}
-        if width:
-            transformation["width"] = width
-        if height:
-            transformation["height"] = height
-        if crop:
-            transformation["crop"] = crop
-
-        return str(cloudinary.CloudinaryImage(public_id).build_url(**transformation))
+        return get_media_backend().url_for(public_id, width=width, height=height, crop=crop)
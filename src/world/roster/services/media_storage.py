@@ -0,0 +1,294 @@
+"""Pluggable storage backends for uploaded images.
+
+``settings.MEDIA_STORAGE_BACKEND`` picks where ``Media`` files live:
+
+* ``"cloudinary"`` — the hosted service; renditions are Cloudinary URL
+  transformations.
+* ``"local"`` — ``settings.MEDIA_ROOT``, served at ``settings.MEDIA_URL`` by
+  Evennia's web server. Originals are stored by content hash, so identical
+  uploads share one file; thumbnail renditions (``THUMBNAIL_SIZES``) are
+  generated with Pillow on a worker thread.
+
+``Media.cloudinary_public_id`` holds the backend's key and ``cloudinary_url``
+the original's URL whichever backend stored the file — the column names
+predate the local backend.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import functools
+import hashlib
+import logging
+from pathlib import PurePosixPath
+import threading
+from typing import TYPE_CHECKING, ClassVar
+import uuid
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.storage import FileSystemStorage
+
+if TYPE_CHECKING:
+    from django.core.files.uploadedfile import UploadedFile
+
+logger = logging.getLogger(__name__)
+
+#: Image content types accepted for upload, with the extension stored locally.
+IMAGE_EXTENSIONS: dict[str, str] = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/gif": ".gif",
+    "image/webp": ".webp",
+}
+
+#: (width, height) renditions generated for every upload, cropped to fill.
+THUMBNAIL_SIZES: tuple[tuple[int, int], ...] = ((300, 300), (150, 150))
+
+
+@dataclass(frozen=True)
+class StoredMedia:
+    """Where a backend put an upload."""
+
+    public_id: str
+    url: str
+
+
+class MediaStorageBackend:
+    """Interface every media backend implements."""
+
+    #: Raised as a ValidationError by uploads when ``is_configured()`` is False.
+    not_configured_message: ClassVar[str] = "Media storage is not configured"
+
+    def is_configured(self) -> bool:
+        return True
+
+    def store(self, image_file: UploadedFile, *, folder: str) -> StoredMedia:
+        """Persist an upload and return its key and URL."""
+        raise NotImplementedError
+
+    def delete(self, public_id: str) -> None:
+        """Remove a stored file and its renditions."""
+        raise NotImplementedError
+
+    def url_for(
+        self,
+        public_id: str,
+        width: int | None = None,
+        height: int | None = None,
+        crop: str = "fill",
+    ) -> str:
+        """URL of the file, or of its closest rendition for the requested size."""
+        raise NotImplementedError
+
+
+class CloudinaryMediaBackend(MediaStorageBackend):
+    """Cloudinary-hosted media, configured from the ``CLOUDINARY_*`` settings."""
+
+    not_configured_message = "Cloudinary is not configured"
+
+    _configured_for: ClassVar[tuple[str, str, str] | None] = None
+
+    def is_configured(self) -> bool:
+        return bool(settings.CLOUDINARY_CLOUD_NAME)
+
+    def _configure(self) -> None:
+        import cloudinary  # noqa: PLC0415
+
+        credentials = (
+            settings.CLOUDINARY_CLOUD_NAME,
+            settings.CLOUDINARY_API_KEY,
+            settings.CLOUDINARY_API_SECRET,
+        )
+        if CloudinaryMediaBackend._configured_for != credentials:
+            cloud_name, api_key, api_secret = credentials
+            cloudinary.config(cloud_name=cloud_name, api_key=api_key, api_secret=api_secret)
+            CloudinaryMediaBackend._configured_for = credentials
+
+    def store(self, image_file: UploadedFile, *, folder: str) -> StoredMedia:
+        import cloudinary.uploader  # noqa: PLC0415
+
+        self._configure()
+        result = cloudinary.uploader.upload(
+            image_file,
+            public_id=f"{folder}/{uuid.uuid4().hex}",
+            folder=folder,
+            resource_type="image",
+            quality="auto",
+            fetch_format="auto",
+            eager=[
+                {"width": width, "height": height, "crop": "fill"}
+                for width, height in THUMBNAIL_SIZES
+            ],
+        )
+        return StoredMedia(public_id=result["public_id"], url=result["secure_url"])
+
+    def delete(self, public_id: str) -> None:
+        import cloudinary.uploader  # noqa: PLC0415
+
+        self._configure()
+        cloudinary.uploader.destroy(public_id)
+
+    def url_for(
+        self,
+        public_id: str,
+        width: int | None = None,
+        height: int | None = None,
+        crop: str = "fill",
+    ) -> str:
+        import cloudinary  # noqa: PLC0415
+
+        self._configure()
+        transformation: dict[str, int | str] = {}
+        if width:
+            transformation["width"] = width
+        if height:
+            transformation["height"] = height
+        if crop:
+            transformation["crop"] = crop
+        return str(cloudinary.CloudinaryImage(public_id).build_url(**transformation))
+
+
+class LocalMediaBackend(MediaStorageBackend):
+    """Content-addressed media under ``MEDIA_ROOT/uploads``.
+
+    The key is ``<sha256[:2]>/<sha256><ext>``: the folder argument is ignored,
+    since deduplication needs the same bytes to land on the same name. Callers
+    deleting a ``Media`` row only delete the file once no other row shares it.
+    """
+
+    subdirectory: ClassVar[str] = "uploads"
+
+    def _storage(self) -> FileSystemStorage:
+        return FileSystemStorage(
+            location=f"{settings.MEDIA_ROOT}/{self.subdirectory}",
+            base_url=f"{settings.MEDIA_URL}{self.subdirectory}/",
+        )
+
+    def store(
+        self,
+        image_file: UploadedFile,
+        *,
+        folder: str,  # noqa: ARG002 — keys are content hashes, not folders
+    ) -> StoredMedia:
+        extension = IMAGE_EXTENSIONS.get(image_file.content_type or "")
+        if extension is None:
+            extension = PurePosixPath(image_file.name or "").suffix.lower() or ".bin"
+        digest = hashlib.sha256()
+        for chunk in image_file.chunks():
+            digest.update(chunk)
+        content_hash = digest.hexdigest()
+        name = f"{content_hash[:2]}/{content_hash}{extension}"
+
+        storage = self._storage()
+        if not storage.exists(name):
+            image_file.seek(0)
+            name = storage.save(name, image_file)
+            submit_thumbnail_job(storage.path(name))
+        return StoredMedia(public_id=name, url=storage.url(name))
+
+    def delete(self, public_id: str) -> None:
+        storage = self._storage()
+        for name in (public_id, *(_rendition_name(public_id, size) for size in THUMBNAIL_SIZES)):
+            storage.delete(name)
+
+    def url_for(
+        self,
+        public_id: str,
+        width: int | None = None,
+        height: int | None = None,
+        crop: str = "fill",  # noqa: ARG002 — renditions are pre-cropped to fill
+    ) -> str:
+        storage = self._storage()
+        if width or height:
+            # Smallest rendition that covers the request; the original otherwise.
+            for size in sorted(THUMBNAIL_SIZES):
+                if size[0] >= (width or 0) and size[1] >= (height or 0):
+                    rendition = _rendition_name(public_id, size)
+                    if storage.exists(rendition):
+                        return storage.url(rendition)
+                    break
+        return storage.url(public_id)
+
+
+_BACKENDS: dict[str, type[MediaStorageBackend]] = {
+    "cloudinary": CloudinaryMediaBackend,
+    "local": LocalMediaBackend,
+}
+
+
+def get_media_backend() -> MediaStorageBackend:
+    """The backend named by ``settings.MEDIA_STORAGE_BACKEND``."""
+    try:
+        return _BACKENDS[settings.MEDIA_STORAGE_BACKEND]()
+    except KeyError:
+        msg = (
+            f"Unknown MEDIA_STORAGE_BACKEND {settings.MEDIA_STORAGE_BACKEND!r}; "
+            f"expected one of {sorted(_BACKENDS)}."
+        )
+        raise ImproperlyConfigured(msg) from None
+
+
+def _rendition_name(public_id: str, size: tuple[int, int]) -> str:
+    path = PurePosixPath(public_id)
+    suffix = ".png" if path.suffix in {".gif", ".png"} else path.suffix
+    return str(path.with_name(f"{path.stem}_{size[0]}x{size[1]}{suffix}"))
+
+
+_thumbnail_pool: ThreadPoolExecutor | None = None
+_thumbnail_pool_lock = threading.Lock()
+
+
+def submit_thumbnail_job(original_path: str) -> None:
+    """Generate an original's renditions on the thumbnail worker pool.
+
+    ``settings.MEDIA_THUMBNAIL_WORKERS`` of ``0`` generates them inline.
+    """
+    global _thumbnail_pool  # noqa: PLW0603
+    if settings.MEDIA_THUMBNAIL_WORKERS <= 0:
+        generate_thumbnails(original_path)
+        return
+    with _thumbnail_pool_lock:
+        if _thumbnail_pool is None:
+            _thumbnail_pool = ThreadPoolExecutor(
+                max_workers=settings.MEDIA_THUMBNAIL_WORKERS,
+                thread_name_prefix="media-thumbnails",
+            )
+    _thumbnail_pool.submit(generate_thumbnails, original_path)
+
+
+@functools.cache
+def _warn_pillow_missing() -> None:
+    logger.warning("Pillow is not installed; local media uploads get no thumbnails.")
+
+
+def generate_thumbnails(original_path: str) -> list[str]:
+    """Write every ``THUMBNAIL_SIZES`` rendition next to the original.
+
+    Never raises: a missing Pillow install or an unreadable image leaves the
+    original without renditions, and ``url_for`` falls back to the original.
+
+    Returns:
+        Paths of the renditions written.
+    """
+    try:
+        from PIL import Image, ImageOps  # noqa: PLC0415
+    except ImportError:
+        _warn_pillow_missing()
+        return []
+
+    written: list[str] = []
+    try:
+        with Image.open(original_path) as image:
+            image.load()
+            for size in THUMBNAIL_SIZES:
+                target = _rendition_name(original_path, size)
+                rendition = ImageOps.fit(image, size)
+                if target.endswith(".jpg") and rendition.mode not in {"RGB", "L"}:
+                    rendition = rendition.convert("RGB")
+                rendition.save(target)
+                written.append(target)
+    except (OSError, ValueError):
+        logger.exception("Could not generate thumbnails for %s", original_path)
+    return written
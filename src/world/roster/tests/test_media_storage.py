@@ -0,0 +1,162 @@
+"""Tests for the pluggable media storage backends."""
+
+import importlib.util
+from pathlib import Path
+import shutil
+import tempfile
+from unittest import skipUnless
+from unittest.mock import patch
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+
+from evennia_extensions.models import Media
+from world.roster.factories import PlayerDataFactory
+from world.roster.services import CloudinaryGalleryService
+from world.roster.services.media_storage import (
+    LocalMediaBackend,
+    generate_thumbnails,
+    get_media_backend,
+)
+
+HAS_PILLOW = importlib.util.find_spec("PIL") is not None
+
+
+def _upload(content: bytes = b"fake image content") -> SimpleUploadedFile:
+    return SimpleUploadedFile("photo.jpg", content, content_type="image/jpeg")
+
+
+class LocalBackendTestCase(TestCase):
+    def setUp(self) -> None:
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        settings_override = override_settings(
+            MEDIA_STORAGE_BACKEND="local",
+            MEDIA_ROOT=self.media_root,
+            MEDIA_URL="/media/",
+            MEDIA_THUMBNAIL_WORKERS=0,
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+
+class GetMediaBackendTests(TestCase):
+    def test_unknown_backend_is_a_configuration_error(self) -> None:
+        with override_settings(MEDIA_STORAGE_BACKEND="s3"), self.assertRaises(ImproperlyConfigured):
+            get_media_backend()
+
+
+class LocalMediaBackendTests(LocalBackendTestCase):
+    def test_store_writes_content_addressed_file(self) -> None:
+        stored = LocalMediaBackend().store(_upload(), folder="char_1/1_abcd")
+
+        path = Path(self.media_root, "uploads", stored.public_id)
+        self.assertTrue(path.exists())
+        self.assertEqual(path.read_bytes(), b"fake image content")
+        self.assertTrue(stored.public_id.endswith(".jpg"))
+        self.assertEqual(stored.url, f"/media/uploads/{stored.public_id}")
+
+    def test_identical_uploads_share_one_file(self) -> None:
+        first = LocalMediaBackend().store(_upload(), folder="a")
+        second = LocalMediaBackend().store(_upload(), folder="b")
+        other = LocalMediaBackend().store(_upload(b"different"), folder="a")
+
+        self.assertEqual(first.public_id, second.public_id)
+        self.assertNotEqual(first.public_id, other.public_id)
+
+    def test_identical_uploads_generate_thumbnails_once(self) -> None:
+        with patch("world.roster.services.media_storage.generate_thumbnails") as mock_thumbs:
+            LocalMediaBackend().store(_upload(), folder="a")
+            LocalMediaBackend().store(_upload(), folder="b")
+
+        mock_thumbs.assert_called_once()
+
+    def test_url_for_falls_back_to_original_without_renditions(self) -> None:
+        backend = LocalMediaBackend()
+        stored = backend.store(_upload(), folder="a")
+
+        self.assertEqual(backend.url_for(stored.public_id, width=150, height=150), stored.url)
+
+    def test_url_for_prefers_the_smallest_covering_rendition(self) -> None:
+        backend = LocalMediaBackend()
+        stored = backend.store(_upload(), folder="a")
+        original = Path(self.media_root, "uploads", stored.public_id)
+        original.with_name(f"{original.stem}_150x150.jpg").write_bytes(b"thumb")
+
+        url = backend.url_for(stored.public_id, width=100, height=100)
+
+        self.assertTrue(url.endswith("_150x150.jpg"))
+        self.assertEqual(backend.url_for(stored.public_id, width=800), stored.url)
+
+
+class LocalGalleryUploadTests(LocalBackendTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.player_data = PlayerDataFactory()
+
+    def test_upload_and_delete_round_trip(self) -> None:
+        media = CloudinaryGalleryService.upload_image(
+            player_data=self.player_data, image_file=_upload()
+        )
+        path = Path(self.media_root, "uploads", media.cloudinary_public_id)
+        self.assertTrue(path.exists())
+
+        self.assertTrue(CloudinaryGalleryService.delete_media(media))
+
+        self.assertFalse(path.exists())
+        self.assertFalse(Media.objects.filter(pk=media.pk).exists())
+
+    def test_delete_keeps_file_shared_with_another_media(self) -> None:
+        first = CloudinaryGalleryService.upload_image(
+            player_data=self.player_data, image_file=_upload()
+        )
+        second = CloudinaryGalleryService.upload_image(
+            player_data=self.player_data, image_file=_upload()
+        )
+        path = Path(self.media_root, "uploads", first.cloudinary_public_id)
+
+        CloudinaryGalleryService.delete_media(first)
+        self.assertTrue(path.exists())
+
+        CloudinaryGalleryService.delete_media(second)
+        self.assertFalse(path.exists())
+
+    def test_upload_hooks_run_before_storage(self) -> None:
+        with patch("world.roster.services.gallery_services.UPLOAD_HOOKS", []) as hooks:
+            seen: list[str] = []
+            hooks.append(lambda image_file: seen.append(image_file.name))
+
+            CloudinaryGalleryService.upload_image(
+                player_data=self.player_data, image_file=_upload()
+            )
+
+        self.assertEqual(seen, ["photo.jpg"])
+
+
+class GenerateThumbnailsTests(LocalBackendTestCase):
+    def test_missing_pillow_is_not_an_error(self) -> None:
+        original = Path(self.media_root, "original.jpg")
+        original.write_bytes(b"fake image content")
+
+        with (
+            patch.dict("sys.modules", {"PIL": None}),
+            patch("world.roster.services.media_storage._warn_pillow_missing") as mock_warn,
+        ):
+            written = generate_thumbnails(str(original))
+
+        self.assertEqual(written, [])
+        mock_warn.assert_called_once()
+
+    @skipUnless(HAS_PILLOW, "Pillow is not installed")
+    def test_renditions_are_written_next_to_the_original(self) -> None:
+        from PIL import Image
+
+        original = Path(self.media_root, "original.png")
+        Image.new("RGB", (640, 480), "red").save(original)
+
+        written = generate_thumbnails(str(original))
+
+        self.assertEqual(len(written), 2)
+        with Image.open(original.with_name("original_150x150.png")) as thumb:
+            self.assertEqual(thumb.size, (150, 150))
@@ -0,0 +1,184 @@
+"""Process-wide in-memory index of player blocks (#1278).
+
+The live surfaces that honor blocks fan out to many recipients at once — a pose
+reaching everyone in a room, a mail inbox, the event invitation list — and a
+query per (sender, recipient) pair there is too expensive. ``BlockGraph`` keeps
+every ``Block`` row as a ``BlockEdge`` under both of its players, so those checks
+are dict lookups.
+
+The graph is loaded from the database on first use and kept current by
+``Block.save`` / ``Block.delete`` and ``block_services.finalize_expired_blocks``
+(which deletes through a queryset). The lift grace window is applied at lookup
+time: an edge with ``pending_removal_at`` in the past no longer counts, whether
+or not the cron has finalized it yet.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+import threading
+from typing import TYPE_CHECKING
+
+from django.utils import timezone
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from world.scenes.models import Block
+
+
+@dataclass(frozen=True, slots=True)
+class BlockEdge:
+    """The fields of one ``Block`` row that resolution needs."""
+
+    block_id: int
+    owner_id: int
+    blocked_player_id: int
+    blocker_persona_id: int | None
+    blocked_persona_id: int | None
+    account_level: bool
+    pending_removal_at: datetime | None
+
+    @classmethod
+    def from_block(cls, block: Block) -> BlockEdge:
+        return cls(
+            block_id=block.pk,
+            owner_id=block.owner_id,
+            blocked_player_id=block.blocked_player_id,
+            blocker_persona_id=block.blocker_persona_id,
+            blocked_persona_id=block.blocked_persona_id,
+            account_level=block.account_level,
+            pending_removal_at=block.pending_removal_at,
+        )
+
+    def active_at(self, now: datetime) -> bool:
+        return self.pending_removal_at is None or self.pending_removal_at > now
+
+    def partner_of(self, player_id: int) -> int:
+        return self.blocked_player_id if self.owner_id == player_id else self.owner_id
+
+
+class BlockGraph:
+    """Blocks indexed by PlayerData pk, each edge listed under both of its players.
+
+    PlayerData's pk is its account_id, so a player id is also the account pk.
+    """
+
+    def __init__(self, edges: Iterable[BlockEdge] = ()) -> None:
+        self._edges: dict[int, BlockEdge] = {}
+        self._by_player: dict[int, dict[int, BlockEdge]] = {}
+        for edge in edges:
+            self.put(edge)
+
+    def put(self, edge: BlockEdge) -> None:
+        """Add ``edge``, replacing any earlier version of the same block."""
+        self.discard(edge.block_id)
+        self._edges[edge.block_id] = edge
+        for player_id in (edge.owner_id, edge.blocked_player_id):
+            self._by_player.setdefault(player_id, {})[edge.block_id] = edge
+
+    def discard(self, block_id: int) -> None:
+        edge = self._edges.pop(block_id, None)
+        if edge is None:
+            return
+        for player_id in (edge.owner_id, edge.blocked_player_id):
+            edges = self._by_player.get(player_id)
+            if edges is not None:
+                edges.pop(block_id, None)
+                if not edges:
+                    del self._by_player[player_id]
+
+    def __bool__(self) -> bool:
+        return bool(self._edges)
+
+    def edges_for(self, player_id: int, *, now: datetime | None = None) -> list[BlockEdge]:
+        """Active blocks ``player_id`` made or received."""
+        edges = self._by_player.get(player_id)
+        if not edges:
+            return []
+        now = now or timezone.now()
+        return [edge for edge in edges.values() if edge.active_at(now)]
+
+    def edges_between(
+        self, player_a_id: int, player_b_id: int, *, now: datetime | None = None
+    ) -> list[BlockEdge]:
+        """Active blocks between the two players, either direction."""
+        return [
+            edge
+            for edge in self.edges_for(player_a_id, now=now)
+            if edge.partner_of(player_a_id) == player_b_id
+        ]
+
+    def hides_persona(
+        self,
+        *,
+        viewer_player_id: int,
+        persona_id: int,
+        persona_player_id: Callable[[], int | None],
+        now: datetime | None = None,
+    ) -> bool:
+        """True if an active block hides ``persona_id``'s content from this viewer.
+
+        The per-persona form of ``block_services.hidden_persona_ids_for_viewer``:
+        the viewer's own block hides the exact face they blocked; a block against
+        the viewer hides the exact blocker face, or every face the blocker
+        currently plays when it is account-level. ``persona_player_id`` returns
+        the persona's current player and is only called for that last case.
+        """
+        for edge in self.edges_for(viewer_player_id, now=now):
+            if edge.owner_id == viewer_player_id:
+                if edge.blocked_persona_id == persona_id:
+                    return True
+            elif edge.account_level:
+                if edge.owner_id == persona_player_id():
+                    return True
+            elif edge.blocker_persona_id == persona_id:
+                return True
+        return False
+
+
+_graph: BlockGraph | None = None
+_graph_lock = threading.Lock()
+
+
+def get_block_graph() -> BlockGraph:
+    """The process-wide graph, loaded from the database on first use."""
+    global _graph  # noqa: PLW0603
+    if _graph is None:
+        from world.scenes.models import Block  # noqa: PLC0415
+
+        with _graph_lock:
+            if _graph is None:
+                _graph = BlockGraph(
+                    BlockEdge(*row)
+                    for row in Block.objects.values_list(
+                        "pk",
+                        "owner_id",
+                        "blocked_player_id",
+                        "blocker_persona_id",
+                        "blocked_persona_id",
+                        "account_level",
+                        "pending_removal_at",
+                    )
+                )
+    return _graph
+
+
+def record_block(block: Block) -> None:
+    """Add or refresh ``block`` in a loaded graph; a graph not yet loaded will read it."""
+    if _graph is not None:
+        _graph.put(BlockEdge.from_block(block))
+
+
+def forget_blocks(block_ids: Iterable[int]) -> None:
+    """Drop deleted blocks from a loaded graph."""
+    if _graph is not None:
+        for block_id in block_ids:
+            _graph.discard(block_id)
+
+
+def reset_block_graph() -> None:
+    """Discard the graph; the next ``get_block_graph`` reloads it."""
+    global _graph  # noqa: PLW0603
+    _graph = None
@@ -10,21 +10,30 @@ Slice 1 added resolution + lifecycle; slice 2 wired the **profile gate**
 (``hidden_persona_ids_for_viewer`` → the interaction feed excludes the blocked party's content).
 The Mute sibling, the awareness/flag + generic "Character Has You Blocked" surface, and the cron
 job remain follow-up slices.
+
+Pair and per-player checks read the in-memory ``block_graph`` rather than the database, so the
+fan-out paths (live room broadcasts, mail, event invitations) filter recipients without a query per
+recipient. Checks keyed on a sheet's personas still query.
 """
 
 from __future__ import annotations
 
 from datetime import timedelta
+import functools
 from typing import TYPE_CHECKING, Any
 
 from django.db.models import Q, QuerySet
 from django.utils import timezone
 
+from world.scenes.block_graph import forget_blocks, get_block_graph
 from world.scenes.models import Block
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from datetime import datetime
 
+    from evennia.objects.models import ObjectDB
+
     from evennia_extensions.models import PlayerData
     from world.character_sheets.models import CharacterSheet
     from world.scenes.models import BlockContactFlag, Persona
@@ -56,11 +65,7 @@ def coded_block_active(
     by the separate awareness/flag layer (a later slice) — never here, to preserve the
     anti-derivation invariant.
     """
-    candidates = _active_blocks().filter(
-        Q(owner=player_a, blocked_player=player_b) | Q(owner=player_b, blocked_player=player_a)
-    )
-
-    for block in candidates:
+    for block in get_block_graph().edges_between(player_a.pk, player_b.pk):
         # Orient the provided sides against this row: which one is the blocked player?
         if block.blocked_player_id == player_b.pk:
             blocked_face, blocker_face = persona_b, persona_a
@@ -88,17 +93,11 @@ def account_block_active(*, player_a: PlayerData, player_b: PlayerData) -> bool:
 
     The account-first query seam: unlike ``coded_block_active`` this ignores persona entirely —
     it's the "does either account block the other, account-wide" check every OOC seam (mail,
-    journal reactions, event invites, kudos, friend adds, ...) calls. Extends
-    ``coded_block_active``'s idmapper-friendly ``_active_blocks().filter(...).exists()`` idiom;
-    one indexed query.
+    journal reactions, event invites, kudos, friend adds, ...) calls. Answered from the block
+    graph; no query.
     """
-    return (
-        _active_blocks()
-        .filter(
-            Q(owner=player_a, blocked_player=player_b, account_level=True)
-            | Q(owner=player_b, blocked_player=player_a, account_level=True)
-        )
-        .exists()
+    return any(
+        edge.account_level for edge in get_block_graph().edges_between(player_a.pk, player_b.pk)
     )
 
 
@@ -111,15 +110,11 @@ def blocked_player_ids_for(player: PlayerData) -> set[int]:
     candidate row. Same active-block window and ``account_level=True`` policy as
     ``account_block_active`` — no new semantics, just batched.
     """
-    pairs = (
-        _active_blocks()
-        .filter(Q(owner=player, account_level=True) | Q(blocked_player=player, account_level=True))
-        .values_list("owner_id", "blocked_player_id")
-    )
-    ids: set[int] = set()
-    for owner_id, blocked_player_id in pairs:
-        ids.add(blocked_player_id if owner_id == player.pk else owner_id)
-    return ids
+    return {
+        edge.partner_of(player.pk)
+        for edge in get_block_graph().edges_for(player.pk)
+        if edge.account_level
+    }
 
 
 def lift_block(block: Block, *, finalize_at: datetime) -> Block:
@@ -142,9 +137,12 @@ def finalize_expired_blocks(*, now: datetime) -> int:
     clock.
     """
     expired = Block.objects.filter(pending_removal_at__isnull=False, pending_removal_at__lte=now)
-    count = expired.count()
-    expired.delete()
-    return count
+    expired_ids = list(expired.values_list("pk", flat=True))
+    if not expired_ids:
+        return 0
+    Block.objects.filter(pk__in=expired_ids).delete()
+    forget_blocks(expired_ids)
+    return len(expired_ids)
 
 
 def sheet_blocked_for_viewer(*, viewer_account: Any, sheet: CharacterSheet) -> bool:
@@ -210,10 +208,10 @@ def member_blocked_viewer(*, viewer_account: Any, member_sheet: CharacterSheet)
 
     # The member's player blocked the viewer's account — persona-scoped (the
     # member's face is the blocker) or account-level (all their faces block).
-    return (
-        _active_blocks()
-        .filter(Q(owner=member_player, blocked_player__account=viewer_account))
-        .exists()
+    # PlayerData's pk is its account_id, so the viewer's account pk is their player id.
+    return any(
+        edge.owner_id == member_player.pk
+        for edge in get_block_graph().edges_between(member_player.pk, viewer_account.pk)
     )
 
 
@@ -224,24 +222,20 @@ def hidden_persona_ids_for_viewer(*, viewer_account: Any) -> set[int]:
     party says or does. Persona-scoped blocks hide the exact blocked/blocker face; an
     ``account_level`` block hides *all* of the blocker's currently-played faces. Mutual.
 
-    At most two queries — the viewer's active blocks, plus (only when an account-level block is
-    present) the owners' current personas. Empty for an anonymous viewer; staff bypass is the
+    The viewer's blocks come from the block graph; the one query is the owners' current personas,
+    only when an account-level block is present. Empty for an anonymous viewer; staff bypass is the
     caller's concern.
     """
     if viewer_account is None or not viewer_account.is_authenticated:
         return set()
 
-    blocks = list(
-        _active_blocks().filter(
-            Q(owner__account=viewer_account) | Q(blocked_player__account=viewer_account)
-        )
-    )
+    # PlayerData's pk is its account_id, so the account pk is the player id.
+    blocks = get_block_graph().edges_for(viewer_account.pk)
     if not blocks:
         return set()
 
     hidden: set[int] = set()
     account_level_owner_ids: set[int] = set()
-    # PlayerData's pk is its account_id, so owner_id/blocked_player_id == the account pk.
     viewer_pk = viewer_account.pk
     for block in blocks:
         if block.owner_id == viewer_pk:
@@ -265,6 +259,44 @@ def hidden_persona_ids_for_viewer(*, viewer_account: Any) -> set[int]:
     return hidden
 
 
+def exclude_blocked_recipients(objects: Iterable[ObjectDB], *, speaker: Persona) -> list[ObjectDB]:
+    """The objects that may see ``speaker``'s live content — the broadcast fan-out gate (#1278).
+
+    Applies ``hidden_persona_ids_for_viewer``'s rules per recipient from the block graph, so a
+    room broadcast costs no query per recipient: the speaker's current player is looked up at most
+    once, and only when a recipient holds an account-level block against someone. Objects with no
+    account (NPCs, props, unpuppeted characters) always receive; staff bypass blocks.
+    """
+    recipients = list(objects)
+    graph = get_block_graph()
+    if not graph:
+        return recipients
+
+    @functools.cache
+    def speaker_player_id() -> int | None:
+        player = _persona_player(speaker)
+        return player.pk if player is not None else None
+
+    now = timezone.now()
+    visible: list[ObjectDB] = []
+    for obj in recipients:
+        # PlayerData's pk is its account_id, so the puppeting account pk is the player id.
+        account_id = obj.db_account_id
+        if (
+            account_id is not None
+            and graph.hides_persona(
+                viewer_player_id=account_id,
+                persona_id=speaker.pk,
+                persona_player_id=speaker_player_id,
+                now=now,
+            )
+            and not obj.account.is_staff
+        ):
+            continue
+        visible.append(obj)
+    return visible
+
+
 def _sheet_player(sheet: CharacterSheet) -> PlayerData | None:
     """The PlayerData currently playing this character sheet, or None (#1278)."""
     from django.core.exceptions import ObjectDoesNotExist  # noqa: PLC0415
@@ -290,7 +322,7 @@ def org_join_blocked(*, joining_sheet: CharacterSheet, member_sheets: Any) -> bo
     The org/covenant gate: you can't join an org that holds a member who has blocked you (or whom
     you've blocked). Player-level — the block applies regardless of which face, since joining an org
     is an account-relevant, deliberate act; the joiner is told only generically (no name), so no
-    identity is derivable. One query.
+    identity is derivable. Answered from the block graph.
     """
     joining_player = _sheet_player(joining_sheet)
     if joining_player is None:
@@ -301,13 +333,9 @@ def org_join_blocked(*, joining_sheet: CharacterSheet, member_sheets: Any) -> bo
     member_player_ids.discard(joining_player.pk)
     if not member_player_ids:
         return False
-    return (
-        _active_blocks()
-        .filter(
-            (Q(owner=joining_player) & Q(blocked_player_id__in=member_player_ids))
-            | (Q(blocked_player=joining_player) & Q(owner_id__in=member_player_ids))
-        )
-        .exists()
+    return any(
+        edge.partner_of(joining_player.pk) in member_player_ids
+        for edge in get_block_graph().edges_for(joining_player.pk)
     )
 
 
@@ -411,7 +439,10 @@ def flag_blocked_contact_attempt(
     target_player = _persona_player(target_persona)
     if initiator_player is None or target_player is None:
         return None
-    if not _active_blocks().filter(owner=target_player, blocked_player=initiator_player).exists():
+    if not any(
+        edge.owner_id == target_player.pk
+        for edge in get_block_graph().edges_between(target_player.pk, initiator_player.pk)
+    ):
         return None
 
     from world.scenes.models import BlockContactFlag  # noqa: PLC0415
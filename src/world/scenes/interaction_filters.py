@@ -1,6 +1,7 @@
 from django.db.models import QuerySet
 import django_filters
 
+from world.scenes.interaction_search import filter_interactions_by_content
 from world.scenes.models import Interaction, InteractionFavorite, InteractionReaction
 
 
@@ -19,6 +20,10 @@ class InteractionFilter(django_filters.FilterSet):
         method="filter_without_pose_link",
         label="Exclude interactions that are already linked to a POSE via InteractionAction.",
     )
+    q = django_filters.CharFilter(
+        method="filter_q",
+        label="Full-text search over interaction content.",
+    )
 
     def filter_without_pose_link(
         self,
@@ -31,6 +36,18 @@ class InteractionFilter(django_filters.FilterSet):
             return queryset.filter(pose_links__isnull=True)
         return queryset
 
+    def filter_q(
+        self,
+        queryset: QuerySet[Interaction],
+        name: str,  # noqa: ARG002
+        value: str,
+    ) -> QuerySet[Interaction]:
+        """Narrow to interactions whose content matches the search text."""
+        value = value.strip()
+        if not value:
+            return queryset
+        return filter_interactions_by_content(queryset, value)
+
     class Meta:
         model = Interaction
         fields = ["persona", "scene", "mode", "visibility"]
@@ -0,0 +1,133 @@
+"""Full-text search over interaction content (the ``?q=`` interaction filter).
+
+Postgres matches against ``arxii_interaction.content_tsv``, a generated
+``tsvector`` column with a GIN index on every monthly partition (see
+``world/scenes/sql/interaction_fulltext_forward.sql``). The column has no model
+field, so it is reached through ``RawSQL``. The SQLite test tier has no such
+column; ``server.conf.sqlite_test_runner`` builds an FTS5 shadow table
+(``arxii_interaction_fts``) instead, and the same two entry points dispatch on
+the connection vendor.
+
+Search only narrows a queryset — callers pass the viewer's already
+visibility-gated queryset, so a match can never surface a row the viewer could
+not otherwise read.
+"""
+
+from __future__ import annotations
+
+import html
+import re
+
+from django.db import connection
+from django.db.models import BooleanField, QuerySet
+from django.db.models.expressions import RawSQL
+
+from world.scenes.models import Interaction
+
+_TSQUERY_CONFIG = "english"
+_FTS_TABLE = "arxii_interaction_fts"
+
+# Highlight sentinels: the raw snippet is built with control characters, then
+# HTML-escaped as a whole, and only then are the sentinels swapped for <mark>
+# tags — so user-written markup in a pose can never reach the client as HTML.
+_MARK_START = "\x02"
+_MARK_END = "\x03"
+_SNIPPET_WORDS = 24
+_SNIPPET_FRAGMENTS = 2
+_SQLITE_ELLIPSIS = "…"
+
+_WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def _is_postgres() -> bool:
+    return connection.vendor == "postgresql"  # noqa: STRING_LITERAL
+
+
+def _fts5_query(query: str) -> str:
+    """Quote each word so FTS5 treats user input as plain terms, ANDed together."""
+    return " ".join(f'"{word}"' for word in _WORD_PATTERN.findall(query))
+
+
+def filter_interactions_by_content(
+    queryset: QuerySet[Interaction], query: str
+) -> QuerySet[Interaction]:
+    """Narrow ``queryset`` to interactions whose content matches ``query``.
+
+    ``query`` is free text in web-search syntax on Postgres (quoted phrases,
+    ``-excluded`` words, ``or``); on SQLite every word must appear.
+    """
+    if _is_postgres():
+        table = Interaction._meta.db_table  # noqa: SLF001
+        # Parameters are bound; only the model's own table name is interpolated.
+        return queryset.filter(
+            RawSQL(  # noqa: S611
+                f'"{table}"."content_tsv" @@ websearch_to_tsquery(%s::regconfig, %s)',
+                (_TSQUERY_CONFIG, query),
+                output_field=BooleanField(),
+            )
+        )
+    fts_query = _fts5_query(query)
+    if not fts_query:
+        return queryset.none()
+    return queryset.filter(
+        pk__in=RawSQL(  # noqa: S611
+            f"SELECT rowid FROM {_FTS_TABLE} WHERE {_FTS_TABLE} MATCH %s",  # noqa: S608
+            (fts_query,),
+        )
+    )
+
+
+def interaction_search_snippets(interaction_ids: list[int], query: str) -> dict[int, str]:
+    """Highlighted excerpts of each interaction's content around ``query``'s matches.
+
+    Returns a map of interaction pk to an HTML-escaped excerpt in which matched
+    words are wrapped in ``<mark>``. Interactions without a match are omitted.
+    One query for the whole page; reads values only, so no per-request
+    attribute ever lands on the shared ``Interaction`` instances.
+    """
+    if not interaction_ids:
+        return {}
+    if _is_postgres():
+        rows = _postgres_snippets(interaction_ids, query)
+    else:
+        fts_query = _fts5_query(query)
+        if not fts_query:
+            return {}
+        rows = _sqlite_snippets(interaction_ids, fts_query)
+    return {pk: _render_snippet(raw) for pk, raw in rows if raw and _MARK_START in raw}
+
+
+def _postgres_snippets(interaction_ids: list[int], query: str) -> list[tuple[int, str]]:
+    from django.contrib.postgres.search import SearchHeadline, SearchQuery  # noqa: PLC0415
+
+    headline = SearchHeadline(
+        "content",
+        SearchQuery(query, config=_TSQUERY_CONFIG, search_type="websearch"),
+        config=_TSQUERY_CONFIG,
+        start_sel=_MARK_START,
+        stop_sel=_MARK_END,
+        max_words=_SNIPPET_WORDS,
+        min_words=_SNIPPET_WORDS // 2,
+        max_fragments=_SNIPPET_FRAGMENTS,
+    )
+    return list(
+        Interaction.objects.filter(pk__in=interaction_ids)
+        .annotate(snippet=headline)
+        .values_list("pk", "snippet")
+    )
+
+
+def _sqlite_snippets(interaction_ids: list[int], fts_query: str) -> list[tuple[int, str]]:
+    placeholders = ", ".join("%s" for _ in interaction_ids)
+    sql = (
+        f"SELECT rowid, snippet({_FTS_TABLE}, 0, %s, %s, %s, %s) "  # noqa: S608
+        f"FROM {_FTS_TABLE} WHERE {_FTS_TABLE} MATCH %s AND rowid IN ({placeholders})"
+    )
+    params = [_MARK_START, _MARK_END, _SQLITE_ELLIPSIS, _SNIPPET_WORDS, fts_query]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [*params, *interaction_ids])
+        return list(cursor.fetchall())
+
+
+def _render_snippet(raw: str) -> str:
+    return html.escape(raw).replace(_MARK_START, "<mark>").replace(_MARK_END, "</mark>")
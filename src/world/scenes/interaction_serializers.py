@@ -115,6 +115,7 @@ class InteractionListSerializer(serializers.ModelSerializer):
     is_muted = serializers.SerializerMethodField()
     language_id = serializers.IntegerField(read_only=True, allow_null=True)
     language_name = serializers.SerializerMethodField()
+    search_snippet = serializers.SerializerMethodField()
 
     class Meta:
         model = Interaction
@@ -124,6 +125,7 @@ class InteractionListSerializer(serializers.ModelSerializer):
             "scene",
             "place",
             "content",
+            "search_snippet",
             "mode",
             "visibility",
             "timestamp",
@@ -226,6 +228,20 @@ class InteractionListSerializer(serializers.ModelSerializer):
             return ""
         return self._comprehended_content(obj)
 
+    def get_search_snippet(self, obj: Interaction) -> str | None:
+        """Highlighted excerpt for a ``?q=`` search; None outside a search.
+
+        Snippets come from the raw text, so they are withheld wherever the
+        viewer would not read the raw text: muted personas, and content the
+        viewer only comprehends garbled (#2993).
+        """
+        snippet = self.context.get("search_snippets", {}).get(obj.pk)
+        if snippet is None or obj.persona_id in self._muted_persona_ids():
+            return None
+        if self._comprehended_content(obj) != obj.content:
+            return None
+        return snippet
+
     def _comprehended_content(self, obj: Interaction) -> str:
         """Per-viewer language comprehension (#2993). Ground truth for the
         writer's own sheets, staff, and a viewer who was a direct receiver of
@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, cast
 from django.core.exceptions import ObjectDoesNotExist
 from django.utils import timezone
 
+from world.scenes.block_services import exclude_blocked_recipients
 from world.scenes.constants import (
     InteractionMode,
     InteractionVisibility,
@@ -263,9 +264,17 @@ def _broadcast_to_location(
     payload: InteractionPayload,
     *,
     render_for: Callable[[ObjectDB], str] | None = None,
+    speaker: Persona | None = None,
 ) -> None:
-    """Send an interaction payload to all objects in a location via WebSocket."""
-    _send_to_objects(location.contents, payload, render_for=render_for)
+    """Send an interaction payload to all objects in a location via WebSocket.
+
+    With ``speaker``, recipients an active block hides the speaker from are
+    skipped (#1278), checked in memory against the block graph.
+    """
+    recipients = location.contents
+    if speaker is not None:
+        recipients = exclude_blocked_recipients(recipients, speaker=speaker)
+    _send_to_objects(recipients, payload, render_for=render_for)
 
 
 def _build_interaction_payload(  # noqa: PLR0913 - payload needs all interaction fields
@@ -435,7 +444,10 @@ def push_interaction(
         _send_to_objects([writer_char, *r_chars], payload)
     else:
         _broadcast_to_location(
-            location, payload, render_for=_language_render_for(interaction, persona)
+            location,
+            payload,
+            render_for=_language_render_for(interaction, persona),
+            speaker=persona,
         )
 
 
@@ -495,7 +507,7 @@ def push_ephemeral_interaction(  # noqa: PLR0913 - ephemeral payload mirrors per
         location = persona.character_sheet.character.location
         if location is None:
             return
-        _broadcast_to_location(location, payload)
+        _broadcast_to_location(location, payload, speaker=persona)
 
 
 def can_view_interaction(  # noqa: PLR0911 - visibility cascade has distinct branches
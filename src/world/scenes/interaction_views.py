@@ -36,6 +36,7 @@ from world.scenes.interaction_permissions import (
     get_account_personas,
     get_account_roster_entries,
 )
+from world.scenes.interaction_search import interaction_search_snippets
 from world.scenes.interaction_serializers import (
     InteractionDetailSerializer,
     InteractionFavoriteSerializer,
@@ -90,6 +91,7 @@ class InteractionViewSet(
     filterset_class = InteractionFilter
     pagination_class = InteractionCursorPagination
     permission_classes = [IsAuthenticated]
+    throttle_scope = "interaction_feed"
 
     def get_serializer_context(self) -> dict[str, Any]:
         context = super().get_serializer_context()
@@ -272,6 +274,22 @@ class InteractionViewSet(
             return InteractionDetailSerializer
         return InteractionListSerializer
 
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """Paginated feed; a ``?q=`` search adds highlighted snippets for the page."""
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        rows = queryset if page is None else page
+        context = self.get_serializer_context()
+        query = request.query_params.get("q", "").strip()  # noqa: USE_FILTERSET
+        if query:
+            context["search_snippets"] = interaction_search_snippets(
+                [interaction.pk for interaction in rows], query
+            )
+        serializer = self.get_serializer_class()(rows, many=True, context=context)
+        if page is None:
+            return Response(serializer.data)
+        return self.get_paginated_response(serializer.data)
+
     def get_permissions(self) -> list[BasePermission]:
         if self.action == "destroy":
             return [IsAuthenticated(), IsInteractionWriter()]
@@ -678,6 +678,21 @@ class Block(SharedMemoryModel):
     def __str__(self) -> str:
         return f"{self.owner} blocks {self.blocked_player}"
 
+    def save(self, *args: object, **kwargs: object) -> None:
+        super().save(*args, **kwargs)
+        # Keep the in-memory block graph (live broadcast / mail / invite filtering) current.
+        from world.scenes.block_graph import record_block  # noqa: PLC0415
+
+        record_block(self)
+
+    def delete(self, *args: object, **kwargs: object) -> tuple[int, dict[str, int]]:
+        from world.scenes.block_graph import forget_blocks  # noqa: PLC0415
+
+        block_id = self.pk
+        result = super().delete(*args, **kwargs)
+        forget_blocks([block_id])
+        return result
+
     @property
     def is_active(self) -> bool:
         """Active unless a lift grace period has already elapsed."""
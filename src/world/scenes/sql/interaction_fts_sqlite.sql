@@ -0,0 +1,30 @@
+-- SQLite stand-in for interaction_fulltext_forward.sql (SQLite test tier only).
+--
+-- An FTS5 external-content table shadowing arxii_interaction.content, kept in
+-- sync by triggers. Created by server.conf.sqlite_test_runner after the test
+-- schema is built; never applied to Postgres.
+
+CREATE VIRTUAL TABLE IF NOT EXISTS arxii_interaction_fts USING fts5(
+    content,
+    content='arxii_interaction',
+    content_rowid='id',
+    tokenize='porter unicode61'
+);
+
+CREATE TRIGGER IF NOT EXISTS arxii_interaction_fts_ai AFTER INSERT ON arxii_interaction BEGIN
+    INSERT INTO arxii_interaction_fts (rowid, content) VALUES (new.id, new.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS arxii_interaction_fts_ad AFTER DELETE ON arxii_interaction BEGIN
+    INSERT INTO arxii_interaction_fts (arxii_interaction_fts, rowid, content)
+        VALUES ('delete', old.id, old.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS arxii_interaction_fts_au AFTER UPDATE OF content ON arxii_interaction BEGIN
+    INSERT INTO arxii_interaction_fts (arxii_interaction_fts, rowid, content)
+        VALUES ('delete', old.id, old.content);
+    INSERT INTO arxii_interaction_fts (rowid, content) VALUES (new.id, new.content);
+END;
+
+-- Index any rows that predate the triggers (a restored schema template).
+INSERT INTO arxii_interaction_fts (arxii_interaction_fts) VALUES ('rebuild');
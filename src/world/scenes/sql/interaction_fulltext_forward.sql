@@ -0,0 +1,21 @@
+-- Full-text search over arxii_interaction.content (the ?q= interaction filter).
+--
+-- content_tsv is a STORED generated column, so Postgres keeps it in step with
+-- content on every INSERT/UPDATE and Django never writes it (it is not a model
+-- field - world.scenes.interaction_search queries it through RawSQL).
+--
+-- Both statements target the partitioned parent: ADD COLUMN cascades to every
+-- monthly partition, and an index on a partitioned table is created on each
+-- partition (and on partitions attached later), so every month carries its
+-- own GIN index and a ?q= combined with since/until only probes the months in
+-- range.
+--
+-- Applied by: src/world/migrations/0164_interaction_fulltext.py (RunSQL), and
+-- listed in tools/build_schema.py's SQL_FILES after the partition rewrite.
+
+ALTER TABLE arxii_interaction
+    ADD COLUMN IF NOT EXISTS content_tsv tsvector
+    GENERATED ALWAYS AS (to_tsvector('english', content)) STORED;
+
+CREATE INDEX IF NOT EXISTS interaction_content_tsv_gin
+    ON arxii_interaction USING gin (content_tsv);
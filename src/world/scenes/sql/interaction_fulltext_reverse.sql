@@ -0,0 +1,4 @@
+-- Reverse of interaction_fulltext_forward.sql.
+DROP INDEX IF EXISTS interaction_content_tsv_gin;
+
+ALTER TABLE arxii_interaction DROP COLUMN IF EXISTS content_tsv;
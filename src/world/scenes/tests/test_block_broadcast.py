@@ -0,0 +1,125 @@
+"""Live broadcasts honor blocks from the in-memory block graph (#1278).
+
+``push_interaction`` / ``push_ephemeral_interaction`` skip room recipients an active block hides
+the speaker from, using ``block_graph`` rather than a query per recipient. The graph is loaded
+once and patched by block saves, deletes and ``finalize_expired_blocks``.
+"""
+
+from datetime import timedelta
+from unittest.mock import Mock
+
+from django.test import TestCase
+from django.utils import timezone
+
+from evennia_extensions.factories import AccountFactory, ObjectDBFactory
+from evennia_extensions.models import PlayerData
+from world.roster.factories import RosterEntryFactory, RosterTenureFactory
+from world.scenes.block_services import (
+    account_block_active,
+    create_block,
+    finalize_expired_blocks,
+    lift_block,
+)
+from world.scenes.constants import InteractionMode
+from world.scenes.factories import InteractionFactory, PersonaFactory, SceneFactory
+from world.scenes.interaction_services import push_ephemeral_interaction, push_interaction
+from world.scenes.models import Block
+
+
+class BlockBroadcastTests(TestCase):
+    def setUp(self) -> None:
+        self.room = ObjectDBFactory(db_key="Block Hall", db_typeclass_path="typeclasses.rooms.Room")
+        self.speaker_acct, self.speaker_pd, self.speaker_sheet, self.speaker_char = self._side()
+        self.blocked_acct, self.blocked_pd, _sheet, self.blocked_char = self._side()
+        _acct, self.bystander_pd, _sheet, self.bystander_char = self._side()
+        self.speaker_face = self.speaker_sheet.primary_persona
+        for char in (self.speaker_char, self.blocked_char, self.bystander_char):
+            char.msg = Mock()
+
+    def _side(self):
+        account = AccountFactory()
+        player_data, _ = PlayerData.objects.get_or_create(account=account)
+        entry = RosterEntryFactory()
+        RosterTenureFactory(player_data=player_data, roster_entry=entry)
+        sheet = entry.character_sheet
+        character = sheet.character
+        character.db_account = account
+        character.location = self.room
+        character.save()
+        return account, player_data, sheet, character
+
+    def _pose(self) -> None:
+        push_interaction(
+            InteractionFactory(
+                persona=self.speaker_face, content="waves.", mode=InteractionMode.POSE
+            )
+        )
+
+    def test_unblocked_room_hears_everything(self) -> None:
+        self._pose()
+
+        self.blocked_char.msg.assert_called_once()
+        self.bystander_char.msg.assert_called_once()
+
+    def test_blocked_face_is_not_heard_by_the_blocker(self) -> None:
+        create_block(
+            blocker_account=self.blocked_acct,
+            blocker_persona=self.blocked_char.sheet_data.primary_persona,
+            blocked_persona=self.speaker_face,
+            reason="harassment",
+        )
+
+        self._pose()
+
+        self.blocked_char.msg.assert_not_called()
+        self.bystander_char.msg.assert_called_once()
+        self.speaker_char.msg.assert_called_once()
+
+    def test_account_level_blocker_is_not_heard_on_any_face(self) -> None:
+        alt = PersonaFactory(character_sheet=self.speaker_sheet, name="Speaker Alt")
+        Block.objects.create(
+            owner=self.speaker_pd,
+            blocked_player=self.blocked_pd,
+            blocked_persona=self.blocked_char.sheet_data.primary_persona,
+            account_level=True,
+        )
+
+        push_ephemeral_interaction(
+            persona=alt, content="whistles.", mode=InteractionMode.POSE, scene=SceneFactory()
+        )
+
+        self.blocked_char.msg.assert_not_called()
+        self.bystander_char.msg.assert_called_once()
+
+    def test_lift_grace_window_and_finalize_are_honored(self) -> None:
+        block = create_block(
+            blocker_account=self.blocked_acct,
+            blocker_persona=self.blocked_char.sheet_data.primary_persona,
+            blocked_persona=self.speaker_face,
+            reason="harassment",
+            account_level=True,
+        )
+        lift_block(block, finalize_at=timezone.now() + timedelta(hours=1))
+        self._pose()
+        self.blocked_char.msg.assert_not_called()
+
+        lift_block(block, finalize_at=timezone.now() - timedelta(seconds=1))
+        self._pose()
+        self.blocked_char.msg.assert_called_once()
+
+        self.assertEqual(finalize_expired_blocks(now=timezone.now()), 1)
+        self.assertFalse(account_block_active(player_a=self.speaker_pd, player_b=self.blocked_pd))
+
+    def test_checks_after_the_first_run_no_queries(self) -> None:
+        Block.objects.create(
+            owner=self.speaker_pd, blocked_player=self.blocked_pd, account_level=True
+        )
+        self.assertTrue(account_block_active(player_a=self.speaker_pd, player_b=self.blocked_pd))
+
+        with self.assertNumQueries(0):
+            self.assertTrue(
+                account_block_active(player_a=self.blocked_pd, player_b=self.speaker_pd)
+            )
+            self.assertFalse(
+                account_block_active(player_a=self.blocked_pd, player_b=self.bystander_pd)
+            )
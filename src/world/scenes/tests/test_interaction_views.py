@@ -1163,3 +1163,64 @@ class InteractionListQueryBudgetTests(APITestCase):
             response = self.client.get(url, {"scene": dense_scene.pk})
         assert response.status_code == 200
         assert len(response.data["results"]) == 3  # same count as small dataset
+
+
+class ContentSearchFilterTests(APITestCase):
+    """Tests for the ?q= full-text filter on InteractionFilter."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.account = AccountFactory()
+        cls.character = CharacterFactory()
+        cls.roster_entry = RosterEntryFactory(character_sheet__character=cls.character)
+        cls.player_data = PlayerDataFactory(account=cls.account)
+        cls.tenure = RosterTenureFactory(
+            player_data=cls.player_data,
+            roster_entry=cls.roster_entry,
+        )
+        cls.persona = CharacterSheetFactory(character=cls.character).primary_persona
+        cls.other_persona = CharacterSheetFactory().primary_persona
+
+    def setUp(self) -> None:
+        self.client.force_authenticate(user=self.account)
+
+    def _search(self, query: str) -> dict[int, dict]:
+        response = self.client.get(reverse("interaction-list"), {"q": query})
+        assert response.status_code == status.HTTP_200_OK
+        return {row["id"]: row for row in response.data["results"]}
+
+    def test_matches_content_and_highlights_the_term(self) -> None:
+        match = InteractionFactory(
+            persona=self.persona, content="She turns the silver ring over in her palm."
+        )
+        InteractionFactory(persona=self.persona, content="He says nothing at all.")
+
+        rows = self._search("ring")
+
+        assert set(rows) == {match.pk}
+        assert "<mark>ring</mark>" in rows[match.pk]["search_snippet"]
+
+    def test_respects_receiver_visibility(self) -> None:
+        InteractionFactory(
+            persona=self.other_persona,
+            mode=InteractionMode.WHISPER,
+            content="The ring is hidden under the floorboards.",
+        )
+
+        assert self._search("ring") == {}
+
+    def test_snippet_escapes_pose_markup(self) -> None:
+        match = InteractionFactory(persona=self.persona, content="<b>the ring</b> glints")
+
+        snippet = self._search("ring")[match.pk]["search_snippet"]
+
+        assert "<b>" not in snippet
+        assert "&lt;b&gt;" in snippet
+
+    def test_no_snippet_outside_a_search(self) -> None:
+        interaction = InteractionFactory(persona=self.persona, content="A ring.")
+
+        response = self.client.get(reverse("interaction-list"))
+
+        [row] = [r for r in response.data["results"] if r["id"] == interaction.pk]
+        assert row["search_snippet"] is None
@@ -144,7 +144,7 @@ def _combat_stats_rows() -> None:
 
 
 def _projects_rows() -> None:
-    """The `projects.total_contributed` StatDefinition `_increment_contribution_stat` FKs."""
+    """The `projects.total_contributed` StatDefinition `_flush_contribution_stats` FKs."""
     from world.projects.services import _ensure_contribution_stat_def  # noqa: PLC0415
 
     _ensure_contribution_stat_def()
@@ -3,11 +3,11 @@ from typing import Any, cast
 from django.contrib.auth.base_user import AbstractBaseUser
 from django.contrib.auth.models import AnonymousUser
 from django.db.models import Model
-from evennia.objects.models import ObjectDB
 from rest_framework import permissions
 from rest_framework.request import Request
 from rest_framework.views import APIView
 
+from evennia_extensions.services.object_kinds import account_has_gm_character
 from world.gm.models import GMProfile, GMTable
 from world.stories.constants import AssistantClaimStatus, StoryScope
 from world.stories.models import (
@@ -273,10 +273,7 @@ class IsGMOrStaff(permissions.BasePermission):
             return True
 
         # Check if user has an active GM character
-        return ObjectDB.objects.filter(
-            db_account=request.user,
-            db_typeclass_path__contains="GMCharacter",
-        ).exists()
+        return account_has_gm_character(request.user)
 
 
 class CanParticipateInStory(permissions.BasePermission):
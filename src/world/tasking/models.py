@@ -404,6 +404,12 @@ class OrgTask(SharedMemoryModel, DiscriminatorMixin):
         ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["org", "status"]),
+            # The due-task queue (resolve_due_tasks): assigned tasks by deadline.
+            models.Index(
+                fields=["deadline"],
+                condition=models.Q(status="assigned"),
+                name="orgtask_due_idx",
+            ),
         ]
 
     def __str__(self) -> str:
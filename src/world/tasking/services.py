@@ -13,8 +13,10 @@ route and grades the risk pool (ADR-0092).
 
 from __future__ import annotations
 
+import logging
 from typing import TYPE_CHECKING
 
+from django.conf import settings
 from django.db import transaction
 from django.utils import timezone
 
@@ -32,13 +34,18 @@ from world.tasking.exceptions import (
 from world.tasking.models import OrgTask, TaskFulfillment
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     from world.assets.models import NPCAsset
     from world.character_sheets.models import CharacterSheet
     from world.checks.types import CheckResult
+    from world.currency.types import MoneyDelivery
     from world.scenes.models import Persona
     from world.societies.models import Organization
     from world.tasking.models import TaskOutcomeRoute, TaskTemplate
 
+logger = logging.getLogger(__name__)
+
 _DEFAULT_REPORT = "{agent} reports back on {task}: nothing worth passing along."
 
 # Points of resolution-check modifier per aptitude band (#2827 phase 4).
@@ -242,24 +249,41 @@ def _write_report(
 
 
 def _apply_route_payouts(
-    route: TaskOutcomeRoute, task: OrgTask, fulfillment: TaskFulfillment
+    route: TaskOutcomeRoute,
+    task: OrgTask,
+    fulfillment: TaskFulfillment,
+    deliveries: list[MoneyDelivery] | None = None,
 ) -> list[str]:
     """Money/clue payouts land on the handler; spy payouts (#2833) apply per
-    target kind. Returns extra report lines from the spy payouts."""
+    target kind. Returns extra report lines from the spy payouts.
+
+    With ``deliveries`` the money reward is appended there for the caller to
+    mint in bulk instead of being minted here.
+    """
     from world.assets.services import draw_clue_from_pool  # noqa: PLC0415
     from world.clues.services import acquire_clue  # noqa: PLC0415
     from world.currency.services import deliver_mission_money  # noqa: PLC0415
+    from world.currency.types import MoneyDelivery  # noqa: PLC0415
     from world.roster.models import RosterEntry  # noqa: PLC0415
     from world.tasking.spy_payouts import apply_spy_payouts  # noqa: PLC0415
 
     handler_sheet = fulfillment.handler.character_sheet
     if route.money_reward > 0:
-        deliver_mission_money(
+        delivery = MoneyDelivery(
             recipient_sheet=handler_sheet,
             amount=route.money_reward,
             ref=f"task:{fulfillment.task_id}",
             reason_label="task reward",
         )
+        if deliveries is None:
+            deliver_mission_money(
+                recipient_sheet=delivery.recipient_sheet,
+                amount=delivery.amount,
+                ref=delivery.ref,
+                reason_label=delivery.reason_label,
+            )
+        else:
+            deliveries.append(delivery)
     if route.clue_pool_id is not None:
         roster_entry = RosterEntry.objects.filter(character_sheet=handler_sheet).first()
         if roster_entry is not None:
@@ -351,9 +375,28 @@ def _apply_risk_pool(
     )
 
 
+_FULFILLMENT_RESOLUTION_FIELDS = ["resolved_outcome", "report", "resolved_at"]
+_TASK_RESOLUTION_FIELDS = ["status", "resolved_at"]
+
+
 @transaction.atomic
 def resolve_task(task: OrgTask) -> TaskFulfillment:
     """Resolve an ASSIGNED task now: agent check -> route payouts + risk pool."""
+    fulfillment = _run_agent_check(task)
+    fulfillment.save(update_fields=_FULFILLMENT_RESOLUTION_FIELDS)
+    task.save(update_fields=_TASK_RESOLUTION_FIELDS)
+    return fulfillment
+
+
+def _run_agent_check(
+    task: OrgTask, deliveries: list[MoneyDelivery] | None = None
+) -> TaskFulfillment:
+    """Everything ``resolve_task`` does short of saving the task and fulfillment.
+
+    The resolution fields are set on both in memory, the task's status last,
+    so an exception leaves ``task`` as it was. ``deliveries`` defers the money
+    reward as in ``_apply_route_payouts``.
+    """
     from world.checks.services import perform_check  # noqa: PLC0415
 
     if task.status != TaskStatus.ASSIGNED:
@@ -377,60 +420,118 @@ def resolve_task(task: OrgTask) -> TaskFulfillment:
     route = task.template.outcome_routes.filter(outcome_tier=check_result.outcome).first()
     spy_lines: list[str] = []
     if route is not None:
-        spy_lines = _apply_route_payouts(route, task, fulfillment)
+        spy_lines = _apply_route_payouts(route, task, fulfillment, deliveries)
     _apply_risk_pool(task, fulfillment, agent_character, check_result)
 
     now = timezone.now()
     fulfillment.resolved_outcome = check_result.outcome
     fulfillment.report = "\n".join([_write_report(route, task, fulfillment), *spy_lines])
     fulfillment.resolved_at = now
-    fulfillment.save(update_fields=["resolved_outcome", "report", "resolved_at"])
-
-    task.status = TaskStatus.COMPLETED if check_result.success_level > 0 else TaskStatus.FAILED
     task.resolved_at = now
-    task.save(update_fields=["status", "resolved_at"])
+    task.status = TaskStatus.COMPLETED if check_result.success_level > 0 else TaskStatus.FAILED
     return fulfillment
 
 
 def resolve_due_tasks() -> int:
     """Game-clock sweep: resolve every ASSIGNED task whose deadline has passed.
 
+    Due tasks are claimed in batches of ``settings.TASK_RESOLUTION_BATCH_SIZE``
+    with ``SELECT ... FOR UPDATE SKIP LOCKED``, so concurrent sweeps resolve
+    disjoint tasks; see ``_resolve_due_batch``. A task whose resolution raises
+    is logged and left ASSIGNED for the next sweep.
+
     Also fails out tasks whose PC mission fulfillment was abandoned or
     expired (#2820 phase 5) — the mission walked away, so the job did too.
     """
-    due = OrgTask.objects.filter(
-        status=TaskStatus.ASSIGNED,
-        deadline__lte=timezone.now(),
-    )
+    now = timezone.now()
+    batch_size = settings.TASK_RESOLUTION_BATCH_SIZE
+    skipped: set[int] = set()
     count = 0
-    for task in due:
-        resolve_task(task)
-        count += 1
+    while True:
+        claimed, resolved = _resolve_due_batch(now, batch_size, skipped)
+        count += resolved
+        if claimed < batch_size:
+            break
     count += _sweep_dead_pc_fulfillments()
     return count
 
 
+def _resolve_due_batch(now: datetime, batch_size: int, skipped: set[int]) -> tuple[int, int]:
+    """Claim up to ``batch_size`` due tasks and resolve them in one transaction.
+
+    Each task's check, clue, spy, betrayal and risk-pool writes run in their
+    own savepoint; the money rewards of the batch are then minted with one
+    ``deliver_mission_money_many`` and the task and fulfillment rows written
+    with one ``bulk_update`` each. The batch commits as a whole, so a crash
+    leaves each claimed task either resolved or still ASSIGNED and due. A task
+    that raises is rolled back to its savepoint and added to ``skipped``.
+
+    Returns:
+        (tasks claimed, tasks resolved).
+    """
+    from world.currency.services import deliver_mission_money_many  # noqa: PLC0415
+
+    claimed: list[OrgTask] = []
+    tasks: list[OrgTask] = []
+    fulfillments: list[TaskFulfillment] = []
+    try:
+        with transaction.atomic():
+            claimed = list(
+                OrgTask.objects.select_for_update(skip_locked=True)
+                .filter(status=TaskStatus.ASSIGNED, deadline__lte=now)
+                .exclude(pk__in=skipped)
+                .order_by("deadline", "pk")[:batch_size]
+            )
+            deliveries: list[MoneyDelivery] = []
+            for task in claimed:
+                task_deliveries: list[MoneyDelivery] = []
+                try:
+                    with transaction.atomic():
+                        fulfillment = _run_agent_check(task, task_deliveries)
+                except Exception:
+                    logger.exception("Resolving org task #%s failed; it stays assigned.", task.pk)
+                    skipped.add(task.pk)
+                    continue
+                deliveries.extend(task_deliveries)
+                tasks.append(task)
+                fulfillments.append(fulfillment)
+            deliver_mission_money_many(deliveries)
+            TaskFulfillment.objects.bulk_update(fulfillments, _FULFILLMENT_RESOLUTION_FIELDS)
+            OrgTask.objects.bulk_update(tasks, _TASK_RESOLUTION_FIELDS)
+    except Exception:
+        # The rows rolled back; the idmapped instances still carry the
+        # resolution set in memory and must not outlive it.
+        for row in (*tasks, *fulfillments):
+            row.flush_from_cache(force=True)
+        raise
+    return len(claimed), len(tasks)
+
+
 def _sweep_dead_pc_fulfillments() -> int:
     from world.missions.constants import MissionStatus  # noqa: PLC0415
 
-    dead = TaskFulfillment.objects.filter(
-        is_active=True,
-        task__status=TaskStatus.ASSIGNED,
-        mission_instance__isnull=False,
-        mission_instance__status__in=[MissionStatus.ABANDONED, MissionStatus.EXPIRED],
-    ).select_related("task")
-    count = 0
     now = timezone.now()
-    for fulfillment in dead:
-        task = fulfillment.task
-        fulfillment.report = "The job was left unfinished."
-        fulfillment.resolved_at = now
-        fulfillment.save(update_fields=["report", "resolved_at"])
-        task.status = TaskStatus.FAILED
-        task.resolved_at = now
-        task.save(update_fields=["status", "resolved_at"])
-        count += 1
-    return count
+    with transaction.atomic():
+        dead = list(
+            TaskFulfillment.objects.select_for_update(skip_locked=True, of=("self", "task"))
+            .filter(
+                is_active=True,
+                task__status=TaskStatus.ASSIGNED,
+                mission_instance__isnull=False,
+                mission_instance__status__in=[MissionStatus.ABANDONED, MissionStatus.EXPIRED],
+            )
+            .select_related("task")
+        )
+        for fulfillment in dead:
+            fulfillment.report = "The job was left unfinished."
+            fulfillment.resolved_at = now
+            fulfillment.task.status = TaskStatus.FAILED
+            fulfillment.task.resolved_at = now
+        TaskFulfillment.objects.bulk_update(dead, ["report", "resolved_at"])
+        OrgTask.objects.bulk_update(
+            [fulfillment.task for fulfillment in dead], _TASK_RESOLUTION_FIELDS
+        )
+    return len(dead)
 
 
 @transaction.atomic
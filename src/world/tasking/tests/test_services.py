@@ -5,8 +5,10 @@ official seam — so no real trait data is needed.
 """
 
 from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.utils import timezone
 
 from actions.factories import ConsequencePoolEntryFactory, ConsequencePoolFactory
@@ -15,12 +17,14 @@ from world.assets.factories import CluePoolEntryFactory, CluePoolFactory, NPCAss
 from world.checks.factories import ConsequenceEffectFactory, ConsequenceFactory
 from world.checks.test_helpers import force_check_outcome
 from world.clues.models import CharacterClue
+from world.currency.models import CurrencyTransfer
 from world.currency.services import get_or_create_purse
 from world.roster.factories import RosterEntryFactory
 from world.societies.factories import OrganizationFactory, OrganizationMembershipFactory
 from world.tasking.constants import DISPATCH_MARGIN_STEP, TaskStatus
 from world.tasking.exceptions import TaskAssignmentError, TaskResolutionError
 from world.tasking.factories import OrgTaskFactory, TaskOutcomeRouteFactory, TaskTemplateFactory
+from world.tasking.models import OrgTask, TaskFulfillment
 from world.tasking.services import assign_agent, resolve_due_tasks, resolve_task
 from world.traits.factories import CheckOutcomeFactory
 
@@ -184,6 +188,85 @@ class ResolveDueTasksTests(TaskingServiceTestBase):
         self.task.refresh_from_db()
         self.assertEqual(self.task.status, TaskStatus.COMPLETED)
 
+    def _assign_due(self, task):
+        with force_check_outcome(self.success):
+            fulfillment = assign_agent(task, self.asset, self.handler)
+        task.deadline = timezone.now() - timedelta(minutes=1)
+        task.save(update_fields=["deadline"])
+        return fulfillment
+
+    @override_settings(TASK_RESOLUTION_BATCH_SIZE=1)
+    def test_cron_claims_in_batches_and_mints_rewards(self):
+        TaskOutcomeRouteFactory(template=self.template, outcome_tier=self.success, money_reward=40)
+        second = OrgTaskFactory(template=self.template, org=self.org, issued_by=self.handler)
+        self._assign_due(self.task)
+        self._assign_due(second)
+
+        # force_check_outcome is single-shot; both agents must succeed here.
+        succeeded = SimpleNamespace(outcome=self.success, success_level=self.success.success_level)
+        with patch("world.checks.services.perform_check", return_value=succeeded):
+            count = resolve_due_tasks()
+
+        self.assertEqual(count, 2)
+        self.assertEqual(
+            set(OrgTask.objects.filter(pk__in=[self.task.pk, second.pk]).values_list("status")),
+            {(TaskStatus.COMPLETED,)},
+        )
+        self.assertEqual(get_or_create_purse(self.handler.character_sheet).balance, 80)
+        self.assertEqual(
+            CurrencyTransfer.objects.filter(reason__startswith="task reward").count(), 2
+        )
+        reports = TaskFulfillment.objects.filter(task__in=[self.task, second]).values_list(
+            "report", flat=True
+        )
+        self.assertTrue(all(reports))
+
+    def test_failing_task_stays_assigned_and_the_rest_resolve(self):
+        broken = OrgTaskFactory(
+            template=self.template,
+            org=self.org,
+            status=TaskStatus.ASSIGNED,
+            deadline=timezone.now() - timedelta(hours=1),
+        )
+        self._assign_due(self.task)
+
+        with (
+            force_check_outcome(self.success),
+            self.assertLogs("world.tasking.services", level="ERROR"),
+        ):
+            count = resolve_due_tasks()
+
+        self.assertEqual(count, 1)
+        statuses = dict(OrgTask.objects.values_list("pk", "status"))
+        self.assertEqual(statuses[broken.pk], TaskStatus.ASSIGNED)
+        self.assertEqual(statuses[self.task.pk], TaskStatus.COMPLETED)
+
+    def test_crash_mid_batch_leaves_tasks_claimable(self):
+        TaskOutcomeRouteFactory(template=self.template, outcome_tier=self.success, money_reward=40)
+        fulfillment = self._assign_due(self.task)
+
+        with (
+            force_check_outcome(self.success),
+            patch(
+                "world.currency.services.deliver_mission_money_many",
+                side_effect=RuntimeError("worker died"),
+            ),
+            self.assertRaises(RuntimeError),
+        ):
+            resolve_due_tasks()
+
+        self.assertEqual(
+            OrgTask.objects.values_list("status", flat=True).get(pk=self.task.pk),
+            TaskStatus.ASSIGNED,
+        )
+        self.assertEqual(
+            TaskFulfillment.objects.values_list("report", flat=True).get(pk=fulfillment.pk), ""
+        )
+        self.assertFalse(CurrencyTransfer.objects.exists())
+
+        with force_check_outcome(self.success):
+            self.assertEqual(resolve_due_tasks(), 1)
+
     def test_cron_registered(self):
         from world.game_clock.task_registry import get_registered_tasks
         from world.game_clock.tasks import register_all_tasks
@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING, Literal
 
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
+from django.db.models import F
 from django.utils import timezone
 
 from world.checks.models import CheckCategory, CheckType
@@ -1778,6 +1779,16 @@ def derive_base_max_health(character_sheet: CharacterSheet) -> int:
     return class_term + stamina_term + covenant_role_health(character, level)
 
 
+def _clamped_chronic_health(health: int, max_health: int, amount: int) -> int:
+    """Health after ``amount`` chronic damage, kept strictly above the knockout floor.
+
+    Never returns more than ``health``: a character already at/below the floor
+    is left where they are rather than healed up to it.
+    """
+    floor = int(KNOCKOUT_HEALTH_THRESHOLD * max_health) + 1  # strictly above the floor
+    return min(health, max(health - amount, floor))
+
+
 def apply_clamped_chronic_damage(character_sheet: CharacterSheet, amount: int) -> int:
     """Reduce health by ``amount`` but never to/below the knockout floor, never increasing it.
 
@@ -1791,9 +1802,8 @@ def apply_clamped_chronic_damage(character_sheet: CharacterSheet, amount: int) -
         vitals = character_sheet.vitals
     except (AttributeError, ObjectDoesNotExist):
         return 0
-    floor = int(KNOCKOUT_HEALTH_THRESHOLD * vitals.max_health) + 1  # strictly above the floor
-    new_health = max(vitals.health - amount, floor)
-    if new_health >= vitals.health:  # already at/below floor -> never heal, never raise
+    new_health = _clamped_chronic_health(vitals.health, vitals.max_health, amount)
+    if new_health >= vitals.health:
         return 0
     removed = vitals.health - new_health
     vitals.health = new_health
@@ -1801,6 +1811,47 @@ def apply_clamped_chronic_damage(character_sheet: CharacterSheet, amount: int) -
     return removed
 
 
+def apply_clamped_chronic_damage_many(hits: list[tuple[int, int]]) -> list[int]:
+    """``apply_clamped_chronic_damage`` for many ``(character_sheet_id, amount)`` hits at once.
+
+    Hits are clamped in order, so two hits on one sheet behave exactly like two
+    single calls. The vitals are read in one query and written as one
+    ``health = health - loss`` UPDATE per distinct loss, rather than a save per
+    hit. Returns the health removed by each hit, in ``hits`` order.
+    """
+    from world.vitals.models import CharacterVitals  # noqa: PLC0415
+
+    sheet_ids = {sheet_id for sheet_id, amount in hits if amount > 0}
+    vitals_by_sheet = {
+        vitals.character_sheet_id: vitals
+        for vitals in CharacterVitals.objects.filter(character_sheet_id__in=sheet_ids)
+    }
+    health = {sheet_id: vitals.health for sheet_id, vitals in vitals_by_sheet.items()}
+    removed: list[int] = []
+    for sheet_id, amount in hits:
+        vitals = vitals_by_sheet.get(sheet_id)
+        if amount <= 0 or vitals is None:
+            removed.append(0)
+            continue
+        new_health = _clamped_chronic_health(health[sheet_id], vitals.max_health, amount)
+        removed.append(health[sheet_id] - new_health)
+        health[sheet_id] = new_health
+
+    by_loss: dict[int, list[int]] = {}
+    for sheet_id, vitals in vitals_by_sheet.items():
+        loss = vitals.health - health[sheet_id]
+        if loss > 0:
+            by_loss.setdefault(loss, []).append(vitals.pk)
+    if by_loss:
+        with transaction.atomic():
+            for loss, pks in by_loss.items():
+                CharacterVitals.objects.filter(pk__in=pks).update(health=F("health") - loss)
+        # update() bypasses the identity map; keep the cached rows in step.
+        for sheet_id, vitals in vitals_by_sheet.items():
+            vitals.health = health[sheet_id]
+    return removed
+
+
 def get_vitals_consequence_config() -> VitalsConsequenceConfig:
     """Return the VitalsConsequenceConfig singleton (pk=1), creating it lazily on first call.
 
@@ -49,6 +49,8 @@ from check_partition_sql_drift import POST_PARTITION_COLUMNS  # noqa: E402
 SQL_FILES = [
     "world/scenes/sql/partition_interaction_forward.sql",
     "world/combat/sql/interaction_fk_composites_forward.sql",
+    "world/scenes/sql/interaction_fulltext_forward.sql",
+    "evennia_extensions/sql/objectdb_name_trgm_forward.sql",
     "world/areas/sql/areaclosure.sql",
     "world/codex/sql/subjectbreadcrumb.sql",
     "world/societies/sql/character_legend_summary.sql",